@@ -1,5 +1,7 @@
 // @api-version 1.0
 // Batch Wildcard Prompt Generator v2.0 — Refactored for better usability
+// Shared prompt-expansion core, inlined from lib/prompt-core.js by script_manager.py
+//@inline prompt-core
 
 // ============================================================================
 // Constants
@@ -9,6 +11,10 @@ const MODE_RANDOM     = 0;
 const MODE_SEQUENTIAL = 1;
 const MODE_CARTESIAN  = 2;
 const MODE_TEST       = 3;
+const MODE_UNIQUE     = 4;
+const MODE_PAIRWISE   = 5;
+
+const MODE_NAMES = ['Random', 'Sequential', 'Cartesian', 'Test', 'Unique', 'Pairwise'];
 
 const MAX_BATCH_COUNT = 250;
 const PREVIEW_COUNT = 3;
@@ -24,108 +30,73 @@ const PREVIEW_EXAMPLES = {
 // ============================================================================
 
 /**
- * Extracts all wildcard groups from text.
+ * Extracts all top-level wildcard groups from text.
  * @param {string} text - Text containing wildcards like {option1|option2}
  * @returns {string[]} Array of wildcard group contents (without braces)
  */
 function extractWildcardGroups(text) {
-  const groups = [];
-  const regex = /\{([^{}]+)\}/g;
-  let match;
-  while ((match = regex.exec(text))) {
-    groups.push(match[1]);
-  }
-  return groups;
+  return parseTemplate(text).groups.map(group => group.body);
 }
 
 /**
  * Splits a wildcard group into individual options.
  * @param {string} groupText - Text like "option1|option2|option3"
- * @returns {string[]} Array of trimmed options
+ * @returns {string[]} Array of trimmed options, without weight prefixes
  */
 function splitOptions(groupText) {
-  return groupText.split('|').map(opt => opt.trim()).filter(opt => opt.length > 0);
+  return splitWeightedOptions(groupText).map(option => option.value);
 }
 
 /**
- * Gets all options for each wildcard group in the prompt.
- * @param {string} promptText - Prompt containing wildcards
- * @returns {string[][]} Array of option arrays, one per wildcard group
+ * Splits a wildcard group into options and their weights.
+ * An option written as "3::red" has weight 3; options without a prefix weigh 1.
+ * @param {string} groupText - Text like "3::red|1::blue|green"
+ * @returns {{value: string, weight: number}[]} Options in group order
  */
-function getAllOptions(promptText) {
-  return extractWildcardGroups(promptText).map(splitOptions);
+function splitWeightedOptions(groupText) {
+  const group = parseTemplate(`{${groupText}}`).groups[0];
+  return group ? group.options.map(({ value, weight }) => ({ value, weight })) : [];
 }
 
 /**
- * Replaces wildcards in prompt with provided values.
- * @param {string} promptText - Prompt with wildcards
- * @param {string[]} values - Values to substitute (one per wildcard)
- * @returns {string} Prompt with wildcards replaced
+ * Counts the values of each top-level wildcard group, with nested groups
+ * expanded, for Pairwise mode. A group without options counts as one empty value.
+ * @param {object[]} groups - Parsed wildcard groups
+ * @returns {number[]} Value count per wildcard group
  */
-function applyValuesToPrompt(promptText, values) {
-  let idx = 0;
-  return promptText.replace(/\{([^{}]+)\}/g, () => values[idx++] || '');
+function pairwiseSizes(groups) {
+  return groups.map(group => Math.max(Number(group.count), 1));
 }
 
 /**
- * Computes Cartesian product of multiple option arrays.
- * @param {string[][]} lists - Array of option arrays
- * @returns {string[][]} All possible combinations
+ * Decodes a Pairwise row of value indices into one value per wildcard.
+ * @param {object[]} groups - Parsed wildcard groups
+ * @param {number[]} row - Value index per wildcard
+ * @returns {string[]} One value per wildcard
  */
-function computeCartesianProduct(lists) {
-  if (lists.length === 0) return [[]];
-
-  let result = [[]];
-  for (const opts of lists) {
-    const newResult = [];
-    for (const prev of result) {
-      for (const opt of opts) {
-        newResult.push([...prev, opt]);
-      }
-    }
-    result = newResult;
-  }
-  return result;
+function pairwiseValues(groups, row) {
+  return row.map((option, group) => groups[group].count > 0n ? valueAt(groups[group], BigInt(option)) : '');
 }
 
 /**
- * Computes the first N combinations without full expansion.
- * @param {string[][]} lists - Array of option arrays
- * @param {number} limit - Max combinations to return
- * @returns {string[][]} First combinations up to limit
+ * Replaces top-level wildcards in prompt with provided values.
+ * @param {string} promptText - Prompt with wildcards
+ * @param {string[]} values - Values to substitute (one per wildcard)
+ * @returns {string} Prompt with wildcards replaced
  */
-function computeCartesianPreview(lists, limit) {
-  if (lists.length === 0) return [[]];
-  const result = [];
-  const indices = new Array(lists.length).fill(0);
-  const totalCombos = lists.reduce((total, opts) => total * opts.length, 1);
-  const maxCount = Math.min(limit, totalCombos);
-
-  for (let count = 0; count < maxCount; count++) {
-    const combo = indices.map((idx, listIndex) => lists[listIndex][idx] || '');
-    result.push(combo);
-
-    for (let i = indices.length - 1; i >= 0; i--) {
-      indices[i] += 1;
-      if (indices[i] < lists[i].length) {
-        break;
-      }
-      indices[i] = 0;
-    }
-  }
-
-  return result;
+function applyValuesToPrompt(promptText, values) {
+  return fillTemplate(parseTemplate(promptText), values);
 }
 
 /**
  * Calculates the maximum number of possible combinations.
  * @param {string} promptText - Prompt with wildcards
- * @returns {number} Total possible combinations
+ * @returns {bigint} Total possible combinations
  */
 function calculateMaxCombinations(promptText) {
-  const optionsList = getAllOptions(promptText);
-  if (optionsList.length === 0) return 0;
-  return optionsList.reduce((total, opts) => total * opts.length, 1);
+  const template = parseTemplate(promptText);
+  if (template.groups.length === 0) return 0n;
+  return template.count;
 }
 
 // ============================================================================
@@ -133,15 +104,42 @@ function calculateMaxCombinations(promptText) {
 // ============================================================================
 
 /**
- * Runs a single generation with the given prompt and configuration.
+ * Runs a single generation with the given prompt and configuration, then logs
+ * the seed used. With a seed plan, the seed is derived from the plan's master
+ * seed and the image key, and the image's replay token is logged with it.
  * @param {string} promptText - Final prompt (wildcards already replaced)
  * @param {object} config - Generation configuration
+ * @param {{master: number}|null} [plan] - Seed plan, or null
+ * @param {string} [key] - Image key: r(andom draw), s(equential), c(ombination) or p(airwise row) and a base-36 index
  */
-function runGeneration(promptText, config) {
+function runGeneration(promptText, config, plan = null, key = null) {
+  const configuration = plan ? { ...config, seed: planSeed(plan.master, key) } : config;
   pipeline.run({
-    configuration: config,
+    configuration: configuration,
     prompt: promptText
   });
+  const seed = configuration.seed >= 0 ? configuration.seed : pipeline.configuration.seed;
+  console.log(plan ? `Seed: ${seed}, replay token: ${replayToken(plan.master, key)}` : `Seed: ${seed}`);
+}
+
+/**
+ * Draws one value per wildcard from a single random stream.
+ * @param {object[]} groups - Parsed wildcard groups
+ * @param {function(): number} random - Uniform [0, 1) source
+ * @returns {string[]} One value per wildcard
+ */
+function randomValues(groups, random) {
+  return groups.map(group => sampleGroup(group, random));
+}
+
+/**
+ * Picks the step-th value of every wildcard, each wrapping around on its own.
+ * @param {object[]} groups - Parsed wildcard groups
+ * @param {bigint} step - Zero-based generation index
+ * @returns {string[]} One value per wildcard
+ */
+function sequentialValues(groups, step) {
+  return groups.map(group => group.count > 0n ? valueAt(group, step % group.count) : '');
 }
 
 /**
@@ -151,40 +149,38 @@ function runGeneration(promptText, config) {
  * @param {number} total - Total generation count
  * @param {string} modeName - Mode name for context
  * @param {boolean} debugEnabled - Whether debug logging is enabled
- * @param {string[][]} [optionsList] - Optional options list for debug
+ * @param {object[]} [groups] - Parsed wildcard groups, for the debug group sizes
  */
-function logSubstitutions(values, index, total, modeName, debugEnabled, optionsList) {
+function logSubstitutions(values, index, total, modeName, debugEnabled, groups) {
   const displayValues = values.map(value => value || '');
   console.log(`[${index + 1}/${total}] ${modeName} substitutions: ${displayValues.join(' | ')}`);
 
   if (debugEnabled) {
     console.log(`[DEBUG] Mode: ${modeName}`);
     console.log(`[DEBUG] Substitution count: ${displayValues.length}`);
-    if (optionsList && optionsList.length > 0) {
-      const optionSizes = optionsList.map(opts => opts.length);
-      console.log(`[DEBUG] Wildcard groups: ${optionSizes.join(', ')}`);
+    if (groups && groups.length > 0) {
+      console.log(`[DEBUG] Wildcard groups: ${groups.map(group => group.count).join(', ')}`);
     }
   }
 }
 
 /**
  * Generates prompts in Random mode.
- * Each wildcard is randomly replaced for each generation.
+ * Each wildcard is randomly replaced for each generation, following the
+ * option weights through one alias table per group, nested groups included.
  */
-function generateRandom(promptText, count, config, debugEnabled) {
-  const optionsList = getAllOptions(promptText);
+function generateRandom(promptText, count, config, debugEnabled, plan = null) {
+  const groups = parseTemplate(promptText).groups;
 
   for (let i = 0; i < count; i++) {
-    const selectedValues = optionsList.map(opts => {
-      if (opts.length === 0) return '';
-      const randomIndex = Math.floor(Math.random() * opts.length);
-      return opts[randomIndex];
-    });
+    // A seed plan draws each image from its own stream, so a token can replay it.
+    const key = `r${i.toString(36)}`;
+    const selectedValues = randomValues(groups, plan ? keyedRandom(`${plan.master}:${key}`) : Math.random);
     const filledPrompt = applyValuesToPrompt(promptText, selectedValues);
 
     console.log(`[${i + 1}/${count}] Random: ${filledPrompt}`);
-    logSubstitutions(selectedValues, i, count, 'Random', debugEnabled, optionsList);
-    runGeneration(filledPrompt, config);
+    logSubstitutions(selectedValues, i, count, 'Random', debugEnabled, groups);
+    runGeneration(filledPrompt, config, plan, key);
   }
 }
 
@@ -192,40 +188,250 @@ function generateRandom(promptText, count, config, debugEnabled) {
  * Generates prompts in Sequential mode.
  * Cycles through options sequentially, wrapping around.
  */
-function generateSequential(promptText, count, config, debugEnabled) {
-  const optionsList = getAllOptions(promptText);
+function generateSequential(promptText, count, config, debugEnabled, plan = null) {
+  const groups = parseTemplate(promptText).groups;
 
   for (let i = 0; i < count; i++) {
-    const selectedValues = optionsList.map(opts => {
-      const index = i % opts.length;
-      return opts[index];
-    });
+    const selectedValues = sequentialValues(groups, BigInt(i));
 
     const filledPrompt = applyValuesToPrompt(promptText, selectedValues);
     console.log(`[${i + 1}/${count}] Sequential: ${filledPrompt}`);
-    logSubstitutions(selectedValues, i, count, 'Sequential', debugEnabled, optionsList);
-    runGeneration(filledPrompt, config);
+    logSubstitutions(selectedValues, i, count, 'Sequential', debugEnabled, groups);
+    runGeneration(filledPrompt, config, plan, `s${i.toString(36)}`);
   }
 }
 
 /**
  * Generates prompts in Cartesian mode.
- * Generates all possible combinations (up to count limit).
+ * Decodes combinations by index instead of expanding the product. Shard i of n
+ * owns every n-th combination starting at i - 1, and the offset skips that many
+ * of the shard's combinations, so large products render in chunks across
+ * sessions or machines.
+ * @returns {number} Number of images generated
+ */
+function generateCartesian(promptText, count, config, debugEnabled, range, plan = null) {
+  const { groups, count: total } = parseTemplate(promptText);
+  const available = cartesianShardSize(total, range);
+  const generated = Number(available < BigInt(count) ? available : BigInt(count));
+  if (available > BigInt(generated)) {
+    console.log(`Note: ${available} combinations left in shard ${range.shard}/${range.shards}, generating ${generated}`);
+  }
+
+  for (let index = 0; index < generated; index++) {
+    const position = range.offset + BigInt(index);
+    const combination = position * BigInt(range.shards) + BigInt(range.shard - 1);
+    const values = combinationAt(groups, combination);
+    const filledPrompt = applyValuesToPrompt(promptText, values);
+    console.log(`[${index + 1}/${generated}] Cartesian #${combination}: ${filledPrompt}`);
+    logSubstitutions(values, index, generated, 'Cartesian', debugEnabled, groups);
+    runGeneration(filledPrompt, config, plan, `c${combination.toString(36)}`);
+  }
+  if (available > BigInt(generated)) {
+    console.log(`Cartesian mode: shard ${range.shard}/${range.shards}, continue with start offset ${range.offset + BigInt(generated)}.`);
+  }
+  return generated;
+}
+
+/**
+ * Counts the combinations a Cartesian shard has left from its start offset.
+ * @param {bigint} total - Number of combinations
+ * @param {{offset: bigint, shard: number, shards: number}} range - Shard and offset
+ * @returns {bigint} Combinations remaining
+ */
+function cartesianShardSize(total, range) {
+  const owned = total >= BigInt(range.shard) ? (total - BigInt(range.shard)) / BigInt(range.shards) + 1n : 0n;
+  return owned > range.offset ? owned - range.offset : 0n;
+}
+
+/**
+ * Generates prompts in Unique mode.
+ * Walks a seeded permutation of all combinations starting at `start`, so no
+ * combination repeats until every one has been used, and the same seed and a
+ * later start continue an interrupted batch.
+ * @returns {number} Number of images generated
+ */
+function generateUnique(promptText, count, config, debugEnabled, order, plan = null) {
+  const { groups, count: total } = parseTemplate(promptText);
+  const start = BigInt(order.start);
+  let end = start + BigInt(count);
+  if (end > total) {
+    console.warn(`Only ${total > start ? total - start : 0n} of ${count} unique combinations left from position ${start} (${total} in total).`);
+    end = total;
+  }
+  const permute = keyedPermutation(total, order.seed);
+  const generated = Number(end > start ? end - start : 0n);
+
+  for (let position = start; position < end; position++) {
+    const index = Number(position - start);
+    const combination = permute(position);
+    const values = combinationAt(groups, combination);
+    const filledPrompt = applyValuesToPrompt(promptText, values);
+    console.log(`[${index + 1}/${generated}] Unique #${position}: ${filledPrompt}`);
+    logSubstitutions(values, index, generated, 'Unique', debugEnabled, groups);
+    runGeneration(filledPrompt, config, plan, `c${combination.toString(36)}`);
+  }
+  console.log(`Unique mode: seed ${order.seed}, positions ${start} to ${end - 1n}. Continue with seed ${order.seed} and start ${end}.`);
+  return generated;
+}
+
+/**
+ * Generates prompts in Pairwise mode.
+ * Renders a covering array in which every pair of options from two different
+ * wildcards appears at least once, then reports the pair coverage achieved.
+ * @returns {number} Number of images generated
+ */
+function generatePairwise(promptText, count, config, debugEnabled, plan = null) {
+  const groups = parseTemplate(promptText).groups;
+  const sizes = pairwiseSizes(groups);
+  const rows = buildPairwiseRows(sizes);
+  const selected = rows.slice(0, count);
+  console.log(`Pairwise: ${rows.length} prompts cover every option pair, out of ${calculateMaxCombinations(promptText)} combinations.`);
+  if (selected.length < rows.length) {
+    console.warn(`Rendering ${selected.length} of them; use a batch count of ${rows.length} (or Create max) for full coverage.`);
+  }
+
+  selected.forEach((row, index) => {
+    const values = pairwiseValues(groups, row);
+    const filledPrompt = applyValuesToPrompt(promptText, values);
+    console.log(`[${index + 1}/${selected.length}] Pairwise: ${filledPrompt}`);
+    logSubstitutions(values, index, selected.length, 'Pairwise', debugEnabled, groups);
+    runGeneration(filledPrompt, config, plan, `p${index.toString(36)}`);
+  });
+
+  const { covered, total } = pairCoverage(sizes, selected);
+  if (total > 0) {
+    console.log(`Pairwise coverage: ${covered} of ${total} option pairs (${(100 * covered / total).toFixed(1)}%) in ${selected.length} prompts.`);
+  }
+  return selected.length;
+}
+
+/**
+ * Builds a pairwise covering array with the IPOG strategy. Wildcards are added
+ * largest first: the first two are fully combined, and each further wildcard
+ * extends every row with the option that covers the most missing pairs, then
+ * adds rows (or fills free cells of rows added for it) for pairs still missing.
+ * @param {number[]} sizes - Number of options per wildcard, at least 1
+ * @returns {number[][]} Rows of option indices, one per wildcard
  */
-function generateCartesian(promptText, count, config, debugEnabled) {
-  const optionsList = getAllOptions(promptText);
-  const totalPossible = calculateMaxCombinations(promptText);
-  const limitedCombinations = computeCartesianPreview(optionsList, count);
-  if (totalPossible > count) {
-    console.log(`Note: ${totalPossible} combinations possible, generating first ${count}`);
+function buildPairwiseRows(sizes) {
+  const FREE = -1;
+  const order = sizes.map((size, group) => group).sort((a, b) => sizes[b] - sizes[a]);
+  if (order.length < 2) {
+    const count = order.length ? sizes[order[0]] : 1;
+    return Array.from({ length: count }, (_, index) => order.map(() => index));
+  }
+
+  let rows = [];
+  const [first, second] = order;
+  for (let a = 0; a < sizes[first]; a++) {
+    for (let b = 0; b < sizes[second]; b++) {
+      const row = new Array(sizes.length).fill(FREE);
+      row[first] = a;
+      row[second] = b;
+      rows.push(row);
+    }
+  }
+
+  for (let k = 2; k < order.length; k++) {
+    const group = order[k];
+    const size = sizes[group];
+    const earlier = order.slice(0, k);
+    // Missing pairs per earlier wildcard j, keyed option(j) * size + option(group)
+    const missing = new Map(earlier.map(j => [j, new Set(Array.from({ length: sizes[j] * size }, (_, key) => key))]));
+    const gain = (row, option) => earlier.filter(j => row[j] !== FREE && missing.get(j).has(row[j] * size + option)).length;
+    const cover = row => earlier.forEach(j => row[j] !== FREE && missing.get(j).delete(row[j] * size + row[group]));
+
+    rows.forEach((row, index) => {
+      let best = index % size;
+      if (index >= size) {
+        for (let option = 0; option < size; option++) {
+          if (gain(row, option) > gain(row, best)) {
+            best = option;
+          }
+        }
+      }
+      row[group] = best;
+      cover(row);
+    });
+
+    const added = [];
+    for (const j of earlier) {
+      for (const key of [...missing.get(j)]) {
+        if (!missing.get(j).has(key)) {
+          continue;
+        }
+        const option = key % size;
+        let row = added.find(candidate => candidate[group] === option && candidate[j] === FREE);
+        if (!row) {
+          row = new Array(sizes.length).fill(FREE);
+          row[group] = option;
+          added.push(row);
+        }
+        row[j] = Math.floor(key / size);
+        cover(row);
+      }
+    }
+    rows = rows.concat(added);
   }
 
-  limitedCombinations.forEach((combo, index) => {
-    const filledPrompt = applyValuesToPrompt(promptText, combo);
-    console.log(`[${index + 1}/${limitedCombinations.length}] Cartesian: ${filledPrompt}`);
-    logSubstitutions(combo, index, limitedCombinations.length, 'Cartesian', debugEnabled, optionsList);
-    runGeneration(filledPrompt, config);
+  // Cells no pair needed get any option, rotating so each one still varies.
+  return rows.map((row, index) => row.map((option, group) => option === FREE ? index % sizes[group] : option));
+}
+
+/**
+ * Counts the option pairs (across two different wildcards) that rows cover.
+ * @param {number[]} sizes - Number of options per wildcard, at least 1
+ * @param {number[][]} rows - Rows of option indices
+ * @returns {{covered: number, total: number}} Covered and possible pairs
+ */
+function pairCoverage(sizes, rows) {
+  let covered = 0;
+  let total = 0;
+  for (let i = 0; i < sizes.length; i++) {
+    for (let j = i + 1; j < sizes.length; j++) {
+      total += sizes[i] * sizes[j];
+      covered += new Set(rows.map(row => row[i] * sizes[j] + row[j])).size;
+    }
+  }
+  return { covered, total };
+}
+
+/**
+ * Re-renders the images named by replay tokens. Each token gives the master
+ * seed of its plan and the image key, which rebuilds the same substitutions
+ * and seed from the same prompt.
+ * @param {string} promptText - Prompt the tokens were logged for
+ * @param {object[]} tokens - Tokens from parseReplayTokens
+ * @param {object} config - Generation configuration for the replays
+ * @returns {number} Number of images generated
+ */
+function replayImages(promptText, tokens, config) {
+  const { groups, count: total } = parseTemplate(promptText);
+  let pairwiseRows = null;
+
+  tokens.forEach((token, index) => {
+    let values;
+    if (token.kind === 'r') {
+      values = randomValues(groups, keyedRandom(`${token.master}:${token.key}`));
+    } else if (token.kind === 's') {
+      values = sequentialValues(groups, token.index);
+    } else if (token.kind === 'c' && token.index < total) {
+      values = combinationAt(groups, token.index);
+    } else if (token.kind === 'p') {
+      pairwiseRows = pairwiseRows || buildPairwiseRows(pairwiseSizes(groups));
+      const row = pairwiseRows[Number(token.index)];
+      if (!row) {
+        throw new Error(`Replay token ${replayToken(token.master, token.key)} is past the ${pairwiseRows.length} pairwise prompts`);
+      }
+      values = pairwiseValues(groups, row);
+    } else {
+      throw new Error(`Replay token ${replayToken(token.master, token.key)} does not fit this prompt`);
+    }
+    const filledPrompt = applyValuesToPrompt(promptText, values);
+    console.log(`[${index + 1}/${tokens.length}] Replay ${replayToken(token.master, token.key)}: ${filledPrompt}`);
+    runGeneration(filledPrompt, config, { master: token.master }, token.key);
   });
+  return tokens.length;
 }
 
 /**
@@ -247,6 +453,30 @@ function runTestMode(config) {
       throw new Error('splitOptions failed');
     }
 
+    const weighted = splitWeightedOptions('3::red|blue|0::green');
+    if (weighted.map(option => `${option.weight}:${option.value}`).join('|') !== '3:red|1:blue|0:green') {
+      throw new Error('splitWeightedOptions failed');
+    }
+
+    const table = buildAliasTable(weighted.map(option => option.weight));
+    const shares = [0, 0, 0];
+    table.probability.forEach((keep, column) => {
+      shares[column] += keep / 3;
+      shares[table.alias[column]] += (1 - keep) / 3;
+    });
+    if (shares.some((share, index) => Math.abs(share - [0.75, 0.25, 0][index]) > 1e-9)) {
+      throw new Error(`buildAliasTable failed: ${shares.join(', ')}`);
+    }
+
+    const nested = parseTemplate('a {x {big|small} cat|dog} {1|2}');
+    const nestedValues = [0n, 1n, 2n].map(index => valueAt(nested.groups[0], index));
+    if (nested.count !== 6n || nested.groups[0].count !== 3n || nestedValues.join('|') !== 'x big cat|x small cat|dog') {
+      throw new Error(`parseTemplate (nested) failed: ${nested.count} ${nestedValues.join('|')}`);
+    }
+    if (fillTemplate(nested, combinationAt(nested.groups, 3n)) !== 'a x small cat 2') {
+      throw new Error('combinationAt (nested) failed');
+    }
+
     const result = applyValuesToPrompt(testPrompt, [options[0]]);
     const successMessage = `TEST MODE SUCCESS: ${result}`;
     console.log(successMessage);
@@ -257,21 +487,22 @@ function runTestMode(config) {
       throw new Error('extractWildcardGroups (multi) failed');
     }
 
-    const multiOptions = getAllOptions(multiPrompt);
-    const expectedCombos = multiOptions.reduce((total, opts) => total * opts.length, 1);
     const actualCombos = calculateMaxCombinations(multiPrompt);
-    if (actualCombos !== expectedCombos) {
+    if (actualCombos !== 6n) {
       throw new Error(`calculateMaxCombinations failed: ${actualCombos}`);
     }
 
-    const combos = computeCartesianProduct(multiOptions);
-    if (combos.length !== expectedCombos) {
-      throw new Error(`computeCartesianProduct failed: ${combos.length}`);
+    // Cartesian order: the last wildcard changes fastest.
+    const expectedCombos = ['red|cat', 'red|dog', 'red|fox', 'blue|cat', 'blue|dog', 'blue|fox'];
+    const parsedGroups = parseTemplate(multiPrompt).groups;
+    const decodedCombos = expectedCombos.map((combo, index) => combinationAt(parsedGroups, BigInt(index)).join('|'));
+    if (decodedCombos.some((combo, index) => combo !== expectedCombos[index])) {
+      throw new Error(`combinationAt failed: ${decodedCombos.join(', ')}`);
     }
 
-    const previewCombos = computeCartesianPreview(multiOptions, PREVIEW_COUNT);
-    if (previewCombos.length !== PREVIEW_COUNT) {
-      throw new Error(`computeCartesianPreview failed: ${previewCombos.length}`);
+    const shardRange = { offset: 1n, shard: 2, shards: 4 };
+    if (cartesianShardSize(actualCombos, shardRange) !== 1n || cartesianShardSize(actualCombos, { offset: 0n, shard: 1, shards: 1 }) !== 6n) {
+      throw new Error('cartesianShardSize failed');
     }
 
     if (MAX_BATCH_COUNT < 1) {
@@ -299,7 +530,7 @@ function showMainUI() {
   const wildcardHint = hasWildcards
     ? `Found wildcards! Max combinations: ${maxCombos.toLocaleString()}`
     : 'Enter a prompt with wildcards like: {option1|option2|option3}';
-  const cappedMaxCombos = Math.min(maxCombos, MAX_BATCH_COUNT);
+  const cappedMaxCombos = maxCombos < MAX_BATCH_COUNT ? maxCombos : MAX_BATCH_COUNT;
   const maxCountHint = maxCombos > 0
     ? `Max combinations for current prompt: ${cappedMaxCombos}${maxCombos > MAX_BATCH_COUNT ? ' (capped)' : ''}`
     : 'Max combinations unavailable until prompt has wildcards.';
@@ -312,7 +543,8 @@ function showMainUI() {
           true,
           200
         ),
-        this.plainText(wildcardHint)
+        this.plainText(wildcardHint),
+        this.plainText('Weights: {3::red|1::blue} picks red 3x as often in Random mode')
       ]),
 
       this.section('Batch Settings', 'Configure how many images to generate:', [
@@ -325,12 +557,32 @@ function showMainUI() {
       ]),
 
       this.section('Generation Mode', 'Choose how wildcards are processed:', [
-        this.segmented(0, ['Random', 'Sequential', 'Cartesian', 'Test']),
+        this.segmented(0, MODE_NAMES),
         this.plainText('Mode descriptions (static):'),
         this.plainText('Random: Picks options randomly; may repeat'),
         this.plainText('Sequential: Cycles per wildcard index (0,1,2...)'),
         this.plainText('Cartesian: Enumerates all combinations (ordered)'),
-        this.plainText('Test: Validate parsing')
+        this.plainText('Test: Validate parsing'),
+        this.plainText('Unique: Random order without repeats (resumable)'),
+        this.plainText('Pairwise: Every pair of options at least once')
+      ]),
+
+      this.section('Unique Mode', 'Leave the seed empty for a new order. To continue a batch, reuse its seed and start where it stopped:', [
+        this.textField('', 'Seed', false, 20),
+        this.textField('0', 'Start position', false, 20)
+      ]),
+
+      this.section('Cartesian Mode', 'Resume or split a large product. Shard 2/4 interleaves: it renders every 4th combination starting at the 2nd, and the start offset counts its own combinations:', [
+        this.textField('0', 'Start offset', false, 20),
+        this.textField('1/1', 'Shard', false, 20)
+      ]),
+
+      this.section('Seed Planning', 'Derive every seed from a master seed and log a replay token per image. Paste tokens to re-render just those images:', [
+        this.switch(false, 'Seed plan'),
+        this.textField('', 'Master seed', false, 20),
+        this.textField('', 'Replay tokens', true, 60),
+        this.textField('', 'Replay steps', false, 20),
+        this.textField('', 'Replay size (WxH)', false, 20)
       ]),
 
       this.section('Preview (values only)', 'Static examples (not computed):', (function() {
@@ -375,15 +627,16 @@ function showNoWildcardsError() {
 /**
  * Shows completion dialog with summary.
  */
-function showCompletionDialog(modeIndex, batchCount, actualCount) {
-  const modeNames = ['Random', 'Sequential', 'Cartesian', 'Test'];
-  const modeName = modeNames[modeIndex] || 'Unknown';
+function showCompletionDialog(modeIndex, batchCount, actualCount, replayed = false) {
+  const modeName = MODE_NAMES[modeIndex] || 'Unknown';
 
   let message = '';
-  if (modeIndex === MODE_TEST) {
+  if (replayed) {
+    message = `Re-rendered ${actualCount} image${actualCount !== 1 ? 's' : ''} from replay tokens.`;
+  } else if (modeIndex === MODE_TEST) {
     message = 'Test mode completed successfully!';
-  } else if (modeIndex === MODE_CARTESIAN && actualCount !== batchCount) {
-    message = `Generated ${actualCount} of ${batchCount} requested images.\n(Cartesian mode limited by available combinations)`;
+  } else if ((modeIndex === MODE_CARTESIAN || modeIndex === MODE_UNIQUE || modeIndex === MODE_PAIRWISE) && actualCount !== batchCount) {
+    message = `Generated ${actualCount} of ${batchCount} requested images.\n(${modeName} mode limited by available combinations)`;
   } else {
     message = `Successfully generated ${actualCount} image${actualCount !== 1 ? 's' : ''} using ${modeName} mode.`;
   }
@@ -413,6 +666,13 @@ function main() {
     const useSameSeed = userInput[1][2];
     const debugEnabled = userInput[1][3];
     const modeIndex = userInput[2][0];
+    const seedText = userInput[3][0].trim();
+    const startText = userInput[3][1].trim() || '0';
+    const offsetText = userInput[4][0].trim() || '0';
+    const shardMatch = /^(\d+)\s*\/\s*(\d+)$/.exec(userInput[4][1].trim() || '1/1');
+    const useSeedPlan = userInput[5][0];
+    const masterSeedText = userInput[5][1].trim();
+    const replayTokens = parseReplayTokens(userInput[5][2]);
     const maxCombosForPrompt = calculateMaxCombinations(promptText);
 
     // Validate input
@@ -426,8 +686,22 @@ function main() {
       return;
     }
 
-    if (useMaxCount && maxCombosForPrompt > 0 && maxCombosForPrompt <= MAX_BATCH_COUNT) {
-      batchCount = maxCombosForPrompt;
+    if (modeIndex === MODE_CARTESIAN && (!/^\d+$/.test(offsetText) || !shardMatch ||
+        Number(shardMatch[1]) < 1 || Number(shardMatch[1]) > Number(shardMatch[2]))) {
+      console.error('Invalid cartesian start offset or shard:', offsetText, userInput[4][1]);
+      return;
+    }
+    const cartesianRange = modeIndex === MODE_CARTESIAN
+      ? { offset: BigInt(offsetText), shard: Number(shardMatch[1]), shards: Number(shardMatch[2]) }
+      : { offset: 0n, shard: 1, shards: 1 };
+
+    if (useMaxCount && modeIndex === MODE_CARTESIAN) {
+      const remaining = cartesianShardSize(parseTemplate(promptText).count, cartesianRange);
+      batchCount = Number(remaining < BigInt(MAX_BATCH_COUNT) ? remaining : BigInt(MAX_BATCH_COUNT));
+    } else if (useMaxCount && modeIndex === MODE_PAIRWISE) {
+      batchCount = buildPairwiseRows(pairwiseSizes(parseTemplate(promptText).groups)).length;
+    } else if (useMaxCount && maxCombosForPrompt > 0 && maxCombosForPrompt <= MAX_BATCH_COUNT) {
+      batchCount = Number(maxCombosForPrompt);
     }
 
     if (batchCount > MAX_BATCH_COUNT) {
@@ -444,7 +718,23 @@ function main() {
       return;
     }
 
-    const modeName = ['Random', 'Sequential', 'Cartesian', 'Test'][modeIndex];
+    if (modeIndex === MODE_UNIQUE && (!/^\d*$/.test(seedText) || !/^\d+$/.test(startText))) {
+      console.error('Invalid unique mode seed or start position:', seedText, startText);
+      return;
+    }
+    const uniqueOrder = {
+      seed: seedText ? Number(seedText) : Math.floor(Math.random() * 2147483647),
+      start: BigInt(startText)
+    };
+
+    const masterSeed = parseMasterSeed(masterSeedText);
+    if (useSeedPlan && masterSeed === null) {
+      console.error(`Invalid master seed (0 to ${MAX_SEED - 1}):`, masterSeedText);
+      return;
+    }
+    const seedPlan = useSeedPlan ? { master: masterSeed } : null;
+
+    const modeName = MODE_NAMES[modeIndex];
 
     // Prepare configuration (use random seed for variety unless same-seed enabled)
     const config = { ...pipeline.configuration };
@@ -452,11 +742,25 @@ function main() {
       config.seed = -1;
     }
 
+    if (replayTokens.length > 0) {
+      const replayConfig = replayConfiguration(config, userInput[5][3], userInput[5][4]);
+      console.log('\n=== Wildcard Batch Generator: Replay ===');
+      console.log(`Replaying ${replayTokens.length} image(s) of: ${promptText}`);
+      console.log('');
+      const replayed = replayImages(promptText, replayTokens, replayConfig);
+      console.log('\n=== Generation Complete ===\n');
+      showCompletionDialog(modeIndex, replayTokens.length, replayed, true);
+      return;
+    }
+
     // Log start
     console.log('\n=== Wildcard Batch Generator ===');
     console.log(`Mode: ${modeName}`);
     console.log(`Batch count: ${batchCount}`);
     console.log(`Original prompt: ${promptText}`);
+    if (seedPlan) {
+      console.log(`Seed plan: master seed ${seedPlan.master}`);
+    }
     console.log('');
     if (debugEnabled) {
       console.log(`[DEBUG] Max combinations for prompt: ${maxCombosForPrompt}`);
@@ -468,16 +772,23 @@ function main() {
 
     switch (modeIndex) {
       case MODE_RANDOM:
-        generateRandom(promptText, batchCount, config, debugEnabled);
+        generateRandom(promptText, batchCount, config, debugEnabled, seedPlan);
         break;
 
       case MODE_SEQUENTIAL:
-        generateSequential(promptText, batchCount, config, debugEnabled);
+        generateSequential(promptText, batchCount, config, debugEnabled, seedPlan);
         break;
 
       case MODE_CARTESIAN:
-        actualCount = Math.min(batchCount, maxCombosForPrompt);
-        generateCartesian(promptText, batchCount, config, debugEnabled);
+        actualCount = generateCartesian(promptText, batchCount, config, debugEnabled, cartesianRange, seedPlan);
+        break;
+
+      case MODE_UNIQUE:
+        actualCount = generateUnique(promptText, batchCount, config, debugEnabled, uniqueOrder, seedPlan);
+        break;
+
+      case MODE_PAIRWISE:
+        actualCount = generatePairwise(promptText, batchCount, config, debugEnabled, seedPlan);
         break;
 
       case MODE_TEST:
@@ -1,4 +1,6 @@
 //@api-1.0
+// Shared prompt-expansion core, inlined from lib/prompt-core.js by script_manager.py
+//@inline prompt-core
 // wildcards
 // author wetcircuit
 // v0.5
@@ -31,57 +33,151 @@ const userSelection = requestFromUser("Wildcards", "", function() {
 		this.textField(promptString, fallbackPrompt, true, 240),
 		this.slider(10, this.slider.fractional(0), 1, 25, "batch count")
     ]),
-	this.section("about", "Wildcards v0.5 by wetcircuit \n\ngenerate a batch of images using inline wildcards to randomize elements within the Prompt", [])
+	this.section("seed planning", "derive every seed from a master seed and log a replay token per image. paste tokens to re-render just those images", [
+		this.switch(false, "seed plan"),
+		this.textField("", "master seed", false, 20),
+		this.textField("", "replay tokens", true, 60),
+		this.textField("", "replay steps", false, 20),
+		this.textField("", "replay size (WxH)", false, 20)
+    ]),
+	this.section("high volume", "go past the 25 image slider. every prompt is expanded before the first render, and throughput, mean / p95 render time and ETA are logged every few images", [
+		this.switch(false, "high-volume mode"),
+		this.textField("1000", "images", false, 20),
+		this.textField("10", "report every", false, 20)
+    ]),
+	this.section("about", "Wildcards v0.5 by wetcircuit \n\ngenerate a batch of images using inline wildcards to randomize elements within the Prompt\n\nwildcards can nest: {a {big|small} cat|dog}. spaces around each option are trimmed, so { red | blue } picks \"red\" or \"blue\". an N:: prefix weights an option, so {3::red|1::blue} picks red 3 times as often. empty options are kept: {red|} leaves the word out half the time", [])
   ];
 });
 
-const batchCount = userSelection[0][1];
 promptString = userSelection[0][0]
+const useSeedPlan = userSelection[1][0];
+const masterSeedText = userSelection[1][1].trim();
+let replayTokens;
+try {
+    replayTokens = parseReplayTokens(userSelection[1][2]);
+} catch (error) {
+    console.error(error.message);
+    return;
+}
+const highVolume = userSelection[2][0];
+const imagesText = userSelection[2][1].trim();
+const reportText = userSelection[2][2].trim();
+
+if (highVolume && (!/^\d+$/.test(imagesText) || Number(imagesText) < 1 || !/^\d+$/.test(reportText) || Number(reportText) < 1)) {
+    console.error("invalid high-volume image count or report interval: " + imagesText + ", " + reportText);
+    return;
+}
+const batchCount = highVolume ? Number(imagesText) : userSelection[0][1];
+const reportEvery = highVolume ? Number(reportText) : 0;
+
+const masterSeed = parseMasterSeed(masterSeedText);
+if (useSeedPlan && masterSeed === null) {
+    console.error("invalid master seed (0 to " + (MAX_SEED - 1) + "): " + masterSeedText);
+    return;
+}
+if (replayTokens.some(token => token.kind !== "r")) {
+    console.error("only random-draw (r) replay tokens logged by this script fit here: " + userSelection[1][2]);
+    return;
+}
+
+// with a seed plan, each image's seed and wildcard draws come from the master seed
+// and the image number, so its logged replay token renders the same image again.
+// replay tokens re-render only those images, with the steps / size overrides.
+const jobs = replayTokens.length > 0
+    ? replayTokens.map(token => ({ master: token.master, key: token.key }))
+    : Array.from({ length: batchCount }, (_, index) => ({ master: useSeedPlan ? masterSeed : null, key: `r${index.toString(36)}` }));
+let jobConfiguration = configuration;
+if (replayTokens.length > 0) {
+    try {
+        jobConfiguration = replayConfiguration(configuration, userSelection[1][3], userSelection[1][4]);
+    } catch (error) {
+        console.error(error.message);
+        return;
+    }
+}
 
 // run pipeline
 //
 console.log("\nwildcards prompt:\n");
 console.log(promptString + "\n");
+if (replayTokens.length > 0) {
+    console.log(`replaying ${jobs.length} image(s)\n`);
+} else if (useSeedPlan) {
+    console.log(`seed plan: master seed ${masterSeed}\n`);
+}
+
+// parse once and expand every prompt (and planned seed) before the first render,
+// so a long batch is fixed up front and renders back to back
+const planStart = new Date().getTime();
+const promptTree = parseTemplate(promptString, true);
+for (const job of jobs) {
+    const planned = job.master !== null;
+    job.prompt = sampleTemplate(promptTree, planned ? keyedRandom(`${job.master}:${job.key}`) : Math.random);
+    job.seed = planned ? planSeed(job.master, job.key) : -1;
+}
+if (highVolume) {
+    console.log(`high-volume mode: ${jobs.length} prompts expanded in ${new Date().getTime() - planStart} ms, progress every ${reportEvery} images\n`);
+}
+const renderSeconds = [];
+const finishedAt = [];
+const batchStart = new Date().getTime();
 
-for (i = 0; i < batchCount; i++) {
-editedString = replaceWildcards(promptString);
-configuration.seed = -1;
-let batchCountLog = `render ${i+1} of ${batchCount}`;
+for (i = 0; i < jobs.length; i++) {
+const job = jobs[i];
+const planned = job.master !== null;
+editedString = job.prompt;
+jobConfiguration.seed = job.seed;
+let batchCountLog = `render ${i+1} of ${jobs.length}`;
 console.log(batchCountLog);
 console.log(editedString);
 let startTime = new Date().getTime();
 pipeline.run({
-    configuration: configuration,
+    configuration: jobConfiguration,
     prompt: editedString
     });
 var endTime = new Date().getTime();
 var elapsedTime = (endTime - startTime) / 1000;
+let seed = planned ? jobConfiguration.seed : pipeline.configuration.seed;
+console.log(planned ? `seed ${seed}, replay token ${replayToken(job.master, job.key)}` : `seed ${seed}`);
 console.log("generated in " + elapsedTime + " seconds\n");
+renderSeconds.push(elapsedTime);
+finishedAt.push(endTime);
+if (reportEvery > 0 && (renderSeconds.length % reportEvery === 0 || renderSeconds.length === jobs.length)) {
+    console.log(throughputReport(renderSeconds, finishedAt, batchStart, jobs.length, reportEvery) + "\n");
+}
 }
 
+if (highVolume) {
+    console.log(`batch finished: ${jobs.length} images in ${formatDuration((new Date().getTime() - batchStart) / 1000)}`);
+}
 console.log("Job complete. Open Console to see job report.");
 
 // functions
 
-function replaceWildcards(inputString) {
-    const wildcardRegex = /{([^}]+)}/g;
-
-    function getRandomItem(arr) {
-        const randomIndex = Math.floor(Math.random() * arr.length);
-        return arr[randomIndex];
-    }
-
-    function replaceWildcard(match) {
-        const options = match.slice(1, -1).split('|');
-        const randomOption = getRandomItem(options);
-        return randomOption;
-    }
-
-    let editedString = inputString;
+// progress line for a long batch: wall-clock rate over the last `window` images,
+// mean and p95 render time over the whole batch so far, and the time left at that rate
+//
+function throughputReport(seconds, finishedAt, batchStart, total, window) {
+    const done = finishedAt.length;
+    const recent = Math.min(window, done);
+    const windowStart = done > recent ? finishedAt[done - recent - 1] : batchStart;
+    const windowSeconds = (finishedAt[done - 1] - windowStart) / 1000;
+    const perMinute = windowSeconds > 0 ? recent * 60 / windowSeconds : 0;
+    const mean = seconds.reduce((sum, value) => sum + value, 0) / seconds.length;
+    const sorted = seconds.slice().sort((a, b) => a - b);
+    const p95 = sorted[Math.min(sorted.length - 1, Math.ceil(0.95 * sorted.length) - 1)];
+    const left = total - seconds.length;
+    const eta = left === 0 ? "done" : perMinute > 0 ? formatDuration(left * 60 / perMinute) : "unknown";
+    return `progress ${seconds.length}/${total}: ${perMinute.toFixed(2)} images/min (last ${recent}), ` +
+        `mean ${mean.toFixed(2)} s, p95 ${p95.toFixed(2)} s, ETA ${eta}`;
+}
 
-    while (wildcardRegex.test(editedString)) {
-        editedString = editedString.replace(wildcardRegex, replaceWildcard);
+function formatDuration(seconds) {
+    const total = Math.round(seconds);
+    const hours = Math.floor(total / 3600);
+    const minutes = Math.floor((total % 3600) / 60);
+    if (hours > 0) {
+        return `${hours}h ${minutes}m`;
     }
-
-    return editedString;
-}
\ No newline at end of file
+    return minutes > 0 ? `${minutes}m ${total % 60}s` : `${total}s`;
+}
@@ -0,0 +1,136 @@
+// Micro-benchmark for dynamic-prompts.js random prompt expansion.
+//
+//   node benchmarks/expand-bench.js [--before GIT_REV] [--script FILE] [--ms N]
+//
+// Loads the script's `replaceWildcards`, `prompts`, `categories` and
+// `defaultPrompt` without running it (the first requestFromUser call aborts the
+// script after its top-level definitions), then reports expansions per second
+// for every prompt template. With --before, the same script at that git
+// revision is measured alongside for a before/after comparison. Scripts with an
+// `//@inline prompt-core` line get the whole shared core from the same revision
+// in its place; script_manager.py installs only the parts they use.
+
+"use strict";
+
+const vm = require("vm");
+const fs = require("fs");
+const path = require("path");
+const { execFileSync } = require("child_process");
+
+const ROOT = path.resolve(__dirname, "..");
+const EXPOSED = ["replaceWildcards", "prompts", "categories", "defaultPrompt"];
+const CORE_SLOT = /^\/\/@inline prompt-core$/m;
+const CORE_FILE = "lib/prompt-core.js";
+
+class StopScript extends Error {}
+
+function parseArgs(argv) {
+  const args = { script: "dynamic-prompts.js", before: null, ms: 1000 };
+  for (let i = 0; i < argv.length; i++) {
+    const flag = argv[i];
+    if (flag === "--script") args.script = argv[++i];
+    else if (flag === "--before") args.before = argv[++i];
+    else if (flag === "--ms") args.ms = Number(argv[++i]);
+    else throw new Error(`unknown argument: ${flag}`);
+  }
+  return args;
+}
+
+function seededRandom(seed) {
+  let state = seed >>> 0;
+  return function mulberry32() {
+    state = (state + 0x6d2b79f5) >>> 0;
+    let t = state;
+    t = Math.imul(t ^ (t >>> 15), t | 1);
+    t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+}
+
+/**
+ * Evaluates a script far enough to define its top-level bindings.
+ * Function declarations are hoisted, so a getter injected at the top of the
+ * body can hand them out once the script stops at its first dialog.
+ */
+function loadBindings(source, label) {
+  let getBindings = null;
+  const sandbox = {
+    __random: seededRandom(1),
+    console: { log() {}, warn() {}, error() {} },
+    pipeline: {
+      configuration: { width: 1024, height: 1024, steps: 20, seed: 42, loras: [] },
+      prompts: { prompt: "", negativePrompt: "" },
+      downloadBuiltins() {},
+      findLoRAByName(name) { return { file: name }; }
+    },
+    canvas: new Proxy({}, { get: () => () => {} }),
+    filesystem: { pictures: { path: "/tmp", readEntries: () => [] } },
+    SamplerType: {},
+    __expose(getter) { getBindings = getter; },
+    requestFromUser() { throw new StopScript(); }
+  };
+  vm.createContext(sandbox);
+  vm.runInContext("Math.random = __random;", sandbox);
+  const exposed = EXPOSED.map(name => `${name}: typeof ${name} === "undefined" ? undefined : ${name}`).join(", ");
+  const wrapped = `(function() {\n__expose(() => ({ ${exposed} }));\n${source}\n})();`;
+  try {
+    vm.runInContext(wrapped, sandbox, { filename: label });
+  } catch (error) {
+    if (!(error instanceof StopScript)) throw error;
+  }
+  const bindings = getBindings();
+  for (const name of ["replaceWildcards", "categories"]) {
+    if (bindings[name] === undefined) throw new Error(`${label} does not define ${name}`);
+  }
+  return bindings;
+}
+
+function measure(fn, ms) {
+  // Warm up so both versions are compiled by the optimizing tier before timing.
+  for (let i = 0; i < 2000; i++) fn();
+  let count = 0;
+  const start = process.hrtime.bigint();
+  const budget = BigInt(Math.round(ms * 1e6));
+  let elapsed = 0n;
+  while (elapsed < budget) {
+    for (let i = 0; i < 500; i++) fn();
+    count += 500;
+    elapsed = process.hrtime.bigint() - start;
+  }
+  return count / (Number(elapsed) / 1e9);
+}
+
+function withCore(source, readCore) {
+  return CORE_SLOT.test(source) ? source.replace(CORE_SLOT, () => readCore()) : source;
+}
+
+function main() {
+  const args = parseArgs(process.argv.slice(2));
+  const scriptPath = path.resolve(ROOT, args.script);
+  const versions = [];
+  if (args.before) {
+    const show = file => execFileSync("git", ["show", `${args.before}:${file}`], { cwd: ROOT, encoding: "utf8" });
+    const relative = path.relative(ROOT, scriptPath).split(path.sep).join("/");
+    const source = withCore(show(relative), () => show(CORE_FILE));
+    versions.push({ label: args.before, bindings: loadBindings(source, `${args.before}:${relative}`) });
+  }
+  const source = withCore(fs.readFileSync(scriptPath, "utf8"), () => fs.readFileSync(path.join(ROOT, CORE_FILE), "utf8"));
+  versions.push({ label: "current", bindings: loadBindings(source, scriptPath) });
+
+  const current = versions[versions.length - 1].bindings;
+  const templates = (current.prompts || []).map(entry => entry.prompt);
+  if (current.defaultPrompt) templates.push(current.defaultPrompt);
+
+  const header = ["template".padEnd(48), ...versions.map(v => `${v.label} /s`.padStart(14))];
+  if (versions.length > 1) header.push("speedup".padStart(9));
+  console.log(header.join(" "));
+  for (const template of templates) {
+    const rates = versions.map(({ bindings }) => measure(() => bindings.replaceWildcards(template, bindings.categories), args.ms));
+    const label = template.length > 47 ? `${template.slice(0, 46)}…` : template;
+    const row = [label.padEnd(48), ...rates.map(rate => Math.round(rate).toLocaleString("en-US").padStart(14))];
+    if (rates.length > 1) row.push(`${(rates[rates.length - 1] / rates[0]).toFixed(2)}x`.padStart(9));
+    console.log(row.join(" "));
+  }
+}
+
+main();
@@ -1,4 +1,6 @@
 //@api-1.0
+// Shared prompt-expansion core, inlined from lib/prompt-core.js by script_manager.py
+//@inline prompt-core
 // dynamic prompts
 // author: zanshinmu
 // v3.5.9.1
@@ -13,6 +15,11 @@
  * - Categories are thematic elements like 'Locale', 'Adjective', etc.
  * - To add a new category: Include it in the 'categories' object (e.g., "Futuristic": ["cybernetic", "AI-driven"]).
  * - To modify an existing category: Add or remove elements directly in the category's list.
+ * - Large wildcard libraries (one option per line in .txt files) can be added at install time:
+ *   `python script_manager.py install dynamic-prompts.js --wildcards DIR` compiles every file into
+ *   a category named after it ("hair/colors.txt" becomes {hair_colors}) and stores them in
+ *   'wildcardPack'. Pack categories replace script categories of the same name and are only
+ *   decoded when a prompt first uses them.
  *
  * Dynamic Prompt Strings:
  * - The Prompts string structures your generated prompts.
@@ -20,6 +27,8 @@
  *   - Single element: "{Locale}" might generate "neon-lit city."
  *   - Multiple elements: "{Adjective:2}" can give "rainy, bustling."
  *   - Random range: "{Object:1-3}" could return "hovercar" or "hovercar, android, neon sign."
+ *   - Items are always different entries of the category; asking for more items than
+ *     the category has uses all of them (with a warning).
  *
  * BatchCount:
  * - BatchCount sets the number of prompts to generate.
@@ -34,10 +43,26 @@
  * - Lock configuration:
  *   When selecting random prompts, do not change configurations.
  
+ * - Unique prompts:
+ *   Random batches never repeat a prompt until every combination has been used. The
+ *   order comes from a seed; rerun with the same seed and a later start position to
+ *   continue an interrupted batch. Prompts are drawn in proportion to how many
+ *   combinations each one has.
+ 
+ * - Resumable run:
+ *   Prompt choice, expansion and seed for every image come from a run ID and the
+ *   image's index, and the run ID and index are part of the saved filename. Start
+ *   the same batch again with the same run ID (and UI seed) and only the images
+ *   missing from the output directory are rendered.
+ 
  * - Iterate Mode:
  *   Iterated generation of all combinations of dynamic prompt.  Best used with UI Prompt.
  *   BatchCount is not used in Iterate mode. Iterate mode can create very large numbers.
- *   To reduce the numbers, eliminate categories from your prompt.
+ *   Every combination has an index, so a run can render a slice of them: set a start
+ *   index and count to resume where an earlier run stopped, or a shard "i/n" to split
+ *   one prompt across several sessions or machines. Shard i of n renders the i-th of
+ *   n contiguous blocks of the slice (Funk Wildcards' Cartesian shards interleave
+ *   instead, so the same shard plan partitions the two scripts differently).
  */
 
 //Default example prompt for UI demonstrating category use
@@ -230,11 +255,23 @@ const categories = {
                 ]
 };
 
+// Wildcard pack compiled from text wildcard files by script_manager.py at install time
+const wildcardPack = null;
+
 //Version
 const versionString = "v3.5.9.1";
-//Maximum iterations for Iterate Mode, this is a good value for everything
-//Macs with more resources can probably set this much higher
-const maxIter = 500;
+
+//Categories compiled on first use into templates with memoized BigInt combination counts
+const SLOT_REGEX = /{(\w+)(?::(\d+)(?:-(\d+))?)?}/g;
+if (wildcardPack) {
+    addWildcardPack(categories, wildcardPack);
+}
+const categoryGraph = compileCategories(categories);
+const promptTemplates = new Map();
+const cappedSlots = new Set();
+// Randomness for prompt choice, expansion and seeds. Resumable runs swap in a
+// stream derived from the run ID and render index.
+let random = Math.random;
 
 //Sure, you can turn this on if you like your console cluttered. :P
 const DEBUG = false;
@@ -311,6 +348,8 @@ const userSelection = requestFromUser("Dynamic Prompts", okButton, function() {
       this.switch(false, "Lock configuration"),
       this.switch(false, "Iterate Mode"),
       this.switch(true, "Download Models"),
+      this.switch(false, "Unique prompts (no repeats)"),
+      this.switch(false, "Resumable run"),
     ])
   ];
 });
@@ -323,10 +362,27 @@ const useUiPrompt = userSelection[0][2];
 const overrideModels = userSelection[0][3];
 const iterateMode = userSelection[0][4];
 const downloadModels = userSelection[0][5];
+const uniqueMode = userSelection[0][6] && !iterateMode;
+const resumableRun = userSelection[0][7] && !iterateMode;
 
 
+let iterateSlice = { start: 0n, count: 0n, shard: 1n, shards: 1n };
 if (iterateMode){
     console.log("Iterate Mode");
+    const iterateSelection = requestFromUser("Dynamic Prompts: Iterate Mode", okButton, function() {
+        return [
+            this.section("Combinations", "Render a slice of all combinations. Start at 0 and leave count at 0 for all of them. Shard 2/4 renders the 2nd of 4 contiguous blocks of the slice.", [
+                this.textField("0", "Start index", false, 20),
+                this.textField("0", "Count", false, 20),
+                this.textField("1/1", "Shard (i/n)", false, 20)
+            ])
+        ];
+    });
+    iterateSlice = parseIterateSlice(...iterateSelection[0]);
+    if (!iterateSlice){
+        console.log("Error, Invalid Iterate Mode range");
+        return;
+    }
 }
 
 
@@ -361,148 +417,386 @@ if(useUiPrompt){
     }
 }
 
+let uniqueOrder = { seed: 0, start: 0n };
+if (uniqueMode){
+    const uniqueSelection = requestFromUser("Dynamic Prompts: Unique Mode", okButton, function() {
+        return [
+            this.section("Unique prompts", "Leave the seed empty for a new order. To continue an interrupted batch, reuse its seed and start where it stopped.", [
+                this.textField("", "Seed", false, 20),
+                this.textField("0", "Start position", false, 20)
+            ])
+        ];
+    });
+    const seedText = uniqueSelection[0][0].trim();
+    const startText = uniqueSelection[0][1].trim() || "0";
+    if (!/^\d*$/.test(seedText) || !/^\d+$/.test(startText)){
+        console.log("Error, Invalid Unique Mode seed or start position");
+        return;
+    }
+    uniqueOrder = {
+        seed: seedText ? Number(seedText) : Math.floor(Math.random() * 2147483647),
+        start: BigInt(startText)
+    };
+}
+
+let runId = "";
+const runBaseSeed = pipeline.configuration.seed;
+if (resumableRun){
+    if (!outputDir){
+        console.log("Error, Resumable runs need an output directory");
+        return;
+    }
+    const runSelection = requestFromUser("Dynamic Prompts: Resumable Run", okButton, function() {
+        return [
+            this.section("Resume", "Leave empty to start a new run. To finish an interrupted run, enter its ID with the same batch count and settings.", [
+                this.textField("", "Run ID", false, 20)
+            ])
+        ];
+    });
+    runId = runSelection[0][0].trim() || Math.floor(Math.random() * 36 ** 6).toString(36).padStart(6, "0");
+    if (!/^[A-Za-z0-9]+$/.test(runId)){
+        console.log("Error, Run IDs may only contain letters and digits");
+        return;
+    }
+}
+
+// Resolve every model and LoRA the prompt list uses once, before rendering
+const resolvedLoras = new Map();
+if (!useUiPrompt) {
+    resolvePromptAssets();
+}
+
 // Main batch loop
 if (!iterateMode){
     const bstart = Date.now();
     const bmessage = "✔︎ Total render time ‣";
-    for (let i = 0; i < batchCount; i++){
-        let batchCountLog = `Rendering ${i + 1} of ${batchCount}`;
+    let draws = uniqueMode ? uniqueDraws(batchCount) : randomDraws(batchCount);
+    if (resumableRun){
+        const rendered = renderedIndices(runId);
+        draws = draws.filter(promptData => !rendered.has(promptData.index));
+        console.log(`Resumable run ${runId}: ${batchCount - draws.length} of ${batchCount} images already in ${outputDir}, ` +
+                    `rendering ${draws.length}. Resume with run ID ${runId} and seed ${runBaseSeed}.`);
+    }
+    const batchPlan = planBatch(draws);
+    for (let i = 0; i < batchPlan.length; i++){
+        let batchCountLog = `Rendering ${i + 1} of ${batchPlan.length}`;
         console.warn(batchCountLog);
-        render(getDynamicPrompt(), i);
+        render(batchPlan[i], batchPlan[i].index);
     }
     elapsed(bstart, message = bmessage);
 } else {
     const promptData = getDynamicPrompt();
     const dynPrompt = promptData.prompt;
-    p = computeTotalPromptCount(dynPrompt);
-    if (p > maxIter){
-        console.warn(`Max iterations of ${maxIter} exceeded: Prompt total combinations = ${p}\n`);
-        console.warn("Reduce the number of categories used in prompt.");
-    } else {
-        let k = 1;
-        console.log(`Iterating over dynamic prompt:\n '${dynPrompt}'\n Total combinations number ${p}.`);
-        const istart = Date.now();
-        const imessage = "✔︎ Total iteration time ‣";
-        for (let generatedPrompt of generatePrompts(dynPrompt)) {
-            let myConfig = promptData;
-            promptData.prompt = dynPrompt;
-            console.warn(`iterating render ${k} of ${p}\n${generatedPrompt}\n`);
-            render(generatedPrompt, k);
-            k++;
-        }
-        elapsed(istart, message = imessage);
+    const p = computeTotalPromptCount(dynPrompt);
+    const [first, last] = iterateRange(p, iterateSlice);
+    console.log(`Iterating over dynamic prompt:\n '${dynPrompt}'\n Total combinations number ${p}, rendering indices ${first} to ${last - 1n}.`);
+    const istart = Date.now();
+    const imessage = "✔︎ Total iteration time ‣";
+    for (let k = first; k < last; k++) {
+        const generatedPrompt = promptAtIndex(dynPrompt, k);
+        console.warn(`iterating render ${k - first + 1n} of ${last - first} (index ${k})\n${generatedPrompt}\n`);
+        render({ ...promptData, prompt: generatedPrompt }, k);
     }
+    elapsed(istart, message = imessage);
 }
 
-function computeTotalPromptCount(dynamicPrompt) {
-    // Find all unique top-level placeholders in the prompt
-    const regex = /{(\w+)}/g;
-    let match;
-    let placeholders = new Set();
-    while ((match = regex.exec(dynamicPrompt)) !== null) {
-        placeholders.add(match[1]);
+// Prompt grammar. Every category value is compiled once into a template: its
+// text split into literal parts and slot references ({cat}, {cat:n} or
+// {cat:a-b}), plus its slots in order. A token written twice is two slots that
+// draw on their own, in every mode.
+// A category is compiled the first time it is looked up, together with the
+// categories it references. Category counts are BigInt totals memoized in the
+// same depth-first pass, so counting is linear in the size of the grammar.
+// Self-referencing categories are found in that pass; they still work for random
+// prompts but cannot be counted or iterated.
+function compileTemplate(text) {
+    const parts = [];
+    const slots = [];
+    let last = 0;
+    for (const match of text.matchAll(SLOT_REGEX)) {
+        const min = match[2] === undefined ? null : parseInt(match[2]);
+        const max = match[3] === undefined ? min : parseInt(match[3]);
+        const slot = { token: match[0], name: match[1], min: min, max: max };
+        slots.push(slot);
+        if (match.index > last) {
+            parts.push(text.slice(last, match.index));
+        }
+        parts.push(slot);
+        last = match.index + match[0].length;
     }
-
-    // If no placeholders, return 1
-    if (placeholders.size === 0) {
-        return 1;
+    if (last < text.length) {
+        parts.push(text.slice(last));
     }
+    return { text: text, parts: parts, slots: slots, count: null };
+}
 
-    let totalCombinations = 1;
+function compileCategories(categories) {
+    const graph = new Map();
+    const has = name => Object.prototype.hasOwnProperty.call(categories, name);
+    const compile = name => {
+        if (!graph.has(name) && has(name)) {
+            graph.set(name, { values: categories[name].map(compileTemplate), count: null, cycle: null, visiting: false });
+        }
+        return graph.get(name);
+    };
+    const visit = (name, path) => {
+        const node = compile(name);
+        if (!node || node.count !== null || node.cycle) {
+            return node ? node.cycle : null;
+        }
+        if (node.visiting) {
+            return path.slice(path.indexOf(name)).concat(name);
+        }
+        node.visiting = true;
+        path.push(name);
+        let cycle = null;
+        for (const value of node.values) {
+            for (const slot of value.slots) {
+                cycle = cycle || visit(slot.name, path);
+            }
+        }
+        path.pop();
+        node.visiting = false;
+        if (cycle) {
+            node.cycle = cycle;
+            return cycle;
+        }
+        node.count = 0n;
+        for (const value of node.values) {
+            value.count = templateCount(value, graph);
+            node.count += value.count;
+        }
+        return null;
+    };
+    return {
+        has: has,
+        get: name => {
+            const node = graph.get(name);
+            if (node && (node.count !== null || node.cycle)) {
+                return node;
+            }
+            visit(name, []);
+            return graph.get(name);
+        }
+    };
+}
 
-    for (let placeholder of placeholders) {
-        const optionsCount = countPlaceholderOptions(placeholder, new Set());
-        totalCombinations *= optionsCount;
+// Adds the categories of an installed wildcard pack. The pack holds every
+// distinct option once in a newline-separated string table; a category is a
+// list of base-36 "start" or "start+count" runs into that table. The table is
+// split and a category's values built only when the category is first read.
+function addWildcardPack(categories, pack) {
+    let strings = null;
+    for (const [name, runs] of Object.entries(pack.categories)) {
+        Object.defineProperty(categories, name, {
+            configurable: true,
+            enumerable: true,
+            get() {
+                strings = strings || pack.strings.split("\n");
+                const values = [];
+                for (const run of runs.split(",")) {
+                    const [start, count = "1"] = run.split("+");
+                    const first = parseInt(start, 36);
+                    const last = first + parseInt(count, 36);
+                    for (let i = first; i < last; i++) {
+                        values.push(strings[i]);
+                    }
+                }
+                Object.defineProperty(categories, name, { value: values, enumerable: true, writable: true });
+                return values;
+            }
+        });
     }
-
-    return totalCombinations;
 }
 
-function countPlaceholderOptions(placeholder, seenPlaceholders) {
-    if (seenPlaceholders.has(placeholder)) {
-        throw new Error(`Circular reference detected for placeholder '{${placeholder}}'`);
+function categoryCount(name, graph = categoryGraph) {
+    const node = graph.get(name);
+    if (node.cycle) {
+        throw new Error(`Circular reference detected for placeholder '{${name}}': ${node.cycle.join(" → ")}`);
     }
+    return node.count;
+}
 
-    seenPlaceholders.add(placeholder);
-
-    const values = categories[placeholder];
-    if (!values) {
-        throw new Error(`Category '${placeholder}' not defined.`);
+function factorial(n) {
+    let result = 1n;
+    for (let i = 2n; i <= BigInt(n); i++) {
+        result *= i;
     }
+    return result;
+}
 
-    let totalOptions = 0;
-
-    for (let value of values) {
-        const optionsCount = countValueOptions(value, new Set(seenPlaceholders));
-        totalOptions += optionsCount;
+// Elementary symmetric sums e_0..e_n of the value counts: e_k sums the products
+// of every k-subset, so n! * e_n counts ordered picks of n different values.
+function elementarySums(counts, n) {
+    const sums = [1n].concat(new Array(n).fill(0n));
+    for (const count of counts) {
+        for (let k = n; k >= 1; k--) {
+            sums[k] += sums[k - 1] * count;
+        }
     }
-
-    seenPlaceholders.delete(placeholder);
-
-    return totalOptions;
+    return sums;
 }
 
-function countValueOptions(value, seenPlaceholders) {
-    // Find all placeholders in the value
-    const regex = /{(\w+)}/g;
-    let match;
-    let placeholders = new Set();
-    while ((match = regex.exec(value)) !== null) {
-        placeholders.add(match[1]);
+// {cat:n} picks n different values of the category, each expanded on its own;
+// n is capped at the number of values.
+function slotCounts(slot, graph = categoryGraph) {
+    const total = categoryCount(slot.name, graph);
+    if (slot.min === null) {
+        return [[1, total]];
+    }
+    const values = graph.get(slot.name).values;
+    const low = Math.min(slot.min, values.length);
+    const high = Math.min(slot.max, values.length);
+    const sums = elementarySums(values.map(value => value.count), high);
+    const counts = [];
+    for (let n = low; n <= high; n++) {
+        counts.push([n, factorial(n) * sums[n]]);
     }
+    return counts;
+}
 
-    // If no placeholders, return 1
-    if (placeholders.size === 0) {
-        return 1;
+function slotCount(slot, graph = categoryGraph) {
+    if (!graph.has(slot.name)) {
+        return 1n; // Unknown categories are left in the prompt as written
     }
+    return slotCounts(slot, graph).reduce((sum, [, count]) => sum + count, 0n);
+}
 
-    let totalCombinations = 1;
+function templateCount(template, graph = categoryGraph) {
+    return template.slots.reduce((total, slot) => total * slotCount(slot, graph), 1n);
+}
 
-    for (let placeholder of placeholders) {
-        const optionsCount = countPlaceholderOptions(placeholder, seenPlaceholders);
-        totalCombinations *= optionsCount;
-    }
+/**
+ * Number of distinct prompts a dynamic prompt can expand to.
+ * @param {string} dynamicPrompt - Prompt with category slots
+ * @returns {bigint} Total combinations
+ */
+function computeTotalPromptCount(dynamicPrompt) {
+    return templateCount(compileTemplate(dynamicPrompt));
+}
+
+// Iterate Mode enumeration. Combination k is decoded directly as a mixed-radix
+// number over the template's slots (first slot most significant, each digit
+// split across that category's values by their own counts), so any slice can be
+// rendered without generating the combinations before it. Plain {cat} slots
+// come out in the order the old recursive generator produced; a token written
+// twice is two digits, so "{color} and {color}" also yields "red and blue".
 
-    return totalCombinations;
+/**
+ * Returns combination k (0-based) of a dynamic prompt in Iterate Mode order.
+ * @param {string} dynamicPrompt - Prompt with category slots
+ * @param {bigint} k - Index in [0, computeTotalPromptCount(dynamicPrompt))
+ * @returns {string} The expanded prompt
+ */
+function promptAtIndex(dynamicPrompt, k) {
+    return expandTemplate(compileTemplate(dynamicPrompt), k);
 }
 
-function* generatePrompts(dynamicPrompt) {
-    // Base case: if no placeholders, yield the prompt
-    if (!/{\w+}/.test(dynamicPrompt)) {
-        yield dynamicPrompt;
-        return;
+function expandTemplate(template, k) {
+    const slots = template.slots;
+    const digits = new Array(slots.length);
+    for (let i = slots.length - 1; i >= 0; i--) {
+        const radix = slotCount(slots[i]);
+        digits[i] = k % radix;
+        k /= radix;
     }
+    let result = "";
+    let i = 0;
+    for (const part of template.parts) {
+        result += typeof part === "string" ? part : slotAtIndex(part, digits[i++]);
+    }
+    return result;
+}
 
-    // Find the first placeholder in the prompt
-    const regex = /{(\w+)}/g;
-    const match = regex.exec(dynamicPrompt);
-
-    if (!match) {
-        yield dynamicPrompt;
-        return;
+function slotAtIndex(slot, k) {
+    if (!categoryGraph.has(slot.name)) {
+        return slot.token;
     }
+    for (const [picks, count] of slotCounts(slot)) {
+        if (k < count) {
+            return arrangementAtIndex(slot.name, picks, k).join(", ");
+        }
+        k -= count;
+    }
+    throw new RangeError(`Index out of range for '${slot.token}'`);
+}
 
-    const placeholder = match[1];
+// Unranks the k-th ordered pick of `picks` different values of a category. The
+// first value is the most significant digit: choosing value v leaves
+// count(v) * (picks - 1)! * e_(picks - 1)(remaining values) combinations.
+function arrangementAtIndex(name, picks, k) {
+    const values = categoryGraph.get(name).values;
+    const remaining = values.map((value, index) => index);
+    const result = [];
+    for (let left = picks; left > 0; left--) {
+        const counts = remaining.map(index => values[index].count);
+        const sums = elementarySums(counts, left - 1);
+        const tailFactorial = factorial(left - 1);
+        for (let j = 0; j < remaining.length; j++) {
+            // e_(left - 1) without this value: f_i = e_i - count * f_(i - 1)
+            let without = 1n;
+            for (let i = 1; i < left; i++) {
+                without = sums[i] - counts[j] * without;
+            }
+            const tail = tailFactorial * without;
+            const block = counts[j] * tail;
+            if (k < block) {
+                result.push(expandTemplate(values[remaining[j]], k / tail));
+                k %= tail;
+                remaining.splice(j, 1);
+                break;
+            }
+            k -= block;
+        }
+    }
+    return result;
+}
 
-    const values = categories[placeholder];
-    if (!values) {
-        throw new Error(`Category '${placeholder}' not defined.`);
+function optionAtIndex(name, k) {
+    for (const value of categoryGraph.get(name).values) {
+        if (k < value.count) {
+            return expandTemplate(value, k);
+        }
+        k -= value.count;
     }
+    throw new RangeError(`Index out of range for category '${name}'`);
+}
 
-    for (const value of values) {
-        // Replace all occurrences of the placeholder with the value
-        const newPrompt = dynamicPrompt.replace(new RegExp(`{${placeholder}}`, 'g'), value);
-        // Recursively generate prompts for the new prompt
-        yield* generatePrompts(newPrompt);
+// Parses the Iterate Mode dialog fields; returns null if any is malformed.
+function parseIterateSlice(startText, countText, shardText) {
+    const startMatch = /^\s*(\d*)\s*$/.exec(startText);
+    const countMatch = /^\s*(\d*)\s*$/.exec(countText);
+    const shardMatch = /^\s*(\d+)\s*\/\s*(\d+)\s*$/.exec(shardText || "1/1");
+    if (!startMatch || !countMatch || !shardMatch) {
+        return null;
+    }
+    const shard = BigInt(shardMatch[1]);
+    const shards = BigInt(shardMatch[2]);
+    if (shards < 1n || shard < 1n || shard > shards) {
+        return null;
     }
+    return { start: BigInt(startMatch[1] || 0), count: BigInt(countMatch[1] || 0), shard: shard, shards: shards };
+}
+
+// Index range [first, last) to render: the start/count window, then this shard's
+// contiguous share of it.
+function iterateRange(total, slice) {
+    const first = slice.start < total ? slice.start : total;
+    const end = first + slice.count;
+    const last = slice.count > 0n && end < total ? end : total;
+    const size = last - first;
+    return [first + size * (slice.shard - 1n) / slice.shards, first + size * slice.shard / slice.shards];
 }
 
 function selectRandomPrompt() {
   // Generate a random index to select a random prompt
-  const randomIndex = Math.floor(Math.random() * prompts.length);
+  const randomIndex = Math.floor(random() * prompts.length);
   console.log(`Selected dynamic prompt ${randomIndex} of ${prompts.length}`)
-  // Get the randomly selected prompt object
-  const selectedPrompt = prompts[randomIndex];
+  return promptDataFor(randomIndex);
+}
+
+function promptDataFor(index) {
+  const selectedPrompt = prompts[index];
   // Extract prompt string, LoRa filenames, and weights
   const myprompt = selectedPrompt.prompt;
   const myneg = selectedPrompt.negativePrompt;
@@ -510,68 +804,65 @@ function selectRandomPrompt() {
   const loras = [];
   let myconfig = {};
   if (typeof selectedPrompt.configuration !== 'undefined'){
-      myconfig = selectedPrompt.configuration;
+      myconfig = {...selectedPrompt.configuration};
   } else {
       myconfig = {...UICONFIG};
   }
-  //Prepare LoRAs
-  const myLoras = resolveLoras(selectedPrompt.loras);
-  if (typeof myLoras !== 'undefined'){
-     myconfig.loras = myLoras.map(lora => ({ file: lora.file, weight: lora.weight }));
+  //Prepare LoRAs from the names resolved at startup; prompts[] is never modified
+  if (typeof selectedPrompt.loras !== 'undefined'){
+     myconfig.loras = selectedPrompt.loras
+         .filter(lora => typeof lora.file !== 'undefined')
+         .map(lora => ({ file: resolvedLoras.get(lora.file) ?? lora.file, weight: lora.weight }));
   }
-  myconfig.model = resolveModel(mymodel);
+  myconfig.model = mymodel;
   // Store the promptData object
   const promptData = { prompt: myprompt, negativePrompt: myneg, configuration: myconfig };
   debug.print(JSON.stringify(promptData), DebugPrint.Level.WARN);
   return promptData;
 }
 
-function resolveModel(model){
-    if(downloadModels){
-        let myNameArray = [];
-        myNameArray.push(model);
-        pipeline.downloadBuiltins(myNameArray);
-        debug.print(`Model ${model} downloaded`);
-    } else {
-        debug.print('Download models disabled.');
-    }
-    return model;
-}
-
-// Resolves LoRAs to filenames
-function resolveLoras(loras){
-    if (typeof loras === 'undefined'){
-        return loras;
-    }
+// Resolves LoRA display names to files and downloads missing models and LoRAs
+// for all prompt entries at once: one findLoRAByName per distinct LoRA name and
+// a single downloadBuiltins call, instead of both on every render.
+function resolvePromptAssets(){
     const FILESUFFIX = ".ckpt";
-    const myLoras = [];
-    for (let i = 0; i < loras.length; i++) {
-        let myLora = loras[i];
-        let myname = myLora.file;
-        if (typeof myname === 'undefined'){
-            debug.print("Empty LoRA", DebugPrint.level.WARN);
-            continue;
+    const models = new Set();
+    const loraNames = new Set();
+    for (const entry of prompts) {
+        if (typeof entry.model !== 'undefined') {
+            models.add(entry.model);
         }
-        if (!myname.endsWith(FILESUFFIX)){
-            try{
-                let myfile = pipeline.findLoRAByName(myname).file;
-                // Assign resolved name
-                myLora.file = myfile;
-                debug.print(`Filename ${myname} resolved to ${JSON.stringify(myfile)}`);
-            } catch (e){
-                debug.print(`${e} Is it downloaded?`);
-                if(downloadModels){
-                    let myNameArray = [];
-                    myNameArray.push(myname);
-                    myLora.file = pipeline.downloadBuiltins(myNameArray);
-                } else {
-                    myLora.file = myname;
-                }
+        for (const lora of entry.loras || []) {
+            if (typeof lora.file === 'undefined') {
+                debug.print("Empty LoRA", DebugPrint.Level.WARN);
+            } else if (!lora.file.endsWith(FILESUFFIX)) {
+                loraNames.add(lora.file);
             }
         }
-        myLoras.push(myLora);
     }
-    return myLoras;
+    const findLoRA = name => {
+        try {
+            const file = pipeline.findLoRAByName(name).file;
+            resolvedLoras.set(name, file);
+            debug.print(`Filename ${name} resolved to ${JSON.stringify(file)}`);
+            return true;
+        } catch (e) {
+            debug.print(`${e} Is it downloaded?`);
+            return false;
+        }
+    };
+    const missing = [...loraNames].filter(name => !findLoRA(name));
+    if (downloadModels) {
+        const downloads = [...models, ...missing];
+        if (downloads.length > 0) {
+            pipeline.downloadBuiltins(downloads);
+        }
+        missing.forEach(findLoRA);
+    } else {
+        debug.print('Download models disabled.');
+    }
+    console.log(`Resolved ${models.size} model(s) and ${loraNames.size} LoRA(s) for ${prompts.length} prompts` +
+                (downloadModels ? " (downloads checked once)" : "") + ".");
 }
 
 // Function to extract and validate category names and their requested item count or range from the uiPrompt
@@ -621,6 +912,120 @@ function getDynamicPrompt () {
     return promptData;
 }
 
+function randomDraws(batchCount) {
+    const draws = [];
+    for (let i = 0; i < batchCount; i++) {
+        if (resumableRun) {
+            random = runRandom(runId, i);
+        }
+        draws.push({ ...getDynamicPrompt(), index: i, random });
+    }
+    return draws;
+}
+
+// Unique Mode: positions start, start + 1, ... of a keyed permutation of every
+// combination of every prompt, so no prompt repeats until all have been used.
+function uniqueDraws(batchCount) {
+    const templates = useUiPrompt ? [{ prompt: userPrompt }] : prompts;
+    const counts = templates.map(template => computeTotalPromptCount(template.prompt));
+    const total = counts.reduce((sum, count) => sum + count, 0n);
+    const start = uniqueOrder.start;
+    let end = start + BigInt(batchCount);
+    if (end > total) {
+        console.warn(`Only ${total > start ? total - start : 0n} of ${batchCount} unique prompts left from position ${start} (${total} in total).`);
+        end = total;
+    }
+    const permute = keyedPermutation(total, uniqueOrder.seed);
+    const draws = [];
+    for (let position = start; position < end; position++) {
+        let k = permute(position);
+        let index = 0;
+        while (k >= counts[index]) {
+            k -= counts[index++];
+        }
+        const promptData = useUiPrompt ? { prompt: userPrompt } : promptDataFor(index);
+        promptData.prompt = promptAtIndex(templates[index].prompt, k);
+        promptData.index = Number(position - start);
+        promptData.random = resumableRun ? runRandom(runId, promptData.index) : Math.random;
+        draws.push(promptData);
+    }
+    console.log(`Unique Mode: seed ${uniqueOrder.seed}, positions ${start} to ${end - 1n} of ${total}. ` +
+                `Continue with seed ${uniqueOrder.seed} and start position ${end}.`);
+    return draws;
+}
+
+// Random stream for one render of a resumable run: mulberry32 seeded with the
+// FNV-1a hash of "runId:index", so a render draws the same prompt and seed
+// however many renders before it were skipped.
+function runRandom(runId, index) {
+    return keyedRandom(`${runId}:${index}`);
+}
+
+// Indices of a resumable run already saved in outputDir, read back from the
+// "_<runId>-<index>.png" filename suffix written by savetoImageDir. Builds
+// without filesystem.readEntries can only list folders inside Pictures.
+function renderedIndices(runId) {
+    let entries;
+    if (typeof filesystem.readEntries === 'function') {
+        entries = filesystem.readEntries(outputDir);
+    } else {
+        const picturesPath = filesystem.pictures.path.replace(/\/+$/, "");
+        if (outputDir !== picturesPath && !outputDir.startsWith(picturesPath + "/")) {
+            console.log(`Resume is unavailable for ${outputDir}: this build can only list folders inside ${picturesPath}. Rendering every image.`);
+            return new Set();
+        }
+        entries = filesystem.pictures.readEntries(outputDir.slice(picturesPath.length).replace(/^\//, ""));
+    }
+    const suffix = new RegExp(`_${runId}-(\\d+)\\.png$`);
+    const indices = new Set();
+    for (const entry of entries) {
+        const match = suffix.exec(entry);
+        if (match) {
+            indices.add(Number(match[1]));
+        }
+    }
+    return indices;
+}
+
+// Draws the whole batch up front, then runs renders that share a model, LoRA set
+// and resolution back-to-back so each model loads once. Which prompts are drawn
+// (and how often) is unchanged; only the order differs.
+function planBatch(draws) {
+    const batchCount = draws.length;
+    if (useUiPrompt || overrideModels) {
+        return draws;
+    }
+    const modelOf = promptData => promptData.configuration.model;
+    const groupKey = promptData => {
+        const config = promptData.configuration;
+        const loras = (config.loras || []).map(lora => `${lora.file}@${lora.weight}`).join(",");
+        return `${config.model}|${loras}|${config.width}x${config.height}`;
+    };
+    // Groups keep the order they were first drawn in, with groups for the same
+    // model placed next to each other.
+    const modelOrder = new Map();
+    const groups = new Map();
+    for (const promptData of draws) {
+        if (!modelOrder.has(modelOf(promptData))) {
+            modelOrder.set(modelOf(promptData), modelOrder.size);
+        }
+        const key = groupKey(promptData);
+        if (!groups.has(key)) {
+            groups.set(key, []);
+        }
+        groups.get(key).push(promptData);
+    }
+    const plan = [...groups.values()]
+        .sort((a, b) => modelOrder.get(modelOf(a[0])) - modelOrder.get(modelOf(b[0])))
+        .flat();
+    const switches = list => list.filter((promptData, i) => i > 0 && modelOf(promptData) !== modelOf(list[i - 1])).length;
+    const before = switches(draws);
+    const after = switches(plan);
+    console.log(`Batch plan: ${batchCount} renders in ${groups.size} model/LoRA/resolution groups, ` +
+                `${after} model switches instead of ${before} (${before - after} avoided).`);
+    return plan;
+}
+
 function elapsed (start, message = "✔︎ Render time ‣"){
     const end = Date.now();
     const duration = end - start;
@@ -637,12 +1042,16 @@ function elapsed (start, message = "✔︎ Render time ‣"){
 function render (promptData, batchCount){
     // start timer
     let start = Date.now();
+    if (promptData.random) {
+        random = promptData.random;
+    }
     // set generated prompt
-    let generatedPrompt = replaceWildcards(promptData.prompt, categories);
+    let generatedPrompt = replaceWildcards(promptData.prompt);
     let neg;
     let finalConfiguration = Object.create(pipeline.configuration);
     // Set seed according to user selection
-    let mySeed = getSeed(pipeline.configuration.seed);
+    // (resumable runs count Increment seeds from the run's starting seed)
+    let mySeed = resumableRun ? getSeed(runBaseSeed + (seedMode === 1 ? batchCount : 0)) : getSeed(pipeline.configuration.seed);
     debug.print(JSON.stringify(finalConfiguration));
     
     if (useUiPrompt){
@@ -693,7 +1102,8 @@ function savetoImageDir(config, batchCount){
           const sampler = sanitize(SamplerTypeReverse[config.sampler]);
           const steps = config.steps;
           const time = getTimeString();
-          let savePath = `${outputDir}/${model}_${sampler}_${steps}_${time}_${batchCount}.png`
+          const suffix = resumableRun ? `${runId}-${batchCount}` : batchCount;
+          let savePath = `${outputDir}/${model}_${sampler}_${steps}_${time}_${suffix}.png`
           console.log(`Saving to ${savePath}\n\n`);
           canvas.saveImage(savePath, true); // save the image currently on canvas to a file.
     }
@@ -732,7 +1142,7 @@ function getSeed(oldSeed){
     
     switch (seedMode) {
         case 0: // Random
-            seed = Math.floor(Math.random() * (MAX_INT_32));
+            seed = Math.floor(random() * (MAX_INT_32));
             break;
         
         case 1: // Iterate
@@ -749,37 +1159,48 @@ function getSeed(oldSeed){
     return seed;
 }
 
-function replaceWildcards(promptString, categories) {
-    const wildcardRegex = /{(\w+)(?::(\d+)(?:-(\d+))?)?}/g;
-
-    function replaceWildcard(match, categoryName, minCount, maxCount) {
-        const categoryOptions = categories[categoryName];
-        if (categoryOptions) {
-            const count = getRandomCount(minCount, maxCount);
-            const options = new Set(); // Use a Set to ensure uniqueness
-
-            while (options.size < count) {
-                let randomOption = categoryOptions[Math.floor(Math.random() * categoryOptions.length)];
+// Random expansion walks the compiled template once: literal parts are copied
+// and every slot occurrence draws independently from its category's compiled
+// values. Unknown categories are left in the prompt as written.
 
-                // Recursively expand the wildcard in the selected option
-                randomOption = replaceWildcards(randomOption, categories);
-
-                options.add(randomOption);
-            }
-
-            return [...options].join(", ");
-        }
-        return match; // If category not found, return the original match
+function replaceWildcards(promptString) {
+    let template = promptTemplates.get(promptString);
+    if (!template) {
+        template = compileTemplate(promptString);
+        promptTemplates.set(promptString, template);
     }
+    return expandRandom(template);
+}
 
-    let editedString = promptString;
-
-    // Recursively replace wildcards until there are none left
-    while (wildcardRegex.test(editedString)) {
-        editedString = editedString.replace(wildcardRegex, replaceWildcard);
+function expandRandom(template) {
+    if (template.slots.length === 0) {
+        return template.text;
     }
+    let result = "";
+    for (const part of template.parts) {
+        result += typeof part === "string" ? part : sampleSlot(part);
+    }
+    return result;
+}
 
-    return editedString;
+function sampleSlot(slot) {
+    const node = categoryGraph.get(slot.name);
+    if (!node) {
+        return slot.token;
+    }
+    const values = node.values;
+    if (slot.min === null) {
+        return expandRandom(values[Math.floor(random() * values.length)]);
+    }
+    let count = getRandomCount(slot.min, slot.max);
+    if (count > values.length) {
+        if (!cappedSlots.has(slot.token)) {
+            cappedSlots.add(slot.token);
+            console.warn(`${slot.token} asks for ${count} items but '${slot.name}' has ${values.length}; using ${values.length}.`);
+        }
+        count = values.length;
+    }
+    return pickDistinct(values.length, count, random).map(index => expandRandom(values[index])).join(", ");
 }
 
 
@@ -790,7 +1211,7 @@ function getRandomCount(minCount, maxCount) {
 
     if (!isNaN(min) && !isNaN(max)) {
         // Both min and max are numbers, return a random number in this range
-        return Math.floor(Math.random() * (max - min + 1)) + min;
+        return Math.floor(random() * (max - min + 1)) + min;
     } else if (!isNaN(min)) {
         // Only min is a number, return this number
         return min;
@@ -2,13 +2,13 @@ const config = requestFromUser("Edit Background", "", function() {
   return [
     this.section("Mood", "What inspirations we should use to generate the new background?", [
       this.image([
-        "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAANoAAADaCAMAAAD3w6zpAAAC3FBMVEVvd4enq7T4+frW2dyorLTW2NxudoanrLSqrrb5+vrW2NutsbnS1NixtbzN0NS0uL7LztK5vMLKzdK4vMLLzdLKzNG6vsTGyc6nq7O7vsTX2dy4u8LX2d3Hy9DHytC3usHIy9DX2t3Jy9C5vMPEx828v8XDxsy+wce9wMbEx8y8wMa9wMfCxcva3N+mqrPZ2975+vtvdoeqrbbU1tqusbmvs7rQ0tezt77P0dW1uL+2ucDJzNG9wMW9wcbZ29+prbXT1tqusrizt73Z3N++wcba29+usbiprba2usCqrbXHys+1ucC2ucHFyM63u8K6vcTBxMq7v8XAxMrAw8m9wcdud4e0uL/LztOxtLvS1dnS1dixtLy6vcPT1dnFyM3Dxsu/wsjX2NzO0dWytb2ytby4vMOytr3Dx8zCxsy7vsWytrzCxcq8v8a/w8m+wshudoe3u8G4u8G9v8bHyc/Hys7Aw8jHyc7Bxcq+wcjAxMm/w8jAwsjBw8nCxMrBxMnDxcvAwse5vcO/wsm/wcj5+fqztr6usrrR1NjR09fR09jFx82usrnR1NfGyM22usFtdYajqLCjp7DIytC1uMDe4OOfpK2gpK3Nz9S+wsdtdYX6+/tsdIXS1NmvsrrQ09eztr3P0dbKzdGXnKeXnaeYnKewtLzg4uXg4uSYnaextb3ExszO0NTMztPi5OaWnKaXnKavs7vi5OfO0NWwtLuTmKPl5+nN0NWTmKKSmKLl5+rl5unGyM5weIdweIj3+frV19v3+Ppwd4fm6OqOlJ+Ok5/m6OvQ0tatsrnn6OvFyc74+PqKkJzt7vDs7vCKkJu1ub/Iys/Iy89zeor29vj19vhze4pyeon19/hyeoqqr7f29/jMz9ODiZaDiZeDiperr7fMz9T29/n3+PnY2t6lqrP39/n2+PnY2t2tsbh9hJLy8/Tx8/R9hJF9g5Gqr7bT1tmssbny8/XP0tbJzNBJyLOFAAALsUlEQVR4AdTUg5JDQRBA0Rcn641t21nb/P+vWfddTewuvlPRrZ6M9j46vYxBkzFiJrOYRfE6q01sBVvldWvYOraBbWJb2DZmxxyYU2EuzI15hLwLmoYNmOabRJp/0dIUW1v4AzlGmvVtAkGZkFXGgYWxCBbFAjGxOJbgdR7MjSWxFJbGMgrLYjksr7ACVnx70t4bS3SX6a5guirHsCZWxxrstPm9K6yFtYW0DraD7Sr2softYwEsih1gHuzw7Ul7p6OeaV4yDNgxrzsh41RxDFVpZxNOyyrSspJ2PuDWTFhdkdZUpE1ma66ht3YhaZcDpqm21iDtanG2NvyBNGHXM0i7GeO/NsaBvJ3pgRwjbfhr5HaMa6SzfNfI1RJuzTbY5X+1aFs7eZs7q8z9icy3PTTEHrEnXpfEElhOYWnsuacVMTf2yt5dMLmNPFEADzNznPzhbssre89hZmaSYwjHCsMqzMzMnI97b6ajZyXlcsVRRXuz1+1Z6N/NjGtKvoqmS9L6tCJtO82jlWhlZL965l/hOeT09Dc1uqnpyjP/Km1H8qUlO2o9W1+a7teaH7XRuhVt/oHUpWW6tKKlH8idiIm7du+SNn6niT14xQ2pjb27ENY22l6Gt+1Dal1M5oNZ3o9MpswCpLXLSLQyUrEaUonAirECMunqWTNR71cWQ8ujl3T1aAWkLZ0e9+7+mxo3To9bOmoHaDNdOWprEnwgZ3X9fu131UaWO1AbcaRYpyVWrY10TbEu+VE7iNhy6PChw6YdPoJMYr+1o+A22jHaNtpxiAzP0gpIhU/U7STAtmLdkMqEWVqnEWshzf8226HDOVoJXYQD2ikMlAlPI/vhuEzu95Onx7RYbeQMzyFpQ/o5ssvur7ts3WXrLluPWvcv1ul1I47/v3YW0TEqisJZiXNxOwewUaS1RxSzPC2MzRdNmKP57OfRSrSggXkNxpZpnd8bx7pWG0mwqdHayDr3K1qu1kZyust29kKmBEfNgQuZVjVfWvq1kbSKdc7WRjYiamE2F57vCM+HuY0bL5h20Vr2PDj8ayNSGz4kG+LbeW+jQbEw7AjR7/wlZBciy0LC0PQTu+iflwnFLtt+VzCX2FX0kgl9IyH+g5jVa9kcxLxJgJHCJZi8iY8+YqeQyoQlZMn3awmuG9HaiNZG3NzUaG1konsfSK2NaLEu+b9rXX/USojAj8IrRXGddpXm0YIGVmra73SD+YKm5sXH/sL7tl4bceIKhNXduzaS/O6Mf2xtRC9kSrDL1tpICkfNvZu8Fv/+2sgKBy9kosWW5kJtJLgR3Lh5MYpbNySC4DatE+k3pN0xqeW65b91ilsnUul6iXb7rh2JuF03ZII+zUcmWqJ1IhW8RKshtRjvhyyF02OtjTiyNK2NVP+9W1Et1uklMVqHzLhQG9mIKLS1td3Dq+3eiY02aOZbkeaLoYW0Es37zoRzMROJ2zUxtFi/BnYfJOzRAhG8AtppMXxdRdbCOWSC2ojru+y1rl8Sk7w2slJrI4mOmtO7bL07o4WluXuTV/JHqWixLoWa//8QHWNGjBgzYgxaAZlEzoq1s5EVrZlv7RHFLE8LkQrH5qP5NE8E327THtBKNA8pDM2nlY1ZLnzXDw2xHdnPnEOeaXp6/DDRVlRrI7QUlqZbUf1Aam1EayN6IZPDtRG5w3deFPeQSTSyPG0irfYosiytEFHMarSwqflNrUwr0S41sABZS+eQGa2NdJ/bhdyvjTTe1Mxy+e6Mni7fU5PeY2aTL00fM6uPmX3o6IVMjxFtT548ffbsCeI5MoQY4pmxF5FNQvbymdH97DcaGQz4inYP6VM7Pk+baFL7JgVa1piZ7plPyyGVCevWgT5inbGx9k2Ad2i5aLont5G5u6nR2ogDR00fM6uPmdXaSPoFBC3WnUHUn/0+uR9SG7Gl0WK1EVqsNkIbzPmG0GJLo8U+kAKI2NJosaMWja3EllaJ+sWWhqxHBjF2QBSvM1Esov1vcmQbaaNp42l7OXZLU5tI2087QcvTsrQaLUcr0C7RfFqArKX9WuZXnlyhd2fokyv0MbNL0njMbAoFBP0TPFobWeZCbeQhYkq/KKZOR2pjKW0CLUPbQJv1JrK1tCHsN4c2l7aSNp+2QAAxgrZ+YGRjaZM49v+0xRw7nrYaWY+3796+qy6dNm3ptKWI90jfvnsHW2BEDKlgdak1tP/bPgY/IAWJAY2+tmZ0PEC6TgKI5U1q7R5EJmy372GsaGyasUI03bsTYvhWQ4owtjSasGZHvoUVIWI+QB8U8NuWppsarY10/dK0NqLXjehdh5kzCZ4xXmmwtDMNllZJ6QP5ETHs06fPeKHNQybxpYGNQSq8gLYIIO0c7f/IZPBZ2sZP0YQjfzS0bbT9RiyPo+XF0LK0mhlr2aMVTGrtK7LWT4+1NqJ/gkdrI/qY2fSfe5xa2UcvZHK/xDr97/buAViOLAoD8MS2bdu2bSdrltZbRgprl2LMxLZt28nDnd15XG+Z+5/z5vyxk6mH+78b3K/OuZ2Ou3PTjTSb+SMyE2ne0tJn5o9QwYqzzKrCMkYP1rWZjSIp+7E/bQ7Xm0ubJ22K82kLtFP6O9FKaqtwZ9pCAAKrQqstU8WutM9nSqdgX8wCwVBo0eIlS5cs1ZQOLgstWxZcFAoW07kwbFkoFAyGgqgTQsoGQygMwZbfNtRhwDosUUJqog4DzUN0LvzKInTqgsNpjaRT60YstQXrL7ODTNcqsUZBdILN5LMV2inf6vIyVR6Jvsy9A+H5r7Ir+idX+Os1f5Xtr7L9j1qO28j05O9fK3R/3Z37Rp7s/WsraSVoq570J2SrR55aobtObTXyxpo1a/GBsW796vUAZIOI8kbaKtqbtNJr1sJkjKd1kRq1TiKaX9aa1aANVhOuAsvgV9aYvb3arC6OobZmBK3+GluwoYhiUzUUqsX63kjmf3JFpt+BkM3/wZen9oyv4GmTE+6NxOTU/EYm/wqezP8AnGf/HfLRz2KlfZvZ/lzbhGzcbNmyFVPN4tu2zWwdbQPrim03W7nJ0oF1pWlDaINpVWgVaOU374jaK7QRrNv5SHuf9ipm/t6If3KF34HAU/P7RvxGJv8Knuzw28iu3bt2Vcy9J/ceGXvyBXYhYnnvMBWkwAOsoIjaXjUZRTIMn38pplxMTEdxWgmpUitph91Vap8tuNBsd5nbtl9RLLct2GWXWXmpUduJaeAAMu/goYMZKXIYU80R2tFjZhuUJOtoE2jvsLf0IWueT+ty0GwIrSbrahywHOd6w2mvwDK4Dnsb0eqxrimtMWaZ/8kVsbio8a/gQb58mafmX8HjNzL5x8z6V/DE9u7xboud2p7cLWi5aPlorWk9A2bf0r7cb3bHqbGXp7anI60TrSxtoNm+LrQqtJq0rid4ajT9UTuJfHvq1KnTpyRfnsFU0+6U5Wvat1KlKXrGcCPtK9o7MlXewN6ztIW0j3iM2ictlaRKc+7kyWhleTXhmneYLXievfVor6DqvntWWfmvx/7eiN+B4PeN+I1M/r8L+S0xF5ACFy9Fs1eml+WzvJdoVzBVznuVdk0JuX7DrM0FSxHavAu24BSud5N1JWilteYyRilaFzvs5TL3GrQKrfZlO8gI2iuAwGlk2q24uHh8xMUXPCVztThJPDiBNg81anFFaBtuaSfGxtOWxFsoUy7GuglxZuNppePsIJ3ZO1iqtPQHWgU1aa7C3lekSK0e6+rfilp8Y8wy8Wb4gbG8qPGPmY39qflX8PhX8OSAfSNtcsAreDLf75DOhd2vpN/CLpIUjrgkl0yrKOYizrm9tB4wp2PSOLMUWMSFUfoV676VqYuEnVtAm68mYwNtvAMkoTmpHG2Ic0kRPU5N2odhKRQbTKunqyWFw+4VWsOkSFIgFSmYlh5Nz98x1STQpv1h9iftr1TL3/+wjraOdf9yvfnplpKsG0LrQptOq/kA+49WJ+3+ukpmaa9g5u+NZKqLGv+Y2f8BkrA0rReJd/sAAAAASUVORK5CYII=",
-        "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAANoAAADaCAMAAAD3w6zpAAAAAXNSR0IArs4c6QAAAwBQTFRFDwgHEggFEgkGEgoHFAsJFw4LHBENIRUSKhoWQikgMSAbSzIoUzQpWTYqXjcqYzkqZzsqbD0rcT8rdUItfUQsg0cthksujk4uklEwmVIvnVYwpFcvq1ovr14wtmIwvWcww2swy3Ax03Yy1n0y4H0y4oQy5osz1oU22Yo43Y865ZI45pY67Js76p9A4JtE2ZZC05JC0Is9xopCyY9FyZNL0ZdK1ZtM255M4KFM5aNL7KZI8KpL869O9bNH97ZJ97hS9bRX77Ba6qxW5adT3qRV4qlb5a9m7oMz84ox85Ix8Jc19Zw09KE39KU39qk49q4097Uz97wy98Iv98Y798s0+NMx+Nsw+eIy+uwx+/It+/k1+vdf+vmO/Pzq9q1E9rBC+L1Q9blC98BD+MZL+M9K+ddr+M1q+MZr+MJu87xv7bdu57Ns3q9t2atq0qdqzqRnyaFnwZlfw5xkvZlkuJVispJjrI1hqIpfo4hhn4Vim4JhmYBelX1dkHpejXhdiHZehnNdgHJfe29edm1fcWpfbWdfZmJcoFIulU0tjEgsekAqVywbRiATORgOLhMMJxEJIQ8IHA0GGAsGFgoFXllVYFxYZF5Xa2BUb2RXe2lUiW9RkXVTl3pWnH1XonxPpoFTrYROrohUtI1WuZFYv5VYxplYypxbyp9h0KJg16di16JZ0Z5XyZdQwZFPvoxKtolOsY9epYVayHUywG8ytmszrWczrWIxpFwxo2I0k1c0l1w1mmE5omc7rGw4s3A3u3Q2w3k1zH41z4Q5yII7xH45vHk6s3Y8q3Q/o3FBoW0/mGhBkGRBjV8/iFs+hVc7f1I3bks3eFdDd2RQimpKlHFLmnZNoXdJqXpFrH1GsX9EtoNGvohEvYNBun4+sns/l4Fkk39lkH1ljHtmiXllhndlg3ZlgXVlfnNkfHFkeW9kdm5jdGxjcWxjbmpibWliamdiaWZhaWVfZ2RgZmNfY2FeYmBdYF9dXl1dWlteV1ldVldcVFZaUlRaUFJYEAcGDgcGWNSFQQAAOWdJREFUeNqU1s1vFdcdxvHvc67NWwnYvBiSdt1FIjatwL5zaf6KvJi+yJi0XQQw2zZUXWGpW2zcNBvAUiMXmkX/h3BfbNgk0LRqu0JRWnBsLkSBxL5znjKZkUdXI9vJM3PnzNFIo/PR+Z1zRx/RGwBY22lY926aUG8ahLEEQtRp15shRAJYySKjzbGmbXg17Bj/IIaHtYCIBrDTo/ZyMHxSZ5F43E1qSm7PpvrgwTPYc8REYPziMcZ9M/R68cNfyggsKCMATBnhot02ujMIVi/GvalZ3ym7iQyE2v3XbkkGABloUKSDn/MNaOfQHyBd6AYJW4Yoe2Q9Pg54D8Ghg9YiNAg7TnFT/5OPRkR8U/xZ/jm+wd3u+qT6OWLrbI/TRwCs2dJOvt4FtxCGRkchjrZkk8dCyjkkLUN+P3B4+p1jaYxPJUWBowNPXoiSYHct9NxutOwoxMlBvXlTwOvcTGPtHk+ihjzNRT2+f3BygA2dv93EyCDnzSa0nh29P40C0yTUm0o6yrs8PGwMQABDEYOBnyzVxIloPRUIcIqwBNqNFsO+J8djC2wIye3kk0vc0BvyzXUUvXhCi8PAo/jpiN+SqtVohGVE0dtyFq0+mtYMdhyO0eA2EaBBW67T1lgLF6DuMIYyBtWUtJMIfCkhwI4jvcGHktilzPbCF2tjbWOUtGncScZldCOmtV5sidGOkqac2v6V+kZnlROILEMR5d7tilQfS093P4O4X/QMiJZGO2OAAkvxeBNc0IboixFq0EGu1/QYBwSOhwlf81jfM205WVIvxY+GgZVDSefkwD2mFyzd7fbG6KSNZoM2PfNrKCjFT/Qhq/eiElmUtID5ypmNFKxajZiyOGru7LOe/KiJoczpa8KTcN0gQBJ19J9XBgwPJewRhwdDdMXe1hjteufT73sVhkAytYZr/3zF7bF/PF6LVgQcQnpGohqZkuHirlKWwqJayvoY8RW7nrEXtUe/3BMGhO3aXTh2d1q//eLHt0weTwpfg8lrynDgeSYucwC0Y/+0DX8ND/ARwQOAA1pPoZW0TUbLS5qGpH89PhFZ6qVgAzX7LcS2qY6+7FUz0Ew69V1oL8SQsFdoHN8YlyW/s3BPLIUUDICunvlGBmQtwDysHqDeeXJxOoXXwsyLtoU5al6Pv/9h/NtIi0x2gXkYMo+aATUWmzb1pjFAiivbfaVr9ffBWMBmu6TeTV8VKETBYkiMxn93jHGZhdg+Ttt4ZcgAnIGrz13ZCRSzRjZthJNLjfHUCDHz4hsyly/YZvDtns0qGQ0yXXdIEvW2MWbi+hkE9O37qm6G1bEjl+VplAOhjOay8u/U2yStertR6+z3sV6Nv7+sVuzVDU0Zu5BhChfXJjHMT3iGswuoFpN/X0oNlqRoBMa7frMSlw+twhQIcX1D8WioO8SErhU0EFQjXClEC6pRZSPRFQhqtOt0XKetQcXRGBQttx0Bg6GQcTV3uVzXlyGjqX47JD9dN8iEWg+B2eGLy5FTczAlS5DZikygvgmTxTbZ/u9cFJHJaCChRhMadD57aYy2gDGagOmjubhUaKjmgf3TgijLLHAP9HLaSp3LsISukmeS66dROZqtdRaVCIuybKtbSkEDhCCQtLCSzmd+ydjQJytpRazLUzOZTYCULFna1x1dHO4eb4X6YliPmIzGBUCosiv026BvqFbebFGHUFmbAqwNmjausgSZEEMhKWEG2Yiizwyc8wKfHwYkg4xCjDIBe/nQqcAsMIVQP2NzmzdDWFBRFnKL8oFwHw1UXozpHlhlKKeVMLzxspmpjHbevsLBXJfnwRGyq0aWxbkwS0YTIMF2OJltotzRL3altvWnFGEZymeClXgkGuiS0SbJYywwgDCFjAjPbSvlJB9eljmk5UMrnCMwex6ETEBsFvGdUwLl6jt0hfB5DCMpEBq3AFg9aKT/hsEhupjh0wBWTqPMDADnjYFSl12zn2XBOQizcH52CgjVVb/JmvO3parSL2lSzUnTWDtqrKem+BAOD478gnm6XFD5p5lPFaULIAKA54CzzFHk3BXIZEhAQUOAZUCmOq6ygEp6fn5nm+bUPWhLOBkY0L1H6445DRm6Z98vbC50MzCVu3KZFQErp52dK0wbPshJIAjbfAtWq83IVYRBm+DKKtV7ywdlIam+Yxxd7PZi5GfvZycTXAbODsgALsqwMM3mMgNYV855jkrOAiAkKrjt15lMf0+WBSaPtnyF9G7R1jzYGIe/fJje/8EKXJifAMpYZiYz5aRsYwAiIGNKVlUnCwHKDwOKITssymxRdZaRUQVbHJvY3ovwaFhScmf/JS4+SXt4lQswPyEwRUy5uCj3SLBsNqO9/ccMl7sogDJghFG55rbSufL0/wTBTY6dB2Ke0fN+7HEGdoL8rCITx25qJR4ZbpNVdSkVs4i0e95Fsm5dUhl7I6bsJAsJELgbcQBJQAx9j88BYFkD0wBgv/1TZvZ6+5//5v/9//RH/iuDAHmCRwgyspBPAAC4XC9XF1fvZoYZWAAGMFgsEwYQGlhrMsACDMAyYC+Z/9N//Pd//C/w9/FH720taC0CcDIBCz4C4AKul+sFrhdc380wMwAABgYAYLFoaABgAAAMwAC7+qd/Z/bq+OVkZ/zxvQECnnj88JhFRgDwEVwAAABcv21jjIEMgMEEDABomsZ5AMBoGoABGLDf+RMY/Pof/vd/8IfvPr03IMCTR2RlJGDIJy4AMoAGXHm3WRsWWCYMi8k0wAjQwM4NgLWwGIABYHv+q9//CeAPf/pP/u0fvvPpPSbg6XGBGjUCYPnEBbrChSsuYAA2ZgYAgDUArGUIgDUygzAADIABYM/+L779O3/5d/CXfHoPAJ4ePzwSgthH4N349G3PF8T14YWHBRhYBq7vjIOBGDSAAQAAAMAADGGYBsDQ2PNf+T18C3x6/MB7gKf35MNjSxrBJ/BuTTxfiOuDlwd4eQAwGGDsAMB5AAOsaQAILAMAi0GDATCwTGs/ye8Bvht8eA+e3tOCiJbGJy7Ys3fieul6CQCyBsAYjFfOA07gAAsDMAg0aMAAwIKxBtYAwH4SPfH44RHw4dF48jh9eNQkouX5necLAFquDyB2Ahx1AKwNDgAAx3kAMGEgsBgZMAAABgMYAPv01yJPHj88ApgnHheaSEJXFwAgXB9wggWAowHD2qwBoOEA5wFgsQBgDbBG0wAYy8AA2M+RPD3CB4/gwyOAQJJnF4DAgpCA1gCADbu62MA0WQwcigMASBMHGMBiWQNgGQYD2M9RCAAAIFpKAAGA6wMJjSwY4AjDy4WNBgAwgAMA5wIwYwBgMg0Ag2EZ+zmSp0cAAGEklBCguV7ycsnyco/IBIABxmADgAHAwHEeQCEwjGEyaMAAgDEA+1kUEcsyAUAJBSBAs0QEAAADZrDJAA0DMA2AFS2DscaAZQAYAGsG2M/kRAQAAJRQaAEyYUIEAACmtQEHiwWAYQAmyyjAwDA0AwyAD+8BDIz9rFAEWgbgtAiF6wMIwFqIEAswMrCGsQEAAMMAoAUAwwBMW8YAfHj/9B6wGPazKKIsCxYEQtLq9oAAALUIAAAGMDZD00DWwBoMCBqAgUGDZQYMDAAwr/7TfwZoEFAQgAT8mQAAZBEZAAAGzAYAAAMwAQIsgwEAADAwMADs+GsAy6SqqgpAECmoIpUiUqqqqqoKVaiCAqBSSShVlaqIKgEACqESBQoAB4qIEn0qBqiKRJBACSGCFKoqUYECCFSdhdAaAAhUAAAAKhVSAwhAB8jYwPOnPFcBqApAkqqqooiACnAqiVCqTlTUgKpTFUVK1YlAVVUAoKCCEuQJcEAAw4VLz8/Pn85Pn6oKQAiKkqqAFFVSlSpVKlKnTlVynmcSU6UooeJEFQpUVQQKpJLCk6enJ09PT4cCPgi5Xnp2Xz3XL78UXEEUqiABChAkVVWiioDaSc616exUJygV6kRbgaCqqhBAhRDI4yOePD4eAZ4ebY7B5eEF9+5fOuHqqgJKFEAVAgglIAWRhJSkQFmBUAlAlBIBKgJAQhoFHn3YTwlBTim5XghuXK54EC/3IgAAhKQFAoZhsBlkoGkNA7BGyDAYFoABhsE0jNEM2E8FEX4hXXlA4AYeRIQIAxlCJCAAg1lsRsuy1gADGAiwxhiAuT4YADZYBoPBsJ8KtbRT8gy4v93jdt8sSARhBAtEAi1AZoxwzFq0ttYAA0wTAMbaGoDGXLk0jAHMYAztp1OnPuE7KZ7hHsDLnQ0RgQBoQBFagMAMybYtWANgDRgIYMAGFlh7eWC9PDANMw3DrIH9VJ0f4dzoXXt+93y53gO84H6IRBAAgIQAWgCDmGNgmixrmSEDyABmDABgsKuHuV5gzTAOGuyn1NmnnI51f2PhHl7uccM9iCSQZQ2QEIAAEMO2AbBYsLYwBDQMY7AYAAaYBpjru3HQGr9KNpbSy+zuBbrx8HLP/e2ewO1OIhDJWggBAbJQDjMAIAIiyEKQyTSZIGCZ3O734uF6mevFlXee32k4Z9iPofNjOh2Mcmf47P6m+893bm8zQxIEGC0EAiAkn++2A2bAssAAGAgxzGAAFgYD3ABglzFgsx8l58d0vv2yLbm7efsFDLhTgJWALAMEAhDpS+42hhkLjBYDDIDEhjEAAzAYgNvDy8ML3j2/4+qdMexHSn106tzI9MYXYWO4o89vE/vsLZkARhC0QPkSd2MYGwAAlgFGBGYMDBhawzAvDwA3MODd87eY/SglH1Qny6uKesP3x3n3/YH7z+LNqZYNoAEEApEvmbeDYTYAAIBlmtDA2IABAMNgXjy8eIAb3l0BfGv7sadH0seq83zzxV4JZ2/6MueO42++PzaR84368nbD93vz/RsM6nvegMgXugPDmAEADRgAEAybATAAGAZu8MANvHMFsN/xyImP1dlvbm0HVtVx5tjpOGBTOZk3X7w9+P7N9/DmyxvBIF8UW8LsbmyghWVZaw2MAAYbBgAGDAw38OB2fwMDsN95pPBRnL/85vwMO1YlwGY2vfmys6128Ddf3u77N5/vfIbY232hOmVHEezVq7cWAwAA0wAAM8MADYBhYLjx4AZggP3uUcFHLs/UL+dvPsN2ksJitmFay+EsHN399345bdhUBUBlM6/uNwOQZQAAgGE2AIABhgEGtwe4wQD73XcBPrp0lfrlPIUovPbD669888PGFpZEDsfOsxXb4AT0zd+XE445vNrdYQIAYBnIwJiBAQBrMDAYbvDgBvDOdf8M8JHLM9L5SwmVeP0V+OYHGxABDglocEz69dfK6XQcm9lxeLuB1tA0ACMYzDAACwYGBgzjBg8vA0z7Zz5+9xG4PHPvpc6z0ij12lfIfPP1mx94/ZWGb/xg1RoNmr3+2nlSHMfmPI9j/Gp3A4EFrAEAhmEwIGsMDAYwDDcebgD2twBcnhHJ+UudjBRefxVA0zLWkmkC5KSwvZr+5eTYjh2vdg8AABYGGQwGAwDMwjBgGMyNBzeA/W0DAu5fJDrPqqXAa74KIQYZGgSncxJ20El79WrHtr0dQKO11gBYMAwGgMmAwWBgsGbcPNzub8B+yzvPsPBwJVJnOS0lIUOEnFoDBBGZYON45TgOzFsGWawFrAEAw2AAAAOG8cXd5zsMzNx44Ab2WwDwQC8SnZVTv4Z/qNdfA0A6EdoKSGBm49V2zMDeAgC4ce64swwNMAxYFmCAYRiGz+5hNwP28NL2WxqAe7pJVFXtz//xL/7xL/hBr30tYIk/+x+tRYDQZh1//r9svRrM2FsAvpRNZ52/ekX2FjAYDACAAQbDvtx9xt18vvvMGnh4Yf8NeOD2r3Sda5Ae1X3mf8/pd0bXmdHFGPBWrMtIdgJ2nA0GJFlO1dZmK958jWtJspVgO0g4a4yIMRfHqdrsbmwgGBuwsxsQisNmP4Ta2o+bOFu5fFghgQFXiA2OQRqN7DUBc5E0M9JIM2+fZ/uc9KlT86rmnJ7u83a3VP17n//5n2ufl5zTqiuxY8R7jsPerFstDaweIxpAGCtvJpMJgpAkoCWEHo8DCQpFsAPGJZsouLILFQKDVplkdvggCDhMFuXxkUyp/wyo0GWwgmaicwCx9xhc8zIUszSZDBskMLJlZKzyaEEfPSaGVpBkN0Q3jhSvY9UZnwrhAI+T6UGrvz5UsA48cYsApTQkxW4FCh7IGQ1QYstolczFmUD59nztS7lMA1zcPK7eQRgERoIQ2H8sRoH2Px0JudA3eWeikLoikAhBQQj33oYq2mgFU+65U82cJw6m4+WSXgl79J9GZ5N45eBEdARhwz4AqjPBUURMzX89dB1WV6APsUF1YIsWGomP8HR/fxDICCobwJHfGnnwxHLw8IHDB8itji6t3CVQ77nK7I3o96tt11D72u3eRx6DTJfR3JMBxox4zqIhkkB1Uov0kaPIgA3EIBVRJAmgd+cjNFkiP3HAUoGjayt2cIxM1AJdNbhmMOZ/9XcZjapbJcMFznt6NJnCJhx1/bPYphZVtXjj1fcBSELc+Fx3J4GwYkhAdQKZAqo8WTaossk9zy1CRl2qEy1lMSocwgJ/PLzmzY3+NQltBEtWHYwzdfDS1DqJI8KCCP11A4LyQbzK+4SQBRlwxUxc2SgYUJAALMgGNsKWDM/CRjrQpQGRD3SfV047eM/YTy+I9ua//KWCNlorKGgGE72H47gnY/4fDG15RJkbeM6g1tiAcI/LiSydEPue8Z7nEHX6OwY0DL9wXCtn7SLI9kbnJnzgsFx1BsBCILpL1Kc29o6w6coLE/PAMFi//57XoAZVMqqnTIVbz9aLZmq1KwjAEUXHHvgH77NxeVQhSV0hXseYe6NmACGMTEG1CEb1/RsbQNLKG+sdOd7Imcn/8o28BIeHcamohhllQ5HChtlzPFLIcBRwfVKLpoXrXgho//yLfWvIKa+9ArtNj6pXk3GGTOdendh8lGOgaqQg20QU5IQsg6sLVmAkCMwNHPM+zm3UB2+KCHhUkZhVK2CuTcByosgmvOeY2QdH+bm//9CLrUbe3HHzoRdNRNfreHQ5/8pu11plUNrRuZQb4Tlws5+nKR5u39EhIUJUCMVlBjkC7H26ewn5GNp7nIYClXQ6ZspqIXOPDj2+pEsAj4V46JGimqkl0kqrNEW2/N3MTR4FaHU9NWQthEFczzMYct8BvMouI6A8rXpoBSzjEAkhijYSZVQs78bntf9Y2HsspqZv9X9o37eJQnCDS5VW6CMd2jI0NuDwyCHQf9TowJ+QKptxiXt4OnvIn+XF5Pmfu578/T9L2kO2TlD0XgCO7ztanGd1EKMvWDcxUg1gdPJ80+w7ajpG9j0t7Us1m2bfMe3l6RgjRgSJ/cfEPs4w8WW++AFxExGxKB3mx//ixxSBokA5Uh150S3LBjDPi1m1Z/c47TDd4caCxvUgju/FSnhGEIFChg2yhaIAhFyO2s9RMEiBgH+e73QOWB/labP/KPuBo25tICAa9nPsI8+KnYEt78g4fP0p3xRB6IjNj43cwzHat+kinVPLZm9Ge7GlGiRyFg0D1/FCviQDJFllHW+NEAZDPVTcAga1uRoCVnCMaO9zOPspfWcYQdKeb19nA970TuQU2xFGhv3//s9tBfSavlkqgf+v2KStHu2nfgQ1x3XtNs6+tA84uoIsS5btsUkOZvQahP8L2g/AUePa01coawbHArI7hX08E0M0dI50z7fRDU/bSNr77evDcM3ixJeC/cW5GDHVysNHiBHWWvoTReDU9h/+FD/CGNgOnN52WlTZwL4Retnmv6MPS5RgGfwc14FfTGw3lAuQNDP7sRJYtjYnt1mFG3lbXAZxYrcU9nDc5qPm6c4WbUjnnvN1WGFNJPhB8D3nWyIuaoe9wfGcDVd2aEQAw2m2AWQwAPwjs+10F2dhx8wNSRvOTc7j8ML1EjUY8xxJtZ+zeKGg8dyHhQRGRy32OwPa2IBrnY5a2VBfDr4/ZS3rKNGg0EFxPR2YmZiThbyRCAvw8r53IgAEfWPYPKyrX8dGfwIOBY6OYrsMMLs9RTjt7cyyfbZXDTxfq32yLMBkNl/H33d0L/SZzbXjUNkmMYUN3OMhah+EqO4RyTYKH3X7/HUvIHwdCQyzibObzhJlALacfXlf6h09y8b7lxDClnSEGjzaC49nyYCzO5hJbOl/nEpsjTRaK/PzBriu9yO4oCUykXxZWmkMwdEf7LYxtlKkeDGtqEIJhf02OR9fR1HXm852ESA/z7FrqC3rDdx37wMAsKwnQAUMapjZycnpbmcSHTtgprezcxJWs7JqijGJLaFdjwqaLDii9+8HaJGUuHBpoa9Qi+pSpBO/5Z7muYz1wnV//yGACeYMHdyZzXAWNJmr7D/7Dz8LGPI982y0DgMSNQQjukIibUSoqGFLVg0FEhsDWgI20LR23PAzzzQ3xpcu8fyHBWAICIph+ABOeq2cpEE5FsQQpFd2o48+rb3ZPwEACdBgvveB710LJD54+RpxeUsTQBmtXNKeuLDl1/xUe0xbINGd2BUpcLsSGuA9Ly1GhXFoAaCBIcs3tnMwGcJLF5AYDC2HHmy3gZevfQVQ+mRKBFU4EULzEY7vw7KOkcme/3ByR88DyU+VeydgrkPsIpNzAl7MkoKqV3q8QiPd6KDme3/w50d7tCqcxbuAs/GGZ68JEXnzr7frPudIA8tjy+MK1zjw0rXPah0XE1prIZ746X/Ubtx9ud8fo31z/WD9bnjFvD8aG1lGXFoDFoOPGkHHdmxvLfJwQvvwCyabR/NzHpnVWzOUAYEgoyFylRoI3gMiPLPnmAKwiXdA12qNWNTaxe/esLjuuQ8ER/BkaH7FG+LnaUMMEJsQIiyy7qJsAgEkzBNi98vXvDzW0XPx/PLYhMabVhfixsZavsa4+H26zEWqSeXC05aBpFg+Ah9+/jqwXHao02vVt36d0RAUOCAAsPUsJLgz+3yuAbBlRdRg2xt/4PsuafxuuQ1Y4KAox2jhNZcYbwMcHgb1/Re7edlt+w7a8v5XdzsCM4Mxst6pd/NnsPQLHN1/FNJf2GsMQDbI5xNXzUmrLCNQSNPRckYrbF1MptCVzM+KAERrz5xpTJABt00Qdpbt+18KvkcUNgxCSwLDuLH+2/Luk4PffszzTEF8L2+/ak03cWDHLTO7To0nLgB4lewOLVAHeCwZJBaAnehclPBKYTBAxaWmyWig+v4yHWFik0O88ZnO/pDdmHe2YDeiOLi45dfvZWl8aawNAIeBW4SWsYwGwOP44ppPH45vNe3UtHB8nrDdA0VjbT4tkqFe8yrwfj6Cc/EBHwZGx15dkKgsAlwvyxpZUUnf5Xhh28fxvTF0YEDWLXrPBc5MZR6LSKgNHdqp799/FzJZtpxl8QENGRcXGUunjEiTE37CxPvQq2e3bT3XhuCodnZSa5rWMQzwAUXbmFXDqrMUq3oA1eGajHa8z2VKbHUFpKzbjQvAuS2qLZCCRowQb1Mw99r48MHDABzQ8hocvBzSyMnF8UB3mN+Il2x2z1nBUzqzPCsm11zaFU5O/1AcjBEz+viqUq1b7LZuR/5wQQbDxFzOVFCxameaq2pFONfRET3DNZMLPRpgQTUSOwN+pvkCvu9uHhcA8i0SLGlgwUMd212HwSbEC+sv7QZZr+4e6tzmt07tmN0pb1H8cerjZjm7Q7AowWsvrr1I2onRSVITAHNUKopcxjLIek5rdCxBpbyr43sFNhLn1wc8Pw/aFCoaxoDPbsI48u5fGY/87pdj3BraBsgZzgTcwXr+Eo02CYiBaHSRNbC885xki7j1zCZOjH0aHj84NFjIlLDmUr8T1BxnPDE/wfzEnNKROSbnEdgrZz/f+Ky+o7iG494Ll8ZYWofAXgxrLrFWDnOha8R4cxipxpyZQhgcr3ztMxpb/l9v8O5fnxTAAZBRRgN3j8AkIIAIl8aBbXMymsQnxICGA4hlqNPIB0Ow6HeMZ8iL2RrZsLBxAaDDA8H6C3iCuVp3s2Lgxmdjh2ZjDQCW1y6yVogLAeHoGDDEhc2q3bvmjDaYC5Nz3bcW3/3xR3X1v/PvfUgf3wLAwR4DHwaAOdkQJqBt2qVds1LcLk7uDJ6REA0FrYSxknjwLgAtOZN12Q2AC+t1fsN5UEI9zwQwh+m3GvRXcAWCQGuiQoQ1LMkyjhsXTJdJuGAMmxHmHWlDNAHB4torP/5Ig9g69saV8deybnOTtwLAY4rBJB+ycJF1G0IMLcThmDykYThAkNF8EKXSO8cMZqiaLXsNAFyEDu/CBrOIvK5WfecMgJNDrC1IfYvBMGwVGMnIYBDGEME+32m+jkVcB1bWGK5+/ao3rnxNvv0bAq56nXd/3J6IkYk57krftx9H82yARc7HiQWtXwdg412OzKqXaNhktFE3//iBMp4rL4/DxbXVF17qJOTChoWc2eDc1Dn6sOcZA04p628wDBvIoiBDvzf2OabmYOL8Gl20ZZDWcuVrJg4ishCffTRcqTfeLV47yNqlMDk3qTZ+/oH41E1jE/Dmug2LzEdhD/7lCe2eCfYOZmuD2gOcGSpYX0YepNZ17+cL0DUzL7EGRO1IWZjohQP3dBzLe3TyJ2EeRSZZMBgpQvaJmNihMYfWmUsGEBpvOSA/4VuD/ViQ4yEePfQ/X8f2rTbj3rn5zJsRgzbKF93sOktsB3YIBL8ZkJGpQ7e9agYoXBh6LeuLpUoNBJB13xf6XHdhAxoRDiAmOM28AWHeCK1lydYaXcCb1aNt8hzpCiwxTqr36mCIhGhJ+DEOPSIf+rri7VxkFzOx2SmHqVciVtC6C2HXXLADAgFxYnZ0CY6BOVioUFEukT1050N3fuWu6k/QH94NZBUTm4CsGudy6QXp8FIkpM/SyyEweHN+yCCsibfDIyhctL1FhjMiM7co3hoittQAaNtpG8d1efVdPcatMNgmMbO9ibOTjrY8sQholzWzS/mbhZMCIM1m6PHUmEILlawf/e3iVz8H6MG7HoS7H7gng9178eHENrrgpGUXkwC9JEQTwusX0eB2APyNBDdsQIh10e2gAwumYTmGANsBWW8zH6MVgi22N8x0bNLmt09NzDdN2zg6woRE7WmX80alkbSCKwqHHm5hIxYwf+dD3PnQ53mw80/mnpr5ECM9B0tjLI8jSGgWSgGa125HT3GToh6Wlg1ojHirUYhBjZp2uWVAY9kgeeOus7YkAE2d2STAnOB8ePQQ2HHjVt7edcpqItpxanTFCVmSABwghjjiKN1EQJDwPv8V35XYut3dhU1QvTr3pZZIpdX36BnJhEagm9SCgItIIRLcxQEMDbD+YtN6bYQgggzAuxLWCQPI81GBQMvEbpjZxUlEYQFG0ZwYAlQyTKAFFCKAYAE+9xCffxC4+w/NPcks7+deAYmKeylZEIDAOX1PlgUFDwkRzE2ixeNLgLOmwiAclhlQ346XtbDRos4CmBY+MztM9b8QtqPNpwBRu2StwibVNpY4v6GzwRQZXXOgGGaCuytH8D1Zui//bqdW51/uBzKZdK0xTqohC8rhmb2ScpLvfgnhvNX5PqAKkiPFI5hUSZ9mzuak3dOzI2ypwsGOUzugu/MUIqw+tVpOkezi16MOmwXju75iIIE9wD08gO5CierehCl0bR1teok+pJJdkODYJ/GSAX9ZpUrky188UP8Hyq2qFKXpOUdFc3qbECEQgEnPMUUEgNxY4RSSaptktAVdkROdWMCQZSsPcddX7hR/eE9nmPd2ppixwAjlZ9fLqXZuQdWdNOSnfB18H4gaTBGpoqnDKuegmeYdSwjlfXnUKQBCbIa0wLqXkcQSwJio/QSFqhoMFzCW73zIAAhthHlj4J4HzBf0QQwA37NB0rXo+xhYkQe6+Y97EYGXPvBd+JIQGkFbYZDrLhoBBVo7g85hJZpzsAlEuQiGwXBwCZgdAgOA4TiXxgUjzkbujBFgwwKAAbTRaMEGk7HwF/kgwHfhy/cCIoFh/SNgw9wkUEOCk176ADnDiVE4FTTWLwoB+YlpJXYQEAgjLl/eoGlpyfY4HFDtUaDqDcFi43kDGyuXkpNZOe74xbQ4P18S9z5wt1Cf2wzS96uVG3rVZKWOOwLZm1DovCJvCFH3MGgF7CQIECOZp4YWTu04BSrXlXVD5ErhQqJxtQzWnwfK7QWsHNC9D6gr7u5G+mC06z/r0EAIDMaXrxAiKNIpNSfW0m0CAoDKVgSrYDYor3JvMESAUwV0R0pWMq/lgsEja9wXP6PcmAZc+YRQ9pX3d3nNxmCJEvSDWq4Y19UuBbXs+u4Hb0IEKfd9y6kRiqRSDkzPsHNGCO0giD44Bs5tEoBNBDRjQGQw18WCiFSuCoZGek4tu4jVA/45ioYSqj5BrwAUGcE2K4KEMhz8qoJAgLGhfBR0cDtnUGarywlSKXHMYPkGSGQZpwhcyaCajrxy9MWV3n4KRBytRJqqmoIpY76M0skIIXHT732QmxQkge3lVFHxhqLu9Mlp0IyYxkGC0e8xzozW7W0AeTDM3XLU4HUXyl2uNmkblhvA8BRQwDGARQ9/FgSgGVhGBIMAYoJ0paf6QiDRwTLA2JLX99emTzINMztPoZ2hcslgc7K7vCLISDEMa92m4xtbBoDxi/bl3YuLEtAA1Etk9wjIrlx5AKeglbHfQOFRxDmi0ff18a+i4RhLdGRITFPDKWmnER2qBZ5xMlOoIURZVPszep9OtAbQLjjVRuPzG+lDwkIwDpDpK+AX/6C3STPGJaByQfaQay51seAR3CNEA2AX3RCKZmy54SZraAA2imyMwMy0+y9K0wad3IEFMyBGg8HInc67kOwTESMMtakGPr/hAqztnm98ifHlXHIOG4pNCogeCLiUR6IRlLDxvI7jq6CGZRQw5dt4Ywwi9tRZyZpnAhY2GOP2dhyxdlhsAooNZFfCzA6TcZmpxfYImyx2Kc5E4/omhGs3wsIG8i8fIZA11qsWQ0YTCIZjiewswNRc8etGoGNcdenM5jWwgm9gAKGfDLBlgDlIZPMTHZvBxgcD7JBwngywSTM9QeYCEAk2DxyTs1w5GGC3HIM5AbjwFnB8AQC8EeHzQuTxXogikVkIBLxBkmyqmiJI1g/GyCwCGAWENy6YyXkgcS1Aal6wPkZuj0OhbcxG7ZR5Z6s3a2Yn1XdXNgHFajmZUwg4B5v7CSBumXEpAs4DnnAjhPnnzGvc4YmsGeapm55SD0EWTZZVa9ZZtauguk96hYHXxZX4J+eZnOuiWViPqb3jjr+NLLbPsp1ZsS28DWbr21uVJqwIA4KEVsEAcW4wcRbw1LmAgMmzk+bETnPSMiKQD4adpJPzQkIQDPVBi02K10XWDQoWJDSAgleCEbyOWNQYSwZA6xfXGhkBzkZ7UBIxWEYIC7ZJb2/dBAgyF5ouIk3p7CYBZ+QQBJgoNBGNdJafnOXnZ3Yhc5LWC4y+pBwiVmgBQCFJJyWuVdbI0zGZ3LHdxYrnJNvVr4OJ0lKkLhWrcWC5EfDZpR2z753dKTyLMtg7W99+l1UbMjNsfWe6T0PpBt3MOQl7irOeMidgF3NMnmDXiZ0nDPMaXaKQEPsEj3CVCvXr1eWALKTKp+Mu167+p6v/KckHXQJI3fqG3Mq+2LNpAJEDEqF9jINjxLBdPl1HILaht9/FpkrztqZTFfncpr6HV3nqGHDWTGFIZDs5MX0ieah5qFJVvhCRZT18Rwf2OlwtQNmuwPJVSTqNvBasv11LfbE1IXloxmAY6hqcNsIcdCDq8QNhh0DMWmzntHssC1CGI+vW0XQ4p7ZsPgubq2Qgl0b3mU1Kou3E595615swPwJ2aU0tNnjk0KPAoUe4mkpm4Eq9LvVkMpJsQMcukuCce/AWl1mTsCAo6uC6h0U7ZmTA1q2ZBUuFVgBI1rY8iVKUZ0tc5DIBOjiBrNpH4DR/bBNwYusU+CxvbaWMcohhHF/KNYlKljRTBya/55+uJluinCWERTaGICypVWOAFvQ0LDkM3DZaNovrAybYMgrmwB9f8AYNYpTggCCIWr8cXy4sbO/AClQyvoSzubNDEBRejGoBBlMZjzNv7zScTXA+DQ6IpXGBil53PHzoUQtAHczVWa4r3+Aq9Lq4wIYmDKJYEVr0d4yDEXU9OR18TEhDj3u4wAaF9BakDgaMTJMPZqRqua1HUI/X00iQt3LFwtjkCFOdUZ7pGDF0yhkyHC0eW4K1ZEt8pBpqArvqDZAXZdYHYG5TowqGQ5Qi0t8Ca/OwFQZqyWGIgkMXqvWDWDktk1T7UWEraC5AQjVq5E0kUxkx/XbagGGwBGlAfXFdgkP1KYi6FAHJ3iwrgKhBywQJ3KHlCQyA1vRgLI/lmgjYlHAAkNcvrsuo1IY4xXv8cBtVHKHOIFewjaCV3Uq0WcDgfvgaMleOsLRmqRGt2mi89R1vCcBKMNyiANj6G0bXVh8n4wEDoAUItmQyoXKFlUrWg71XCJAofKqyoZVoVa5YEv3uNO89DTaYdTwCKEeWwCl7O4QYvfEcIV4xCmYL+60reBPRoV3sOnOp96i4iL7/rQ0xxHop8xUw6HkSG9t6onoIJbG6bLHHoNAZn+6Ph0FoyFjmWntmncU4y+NL0a2m5vwugbCMAL8lxYhAgon5rBosrpNH6epxQFvPJLLDB8rF2IAAbSNZZBGosqmKKFayGedAfSezxNPY2IcJw7GlrJURjLNEXGaAAfDWIMC2An6DpuUTT0rtgFxw/O/SCb828SX3XxlWedkbwYH+WOG2AwWpsoSVnaeUNBmpohXVsDn9XmaxeVzKYCSpiGAsmy1vS9hCySTN25ZB0DZOewbAEH2LtnNE3QZkf7SYp3utL3DUjuUKyqe+SYZDGW4lG6qIBAqLXAGpL7VT0MA5dminM/YTbdETuWTGLegtAhETABIQgFXT6diivwhtkxJNsbnsMRcB1qtHmpvs4tS5KaxC5k99M7OpbWKIOVNmuFoCUCIQiFBCACBS/OOKphJkwXzYjZYM4M6eHC3BVos3BbQD+4o3JcAjy1TyiT/FApJqVDKwnKc9bTjP+vOphx3wBPPAJEo/l/qpP+li+jHYARBDZZtOo05Uq6tssnDRTRZ14Q9mgW1FtNPusTpDtGVgOYCvqL2q7zgqMrChBrnsinH4N/8soQHRsILNGwGfn8DzuY8o6Qbk3RSJbyxCMDFJT4JjsI3RJUQJouL0x9o56VljtgMkRhs/3gwhgaXxH9uJq7YS35YtDYP7M1CUagkCI8s3PynL+ksQFP8Oo2uLUxOZbOocdzx8xzczHcCAGOoA+zQgRA3q4bAMICrZKWwjSs7jsDPORRpoMMCWwC//hQAMbwb75v+O4Wae7Dbgk8mAjvBb2Qz9G//DvxHsP7uZiP5PWyRVBhyhq1hl+AQms0V+io5tMAxxQIQQKXQVzmBJoa4ITyn6ncgc3FxS6K0QmQjn17O4luVMhuwrZPSxb33sW/ThY+JJ1BJufvITf9rpBTaf7FBbRTXRCmAbvedIdSBUIq/UTl6RuCMp9s0MBzIhRKokyTKFwDCLtoUQJAhqCaaJsXPf2PEUk2dwo5bHJIaG8yAga1Ye4Ypf/otf/ksLfumv4Cey2uYT0OkEAEea3yQc+WSEiBSe5OZug4xG+s3ZI6N0eaEVp1WaPvNHn/kjLDwCP/VJCkqIBDIdNZ9NI/ihzHbUSAQkIROjbLfRnZMvghnnDs5FwZqlAB4UNABuzuaHWjCCAgZHOs7myCcN3/q3PEnCAjAZrdwEdf5Qv+LWp7tfUkt0KXIb9D/syiNZO5J0PY60ct6A4P0hMAQgNIMBCIRpHR3t9JffIWuB4demvMD6RRC2JBAMFTAYkKCGW3zkFiMjMBbGQMdPCUZXPdlhK0sH4gkKHo/16gEgIAEq0SW4hJccChSmYAEoG+SPdvjUbguLEBuFpi5ZSQTaOMStpU48DzGRhxFgivdDnwF94z8A8Md5RVjK9Ni0eGNBqBklUbhmoqsyraiVoUoHAI/18tU76g9xlHOVLY206eQ0wUEmqIEohbyBQxQGedgm7TqjnB2CQa15GAABt+dfmcXi67eBAUYOhy+jG3UXCa0kL9/n5TGU8G7t1/JThdOjt+fGPVSuno0EhyTlPWoyGjV0aI7RkdnhYBmQsY3ww4egejKZeqgQhw+sRDHIquxgdOUqXCsOYpXLqnDU6jE7QaBB0DIKCjQKSE6bFWXcDrHbeMJjbDuJwcJgVwRqmkpYzyTZSjrJXG5JGQWjd4NGlydcHabeNdqpIKhsAtDuwCnYkTMbA4WAANwSTTs8ZW2fGU6f3NmpjEkjxrVFClW2UaQV8J/9uqnBdwBfAyChlSBgVKhROlTbaqvABxkkyYIBIlg7IagZSAJM2wXkaIxdEU4CkQLFqGyjee6zAL1axYq/9jsJ7HNf/dxD6ApYvWUmsrgVbMXhCQ4AovxZIAlAQvFrUwccHj9II7ap6fy/giDb4dCKjj2YgQJWISrx5XDcBpmrQBWwjqqkH9K7WP1H1NXhU89ViVw+1SCBKMdHQWBPWRzEg20KzdhYCAAM2yWJ1nbPVsCI4MJgeYTHBapgHVoFygAMDCBblcAlEfUQ5WwEEDK10gVwO3wdhA15Vau8fHSIGIs4z9Rw4PeCHS0ACEO3AzuaEilc7tkqJ1iY276RmCpU5ZK/9jkK11eoQVtX/eHwkQuXJ+4AeCTjfb2QGnHEAlEefepTYaekMBgfCwAsLw2jHDkxDbYMr1ZIq5poAVr1R7tqqFR1et4WqEGMBo2mavLOr/I7APDwHQ/bkmwQT6aGhmhRtDG+Q2EahWYwNiawly+10SdNtEKsPhGnSkdJ3bYqhKxRpKItkCfw5qjNIyCrUcogc7njx6I2Mv/qYwh4kgjYYGe2nUm2ZhAa2nZ5GG3POOZftDOYP04LfXOLAQzV3BAWFBoq0ec7JitF3OOwImiTxapAWuV0jzISgkWBC3oCwHz6v2LfEaYlQhMCOLaOxpykd5GFiyIfvhN46M4EUP8yDO6FIW+FaAQrzbhGU6uAybKoF6x6djT8zS+62/TX/6Z2izz5SSDhmXiblNEIkmxsG9yh4Yx2q9My3gXs8hKMqkqmqCBUGDIP1TY1uYIGi4KAGP3Ny8vvFZUP/voXR3rHj4A/rYQ0XYc0Ija9aLjsDIeSC+9eNqFS1dQ9D9xDt9HtOohMUlgKDMhQgibqCbmPVZ7KiaxKtVLafsdIh5YQeqJDk0SYRpTgBEbhwuY2HuUQJD/OVyhmxwNAxRwFKZ/KOWHqaU2sOhGdSjlisytOF5xCLcoZgXQEfxpJCkyDLDOiGPg2yGSikGUwEprhcj6PsubNK2TTxsuRRjFrPaqE0QpJSRdgFTICRzj4WBIOEQAgUsSCAnYIQGSw7PFKHmL1HrbVf6B/FG2EkVE+h6jKP8KFViQLX2aDDFdOusZSgGUyFZ9usqcoYAXDqzBVmFoSAWjDKn5/VMZRYtUTMgjIaYwom/IOlALqyXDhS1hULjJWpio+vLCY1fAqTCVNEW10kWWEYBU65GCXgtTWCqOVAMqhABEQT3AQKK1kDhh/NmewCvZ5+UHuLi/i3c+996k2s0e5yumSGrlWVFs1yKufL8QCV4NUSaq+nWYaRYKOwC24fCHc8dXfoWaxFTlMBv5/aeei3CgMQ1HHzqvZmb5+O0/gf5P1FRJ3LEOdtMe2MGwePkjAzmx3ipVbIu5hVdYlUyWRC6Xq4Tn2hyXeMKwB4/h2JB8fH++f399f319fn5+fH7l/vB+P75ljTX4rOB3fTrkBbP69VfAb/2FIxER62O+eZ4+ureY8NuF0PuV+OGXyCk/HihPayFseB/SDcj4c5KMyh9xkRvx3H6Rx1+IhbLe77W6z2wJMMzkA3UPEkI6hE8cl9/0ls7+o5UEcgQIdOgH4n8+H3EQF4YI2ncHL7rqz1XBLeKgmbH4AtjliIh2DkOvuquS1XAyYMYeEUsaFXOFyRYQTTvYPcFlAZrIZp05tPWtI05prbtvbbXs1sKiLsjc/WuootJBtnBQIGbebfDiit0F4gpB1lA0GGlhLX2bbbZVbFlOuZCzOM8YiTBfMrsDQz8Q5Mzov1FaDj4HdjTpWeNduhGaQu1GOLIqpm7ycXjeiap3woxozIx1qo8SGA9CX4NUIvbLp+r7rRPCGARRvB4cZMXoRJ9Z1EJPTuOmcjK6pWCwFJU2ZlBD4hy1Ere+IqBFTMzkKoiFMzGvhbBHvJMOv0+utg5iZFmZNP1Yk8Wkjl3m8Vy5l0jk2/WYjgv3CinIjSWVCSimkgADWGIhPqLm0oS5n7aDQEiNMGOl7+bpZMa+UA9WAmpG1NHHVl5NerjcJsGvVJWtTo6rSq6BwQhNgtqSGRRrYo1pAo11tmZFAekA171bLURBBoRfpnFkOyhpmpmcCwC0WAV2yxppcoulW2xF66YY4LQesiJhJpJJuY4oxVQS0DAI26EYC2I3J3msZHNbD0HsadqRpRi/dDL1S1qGaQS2HTJQhrMWkTYyrTCQpt4H05Hm7RS061ZRXGQaXxHyI2pNktRCoR8FEt4YdgVQrX55BmLmBRCAxgDhWYsZ+pLQJ1KKZEXXrMUpYnC1+9pJPVzW5PziiymEDNUhhoOkPJrbUcstUZiIntC89jz0NnZlTI2IyXfWwQpdDUXa0JMuswa6hhsSNFelzNwwtOVMBhVkrYyQZZkRRBJYkskU1uDXkIvRigJWTS5NZcTcRNdoRii6L0Q2DZupjG1mJzSLWqKjaQ2lea6sQAYs7t8xAtaXrrU3l1BMWowVEWYGRJGUYVKNZw403x+JZXtz/LW/M3MtmdOGekBwsSZnGEEecWssOeV8VXvq4HBS6OX5hhuSzDhbMJFESzUcChkSqLZtJ2svrFVDLFaMXdFecMzInr4ZR4LQQwEIi4CYtQyf1BZqjyM8zrckM0ejbQIW+FTBirkgyE947Vu624YiiZSJpDIk7eO/0rKebnkOx8qn7HUx0mSnmKxJ4CaFJWt5LybwkdzIVK+mDms5jN+5e5uxKPx3FvCKaTVaLyiTIfzl+Al5nqXZUPcDnvzHOhojl2NFac8Ee/vOvi5FFKEMCswY7D//7EWZK894fPavcENErKgX0eVTNEyeSKpnryggkThLEHxJwCH2elYSRmPsszus1YgWvc1FTPafmLR7uoGOpfGnn0jbk/if0U4iI2GY+a/ngQtZqNVL4EJqZGN3+5kWm7EQZhG7k7jRCUZFu8T5lTozXs78G/yjm9GqCbu+8ddzv9/mkpPAaRQ2qG4JNslz8q5UWeu0FbAru9+ClVPNltWgOdEMvq5NqL0q1Uxa0Y+qkXD2+RMydZ5VqCOpGNcQ8Guh7G1ok3DPhHto3iVfVCiGXNZYmabppunk35N29IqiZyMlg/d3n1dJLapokSgI992Kp4rbm+VxZZCXrG38gBOhAKpgepDJjIOFltRXkAl0ox6eOB3JRLKxSdaobU8MM3FcOHrVk1TxwuMgX9MIveIgmV++qyuCqYyprlA9j0kiZpCogeh50U7FfXHArt1c6GHXeiBV0/UKKztvyN0GyDB8wHTstnlSLDddY/23SSssyaWbFxchSnn5zFzoMLEnySowcA14Wtc4gJ2aFDEJ92/wPuf4OR0nj2fcAAAAASUVORK5CYII=",
-        "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAANoAAADaCAMAAAD3w6zpAAADAFBMVEXs4dns4Nnr39jq3tfp3dfo3Nbm29Tk2tPj2dHg2NDd1s7Y087Z1dLS0tDO0M7Jzs3GzMzBysrAx8i+xcLBw73Dx8LEycfJysTMzMfQz8jT0cvIxb63vLa7wbuowcObt7yYtbuUsrmOrreKrLWCp7J7oq91nq5um6xqmKlklKhdj6ZVjKZNi6dDh6ZQhqJFgqFEfpg8d5k0cZc0ep45f6FNkq1Ul7BXm7NfnbRloLVqo7ZupbZxqLl3qrd8rLV+rbeCr7eGsbiJs7uPtbuTuL2Zur6fu76jvL+nvsGswsOuxMWxxce0x8i4ycq9zMzDzsrH0MvL0s7N1dDS1tDT2dPX29Te3dXj39Xo4tnn5tzh4tq8ysazxcGcubOTs6yGsal6rahrqaSErrKOsbiDqrV7qLN5pbJxorJsn7Blm69ema9blq1VlKxWkaldlKhil6tmnatVkZ9PjJpEiplGj585iJpsn6lso65yqLJrprJioq9an6xRm6lBmKc0lKQkip0jhJwjf5gcfJceeJYZdZMacJAYbI0VZYcnY5AnZpEoaJQpapUpbJcqbpkqcJoqcpssdJwudp0rd54qeZ4teqAufKEwfqIygKQ1gqU3hKY4hqg6iKo9iqtAjKxBj65EkK9Gk7BJlbJLl7NOmbRRm7VVnrZbobhipblpqrxtrL1ursByscJ4tMR9uMaEu8eKvsiSwMiZwsiexMmixcmnxsuryMuQvMWKusSEuMN2rbx9sL2Csr6GtL+LtsCOuMGSusKXvMSYv8aewcaevsOjwMSmxMirxsmvyMuyysy1zM25zc69z8/B0NDF0tHJ1dPN19XS2tjW3NnZ3trc4Nve4t7h5N7k59/o6eHr6+Hu7OL07+Py7eLx6+Hy7OHx6+Dw6+Dx6uDv6t/v6d/x6N/y6d/z6d/z6N/y597x597x5t7w5t3w5d3v5d3v5Nzu49vt4tvt4drt4Nnv5Nnz6uDt5tvu593u6N7w597w6Nzw59vv5tru5dnt5drt5Nns49js4thmCluTAAA7hElEQVR42pSbW5Ac133ef9/pweJGErtYSqlKlV28gwRISnKsSyyL3F2ABEXZUimpVExQpViMHMs0JYdSHkjsLi67C1AviiWbUh4im5FsU3lKlSopiSSInQUlOZSURCFBEFjwIsoPqVRELBYgARCL6fNluqe7Tg26ZlX6ZqbPrdHo3/wv55zpWr0kEAgB4N7LmEpVTUg2QDrPBgVwNSDRe1nGc5PMAp5i/5VnbUeDF4EtkgnA6KlRX9j/2CP71i8db4UQ1gTELuMoQ79kVZVmR39hBGC9hECAZEFFZVuGhCZAJOIemZEEtmfYA0g6MKUe1ZRnYRrP2s4jnJAAgeMWgYKCzFXn9wVmHtl3dG0YEhLch437sfqraoypcab+hhYYUIWQwKumjKIsI2xIvNhmx7OW8H7DfjEN7MaedXS+j7Iz5mD7JEIgywoIC7TXSJ6ZmorBMVCRxUFgor9pRBNLloU+Tct1n3udcjWuCOAQETJgGUyCM75jZo/xTDQIZtljRZh0nDEGJBy9KBTSd8ii2UrrSvaLPc4vXZp1TLdoGmANsqYSFhiw0FEQSABCYKdQkhRJOCbZjYnDeBYMRBtJQkwLYWZiTk966ZbFgEBmrC1svCWgsH/GSBvPqtPRiaGQDYX7jAejiSZnM8JSBy0sAIuqUG1AJEE/mw1mdhq4cyYlHfPyNhAwA9rDjOEYsM3WVtsISUaA2dKKyqQ9eztkS+SLLdasaYX7HSGFgsCoabAmL7JAl4ekaqshoB63wQZBjMZUb+xZoD+VHGMrlpCEsFHAdjTCJ4KNd9AOIDx2BEfiNllhn6ePZRBQEEPZrijTjwZNstQyauTH1E3pkIKEJhCxAgHHaIMxnk3AtgXINgaQCADYQeCIQSEeD5SsoNopHB1vVYeW3nm94IJAlt1nsDAokdEEkwWpKpr+mhySRFYfggEjR/c0W+f6Y1sL1ysKv8w247jIFpC73RJESYp2BEEILgmFZAuEo7BjsC8uZkNyoEUQuywjUsxIkT4kGjeKUIM9kfWsJpTABAbPTLtQtOOsC3VxAFui0stsjYtywZa8WsERG5Bayi+dVJAClo2Fx5jPb9aJEAgKSBlF8QeYJAkRnXgGmlFucNXVb9doJLLaAUvFOFMcu3ayARZhCxIYGZ8UxgL3+oUwNrJDK+yZWTmRKQhsMI4Qb17MQhASDmTBknblJEnf4X5HD8ghanqgGlwFWuvyTrs6uBQln7klLiIgrVEWAQmEJubBLG6BY9uMRTXEbIw7nkNgGG+rmDGsV9dkQRnIeaZC7IokBXSfa1TkxtpKYCU6iybWv/oW6KgAJAEYqsJUXPlMdCFYlHDPOrhoABNtYBwOG9giUcqWJZS9mCkTlSWDZEVCaElgyQSDajCDgMFJX80+0eSCjCdI81pVuMbr0SA0PdMNs/iKK3oK6/hkEMJakKE9jgBjDNTmhJuyTBLIQZgAGurQ4xICPvV34IpGlLL6WQQNmCaYKwsa8S0AktUQYJu0QDSS476Ym3gShMbnDRhtX2B8wQBWbWSAQE8KQKSKKdkSoAzIySCADNL92BiaGgiYDsk70+C3PsMTn3nigb/mgR6aei/bhrTMMoGY789fYms8KSba4/MARpIAM97uFfM2dS8JURISYAshSrYsh0xgERDcb+xBWINdsZkaQwwA4q8fQLSSAwiEwSICPdIgoVttmFiQFgTyRAkIY23ahnHmD2OpOKFEhdpUQE1rGcgByDqOawAHgNpuMgjT3Jc1uFAaSav9QKiGHuCJB2hZyc3l3ttEEDjO7slE9Mu3WO2Jhe3zGmNBNUGbMebhsAkSHNne1pEgUu7CKEWC64C4JGJ0tsZYYpdtkXZRAx0TGVJFyRhCAeAJHgDoGk1dj9RRpLSKrFJ9BMCO+9G+uDfai2F7WABsJtoem5fAtoVBJRqS+lOSUQDSbBIgoBwRaQ0VXBgGw9QETYtBcKr3wD5TumLVWaBJghrOkdiVqDC9n2zvvhe22q9kkrDH5ycWbDsw1h47LNy1lQpvRTVRqCs4yIBwtG2kgFEMCmuC7jcY6LOFlewja8AKUqkVgOYQ/FVLIpGBDIQKbMbGHfbtfXErjB2xhdrCGj+MtQCysiMZUJD1TzKGenVlAuqBSSBarSAKsBRcRsi1iVyDktQXh1VLgsbisiL7bAtIZEMXQQEbxwIs2jC5RsSTYUG9BQXgXqk2YeJIbXMLjHY+nfyx5htfCEUaytQCkKT7wc3s19x2CpIdrb5RJZLm5K3P0qpx05htYpyJXS0iNHF461bbYwvMT7TFeJfQY25Lmug6Z5ABy5hKgsoDx2nLQfM4hOeQALU+7QhGIDAgLHBVAv2EIrGkMnjQd1IfQ3L3BFaQ5S/mcVHSdi3s+MfHj2+ZaAPzHgNggoIsHAlHpORCEoB2gh3Hol2dS8gyQbDzXGs+/a34t6ScIFWMSmQJQdWnVghSMgWSEBLpUkh18xio9xpawbZjdOyivbjVXkRsb2t8gTsfuD+EsTaMhzaCOLYQFGy085kUFHcdwshgY7p2FhReHACQ1JL+8Fuf6suiDQ2cvULfSMJngN2qDCkB5S4tlmj7cwPGJyWNS+14/W+obTEeFgREEyTQXc+m63nHIac7hkjFhJCy4hP/0DZJaZYewCcSFyihNJJig7LVQZnqlok29ox5GeBJz7wy0W6Pi/Daye2ECdqEcNehCBNHsO5+tiATKJCz4xmMkSWDrFChiwytMZ+uWNLqRM1prNEIjQnOKZuiwVb7mPZlISgI6s1Z3G8bw0u3eBFtF1J7PLp9l9pwzyHu+r7HFwRBNVgMxHE9DenOsUowkQl6YBgzWE3EsPriUdbA3ap0dwjZviwLSmQznoY4h4/evCg0oUApP3cPT7Mzcsh2QDvNs+n3lOgdT2EEwiqj8K5nRUYBhqFkw9Tk0FRyzxDDwM0MzaTfxFcLgSPOcEU2OzU3N42IL918cscCVGTtCcbN3bWbF2SuTIZRBIOBAJTDOiwBBVmSnLxroL0CkOHLb1cWDbgBS2dovRJv9r6wJ0PRtjFTnsKz8egteiVIRZ6fwDBht3cC1jM7n7bYiecBiHiC+fqK0k6eFjufObRdYCFqom/zmTwtMi0DECI9BZKUjJJqDaABXLXVJuYXfXM2syfKnrHAOOro1qhONrFwJIR2thProkHjMsDd7HxKco9sYl5lgXwIkICuK0ZpHhSwA3RaCAOCGhipiQTCze0MTeqBkGlyf2Dh2td9U9D+ueh47DZFsEM8sb09QVBbE0MA5lIuWLinkwGgp3fGYnEy3rbwBAi04m7PPfDMXYCZFwJC7Y9+wACRUjWjBU0lt/+1d6ap/kem7WtfvWmRW4wVIjq+TS9t+U1JqlaWGLgUQRoyYAQGmEfWuLAQT49ZC+NDJoGFGB78BgWc4QFMKfcFXlICbtisgdUAbpyoP7ZZvGl+/DDXX/PGNbzx8wnaHqc9EYKGKGUwQitucw+dzFSan+i+5IkKjafGNYQxFGSVzfiTb0LCwg2eRJrKAV0aHF0NPn0Og2UbEJYkADHUAaWTYwtWAIYSXDWSAQJWGLKBCg1EeNDfpEQr5cZCBJCrmjyQKnENcMwGf4HW/PokGIJOX1pyBivMTxgNdQLGVOgOeSZKdQKl2oCgS/YfP0vPaiT/MwPVyPDNNWOTtFFJjzMuH153EdFp/pcreMwRrUDAQJZnscsFh+6mVFZHIAL4/NfpkSH+ioKw3zRp4eLU3fStVbxwcKnCahaQv+ZwXUCsg4uoz/wGhN1amR8zJkhrclqAYxA9dSAjuaMAeAgMfPOz5eGb/Gt+tdVI0mr2UaNIRq8c0gg2LR/PMilek62Hi00HsCy6bLZZ3CK0tkNrBUIm4B0kSk/NoqA9XjskdDPkg5VlHuchJ7RfxykFA801ONo+55e4FWB4efj04c6N14Sw7mJzPWBKlWyRgFsBohEMrcSiS44KEkUgMq/1F6icEsvwOJjPOwVck1GN1mCq1B5oav2RFm/k1Rte1Q02Kua469H6i+B1K4mtlGlxyY7RRxjPNNSJBrH2QsQ/f8PXvsZ2ZWpPlDm033Y89Dg8RCVrNdMNjLrVg6wBrn+DcOQNX8Mv9t7/5K737JnhkSfCBt6JyvouZYzBzg9PKCCJaKG4yI3zaHxhjNcCRbyKLp0Q0AbB5/+y+4G/7H6aREb9rmhAkDqaGM2mZZEk0B+TfrWZj5FtLa5cyqf/U9h4sd8r0/MAP3vdNUFGEJF88oYADgvj8fA1cK2CQALWOCfQRv/2q3TfwBfcJBNNQkCNmga7ZnMJqi7a8A+5NX/1Q0sG5p1vbV3FmU7+6m9sfeGDF/s2FOmJTIzKMKBoCciGioXIip3Pjy/sEGCJITpCtIuwexj8NfgCzRAbALQaVrNsUFdW27wEgG1ee6PcxUjDZ1hHjy05P4Yy2NSSo5EdJHltntERGRejFTQEK6ZImNLzFddX9WcAA9FWs1gjWzZ4reZZ+jDArS/devS24WVgGJZBw6fFi7c35xOD7ROt/KYAjgJJIsj+CXzQebKwEEg/5sKXvvLwnz8Mf/7wV//sayVfU9ZgOrR63rSaqKAu2rZjlHRw9Lajt0FRCuAFeO//fm/j4qXZXrdvDHYPTOHHwIee/9CPP0A0QcYGIaTn4QJQwCUZGXkQy2CmwaDNHj0CP6jYjlLr9q7JeOE9Pbifve9n70NAkmP0qzcIIREK09T6YCTo+Q9FAyB6Q3+iGPjKF//9wyEWiIMlDFrVfqvHXoof6ZEfAu6Lgtt6jOY9Jd3tL297wfC+n/0W/e5j8AvvRRLwY2o2iR9/0AYQFB65vvv6UndRUsnVQQbQr/RHI1JjEFQz+X8EACc+g9x1zRdvfxHo4ilz7vf9DJJ+63/VmP+DUh/4wE+oFQl04X7y20Av2pIe5BsPfuVLdN+YJoq1Wq4cwDToa9FHBIabT9x8HFPLqezxUfhm1aoxu3j/85/UcMBDP3n/T9//U34CHwCK8reLwQ9UbA9+o/vuvmhoNR5rwLj6cRuml+5ABifbDaAjySQ8DzjnT7/+p1+HyqRUcMl4DUcc6IyXe5sud1INuoLuBNh9kJgmLkHzjkkpbTB7ajRZSXo8NZA1EC5Jq1abF6rQJg9MHgDw5RYzpimzCmBTloF6jfyQ5Z++f2B2FKlqxOp0q5mtRBPQxesazvTjuCZErG4gy43k2S+TAHn8IQZIA+oD/FcD6Sw0FgyCRx+ryLom7L57ihiwMIBIKRsPgGQwlIstQLUB+PVXkYO75MvBZUAT08SCZLcADuw2hi4degwmsT1bswg0dXBSc1M+EFOnnWwn84W/oAn5+bKzQCNxGbGabzYAmtiW1WR+/PNYw9qhPfns7gOPIkkFnI09CRwUkvbQYfbRx/IcKNCkgyJMOsYDEAlA7oaFLCMDTa6/6LIn5MFO16Qc7LoChoWDIpC1HMOaoB3aSyc6Ao9NSsog95wppUke27uLJ3d9J3acz5WeOqnHJrPyLPsAwO65HKY4uJu5RjjWB1cYyRkbjQbWqjBO2YJhRVizwtDKBs7BFWfjJgDd5akDftQGrIIuZBhFRwuEyIJQsJeujB0DIoQsh+gDTOrgboOBg5X/UkqIg4/6ALsPdlMUMAsWTM8yPTfFbFlhlkpRKbOoR+yG7w0AVQ8EJCwbXO5hdBfe7ZQXk+0gB8jQru8QQpCddzqRtC22CjliK2sBOY4GoWQ1lYFLwDYWYCMAY1Nq+fGpy2PKCPBs5cUNufGLGyZhG6Ed2o372ASPaVIZOKjq0cFp2dHRdIzB0sFJROY8t788FdxCyi9Fd7uRAIEO7gGoUcjTnGkwpmkdQIjQyu0oJGwb8FljDAYEGIE1INds0l09N3JydasQkOEMhBCGoBhtQ06pTMJEXYoSUpavOb2pYxsDkoQUQDUTrt/UWLjxVyMKykwGWJBDdE/LYOFBT6oa/WgBYRuMK2ZJCnnmABGCJAy9wvj0yOnNCAw2EHO1cpCCraXNuEQNEi4E9KrkVRMsrKqCQAgubIDMmQRLI859bl2MhuWEs9oPB3JqCgzasZuDk8YggSklKTiTvDQCEjaggEQpY4TARrawQDJIICEJ5nbH/XE6y4TtaMeO7cakJxAgCAA5kejIshlApFXyi8B1r+ZR2hoiCSoSZUGqiG1ch0HNh4QAhF1R68CUQKDZKTw7iSQcY55Hu4MhBEdXeMmfLINtjFkGX37zsiBBCCfEAU9Z1aZ/cyK1XLUVFGSgNoltAAqHVAhBIFK2B0RvNgAbY+zoAisHY1uE7MymmEdQWJvH4KJqYwCWAfopUHPxsfpCLKEJUniD1lA/DDw9Qm0zIUlQExKycHBKaI7Jvjz82KNgZndHx+iSKSVDMBikQG7UGgpZXMk7Pg0GWW643SAo0TBcI41IxiBsAIUeVmYyYeGcSCmJIKl2QInS/bCF0u24VMyjSzBMjGBYhqRhKBmHsksrS4yEUzSR5NT8NTd4gH4QndxKWh4FZCkTIU2t9TlIQVCxoRSZlErnxzzvxNjz8LxjA5wBNp3dBEJcWpsjMFl2ng3La98Cp9tcBShRW3iw4fR87BhTSToT2FzlbiFbyH07N0nGrsAExgkrwcVTcZPPaS2Z8txYsgrEjYANF9YbXQBY5/DWlZ1ldAVvXwFkZ7GBBNrwyyZS03H1saN/BxAhRVsgLF8dJNsK4cCkHTE2FkgBDAGBACck15hUUXYerQO/s0F6C0aJzvG59QZ4ZyPOTWetJDorb2ujvTKExNuAL2disATNcfR7njQC5wbo8wplClkQ+f7daoGxhULyQoyq0jWiELa9BKPAKYBRgaNz4/PrLwAbEcTzWrvS0ooB6W2LWledpScNtIxBMNh0lj45hUEx/tKbOM0wlU6PAKCWFGKMUpAEQK+s0GQQ4GZEG9t+09jDPrdupUWHVufyuQbAErydiGTE6tvT1akA0D8Hw5RxITg1suRNwLIK0hFaAp/aRFYkGFG/EH0wrgGFwdHRtk5dGVegVgJTjcZGTg8hxNvadAZf8bbolhvPUWsj5wdh0FAfvf6ZMFN3HsFpDWUDyKZXxiUARihLoc0hBBRd50zZlZUIAUeHAETnv9xkAAoAoBkzFgLgXBen96Z7aAIhN2lWhdYnBVOz0wYsLAymbpVB07WjGQZOUxYsM7KsgEGjpzy6RvH/RYRGUQjKY+W7jjFfKnqBNwUQ4zDndGEDlbyS5XGd6KIUn+LQQGIQUdN1BSAhjSL0e1MHpmEOpmnu6oy9VJtx+DT9EpIjw8tgYIQz72rJzgs+IxGjLUl2fNMurjB8DqTq9tdvePvd/r8tqYGznguJaFVKVSgCvxnRuyShgGan9ff06TSwmaQCbGQJwDTky6t6dyv/pTXaUnRQjKcoXFeOuZfYTDeKT/d9QUOAALhQ8AC8Q09rL1ZvASOnm4yFGJWoox9HKwvMlqZygSYA9zjoXWekpkyqAEkgzfowy8KggNHVp2xLV2fCtkVcsqOHVkqktAHZoHNwsaRZuwKAVZyUrGLhWDUNCS6MCik9B7VgDoCpOfTfq257qbj7+rl2U8IpvTUfBLjpKaEbiCNL4V0BG7DfjJuWlY0KfCrGNaxIYYQWUacYDcIIMNEs1TmquB8bXAHQv+VEhKuDEA3peaDPbCPFlNb9SODakqYpCxpc/U1JgtEwN1VyoeWwWUFCjvnpUSmlAYQpnQmYBSYpUxjr1lz6P8YABEUAkbRZkufC1AFgmiRLvw9TThNTSrQValJK/zRctcE2smyAbglo8ykPcxpGWJZGQ5ibnp2CuSnmmJ4lIxpgCtPTgXW8sxtbXbYrh//doafCCsDagyuPIkJXeycT4b+4RdobDMUl09ymT3gam7nJA9OEPCJC0Fxn2rGGK+K/YZBBYWiatTK7jpwuQUeWJW0+WIAF5Ved3/CWwlryziV5CgAXZNm68Gi+R50vz3zx4IZvt3Zd8kbevmJp9FxHQ46XWoqR6d5Wfl+OQ3Dce3k2HNEnD0+AjaVweMyILMQ8hjhJYitisN+ILjsTHGnUyIyeSngjn/pbszxMkpA/dceZfOQtt1rfP8t9nfWfCwKQ8ZyUXXGG/PiN68I7G4a+c9/KRotT1mbkd5xfZG2er+94qPVf7954poPAJ/6GAID+YOskCvqXt+iqcWBh3LBg3WkU2vrYsmR6D6fUffwGBnpPOSwM1Nwpp6bmZgKtTlx+96U3GYawiy4aIssNEBzmmOT+O8zS6DLZkfyjxHWfC/g+2Pry1oiAE4KbTtxiveu/ZR9lydaov3evfil4F2/66v+SbT/cuXcdAnjz+A0Qpuf2cP8WWISbsTR8h47oDp6793tR+l1LP+DeM5YMAmSnn7TAIB6lX0ubkZ3aB7Mrzzy3feHDyl/iyTlg0oQv++i2SYN1ALDJRt+6YonRM1Fs+h6/80ggzk7PGk7eGPDJLcHHb+uc2CLp2FbsxS2hWPvki0JEbo22RSlzcvvroCCVXAIw+jjwg3s5i57TvWeNMDYClLazKeMaDMgA8uQBmDpoESXF3ff958f86GPKQ8YVS8fYio2m4P7byXffv2337PQcmOkZUJbF+PK2UU4du9XEfK/2u8hzJnQHaFnOT25p0WExTPBzcx3MX3cNvH7tz+G6efD117xO0Q1vCAAhLHqPFvT7aXOEwaQlZHoeknBUjQYDKIIUZUD42JO7gO5h68vb5Og68vbMHd9qI9sC750xSs/7SkOZQC6EQSHLp+dsbPTqjRhjg/B1/IM7BpEFLd4QTZg6KP/mz4OwEFCS9baikOQEeIxtx2hqG0Aa4Mn0L+XZ6d4jGPddTGkCxAJk6gNAYXlXgyJWZ8gGA6CqEBEF0iMTZCS0+wD1k1xRS7oX9ZPhdO9NhDmKvD1JPYmUbWab6R4PbMDug9XBguQqSo+WcWP/ldquujVokyqM9FGRZEhWKdMVwFSJNFkcy9ZcceiGPCQVCSDJqRjMJw9alFa8g5SG1KhAIv4otRLU1l81A5umTgLcSE+vcj2QZIrYH7hkWx2A1fs1AE6/CVDHVcIa7F3uw0m68RUB3MCrUHNZmObV0qY3ddhoIFQTrvnoO+UlBHCdtqjfj/n4d2tsi1T4E9/9BADfpSxXvg/d2gCtMFR8VujpqXtqANBT3GOAZ+5+hrudfPPQPTkkHar+HvquQ3cDT+98+p6nAO7hIgBr663dJs5g4KXf/SEfAeBHIBz0xZqr5scBu8/QBjkYZIQhEAlADFBVgShLZWf9s836C7ARACFbAldNSya4NqpkyZAMKoERNslAhuavJDYQoBobXh5meThEPQy18qz7gqyiCYB1GJhAGAG9ipErbEs9RANN17gCn7tCtgEhFKsBIYOwwMYCkAk9NtVFT5EoI0zI5ChkbIwkx4AFRJArxChfrffC9sMTgIG8JeN0+0jgECWINQjUXP16Zx2QZzgAsFEAAQsRwQgIdky74qrEQhiBK2LqEYzBBJAw6ZFJNa4SzwCEGCT3ANAXS7vA9mR5TFpXSaYmOby9PJQFgZ5iSHNrAcZVEOJZ1YS1rZAM2CAASRGsQAQwEKRIKQVHIZBs2cJ27biWAaRA8hsJuzJ3NFDEmmXIyQCUsk8to/Q9Yiki4RAJMX0FvDMMpMBBUjUog3F9qWt+YQBlABEkwMEQZSCFfiAQA9E28vkNyICwqOAsk+733a9fAQpA9D/im3oY8qwCg1wGGciAvAOUuU5ZPsLSCKgidP/yxfAj+LAzcrKcIFlQHn0zAsTL6MZXAK5/7YZXoZkOZPsW+QTlSa/jmxZvOS5t+frYbV9/8Gu++zrwL87f+vq1iv/hYTor/0BP54fu1MwdAYdQcxp/X19AiKGVoRXDWkDWRUptOF+0KVtljYAdzKlREPzgI/Ccx6BgQdj+ER8G/l5E6Fa76fg9GIw4CtxGTy9yu4yA/uWl4Zi87eo1Zzccfq9HHXIpMvc7IRgZwGML+Ed7335++9y0EDFkb4+enyGGsCc+tVYgKunme6xi4hkCWcsAwxYEeO6OqKURcUoGFkFmSz1V/1NfvMKku8JE+UcydbTbfFiF0hNIfNuLlDI//AgCoXQ7TrFeka+6enM8tXEj5zZyGjYvDXH2MzOP5jNTebagXJzSzR9PKzqdBguVcP7/BMHfrx72QR/g5/N9X9uxY2No3DYUBCR0ZGjd3SSUuEvaTIT+IDTSrii9mGj2DwwN6p7zHvu873EcpGmXu4F007RysRtgGclo1ZqUOOZiAgkKVSRIKGpD0oaAazuO7fN+PzxP/GN5NfXh1zz4OmY1Ig/+TZGU8kjCv/5zL4+RahvMs6gREABUqvzxvy2BACIUkL7x+s8tIyClSrFd0AA4XMJ2sUVSV5IxIv8RgFz+uCLKq3x4u9guXn9gfnv5oe9g/hxXEKOIIE1l9zbH0mdaQCsTtKKcdWX3gMRYXlrdGYu/8i+3P8VrHvhrmaTSs66cfeUhXn3ovu999+j5fvGu+fA7r+bhTAMNSioqhcxhDuYwAWMaeZrJgGz/+mcOj9w9chdAI1BRoV7z4GsPAgAAytLfLjL31vOn+prGlJ/2ugfGlK/10beMM313kSPneiHzRNR/Wt++PSPlQXjpMa8/qL7+O+OEw1//8fu9OUxeGw++np3uO3vlLFec9Q+vPuRVHgLgvn+AVx/ivnfel1/FS48BZk0pkQRAtUkFKGhoKqpplCbtfz6ye+vM90a++Tt89iPe51rzQzdSsrQaLtVz33//69sLxu4625Nv2/mSjtfxwOsP/m3CXvafcbvL8z8qvv3ABKQpmr6xP9r5WX6Wb/3st778P7z2APK1n8lATfL0H20//BN62JcebermcPnThhH40BsfegPz+88s7vbShTtPPTb5tfXhVt8f7fVeWDfL/YO50L31+XZzYZTbX7zzrX+1+OG3LfeTXLjXzYxxZEW73T+2l+5v5907PXNjGb+xc/+Afmf/H3/klz/yxQv9yTm+fWGz/fE35v5S5n/zzl/872x+ZEAK0b55dMzT189H909Jb7CUZHWp4rCVPz06DtfH3Owif/jJjBnPP3HvYgRwSH+wPPbcmN9tfuzo58bMb+vTefb9n8/eOLJ43+fT//5dR+4/XP6dxeL+7Ztbtu/9l3fc59qF0azn1YcXIyUzOZx/2n9zaey/d3y4fNPHlr1n0Lc+iPD99eDCX/z0j/HHH/3eB33vnuXdU/TXz//\/j7995rLHAQHmqLeePWGu0/P7ns2Zt6Yo44vb8/nLfaXl6rU++X9+Sbg725kmi+H8OPite3/5f97+ez965D+0//cXx3MWDpdvjLl1/9HxufzmbT/hjUOWy35wvnW3c/XeZE781a3lQrWWDj+66N5Cc3BuZpG0tNnOi7sH2MmIbnaTHE76X3/wQ9xc7smUCzNBWq2T4m3ivn/yw721OOKcS3DuEjMg8pmXP/p1n3j5cOlanyTypb+3ixk897Zsf/KzX3rzA+7xK78/Gp/5LeNXv3z3zTNP/6/v2M6jpnN57jv40Ft3z5duj7+yXKTb+ci8lavlxhNXH06sbEp2szFLO0i2M2m0SQfVe2+wGKuMtnOze6DplNVBdC/VqnUritPXT10XJ3nxk1741AuPfgOPkn/RR/7gyDibTiOkC89+wW/27mLxGzxzZwzLO8tzv/vO5+cis12sHf2C9sufs69d5/aVbvPoejlm9w//xK0sHU6f+LWDCZc/HiHt5aNu/7sxQQljdp78f/NRoiNtT/rqXY/txUiSqWvICpudgx2sq8aIFDtjMWc2O6CbmDGtDlYHu+vmz5uwbiWiTF95IiRY2ai00koTmFJRzISWBkOywqazzRSNfsOjMVYXdw9mqyRJMKs0XP7YK210MJ1495Mv+sSNJEZWeqB7Y653Lk6L3YRLvrCR1SXn1rOl9OrDKUFP4nqaP2OfjmRmxF7Q/VnEIFVfeWIvoUm73pL2cvp4xl7MzZS9hFbDQWFO/caneOHRGIvdHmznSS986sbI6hlYpZLud6IxhFDsHuzsi0iaNskqRqbubxEWe3RTgt1RialJu9nZVHtSnkrG3jDXVtGNnY3au7g76EHJbkLX7VjZ3L16+3ExGRfSbmbZu7g7WM/2FZqzY5XN9vLiRPPeI4vzsJ5fzwLjkSSri6zSg9kiMuwe1JyXH19Esxoq1Y3djb2ozSp91hc2rEZac0NWcWnHxXPtwe7oplNBZmYqI98UrXajgpZkN0lJ6YHdgz3r2WQvnetisbuunNc1or38cZKsYr2dLxtnF7FywMrBrqy37Rh7SdeVpiAqVrl0rptmj0s7XGRnveAwfv8pZujzvziH0FhgLynKOgXZIXoROxd3lGfyzXajM42OOfZaOQArUJE1KxJzMzt2NoM5QHbXSQ8t93pgN7kwrz6cWjDFVfCwkL08s9PuH1okqw2odDUu7TCNUFx8/uQP5pNCPZ8tn4nfG08+j0+/8OkXf+HF8Qt85RSunyrc9Hj0so/5Ix9D6EtHkX9fXzUcG++emNECi/EwyR8Ys37JiHOb1aa6t7EberBz0OzpWqKr2KzowUxasf3az4uksfjtp7NNSO0e7KkNHTsH7AHdxDnrzlfe4x4EChBpdQKQMlCKqQEM20XURM7AsdscA7cdA3D7GDiUXNs+FUJ2DkAT2Fp0Lg6hQRFiMWPv3jOOZhxb5vQ/zafaIMXvWfTJ50VCnaaqGgANYI5ElYkJwAATcOLdE+9iOApwO2cAAMcA7gwi4hoFQBW0W8pWqcm4eRxq8SvldzNCwOlrp6EgQAHQmgAVABy9M6KW7lSOchs0RJvjAI+99NiLcgwAOXMMh8vD5SEIoQUiwjUanNbgGk5fo4BGKWloO0bgNKCkUWiaKJSSkpqqAY7fQkyJOnaYsuQ2x9zGcXALx6GBhnfjGAC5HwVUCNoCEoRASQNpuD6BwKyU6OwYMeAUABRN4wecRlsgaU0mhOO3OlA6yiK1vM1xtzhOIbh1XAF85JsCfe+eFOR+SisgRCcACQJpGrgJCuZQAGDOjkUHADgF3ODem/fmGqcB4JrT7QQUSWLOyZjpkdE56XFuOU5TaW453hQAQgGQD4oWaQOJWQRwB0pP3AIFNAU0BYDtHIs0T3wFpKQ4dQOgc5y6cfL6KXD9lOsiOXrnKIA7bZKA5XvbsTjabTAmBB2iEz75oubEYy899iLE8QL5gDuOAu6CCoACFNDQFAo01QDw8ke3C3niDwOkaQABIAWgQgCpaElAlu/VOOYQlocAltwVUs5e8chVGiVOFOQDdwEAANA0BRoFmgIFZlIA2P7JWdLAz38VaRoQCFAAJQJAqiRAZ41jDqECNAU5e+XsFTxy9WGvPPJK6p8LgoPkMM/FTK/n+QBI1JVFACbkWRaUQVcqk47tLCwraHeXq1IZZk++YBMgLV9aBP63z5G/MPQIAAAAsAxYA2vNGi5EA8D7jdaChtaCADRYpokAwFBw9+e1+hmAN27fbr3degNwC/70c/7GL3/7JavHBlpYA60BsAbLNNYwLgEA8OMONAGaQADAX/4AEL/0H7/8DQCymfnf/3+8818AAP/f/xkCwP/j/hWTq79nARajZQDWgAHGGlyyAAC83wDmgN+++e3f8Xf/7u/8+98B3y4ACOAa/BfpX67vOuwzkIGn5yeuP4DfvgH+Qn8D0PT3AAAsYwBMA2tgcKGhybIWk0EmcGHNZXbtv/737fXefOc/fvXHb1w3hvir3/9KIhcgBgBgAA1+56+/vyhQ+nsAgIVb/vzpz5/+xLIw+8vf1hr4O4BXAIbNLtf8V//NXvjlj9+sZ2QBMQ1kWlxnqwWAAZo3ANd1DrdgyPtux21+cBsFfWIAANwC/vzpXOc78MFaKF51zcVcxrsvrrn89oyGGsD91937CgAAsADWZDKNt9u3W96gi3MBOMwto2tyBxAO9AmMmAZuLRYhklfbdl27vty/bC6w8QMoA2QCPvrMp9d7X/ERX/kIPn/6CnsDd/joMy7HdaDNAdYlBuAAdvuOugXUHOh/+w8A4KC0k9fer/+j//e69sVmlutcMIa3G9g0wQCg3fv8yWc+4bNPPsMnn3HhcOE6AKD3A5oci6tm5bIADrjxdsvcZlACPeUgIq+6dm3X9WXD4HIu2Lb8uIW30juHAZo33OINwAVAA3A5AFzN4XIucC4HIMBhutoEnOtAB8Yda293IehmxoAvMBgAF1wfeXb34/bxr4g33L7dvgFo13FlAABkWC4HuByASwwByzIOZgWOLjIADnQMuAUdE+rFADCMBlxgftvnBX7/N2MQMMRVV9vlAGBwnevAdVycywEBrjCENWIcgPPJ508+w2BybgAuckusqUyoF/evm8AYAC5c+q3LswwzAFkGXKwtAC4AAAAHmsUEQxiQOcA6dz98+rp+MMgON1znHRxug9EBsl7YkIEBcBn7uGcAMwBAl/V+tgAAFwAAAA4AFgAMdWk4sDg+fXYROJsDuMGVO2ByAMmLWQwYwGX8tvYMMAPETNbmogUAXM4FAADAuQ5oLMDCqAsc0NIV2Q5ugznvN95vvbmbwFQATviCAQMX9ptLzwAMbCQDxnoXABNcjgsAAOAAAACwAxcOKMDdAkDeb97dvt0KNFAAJb5gAINx+TWeAZiLjEYYXAsAABfHBQAAOLgOuA4AAC24Dhx3e+P27Q4A6P0WWUAmAbJDvAwGDFz7NTwDGLMYMWCuAADAda5zAQAAnOsAAABAAOcOMEGmaRfchgUgAVC4BQCAa7+yAAyAFtMgNy4AADgAAAAODgAAgDkD6NNXQMiI3m/PdQsQkIGzkQgHAGzAQZ4B4Npsmw2DsQsAAHA4AA5wOHABAABAIHwGEATv795QDyEgU7iGUqrDhgHYzz//5QIAcAFgAhkAAAAODgfXARcuHAAADOZAUu4ALAPcuXMXrzCAbAALqXgZDIP9khHPgMEFahMMrgZoAMIAAAAAAAAjQTtu+4E7AAjvN+/ugDUBAglBhPiCwWjsF5BnwOCCcqE1wPuBAYBYBhoAsAAAYDgL9JMfdwAAuACfPt/WFWiNTAFFguMLgPhoe1AEQCGYC2aouBkGAOwaC1wAgAAAgOOInOMHAABsjW17XgQwUACb2KgXg4E9jO+CPANgXO1sIHI1zFoDAGgNAAAAADAOcIDr3AEA2GVQ6w4WAJEGlIRbYEAv998J8OQZYDhzAYEwotEWViPSAAAAAGAOcD59/vT1418BADSg5um5O5ZAliUkRklw+/ACmAgBeAaQ2QAAI1xZiDkbwAAAAABAgF2ffb77/LvPd2MC0MDoGcRoiESDBdZEXgzj3gv3L78gFp4BDBdAAHauDWLCgIUGAAAAAOR8+ms7Pn3+5K8cdz9wGzTYRT49d0tAC0BoIiHKy2Dc7zsIkGcA2BbsLAOacd4oo3WdzRmTKwAAsABo5Nz9J4fr5x9dhKvuCJbryp375zvAkgUECBFSfIHx0XcQIJ4BsIERgOH9BGtYoxEDAAAAALTauTg++fpjh7l9uxUEvE/uQANZBAAhQhwAAwQAAExAAVC5Ce+mqkIyAQAAAAB20pzj+uyjdjNXdxUMOOf09AMMMYAB2DQA8TKMuf8OAvH89AyAMdAIw85YQ2NtiDWZBg0AAIB+5/PY7/56uIv9uC2YFrgMd3YGjdAEmLNCkLIvMNb93yAgnj09AxgLACywuSLn4hIAo4EGAA0AApxPfz3rLjYOmADb5fdXmgBNVoNGDiCOAZGXDwAYTwBQAgYIqM4558C5PahN15UEAIABAKDjrwfbhTcYxQA8P6AAxBg0aANwBIx7D2AD8AQAAAMAqNpcb7hWA5eubIkBAAAAcF25c/35n2+zuwMDwVrdvswYGwhsjDIGcCiIVwCAATw98UQBAACujauOC6IqDYACAAAKwK4fu+nGj92MKbyDAj+IEKFzKBSqIBw8goQPH3z4YGDwBJ6fngAQAECBLkRCMGYwAWAANgA3rna09z/f/2S8A/b2/n7DBCwMIyR0GgDFfAHmYQO+BwLPT+AZDAAAJtZVF5bRGNAaADRNTAsIyzFht29uD+D9hvebd24TQwRZE3AmIHVmXgYD97zuZwEBPANgAAAAuBamkfdjhCEYuSKwwMqaE9cBuDkAeOeWYxBqsqzVOACijo0vZEM+zncIEMDzk2cwAAAAXI4LpsFiNVhGuBJYYGVn68AC3Lzd8naL4TaxFhJYlrACQuuYeXnwwh584f713r4TQIBnT56fnmEaAADAsgFmZMHCAgsmO4Nz0VKYAGhwwG0NS5GJNQctIKTDsJeHl2nmnn0HAQIAPDMZAADA1hxXGxY0YGGxdKkBh+vYwQgAdN4LXfH0ClGAkTRZkOhmDOwF497L/d988B2ZIADwDEYDAADA1dDAdLwDNLh5303v5Ny8ZVkYAUCc+Z1/A099BQeAFQSI6GYY5sViD1+4H74DAgHAM2AAAADAtHGust5vuHbzfvOOc3Hz7uZytsKMMgEAkPUP/u3p/Bu/f/vtGwiAECBCN8Mae4GHL+xhw3dAgADwDAYAAADAEABGDIF14x1YFgAANEKfnmP/sNeCFoACCKLbMZjhhc0DF98/8B0CaFoAzxgAAAAAcMO73boOrrnhrRt4u4V3AAAAoAXorrl3na9noWlEACE6IiBEj4+Z45f48AGzGQYDeHoiBQQAAACY2/d3g8Jt1/vF4QIAAFAg/UP+4R/q6ff76fWbKwCrFKAQHro1mGH5wsM2MPgOCIAWwDNM0xoAAAA33qFjXRxsOO/CAADAzXnvPbn7cTcE96/ud679IeOYtAABeexuixkGXnZvevXxAr4D0AII8Pz0bIIBAACCcfNOdc0Ny3Wu804MAADcjN5vdhPguKR7l7Nvv+KPOJezAJGph+4MZg3Gy8OXe692P2vg+wffAQQQPD89A4A1AIBkDMqsEFwjAwA06Ix2i+aAq0dv3HjHH04AGgl4fHGA0TB42EOvUIn4AB8+fPgA2wDDk6enp6ennoA6N6AE2NzmnBsMbLXrwrABACzqDKOTXHNtPXp1c+M9/IXBALANPHTHGDAGXmaPF4M12Q5//LrvIIDAzjx7+jxNNhoNnYt/+DdyoWYBMACADB0Gdz/uIBfi/gzvDfYfJ5cDaEEe6URUEAUPeXyx5ZxyDh286ZcPMCAMvuWJuwKCWicu/NtP3KqC4NQ5nHNzw41uurkpTjc3YoNbd5U4D91w/+3ter/ebwb6+zgBJQiln1yxtgYzgMt2msEAa99BFtD4w9+xw/NoLGfTFlbTsCDbzbBacHGGOQPugBYTc++b67dw3mF8DyCW8KA4FrMZoAD19dvrAK8B5gMfmIYx+hXOV54CYvi9OgBs2BjvmzLbxQHc/bTb29vb29tbwAxx/fh48esx9s42//ndGLh++un+/v7j9PJiOmJAogjotbJVPAQT8OGDzSb8gV9xfcTdU3dP1E936kUGSsipbikMaJt25+7O7lJVNFUbg+NXv7LB9+8MM2wPHz7Ydm8eZSeVVAOiCg8PHoCyEKd++YAPHz7wYQBYw32/P8AdT0/c3d3d9XS6u4Pfjxaqap8A+OmOO0QCFnTQ3J1dQLbx/fuFHDw8fP367Wtfv36ll+KMOQAwoPDAP/8zkEoF4DvfAdi//5Fd7Lqexf09ftzf4zP38NNX3d3JG9zpM3d3eLq7A34Exj2wNUXn3gGa8ItuKoCP9LXw8GB1IoRySikIQEkRiwAE/hhQf1D93tzj+ekJ7p6envx48uT+7g544s7dE37c8/QKd/j0cH9/Ds63BVz77ePHjx8/fuS93LgZ8mEBgMBjJU0/D4w1MDCA/+pfjbGBgeE7gj/wqz/89s0+fpvdr+dPAa/nugcAnj29Au6fn17vez+vzf1rH2ft3wF2/4r7yw3eceuNm3ej/fQ1DXjQK+2Rl0fIEVCpopQk+Nd/HRSEQOkX2gbOH371jY/kmL8f3+C4B8DG0xP3P9zf3997cu8d8noPqD18/Pixj+fb4/39/YHrHd7e8G7gPDDgwetrPDx+4QGinxmWwQADjGXNbBoDhutPgT/g1z/gN779xrffcDVwQOv9hpnPP//2/NT7cS7xftrrfTvXdc7lOmctb+dyA/B+05vbt1veGB98//AKcN9rAbpP6GcG0wBjDZqJmRnMyIz1HWH6A/Cr881vvv0Gl3bL2601Ghq5ioW1JkN4+ViAN7cD77dvt3i77c+f/Akfvn/wKkP38hoevO4Rop8xABgMlgFjZjBYY9l3xN2P4T/w24U/fsXt2/n26+0EGLGAN7cNMGGiARN443bvtw368yd/AvjgtQU8eA3uX3sA0c8wwMKwxjKAMVfGaMO68t3P/9n8ZBm83QLwdgsAsLCABQBAAxbL2+3bLfDjrj9/0vzJh+984PXhBdHjFz3s9cGLRxB9MAYAhjUwYDBsFldjmu9++vOnP3/ix90AAAAAANAAAAAA8HYLYv15F3/+bMf3D/vPDwB6TRM8vHgE4oAUACSBAoWk/umf/8mIAucnHzh3P6p+8PZDFKJARKGqhRQAEZUqlapCfo5+WvjlP/xSr4Fe6eHxEQQk9MEAa2IMTINZA9M1//QvMFiDyQVYLGBZpiEmADCxRhZrAQwtAGfLDth51e6XxVePePXwsgdptNIHDJgMrDGAGbAu+Ef/wjCADYBlrQUAWIYALAvWmqChAQCA7LichkzES4/w0r2XB0HECQFFIFGABFjhf2BAMM6BUCQBQAgFAQlICgAkASQVh3PQ19Dr168vr6/5Ah70WFQY/TKYpsHAWKNhGDZmI4M1GrBM23E11AVooEHLWkPTGk0mi2Ut00DQdUC83gNf7189QmstCND60IABAwwGg7E2bDBgAIB1US4AIGsNEJgs02gCTGQMjRYtwFfuhenV45dHIIsA0gdgDY2BoUtjmDbDBgbLAMCMwwY0NAC01sRaFiwAzgXAgrVaAL6NgPv68ohGIAviFBLVGKCsoLYa/5fzjwMUHUpkMXVOWud0TkeVUimVjuIkAh0czuECHQikdoBoHkJ5xKNKJRVBcoYgBoCJZrYY/Q8XSsD83xFNaBszxiSCVGA15CLBcZzjOjg3kAQOJdaKSYHN/jkYIIBCt8mANRqQrQmYtey/Z7Wuif23gWELTZhpWZNZpoVwruFcBg69cx3sMMd1hnPBWhM1Ijx4ESTQBEHUXwyrzRowy+hqY9piI18eZizLwGitLdhxpWk7s1qb48oO4DqzAwCAtgD88esWuG4Ax+vD6MsjWSCAaMLBqI1WsGQkgolh1+6HOooUlYYqNacu7KjTZuegDsBRByVRVa/RqSryd3/0LTrO+6nKGnh8YQIBSq2oM5IJNjDEbKMKqHPk6/l6Xl+PggGKRooJMVs5164dAAChBcFDBpDhj4eVcXMF9eV++Md/fAgQQCA0/cWAgYEBY5rB4MvjmheYR9sYZbzcw7IYNDEBFgAgCxBgjZaBbGB13ZheWh6QBQKIFkJ/McAakzEwBsMamKYvD+DlfmNpO17ud1yA0YQFQNZoyGQhC4G1RTYtBmJ317wAf0+bLCCTQHAGzAzZGMAKgkDJHsCLFzUzqRCBUhAG2IwgAoqIAVJSApSXzvU/vUBlWwHQlABwIlhAAZAMDSNAgIcHr6+vlclLvL4uU0IGCEAVEUVFFJKSsFKoXnt9fWSPXwCPXl78z8VBJcqowCEoAkMBCCuFCkTqxSNevx5e2yNVKqhWAAgoWb2iU+p00jkdHVVV5VSn6tEDVY9UfPHIY5NKqpAgHAwMGIEiRBuEBZO2hxcp65TRx3tsCQhA1im9puKeclNFZaUpJUjSa+HhBTy67OGBPSIbHQEVmBwAGahBxiAACGDw4OFxei07L/ehSKqiTEqRYAehnFIS1CxBZfD4Ir08wutLxyMPA9VhA2wA1gGAJCtsEpEqAVVVCl4eH/X62utLXl5fX3ot4fX1NeqcxNem6BHCiUiQVnU6iEZVPJBHwIMHXl5ekmiVqupERxUHRQhoCxkagCgAUDzqAeTl0YPdr5SHh4f+WWAiL6+Zgrx2QKnoAIQWgAD0oId6YaUY2ChoF8hRw4BhGWDJBC0LhgE1eNhsXnqtErW8/AsgHqoHTpTioSuYUAADEhDICy/zsOzx8bHPAGawkVXqVH9pawAG0zAMgME0MMDghYcvsjy83Gte95CXjwtLwLnIahAIoAFgQNOABROAg0ZDEESt9RfWAGAG1hYDbe1smYEBWHt5ABbAlx6Yl8exMlkNhBUAaDFNwwgDstYAYRQsIKQliSMJAUTQBCpzNKYCVUB6FFKCPDyaPFClUlBiAqkokupEJFCUWgIMOYMFFeBUJ/hfrQUwBB03yEgAAAAASUVORK5CYII=",
-        "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAANoAAADaCAMAAAD3w6zpAAADAFBMVEUJOVENNUoMMkYJL0MILEAHKT0HJzoGJTcFIjMQKz0UMEEWNEYYOEoiPE0lQU8dPUonRVUyR1NAUFo2TFppdHh5fHpzeHdnb3FfaW1UX2RNWmFHVV1aY2ZhZmRqbGlxcm56d26JgnWBfXSYi3aKemR9cFxnYVJtaVtZXlhRV1ZHUFA5SUY0QkMqPkQiOEQfND4fLDMOFhwXHiMiJSUtKyc0MSs9Ni1IPTBORjxeUkN5ZU16VzdjSC3HrYy0nH+lkXeWhGynmYOyo4y1qpa4sJ/At6TLv6nXybDh2sjK08+rqJ2mo5ejnZCclomWj4KLh32Bgn6Ki4WPkY2WmJR4hIhqfYRZc4BBZnhGdIxJeI9Me5FTfpBag5JSgZVWhZlciJlhjKBZiZ9cj6NjkaRklKhml6pqmqxwna12oK5glatdkahZjqZXjKNTiKBQhZxOgZpLf5dHfJZFeZNDd5FAdY8/coxCcIk/boc3bIYxY38rX3p2jZdHm8lInMJQocZaqMpkr85utNF8vNORyNegz9qs1t653uLG5Ob7/Pf2+/Tz+fHu+PHt9Ovq8Ofk7eXi6eHZ493T3trM2tfE1tW90tK2zs6tycymw8ihvsSYu8SSt8GNsr2HrLh/p7V4pLNwobJ3p7d9q7qDsL6JtcKPusaVvsicwMmfxM2mydCszdOx0NW309e71trA2tvI3t3P4uDY5+Tb7Ori8e3m9fPh9PPb8fPU7/LP7PLL6u/F6O/A5e664u203+yv3Oqp2emj1ued0+WX0OSRzeKLyuGGxuCDw919wd54vtxzu9tvudlqt9hltNdhsdVcrtRYq9JUqdFQps5Mo81JoctHnslDm8ZDmMVBlsM+lME7kr85kL02jrszjLkvircsh7QqhLIogbAlf64ifKweeqkZd6cSdKMJcZ8GbZsGaJYGYpA+SlEwQk0RR2EMQlsLP1gpTF8vUmM8WWZKZmxZdG1SbHQ/YW82XW4vWGsoVGskUWkhTmYeS2MdSF8aRVwXQlgXP1QTO1FcCA86AABNFklEQVR42pyZ325bRRDGZ+zHQEJIUR4CRCV6QSQncf8QR3bvuaLwBqiAgGseI7ix04DdGKWCVrRQCYEAIW7oDU+S4ez67Pm0/joe1D0nZ2dm1979eWZn97T6QtqiUhe1ZDMVp6ivKlkqXU3ZyoOhnz8yDFz6H7VfEvQOCEnRePLKDDwQt2q2kMEY+J/N0UxjJpgDFoPiQrHxlVxFcP0PBS1Wd822VxmQvQmv8UzYZ/HklUcj3yU0DWYMXwbQhBJBKzmXx97KB7UEKpr7d0XNqm+KOeNhVfzws1aAMfAYehOc05kCMjFXQanwlp8GIEVYNaDnQZcPKvHh04ipBi1XEidetTC6THke3N33cOBKaLrJDRXj9+8SQTsvkISpwqc1KJSI0YNbHZv7/Qxu0v+A4i/cvJwwdH9ulg0/Iaw004DPsUL5W1BO7vhIPAxLMbwTcZDIFC9JzjIF7aTY7pzkmwDdzRVavOdEiobh6IQ25ahue9OPZWsBZuQ8fDW0wIXOfg4z9dLIxVB8tBhTOSGiiucfbx+KgSiIXTpkc/3r9Kp3PO1d9a7GzXMs0/H6EpHpS/lOJv8rquIfOHYmg7DZp9N7DdnpUe/02GbHpiazUbqzH+g4PWVQP0dqeP7VAAom4nMp1dDp3ihTlPMXeKqzULrujwWM44I5cXyjAZBGJw71UDWCLcqf86P5EZ06MA5wTSsnsCcnzkh+2uQ6jkoEAzNDzmhiUL13argOYdrCgjE7chKlM3eF+BHKGzuTQIHpj1Z4cPulMNmJxWmww8Ce1DB9cA9ySfxt4GBRNKM9uJ0uU4FPoAIAUK4aHylpbq7KEtHjkzVR1+P381sicn6rqbKEZ2pe3/BThUUyDNtmZyAMwFwqdhs/RD+5WSUQAEkFQ0yOJdqQedVHu3CEDjHfqPtfCTIIHqhCpmowg+afWZhXyeTnUa68MP5tMVwMpbnTHxdGUqbmSXGuDv6ZTgnAPccp4cGuAkU/lUNdHKqVSFwmuaR5j7TMlPpQjsk1GzmQw+DjTtxfq/rXEnxB0cCddKwIX4ZIDJIngwMVT9j7r73YvdiVi91yCcqG84zeiFA0xDI1Z5WxkQF977rZ1vSzwWogzS3sD3M8hdzJqcXBIlez24xJvBzKjsMDdv3FNueOKfASo+jl9ABoU58Lpxyi8YOT+RgI9v7769mUS9oKMYjMAYO3V0EDgMFEhDx5V7StuwPnx4R2uXO5033WOAwzebZXYOYeTIxPHszoy/ELK1gp8+PPtP/6nu0IlzplUCRavsBliLIan3nFts/cILmszAgqyM8N5ytC4mwCe21D7e5fvsuoJxzO8ToVHXcW4Cg77mcpCwwopm56ZFBOqzxrBg9eERwB+n2RcbW6ULe36U+0rlpUF6k2w2P10lLyHR3V6h4kENn8SGejmcio2KcyESGmQqzPcvBJUBCIGJwwna51K/8ARVwMK9xvbiLY8psy+s/zc6TFfyJjQLWgavq5XH/8zpPrVuGpOacO3gJ7Vz2KUTcIAQYGIl8M11drTZCFcP3aLKIt3mh2DDyZfD1BNIrq0/Zs0V1C+5s7ce8EhIlDBBP3vNjfXGXLoS0TnwwXN769kfES4HlubPlE51LKcYen1kXkj2WJrW9wCieTjp9MDFqMnC4FwHX7aqDSUDY32paHy2H2o0iGTJRSSuKTs0617v8uJhnti2tPr4lbagaaL6HXjIhWhkTa4YS62rfGk+kComRGGYpmQPAlD569d4bDRQHUJ1l59rYPBIiqAXCgokM0eoMxestWK2KClET48EAzHgrwBFC1oI/VtGjeQRmAXhAWSFJIg6fivRtuHKykIVzrQBw2QbomBB9q/fIte/6mAGNzUTEGByO6UGsnQGOOKuZh5VeglQxklYSDDR8ynoj+0BkUFJRGyD3uGiSHFQMf9lll4dHe5V7V8N2gceH+RZbt4CEdJSHr99AVXkL2p3TIhpoGcOiMFYSG6NiF6tG76Wogm6s0aIpRZoLyxr/6H2tvHiTJdef3fb4vs6q6uvruuWe6ZzAHbhAAQQwGAEGAFKy15A3Z4fAhcZcECHJDf2nDtqywVgIP7XLXVtgR/sMK7S5JHORKptbakGV7d73WckmAOGYwuAmQuGYw94mZvuvOfF/36YyKnuY4wv6+7Mys19VV+cnf7x35fi+zf+8g19d6X11nxAKsB1TXtLdgHfJGbD1l8/9h/JX/61eWbbieCd9wAgD96OhBLHP9KMZ60t4Kpqg115e54l0b9bU2vgZwAUlhR2ARUct8//4aoaHA019CrzsiChKwNoK9lnrBNmy2+X8/01DXzJIFa4e+CFjgFWbSv4PX73n9HtbL+qUtt8V6A7G+bBY717kol3uC/S7yn3+E5x5ZTJ//yef14y9AwfijJQeFdUbb+/ES2uuflove//Vb7us77fVtthHcL726BVYIWUIsPuSvHuVHQIG3xMUNJ/QXyD1sRROOYrD4pdLG7R5sbKfrj9FuWJ0897Cee2QJUvzk8z/5AqtmVIFnrVjtL3ovP73+INd7o0NcTBsGPcz6rgnXv+iht8J4+QFAYPHiZxfTQ37xIZb6uwKef/j5R557+HkAvvBjvgAn98Bf/bWiKVu02v/J/z/SdXpg1408rm8mDt9/+H69/MAqowWgFxYhX1hKn/vp51asyCrg8uoLJ/ecPL52raROmU7ZhT8iA/L6qh5Qb6dlQy+9lr1gwz6XdfSgxdGDi+m+Vw722o/Di3grSS89CEtW5CF4YcmKgudhjW7vx4t0ixY88TF79ecuoDaoPJCRr3eFes3faKOI9xufFq8v/dzD65+xXvtMjwcvMq5S3gcUoC8DD7y8uDyIX2IRcFWf+ylmVYt4K8bTnwFZyvW1cSvH+nyZ9WXK6n21Bskb9ywiLqVFxNc+w+ICvHrvq6zpvlcW05FDRw4JDnP/YVb1ICvlEAAsF3igP8sTLIA8AQrjrJqq1zuvbTprvQk3sh7rflMwahGvSEuAy4wHjxaIcB+LjIul8PCS/QCwHlyFAywf+AgA/WkMRFlWcUS4B+G6ktfzbGAxdUrColOx6NGbd8ta5FtM97zOEhsA1qIhl2y4SLgKt7Q5IlOox2KwCHfgo/36U4hhBcKSAShsJcv02oOCZOOh2MINVnbyNEuyNKME3VKXUre0sil3KHcq7Uqrr9UHtPqWGRcpFwFZXFb5AAsXLroeqTDZ/mMA+4/p/wDev5n/7+otYBYQQwSC8mSJLlmGzEjJSgXfEt5SWiZkGXF5efPuJUaW+HpkCt34obW44sYPbvpg6dWBj5aSV3b2658WnXaHGCwLYmBVa7vx1vfh5vdZWi2nDc9H4dGh+IQIa0rypYUkS8mg1AWAcgeARbw2SzYs0ntLgL266QMvHQPACtPiciMreyzz8eEB9N/xS7XO5UJcWa/tWACr2CzjfnATLG9v7Pmza1e1TnMv861RWlBpyX0tlsluYXEFt7y39B2LJDctmmhpA/D+Yg7LrxfZ5MVd8+GNZpGNX44ms07rm+0NLyENWqXcYGjJKnp5vdmW+9oGWKaD926Wl70FL7GwiLHqOot0KydSWMZaPKWWr2c1ubfSALBcJIQBeV0cu2foHAHWkssspo9WnObYfhZ/FpelHXN8H70OzZLpevKAZZplHplVufcdGDay2vXV26jJPXdSKYa1DBXuuAJJDNeqTGVQkbX3Y/Z+fIMMrDudUJj7WvXL+e1wcdvFDdDk3maaogFn3bwnUGGUDRRiUaVQ8G3coBfQ3MCqTu7xqd2w9HN6cmnxmUmfmYCzu3xu5znYeU7A9gsgC/RPe9tlZBSD5WvxFrnakKS46llKbFxYWf8ZcsF3jUGXPSeLD5g8DRNnmDhr7TrL4rJEtuP8jvOs2UD/PbDex5G5bvypqCywNg5ayde/K9Na+1pdL6heZBTk154W9D+sEd30vqzlmvV9rdSoWB94Qyyt7z/2tKYbNB5sfFPetU8MrJdYH6lcGUCnGJ/U/876I5QBFx/74TWPr+hqrcPSuryNgwZYXPvtsEHuEkOBvfxyObGGBf/BYgTkf+OXS6zRYf2y8gUHPlpdVnTg2IaBgkLXRdr4jqACi+VoB2tQv/qnvwqwiGaxoSwsjsM+fYQFLmivPwqk64PsOSHW6boTf4vgzZ/zN+HPl4y07i/0b3s+6eO9LC4Urm9Ax/fBcfZ/tP94T/vsYnfDcbsb1ipuOHkdzOuUy4JpOawIAH++yrR+wLlAKySf2GsQFDrOivZ9vNcnbuAE3mvQCQDDKsmeU7CHE6xqt6IlW+GUJk+tuzXvmi1L0clZXxnTo+vM8Jalf7vB/MBlvpN7LAAjYBGKHCBgGyQHgQGM8OoWjKUIgLElkITh3M4cdHEnZyZ8HjCAJOLWSwZh7ThvBOw4T28x3WBe3kaTFPW/Ar0n3wAO4HUBRYxB2NecEWcMotgHHAGBhABssIA8V5LPjYSpGDfnAJQusyZheg94/YtNV7E2bPdA/wZw4QLgnlsEDBRyse5hc8+vVWz5aD+FAtERjIJyY0CAsAFJ02j8E2vbxa2Xtl6ikLZc3oBwXUFHgGAVLV43rqbC5TDYAkCCXvIPb1xc1rgMmGP7C/OZwh4UpseABYgQdIVNXKEg2HSlh0IjzDDiWQAYnh2eY4i5ni6aAP2JOL9dZkU9xuv5YmFhwGD46IAwCMBICCwKly6mhi6ZztjIWNB7CSIAijyARGhK3mB25zINRtY8NRpQbUK15aK/rlKWZvrXCBkbZIAANgYArQKYorxhwPpovwyFF4jeytuFo0fjgA2Arz3lwRQSgBSmNvLCYeaG5s0Q81BrUAVarEmlLCGC/tlWQKbn27x+LH/9cZgi3IjUW7EYgykoFQMQ10++xIXhelWP7sWyVrkYgnnZQ/PFmYAKdEqA8xW0P+mB6dm4qE1AvfUlduGrBqzirUBBNjWGWStw62Us6HVTLQAMsDA4u76TKhiaE6hK0wBCRhZUOpTI0ow0SyL6n7ZfWLrK2b6ei0KS5Z5L057a3lrdCQAIPmETGGRhC8sqVgWFhREzjMyMUNAVm9lr9TCF+oTbuKdBX0JbUSkD9M83S8AS23ouF5dQtljFKGoWDCC8tiOB0Sew2VfHLTzF2NQYiwvAFIuvAOGRzHTiIBgxOwxQVHnMLm+XFqB3gEKh2nPm25g15gqd8iqe0B8OQAifbAXAmCIkuH6SSbEucqWiDpoa54oBtnwCbOLqOFylV2OaGjAYAQrBMF/tyllcBQGQVxhnERRD9AgEUIXWKgzt3qsyrcHpB1KdAUx9SACgwKWtYHFpi6w1Zm1QoenyFoyAK2OLbFdA8c/+pgo/UVAuuZRLlnMPRzs/EpP7ArJjkoUXgRDuicDwnBeRVkCGZuV10Uko8kJ6JO0kkc92lZIl6loWRtYyGqJZWwAYDMt+MzUeWIRbTFsus/XStovbjCksxiebgcInZZbNI18dgynGuAqg4AhYlaMy3H/EBtCDeikvyRQSEvVavLs2u1Srz8HyD8yBZcS1ni6TwOsxVcxKcpfPkiXkaZcSdMFaQrMQQgIkAVzZrEU2Li2CwTaDAVsUbbpW+eDKKEjMlLNaQr6gilTPraEcoWauko7CYhTwMAkZcgrCyD1koAU91BlkHhiYH2KZcXG5ptKjeBlDZIkA8oMpWZrZKqIxPwDQKpVgehzgipfIAHlrZMkaIMAymgm1hUFNRQigESDLDRCs0KoYJAMg2gIRrddsI8Apq1LBBgLF9ucaAAMLK4hr/O4dUkuSwylAlkIWYioAH+qWoGuBsMAraIhmf31QMDPq6fErm2HJFwE5jNE70jLzVrdE9/7+aRiZ73eCoy1TjKYG7CgnqJt2JQEYIke5/3BSHLOEQQIBErH+YM4b3OtXD2YU7BYurozT8Ep0CchIyWWXLKATDsWec6bv9gGwiAYKCJhi/BO0BbgUksEg8NTY1DgAnksPp4DoHBxiVv29zXexjQEQjgIswA5HDnE4KTxGLmaugxAwVwtoXjU3DhkoZGSwEr2K7RRI5NgpZekaT/f+SEGnP1oJZy2h1RmUPDMSuEpSsmIeHGK15YEwxVispxl6BXAJIege7Acsm3VsRgCWiYTImpMsovWMGAjUe8OPgflBYd/N4YfchqrpKBpCRCL4KNFUhAQGN/tjBOj6wYgMPVZrVlvgyuF79FqUonQQXnGsCIDOg+Vu92jSARCpLATi7s4IGFP09osNRaZZI8WHi/5ZWpD1dEKjtAoeaYT8oUwvDtU/2301ZKosBEM/jf7CYes1YexmYqe61yAD+spnraPIthBw6AhY6L6Xc6qrf2jUOXSk3AgISAEkEH4wEIXBhdGsomCY3jYQTJQFAIcxKYhWFQIWsgArAHZCDJa6koLn6JctbCMLjABUVEd2U1Z6LxZGf4+2AINgFQ0OHc6pCJrV3tDZQrVDH9EoYOFW4kr2MGZ9z7pRxVC4p4zoNSheAcSQFgZEBDAkkYAiWAqOCspzE9tQQgbIKAkZAWKBAeFGEg4evXcJTcwnjoMsBIVFLoOVgaCv6JVSr1EfANOgKmwFbBBYDxbeaIEBZEOBIQDalVU0gaFbMhARrBGmIDplCZAUgzCYEJRLBIh5Hpu1NggAl4C2qzKy6gPIuEFQclC/CQgAM69qk6KpKa+fQOWWIlUsqTj57fv6KQwhFmr1gQVVAQu3qaBWZXFTzJfqljFdSmAgApaAIxjALkNo1EzAIEiQgWAJMkGno/uPgElQB6i4jfupU6tDrW4o6TetnvjiQq0hE4AyyL10bivp1Bw79AkKnuzTA/SUqgVqjSrAWh3Vh+lACQAOH+RI/oBL5K/cDxBxEgHBEQ4dBmPKcqDR3+gXCoAsHIRtYdHtgp12QXK5FSJVxALAwPzAwrJDWj3x0oUkEgIp6x/J4laaVYEmVRAFTpcHU4oPkZfYoOiQJy+H+8qdkv16/SG9FPsbcpaWuh6cLz0AkJNEIxDAKzZEuUSGI1ADISCAYYpRSZ5Tpwz58IJsgl2FOqvyEpp7ooKGBkAfvRIALcV+oCGqFDLNEO6LeAAL8MIgXgCwsFIdzftE7N53uIrIGx4gzKm/vtSjUrzbgJXklljVUXBxQLiCAFkIkABJsuIVsu1xHhxsV1XAWX8P1wcswDIQ24gKNKvNPgBTXCrRZEVVS0W7jLHopAcDeQJZGklaK71A89bBV/LYXx8oaugYcCBHMpofxAtKD0XJllZsBhhTOIZLQKuqBv0AErIkOQhHJ/kChBgyqmgFzUJfqVGvUUS5YisOLIQ+WvS1qjT7Vot9T7SvGeLSr+iEWAZn7kOAY0c6FEBZEtOmh5jjrUiMQH8oyIyIjRoLA8IS2DQexA7ilfsWkwGKYkIsLR0K1SZ9avYv8gnXB4UIATKCsjpOyDH0r7Bh/X0cc+ZxrrQfGoOJgItb5XyhKojOSAEVIU41ykmzajWpYpAQa3Ij4CDdB92o5DWTuyCzMEZaWMqxICoAUSK7G4mjRVHBgCIilotgqFWvCVgYkOQQrFy6uD1fsAzgCAJAf182uoBKjuOWLAEWvlrNBgx5s7IMJ1akZl+7FEvQLgvhZh8SCIrCqkorJDr4ihXzPjqUg7BW2emnsQQ7PyBs6gOSLTH7EALgKAWfAacCim7VqncLEYSjzOVt2dxgA4AcQNYiGljYRggjwAjiFOPCXBmdr8UuKXShDECWxgR3ltGihN1juTo1406CIyU6wpQFAIrdaGFRlQOuo36B7CCm+g8CBZwRGLskAC1zAXUGAIQkEeFqvj1e0SamEgo49F9jMMYSFHJEkoWvjMd59bWSlCxVh/LiAu3K0kYoBoDV8g0CFmoCN5LENsgWJSyATrDlKLDc3xDgKIbiLCPCdwJaozMC28ExVkGrZ42VLQPMKx+RpsaAYF/dIroLkCcraE4BDJj1EoDHlQ5PJbV6KWR0St0OQPvQUZYdzRhh+sGAjBiw5QZ5TBAykrvFgIawkIUaK4chizAyPz8Qws/a964SvQoCnKOiOoEaNPqhDoAYEVNIMeji9q0xJGr0GRJyMKnXUVmWoSjLIhk3A1BpKROKdHRUh14YJGBHDP2NalMGqisobgDRqQAI9x41AILNJ/vkYDD9NKyBukNNkCezjKny6r1wtJjSaYDYl3YBa2FgKQG1FbZcCIwIuwGhHVxIy+QApGDAtsACgzFEoOjzBmISHapNCAbj/MUhBApJjKZOyACSJv0Glg+bmluSuZ+jSBgx/vuVQ3/xNyqGfICmrcGIkTEwCqofOcRB1hQt5O6wmCVPGGgMMLDmlAt5AoIRQioJCxRyuk7SJAf0XwHYU4wGKOSpUQKAQQHhCDkzSS5ADtEjKvqWyJrCCEZB8lUlHtDCAAuBPFG7kggOHv033as7O5d/6zID9VoD16iL/oDAzIwii9nKvXoly+PYlNM8YHad3gZ5UDwPWwPTAwbqAEOQnvduIWQB4M45qQTCi2gGx5nRQAyAhZGNgwmYmAQEtrGBaRSAfMQBW1pFYyoZnEbymCRsPIXHohuiO46ki5U8mXuhNQWbL/3a1mBNpa7RUM5gAKZhRABMl/IhScAVxgkX2SEAznnHhW3lPA8i55OtMXJ5ewhRAVmoMHVbF2DrstVsT48GTG/8SzFgTXmzABkbg8xVkQADAmShZeIkGtnjq2QK4AsJMpsB4SuBPy+ftnbF5OyvbUoCeQbNHGOjBBhiRZaEdUVjqRyDAJLsPGxLkvzMRGJEHgQ4ntntgIACLp5CWy8ppYhVrJFhDEyNEDUtqzd0LjbBFYGYH5BnRhTFFMpAcfwyYJkgQDsAX4gSQEZWWXSzzSoTsi/uMKF0dTQjKuyCc8aa7vFx5CCQsCCPMiEh2WXHAAkAEqcmwKIIxxNuMBCWHNJ2AIN6xtvmh/CsPI4AGXwxydkKCIgCe9pskos+slZXvZ2vC9sQvqifdEyspM3K2eAvLufhK7+v/KYPfhPAY0QECIur41PenGBkBL4U8Q6RdKUgAMiD8jOTZyaFsABRKAbbRjYgFxaC+ZzpeXmUIvC4PU+SKzbFgLNBCgLEVXHVxhjBmgTawcVo1B1Snvd5rgrwL8rxYuni2X/504Ha4LnB/zGHOCYlMmAEXIWLIIyNL0CwCJlEzAFMIs5iTgO4dwUhYKQQAhLCAJgVsiTGGFiRlrQtJ165LFiTtAmQLBhniqtXr04ZGxdFFwg7Ll4885cvtfCA0gEYsfi9b73w3R+9Up0HBY92YwQgaNoGuDqO2AaAhc8pEnfZcNYQAATkhLMBjG0AuzBdQJIAQbG256OkaACKqH1wRtyeBKEgsSrbMkxNMy5wEAJjuxj72eWsbJWqTkXGIIj9YTANzTJA0L/6g82ygTA2Oz9tBBIXzTnZxqkkR8S5XedMzJ2T587PBBIpOj95mt742JPovyxyXExGmkHYIt/0yeaAilMRl+tirxUiAOQtl2HL1GjgyuaoYFkWRJOIVZ18o5MH/2LPcIfyXP9ZOW4euX3+VOdMlMAO/zDGTACzIY9jeFp47BP9xSNP/W5GvGqUe1eIUed2ASR5iJwVIckdZe9Zd09wyvoncMnTko3IuRJEQQZsx0gGBNvRuR0X7Is7EVtsb0ICg5Yrne0SGODUG+1up9reS5uk5TowPrZnOm3bEtbQHIkSZQBZYuDKzvNdf7OUfNnJt36H0wGsnUnOeTCCHItg5TvOJEn0bvU8thMgiILMGFiuPYwECVptPwxrKl5KYsc5e9eEAEKwLiIuIsmXxBKZjeBclitN3us7hqAvAfO5PSd+/la9AQDz4rdPkKSlEoxHcfHb2Ynf9zP9yWPoq/k3n/znvw+d6Fxn8jBx/twZADiN8okwuSOL9EQbDEBYF2NZbnwFwC6Ub+vxYC6ep6gdEELsACRAabAM4HgphBwBxiLL3VEVQ5kkRhif4OM3j01PXYWAAPRDKyEJNu48k8Snv/o08THj7G9/6fHHv9xoZIkvHO9+95/97nfZdebMmfAtJXR+/7f+wddPM8mp3pF5A6kB984aWyPzqQSwoNB2uYj1gjgng2UQiJ0GsC5uuZrvABAGPVeLwM1B/ZSSevhke9J4oz4kJREiwhAr7V/fG1zOwo7wJI+Fr0khx25ReTb5UtZxpf5+u9Ify1S+909Iul/XPyGPbagyeVoGEFCgBLChYGYGBICtbM1oSACgs0vLuXMBpCCACbGSQFIIYacuiMtbdkoAnAs6M+iQ1E3c18mhmm9KS/3NqwoAhAAEiwpIJ85865soA/DE493Zpv/nHyT6l4dffS2lMtL/neoT0ZXf3b3zaTk+tr+LmDFQSAjABBugKEzTKjwwmouI3ojGOXadYQJUTBMBznDmjAAFUNjF9u3FKTzHd4XEfIlyJZZubyuNrSxdJVNEhEiwf/gPnvz6vqflf/z4V596yvHLD8/UxR9Xg/Cpk4987wchfL/G07Znf+9b4tv8VWcQ4AendnsSzMd8/Rvf/OY3nvz612WcAma9jK/90NsJlsEQIgYxgYq4mmKw1Osc58Wp2+56W0A7dzWYUCt3+rsJBBsUZBMlOaEOv/v1b/+jPOi/za25ck3ftyV7fug7JZ4qB/uJHxjnaVvHJ3URwAs/+Nbe47D3SRQECda3HAkbzWGOEEG6cB4kOHtWAlY9EEkQQCEgdGYCAAdkEDp/7hyrUvZigmITE/vyVKHVaaibngMEiUHBEAQq+x8/+TvHH7/Jj3+odnP4h3pWqcIsgj7TJwjfBw/b7PvOQyekPvZXRiuw79lnnhTKo4U1y1ySBApNLycDOAqChM25c2cXVXBPFEVPERBnjM6AgEiIsmRzBpkz51O9kN727p1ZNcymbnDnHR5ESs8QBCZKNggZUQ769rHcH4bg8L/8yR997elvMwtDCFRKowgCA8Rj+17OYuwO//XM0//wG//NFyfbk4/t2pflNh6aZXY2GLOqUY9SxJOxsb1zx85d9OpM0UEMAJ4wAKcNgSgHewIjnzuXJG6jegwijiihS1QroVFXAFlBNthSAEHlKx/FkH7/exGFkMevfoPh2W6uWYAulo0Ds1DSiXt/I9bT1lMDUkz9Ulr+/Itp9qV2sNEwEIRYM9oM0wLbMYLBMfos51Zd8QyyQJqUcC/sBDC5nG8JS5qcwEKK3Z8myalPva1GlJnqcziiLiGAgJFtwwFBUBAAyXMceHbf73zlpn375Mf1DMBXwyzDAKmwIDIKSfhy+TuNW77ypRxHz8vqftf3n3htaK7UzjIPQ3BhNEBrvohJHA2cAyMmJiYwRe2wrr6dAGyBkYAwefZ8kvo7zzi97fZ3Ww2IOWOJ386cOr86KBNrJU8bI0hAduDy3o958thNH554kseDooA/ag6nyF214xe7yrBnhB5rP10LuV8pw423pOHh93TzwWzfe3MjW/bu+093e5iAjKYAphkFcMghAlncwYp2GhbbfxDIRpIKNk4v3SlH0a+xjfHZJCH7Q3YdCnXlzQhl3N99ZYGSUlOH/tFKVeNjCJAsgeHkXh7zR9qnx8BEzUL/rx/QbDNLs9L3yjPNEBg2eeNo/68/8dCzp4STB7/yxHP62j2tcozMHuf86+87HwoAjDHF1ChTUxBFMABxxzkAJjhHrww+XZh798S6+f6IMyFp7szCjdV3bx9+HcNMKfQ19Nm+8sK57rERwXAa8iQdGDQIhAXwwycfz8MevmE/E39gwbA7Pz4OWWc2mxlglNkkzOAv9Z11l6fKMcAD8Xvxvq/YlZc+qkXnH4YLN3/xy/UgJMMYK/MxIzHaALEg2oknYEKiCG5NUCgAk4WjSouGPB2c6Rt/sK+Z3PHu284AVRL3Zy9kramJD/dG2JEl757PkmYahQIAwVI64HTPKSm3QwBg15c+32ckYCaZEdOzwLPf50vzz1epw7b2HyXqU7PyWorEyKinWk9/l8AnXNXUUgIwIAtwNKuaPAcCLEHxrt57GU4DNmfMEhea3PWd7/5B5+Y2dyYLeV4Hxu7+DI1qH5Xt3VviXP+2XKVPe76tDAMgWWDxx3uSp5/NHzvwbfmrUu3XHz6ibhw2MkwDaTnNQintTg2dtlF2SI8/EfFrP3j/5wNzAfJRZvbuHwpsvjzu3JFxjV+RxxGOoAhMLIoJMTmxYjRbIABQDxuwXB5Ps7hMstvxm98MbRQo0U3vFopx8KUjnfB2t9NK4sG+0aF4332tMzRnunEQYYQBgpX+1rdLj3+l9PV/hOQv5f7BqafIjS0YSCp9B/KhFB57bOypgAbzLNpNvfD9D3N71vZM+9Fw9cqlVP8Fl2HL5aWkTVNx7UZ5x+WbTHvuDaT33hWjHjDgFPCUABChtT920wfDu51OB+LMDfe88vMblZ7RrpwLYw+bw+kFAt66sBAshRgRFg5RcervPpN8+dk0z27QydLscLsUmHOtPpKVvviHkFJletQRwY772kOdV+IxDU2PTsPIDMPWzCbQF4Gtl5YSWz4BC7CIBiYEvZIRFtdCO3ngIz0NwkYBa3f/fB7uf+fuw0k9cSwlhw5X8uZVMXmaXZU7wmuxNY3E4CwKODjKgYgEkazjGOITuZ4tzTJoNC88ksdSvdbNn9APpwGN5Nlj9Wp86QN7qFPpNAHGr0q3/JxxAsClpbQ1uQwmBJDtX/YgQBcvCrJTvJ/5CQCHJAE6D2SQhE+/Qxv1hWo1TbJuApM5Ow7e+eJrC40rec2ytgEoFvPUhEgrTeJj3We/n8wCjnEYNBtCjAsxPPP9KOE4Pdf44b/4V398bsDMdjpxBOCqbz3w0QiQgsW2C2y/IDCKoGiYENYagjCwnkdF27YbyXpajhKQP/EHd9zrGO5TnuGQtvn00ZeycoYmSLb7cDL1yabKrvdKMSWbF4ADMVAMvCQe/vfycrJMFoFZASJWH49/lGjWICPPMGskM9Ts9K0Y7Z278zgMqVkEu0jvvYAygIpddGrSEgUrFGA+Ueek63f9ljBBArKX9vYbP5K965bcn3aGIE9/vv/KZqrdbl9jenhnGi+QjcVQF8gELAsRBRYw/xcXkgUA2hUCALFJ9dk8ujUyDUgURzH3d7+DR3wFwoed+gAE4CKGCzIGUEAA7r3FbrIwnY0NcNorOqU/HvxerB0DlEiYbG+D+HJMuiHe+UCivH2yeYSSbv14Z6q5i2oy0Zc9yM5diSkmdAdssLBlS653AgCULQBQhSYB90/3DMRpGOJ3okdnhIfdeYJZCLDdrDEIsB2jJ85gU9AZkOgtcZPLfPrGM9//Gkr0tJQEA8I2eWj3JY6GJPq2B6Ts/jDUvHB5drikvswPqhzrJ/tkgW2QFUEYiAC5hwFgcC0HtcGddqc7MtRTPjQyOtI/qOnlW1hC+acRCOYCQHHoOJpFsjM6c5rT16w2hFSAfyMQn3pKzzyjEFjVAaippM9A82XnSaX6mSOH7kmeaoxMobG/bh+89/6f5Z3z1duFogAsRwVMABFCsEUKALmkVAZm+yt0yhW68/WRnoOasYHREUYIg6UPAQJgbDAIMEacAU7DIttGDwVd/eWpbzyNTUgSUOH7aag5CUmMbz/4wDsV+9M6mJTCCAFRea5UqjfnzH2j5+fnHYMlcIx2Eh2RCCI3oNIwMAAyCGC+LTodS8yHYQECRBy1BTAyN0/w4ODQVYIAtHMnUgAgmgJkktOngV48eZVs9yKYbCsJouCC2C1l7fDpg04Cc3TUIR55+akz8yB2wWfor56W3pxhbh7lliO2Ayyx2dExt1EI5croEFEhIWdFNYAAYnA+SEMjYCwXBzdosbAAAZB9/rwFCPea6PQknF7bL/4co932N5+RTUgDAEgABrohh4OB0pt3epCUT82+/aC0afBqjjMeCg+GV+bvOXoakUTLDiAlCgqpIyYHFBJB2rc5fcIhFv5fNoRbAIZqi3jzGhwGWQgjrzbvHiWYFQUJgQqyyZX1ZGFBU8DxjaefJVrJKpgkAZKIrZvjZ5NS/rJebM7Nv/Op7h1hoPNCffeVzVtmPedDevmVVx586OVzIDwoIIggkAgJEYKSIEkIGpv+tYhmCAAa7QrE94F5wmAYjiNJWIQTQIB5IywzfTWABCoGEkjWxTw4veqWto2XdPIk5JEnnljNBglsROvAzW2/GO145P5P4SgPvPtaswsj3Xx04kbSF2LMEnzDJBEaAAYUhNEKGzHIBgPyFiLOAKBS6QABQDMoGQ4hCfIcMjADwvMGhoOwpQAYkj0gggCKumLpKtppEqRTySkZ4NQzzwTpq1956lnRew+yY1KnWn4g3Bvi/QtBQ/Xn86P1hQhGU6cOPvS555TGR9z57L2nwWBQsWMRZFDUGpvVrO4OTgAg6UDqHIOFSRDBEIRmZoYZFEgeGHHKxBlMkhs68WaEETJMMnkaYFJP8rWnA5AngG19++NnJPuJqCAjhACiLWfhAAoN3Ts/9OBcYODNy/IIDpG5OD73hK3P+7mH3Cq/kG2+Ym1dqCMsg2wQBK9CSkYY0OyW8scjMwAJLmWWMTBHUcqTjKV3zA/KeFA4jb9N/u2PMwH9C0X8gcmTe7wbf0MAzxYTrJD1DQeIT0SeUU4Ay9gGuiE0QqJ2iJEXD70v1BqZ9QwWY9n8wK9VQrsv92ffuKv8Qil5YMdCLoKtntsZjQwiBtYkt5p7O6cjMiiHKIRHZsaX4/lSJJL0hKLy306fycWTwY8f4NQuOGXYdfLpJ3hGgE0kufY/IYjRNx7jK88gwNgCMrG/S6WrQ27WPptneTY7kWxJkBpXPp48eBdy+XUqim/e88iRLvf8bP9sG8AoT7EFEYcoA3JR5QpmGb9iM68bj8VBL1ieH4IpGEM5gGJkVZov/+ddNUHRT+BY0e5TeejqaQIbPZtGrMqP2+HpIAuiQcY4cmNo1xbyvvvN4QeOupPNjlbtvrtf4oGcRi0kbyWtWr0GMtjKiHMh69ZDDAkYZKIACxwEtq3EtkV2dWQh3XPctbmhBcNgmBkHgDwGBXBklmHP/cZrNzrEIMkhefaZZ7//nc77jewPnsJEFyTCrCcj2s8+ncg45kbgLDeE+9+qZJlbP/7JjzuvSpo1Smm/Wg5utPvfffuNNKm5BhgwBO54OHRqNQdsC8ARgWxk0/u4i5H5ND9OnGMeAI2yqvkQAAmG7N94Z19fJTrFEiDEM+ar4mnAVkHxO09K0CuHp4KEo2zAOUFYv/ETf6ppsHLNhFqojU5XAXj3JiuX0oAlkKVo0aXz2kKlFlJDnmDZKMWAbBkwQmArkg6ej5axhMT88IwFwPgnWIDiaEZ9agdzJVVTGxmBCfhZ6H00h+FJjABRSA7CESLkQGKzN7UStWJCDqqHMD/m6eH+pBvLZ+YSJ/m7YJr9N30oS7O1Zs3xnvgTqxXnA2DBKo1lCWMHVlcYhfr29FTmoVnKXZe6MM6KPpZyC6yQz34lkvXFUjNFRcfegmJYziAEASjKHAivrrIQCQ4Rcu2FdrWUzds5gCVQi4E8c2VurOZGqTN5PkTvz2eDg2PtxvdIwk8pp+dCbbDWpPh2ogCE5TyxBEZCVoPMAzNSNrAAA8VByfnU1bGpOFdj4O1JmyRU1TLIQl7/QC0LrvngW0NmIgIIefBXre/d2hzsLijW+1FUQ8rjaF5WUNLMy5/rhp8Fbn33zrf6YpNavuOiZbjpDTtP2lvm3tqOTBBgkKMdhMEEJBeFv/bJrJwMzoW0W2l5TAB0Q/w7USG2Xt10ZufoIhbdgYsBJMMG/2vLRY4EgMCG3CYIgKgohe/dGMrzMVoCC4GYHnj4Idzp//znnBz+1K1zrzRfmbv84iA35Zd+mjTy6dlS/q7u5/3ZT99sGxWxZwK2AYiWwQgAdeY1NBxVS7sDnepIBICw/T+aaTUPv8bY0IThPLnqs6lQDAVVj7lAFDxCrKkt8FefQjFBau/7/NMH+mpzpdf32iQ5UOlgOY+vRfXd89bdhyOHy33tmOY7PrO39VanfWBntR1aL+Y3ll8N+z9Pt9oCbBkAQkwzBMg4S4FgBJBtaW85diNnu3E+NBvjXB0H/rNPtdWp3V16b6A7SLg4Ueqe2rcnEAiFVXpMJ6kgg0J5W4CfCUlSCkEhfST7O/ncT9TdByY3GBCkr7VVuWeu+Yf3O6uqW37HfQ1fnllQ6yOLdt6KcSTJ+n/+5lzR1giBISFaRoIchADAGth85y92lGKoxOERGAfcrfZZDTo7J6cvT3vLmcbAreVy6ImurJckFWTGMet2c6EQ0qCwCAfomaRUrT4aSbGgiSWDJw7mDz7UeOO49GbMOvT59jyZyS/HvPXwHZ3W9HQ9drcpjvbfNjNoA7YRAQeQgm2BhTOEWVVWMe+NDJXaw/lsfhVHeO39n2eVys8pt+8OEXbFX5hUnTUwHMwvlSHPggGnSiIQwDE05QO/ONTc1O0cuUE0rT5EC2fbYuXgq2L4r/aNzsThch6apZn6QDkL22nEpPJBra7b89i88418LqqFZAUMDrZMHiUBlkmCDYVK50p95PXh5Op4nsDl/5DLt1nkv0i3wOXN4/G9PC1cTiDzy5SbYJyQBAiyANy8JcbyIzFkWy/tXbsz34Ac+uaOOiZXHKMZOvBRu1odOstW2a50PvWd7c0Q3rslr7wVzw0GO3ExhdXBcjAWoKK9KbT/WJ+6QzNXRi3iWHXiyPb3x5SwE8wW5+EWBdYkodW1lgX0KhpbIVWSIIwAN7q3HCr3D9cZuvHiWSHRRz9gopJOFpXmI3vjG7DgK5HW9K6d89m2zdHWZ1DAP7/U0NgguJoLsBwtggUhFC2PjaHoOiStySSGWUY2j279j/+TgS9ld0+POqHbBSR9+ItyKdAjgVxAYfeg2VLoCoQCgCnd2nekoedE82fnMZimME3s4cbbo30Obwm28/FdCXe5+9Ynzw+GcxcJ8dVpCbTtg9c7Pxe0Gk4RWAKQRQwB5wKAGI0KyhtoltPS8NDkfdXPdLNk9tKVzSlQKmHoZFuS8+cColc9o8Rr1pOgSxJJ0qQcEgDQwkJz7wG337ZR4GoEDNhCkNM5FLKk8+nnUJ9v/8XL/a9lb+xvPnoqBGjkFxoBIuN37p0FN6pIqTEgrzI6SSRLEqBAUUvyizb55aBfu00jzQUhirmdQlzeveVywJLE+oCMXcyeBseIQpIrkgRWVL9j98RcPbRvHtD9djtvCBruk4AKcQRy1zQ8/Chtyg/Ggawxd6DZ9J5cSSfEkWCX+vwjCSA00eSmMiCQzdookIyE1DMJEwPh0bG/vVBiPh5/Y3sb4NJFANHx9C2hfaO6Zo1FGApFFf1/Zwo5ITExsQBc31tj/GNAo5TSTnveyBam7b6mqAblY37t9p/z6PHW+dv76SzUVVsY3OWfPFKPSTI7HQCV0tJ0P02wNPT+ni7BgIOMLXCMiVxcBlsGwOBtt5Vblffzgf6KgfScpTHAMwc6KKaIDS7OCl+FnGBCQqO/VRMAzQP5+JmmkUcoudldCJkAsFA7mPmhqCT7QvVRC+7oy6GuPg0uEDWjsuO0+lqWuwxN00hygt26QTGAsAqXgRgQYGEwGFUfjR+0GrfRrja3Xh36BGHvvvUXu5smSy7f4nK70kqBQi7MRI9afSEq4L5G/wKDlrd5Aj64SRy/XaXb3+nOk4GRhTFgQtx504d5DeTbdv+sE1oM0WndlunOWLvjg+bIbFOSY2em30kEQcfVSgeMwEhYZq2lAyMLMH703fGRvpOx2tLHFXmXkyw5fXpTaOjqJvmWUjIbWgSbQsLYFHcrihUNBEdDbrbv271lwfVy/4kfdW9+f3Lsa7W8+053QRI0MNBGEDEjekt67keidSJpa64znM02+ZFm7+vzz+p3Dd6GHSNquRPVhxNwQ5WAMAaDkCyBowwYRHnL37r4M23pH9p2uh5ca7Xm5i/VRs/Lm2+hMjG67RJ5W/SdDsJQSBR1CqyxIaKlOu39nihl2Z47Om9OPCwe2XLXz+Jb3XzBIFS1bQRErKBz/snz9/41rJ0vB3Oiv6Fa5fM/TvEdHd5kplob7MdRHcudJCCCWu2QWliAASMpIMewCjf6wME3Hrl1cm5g0SOitakSS/l0cnk47G/n2wZxfvd7v0iPLVweCSCur9i02gv727fRPWNvf9Pv7bFjraM3yW8eyTPAgX0WbpcUjWA4d/8jjzZPitvrD7geb1rA7Iuf0ZvhrTcHCNONhaweJAtLAVvCpfbkvjNgIqssQCIRCUD81bv7jm1vtk5knwx0S5fy9y+1apWzDx522Ok+ZRLH3itvuryVT7YHZMPGkgAsdzjQnlRU1RXveOPuyRubzzs/mbfdNyOEEcflTqdCtHE+riZoun8Pxy7ncMzt2D98w3zjrqORcO8lPAx1GRlCojzPlUuhG049f3MEAmALG1khEA3e0fS7w57MwuWLO8tX9jfHpFH6XZ6dGnA9XLnUPz085KRv66ZbuwEkfrkMTXfZu5PUlFv5e9UtNy/Mv3Z1v9GbQbFVBwnfACrR6RgTNw/F7p5WXVGQt3/auoXK8eN5F46RhFb9PakugpIQIBFR4BAhONuzyxGMgYjAEpKwL3yK7IZPkqHaxKQvXr7tfbu2Nb+sj4K7V06c8uVL+RVHRkuN5lpABG3Mh1Rf2PXwvk7nuEKz39XS3gHlnp/DUfMH1OxWI8GYj8FdjCN2WdVjM3c6Gsb7yAQfPPrXjsWK5u4lbindh/JYFbaDCEjCQQjU+cVtNkJIsgGv4vm2TsPN0c0NTtW3cPeVLYbIpu2EVt4/MVmP0k3JxO7uQPXjd94JBcGyruWNDOzn4+7NJGQar0UGkuYxjnkuHKTf2HwYcls2UI444rEdVXR7eCd/Y8h5MtLK1dp/d5Y9gvqGY94+PhxDjDSNggO2AMm2wIG/vIAhYsA3J2Bs4+pgN6vPnaz3fbAld3Y+WpIcm/N33XO7hgZPlknCYNMDb+nWuz4VKAgwCCj4sMBs7dJKXAqOleMLbX7WzPd57/xYhdg2WX8gp04dCbBze9cjpTyfke8YfzTVdOPjfcKdUp7FJuFC0Agh+VRergXhPI+QI0uEELCUe5dTjIyT7TtnJvaDXdq5/W9tnjw/tXX7Hcc/HM1iFhUMxEj7ttDq0vVtN+7L3EdffmverLeUsU499yfaLBxox1Dua08NDGoGlXJEPrfps+Fos68+SLPUCW1kRZmmI/bexqYFxyThE07cHjozO/JkfLr//LHP8fznT423urM7P/2zRr0eCBGW1k4QYEeF3EHc0tGFXVdm8r2tbUaN91z+lfma52uNkJ/d5Jg72CrF2dGppDKj29ym3D7buFlpaJfdEQ4OsF4CkAwg6UBXbVXpDpaVDU9ObK3WlAxufSC+0nRII91YLQlEAIhT9vhdutRqZsH5vsqtydu+kCh2CHv2hZ/uOzmS+oMqxAUTnUoCGxTBJklQkkj/Tid2/dUm3egtWbSz/Tv+RtbnZknNs+HmS5dmSvUdOypKtamv6/Lu22hVkm51510uK5Y6HOuLxGMpG0sAaC6WOjGJoT/5v/s68+aormzLr3XOvTlqFgiBBpRSSggwiNkztsvg6njR0R+gO6L/6Oh4/b5SRfQH6E/Q0W1TzzMu22AJbBBCqYFBCBuQkFLK4d579up+UZXYr96rWv9l/nNjR9zY59y9fnvv3ZFnqDtdokQAEpqFVoGRawMiMLkCqV/I3XLFLN+uF1pZrn2nWnvt7Vp9Hw+1ysN4ciofza69cT0Dj2yCIOVEiE4gAdExOFU0k/zODdWH5YIbCbf6v59xUOG5zfyUL5i2+AwJkvjZjDlErWIhEI3un1zmNf4gP3zn1C4nI+DfrVoRHWmaQhdRL6N/cie9efFC5hxEZm987QE2sXBKkHMGoWkGDpUtj/TC9aFGsVFKLkYn3/7DpeJeQPujj6kPspZGz5+d38rnel5ClAwEzJlIyREIkNoR4mx37mcDQmQ/Dx86ROXoNnO/2InvL9zdOvg0GkQ7Hm7SvewttAgLDNAQ2TjEcGjXOzh2Lth/64CrYxSia+esna5+jwutr//kvqQhXCcU4nIJJ3KLoowggsTRd1k+c7YL+y/VKDcsy3HpPHfVbuU+voKTLxN4RWCz6GIhcf6V0eUcSOs0f+Pe870jdwDC7z9DsU1vhqWhnhOnwrl245A7cIBZzhTirpEHezCT88kpV3geFeM4H0U0OZCdmASCnZ+d66OcPWKPW0Gc5fdXLkctvfmOXYL3X7+VvfvWu2dbaX9xnyRhWq3LNHFhAfsL8/V/7ktCvpHAu+6dNriXPJl4jyczy+8iOUUrNBZWKCAIFgw0R0AgjCRJue5hDAkCu/RiA6H5qLbcC/O1paWHPeWSKTHQtQaet4ayULCCU8zcxhEEpI5ZHnJ/VRjBX9F1u0crwRUaW7O5JOzINc/jPQdXwFfp22q2HL7uKjUv9LxW7o1V3921MFE5czvlVLrd6grZfDxq623LfCkLWj2LL1bkbxnc7J1v9tm+MqXEJEdDyDrcICURcMQUJRNYb+3mxsfMumaOyKSlhosL5WCUacta9EMeT7lfzqzmb9VTFUG0N9tL6w8c/j2RnZf0JDCRCmPIQgbmG19LhBDest1m0Wc3u0+efOfrFt68EPX2Hxw4+lFlmro4sbK7VwtJuLi3HC799HqGVmjj8A+bR9pc+WBJ8U/Kl6CVWmoEISfCAwCNQQAd4GYbfYBQ70nr+/6B14Nmo2tr/IFLyQJMpMCDmSl2+KXiiy0UJ5vVcyeLKuZKw7Sh4UMOf0881G5n6LZyphyiQv59+TcS4csvZIiMP97Lmbvz1Vuvl2/Np3vFdy4fI+zOmZdrJlz2rSmOodo+5kwxXQDb5J2prQ/79147lc2DaTsDBMERTDMDQHjvaAZgJwoKfmvGbG7OxlWssAD35UB9DJIMgoHtuBw/SaNJt5y6cC8Qab6rO1fuue4Jwf3dfTD1fJYAhouAch8W9CXOt2Ond94RtPLwXoGOt+a6zIU0FLteh5iWcMLutgKL+zt4EVaybcbfe6kRXL6SxMdz1+IXXYWFb9oVKCoCEOhFFPKdASdmnWoBEW3FS5hcqgMr7QIQWzHf3Tf9jHCQhADT00OFAnIniXSI7YLSG+3oB7w1+ziVuVcQEgH+dZAnmgZds+D41tuXP21+cPm99p9f8x/v3nNsH589vn/6+t5337Zv3KzXr/8IFRv59rcxbzWOdqOqm1NgcGw4obyyvnZiPUx9YP7z86UspZjUKRpgEFsoIhMAwQMEvfVLQT0DNLpHmNZdMenuM9WXDpFGGOiVJYO5AuJaAiXm3H57ZU7+fJJATnAkf2OgkSBe/TO051CJ5966JPs6fHbZhwZu4UcLt3c8oSMXcP0Gv3Uu3mtUp8wXTzNVKdyPwTPF7ce22GJtNkQ5WQiFJnDlGpDtzOMj++xeDzVtrncgRweHPAkJDoAjSAJWEGDEi6zdD7hgs2xFXebdRk8RRgmChEYpRrTUFNq2FcCeWZ+7c/3GD9/2mxQB/zZHdtKjkOZfRsUbSi7jq0t8p138/C17DXf8BoWs/4vIv+xte6fKqpzLn97Vxkj8v87Nn22p/2YlxMXZ9hbm55Kju5apqgrOzp+6XRlL7cxCwx5ceHqsHJqOJIOXJUDmCPA3zrkGJIQXGpWKaZct9Ji3VuiyV/jWYvXBVKzZJVOCAzkV8A0FhXjAJd5H+NsaolbOJmq1eNncuyZ++8474cfICI082pO80B0KjSTdXq+6rWF12UT5u+OLlf60VxMA0MoTEBK7UTXYarU20XW15Wbgji9NXGqfaS99uOPh4QQkgvvtDrSp3kxAoym+4KiBvFV8rYzuvVzfx//J8Bc5rEWTucXe/gcjBxfHYoJviWwLuS8PfvZ793fuj0ors5kzFhz59adfui+6bi/c8SJGRx4mcf6ffUQHobxaxUTGLg92f0dN5G/G2TYyCdP9ye3TUXH3+2MBk3SYEle1p+s/LOJoI1kAVjogN8Bfr3yUjs+KEig8GoE5lRaHzsZWtihE/9E69S7cxcTvujb7IEX1yXzOfSsmrRa8T16f/G8Vh7+dIhf1ohss+ULhyy/eeP3iF33U+BhGNPJodeflY8WS6K0YruDqyu7AKdPCdWmUi1N5XwVY0Sfp8FxQ49K5hFyHd0odim6hcOW46q77CicUOg+PnIc/3vEahvq3KQAccePJCDfWnXbTH3yrnRmpTi64iypubkYRMMT8f1DTLrV2krTt/D4o0Fnn00Ug/1WA49VcxH6xbA5ALjpxZKICHfEjbG2nvv9OvtVMGlrYPQiu1NHvDAg+WVu72usaDMRn7h+za5kt3Pv2Xq5lQZk15Bt9pxO58im9ntEA96o+cOzAwZ5PTACkfzj3BEaCwkArNaeojqnFrhhJufibKd/HHWyOgHx39Pv/C8XfkVZYsd0imY++jOqa3PrtSHmqE5kw/Ok5RV2w85q/dUq9t0/9ySNCO1cX6v3H6MC4ebXC2h5s6DLdnxxuVVcq1WapdZ/CFXdjd87bB2xjqdLqkgzwxdxPub6PTyPMD9Z+M/jEPbjQE/yEDwI1pDsn9gQB+jk7GEUaJfFo7JeYeYgwERAA47X/3OQv479M/MP/+d9OYfnOP7XznEvycMjid7k1CTx3/9pUA9Xnlv5lA3zb55IUexDeXvhuYn0qKrTCxAqFZimvInYrWgXrOlg+xzS27w88bucS9LSbmYMG7fbkgPWBcgDDTgNJnL/9T+GLYkbk2sO1Dj3h7Hh7tzdOue0al7Mcwp1xqSkZA3qTZ2M02uZYaAVBpEQJApZ8/+l29rDqEERAxfkLKeLv5S5+WTgvODe9htVDA/ZXBtugv39p/9JeM2nutprbDqLsVO/k3lqShhU01KSAJrufbcDt2oEuX08i+2bwUarRlortDMCxeODqAHtB51ftjzX1615PKXnNvi1cLOYHwk81GQDo4TGfJRxA2Nvva5Yb7TRZPNh8tPHqFBoBHhsPOAme/HWfBdfeO9YubkwpY5wzxcs495X33zXZ/C4Of/h+fimqVdcA7PQSHQmDQKgun0Uz+NDdKDg4vbm43fOy6QcKLZRUZKHd9OppZ117A27Sut1k8e7p6zmOQRu53swo6MWBR/cusd7thcmVq9lyjImpB12X6N1C46czrEgUDZgQCnTBr042fh7ddtmd+MDW4dFmx4OUF52zzeknAzLQXlkt9t8bgk1YLgWQi5YDln96szxAYHkGE4VSzlVCVWAfhI76BhGMYZb1xJZsV/tp9Eb5HqKdJoFWqSDJEjCYomxv0M252J0suTDvnZZr6831/PcEcRC8d16kFx1YAyXi6LzCIM/lrt46aII5gyACn2KfcvlF9K024pCXewpPgUXIpfbgSJBvDsoBBkKCAFX2Hq5HLcsj9hHby5iBflcCCR7jPbS2EG33YvK3qb/XOQQGgAODwBXAbOXCQhSStFls5wgBgOLUmupqdC9cPFo/Se72zDMErmRc//BUbhLeZl5w+UxOzVtXnNWmU+LYw6MCflf1P1+SrRxlkIsyzNYEAVczkWHv3IGVKgaRHXwwpBf9gN+N8fywKCdECSSw4yfb9j7GmYfBeZc1gqZ1q8dRAnl/5rgI57Cz9f/VMQ17+72ZKO95b3WlVqtJNnrBE60XBqEFiEASMoPKHrhypn/lh3nrvdlKUDwI+okX+ZtS0B/noT4myRUIsgjkUVLG5cW3/FettaHpKB6s+mMUpwGh0Q2tZT/UqnqqkHDMbw2AUsbHFm2MeAN7Os3FAmFLVhmdcJASRo6utmlolAhsMwecBGJ45wCSRD8JoRc0UOCeeitSK0H/wFCSR645ILh2ZxhyjnJAfaGGZws/3DjAW3/Kcp4GEOMH9ivIQJ3fCg34loMwjaokyEARmC8mFy2dnHq5GNz9mQOb1ZnppPgpIfeRnlfGZcgeJxBIDEYYz2ipNlz9me/0s8tWAMbmfTvJ1f6wuPyg/+RxoEnGh3OII4sjREQEmAO4LeCgOQRADPs9y+9tH93uRS6UZCx+XnmaT5jLOnyCfAC60deMohtX1L59+keccy0I3NssQZG5Cz0/xz7drhqIGqo4LoIGwM+fWRhrZJ7LcHY/S8o3ri5iJvkQwMWFq/t7rrAhsnPARuMPRwAQwcteFbhtkmONdo6w3vnujwpL7H7RpeSwzAIEUpCEqH+LNmjYYT8kHxi8givrdKk8wx+yrbE6GHYnxXYeGQiaMoLmpH3k7p1KgQ18FGEuanhBRxuFyWVkbjB7xLU3u3uF2nRNrAEygYJTUWfuP5v5uMLUIZCfTVS9/vgeU0ylr92uUjYemt6LgkK0XRyNRo0bI08sJxCSCGH3ZMMip3S9XNrdDROzuAl/IKMI4BWYH20B3NJAHwHAQuRlYFxK9sP3bifkPzvftbOzNgERQNTOmcEBMojiof9RaF5UcXt5/dzCaSSrOP7C6T7hZraHnrnLOYI1okpxWZ0xIeB99xAPrwq0KDC+AgJX3U4vW5lNrmn86Ugr5H4GYLw7B0CPRjjydLTRSwQIhJzN7YeAKGEhtNxhFzZt+BWHxdRDAgDnSXCANClYaAYQ3iG4JGnvWPWeunbnXSUBmYIWZ0aSdA4QN2duoVTK5oE5N5vzqcInPQYoe/Q8LHOm4T5dXVYKGTBNJ9IBsNStCWM1ZJ7BcXEZ9w2hUUZ1BJRnY4gEDg5AhpMKwWVjwNOeJwEWAABCmtzWRjGXucJeo1AuF7qDJELqkGTi4t17ikCxTzRTE0DJM43k4jYSGqjZbmmkACW5NO5QGwTkJKh6yI0/2u//ENWnyiwxeDwtCsDpgU08vtDjK9NanjVCogxJbECi4grWKjUgyhAZlcUAsm8np5BDc3NUGQwuCXFm7a7gRhQIYqjV7bNOX512p81NAUXUDlEAwyuuF0hiOMkcoAhAn6A9kcUGJUUuj30DkOYLG93p0LICCx0wsdOkKAO4H6WPUzyqVF8o6m4Ca5W5RR4N2Dj1cvjBpZ5IU4GTIrBScaA8oMy7WsBVEVT0av4vWlRt7b+aG2OW18MDMqSGeg57w1EmAgHMZwChu5i1uTpo0GrcTQAyigIFBYCiuIRKgxWHLogMRQcJigBh31UkmalRjvrvJzkAiZAFCSQAdMAppt+ULf7kceqJMvrm1iNMQP58TvXJUmhkIpwHOB2ZBMeQtj5fI6Asy4sIQXAI5HRJwD8qbJCeZV+EYGAvIMB7APA7hiwE4cQx2csHzkyPrQsCQdfpo7rj6+O7e/uFeHZ2cGz4peuJ+h2ApgiUuumBJTuwIrXb+cWDUfoAcQipmLnfgFsWQAGz7ZJ2kJsudsWZgHD7fZJZVGGiHnPee8DBIMFAa0hyXR9V4Y8xxjhfAblEiN4H9tNwGI213pXuDQcRiCRCFh5B2D7i5OHJRaVDOrQC2+iJnYcEOEcCW0fqM9tTzRT8uVjv4ZNfNpxglgEQ2PSywNpZ1YCUXLqU5m4AAX8J7FcM3wCR2g+fn7s173vsdBbB7rnZT21KEZ8T8Z53PnagwYEEKE4c0hdf+PvXqtk1ZbgPwUsGR4AO65P5hxFXN89+VxbrACDw2eEI9COEBoH45yaJ4dCiK4yu/NzDHnuxy85OVk7sj0yMIOkrtE+teD0+MnIwghgaZZAqOWdQ72t/Wav35CLMARlFEHpVbBIEEczRwusDuuSy3LwP8QuxdD6rVbIDr9/MowS3PL1chWiCyxyEJ4fTqyKwwg+8GKJfkeBjz4Y+O+P2Jh94N/d0BNb3l1yIwcfj4MMRUS8OPxkcJoRKo7U+msJ3ScIAAL3q0OvaYTPTi4s/lKbvjkneMcCzIaDkaQGeP24Vj5/QielLJouJP0vswLOyALjN0omJgZsHevha48/od33qfeu2+KqiFFlX6QtIy1WSK875ZZrIAUTXAjAhfeoiGfjKPE9vfXKlZ274ETGxbchoAEB4OC9zo8Dj7REeFAj5NdmYgYfzjWCA1LGWKO5upv5ZwkXO/s/o8ZNNuoAQgCYgjLvxnp1nV9CTPd7capb6M8MVRYI8HNnpFI2Qyz/5cAK76fvLZGFQvsWFfOnai4XPXVhBpWd+YZsfZp8ANRiqZhkcKGxt5M9BMyFlZZmI2wAiDwDHXurKtdEWpYEniTLzFEAgADE8HDfGDivDVtdLoeFdEIoqlfr3YQaSJOi8a689GosFeJaf/L5nsP+AOTQaEAlEwLBhuLCed0+LF/zOo5Xm5toqMjpnr9hfwdLc+rpWl64lWJ9e/kS/zL/0ONfenhusXEnnhf20fbW38UcB2bQgCD4zCKlFy4xry8chQUQOAYAHlB64OP5fWHo2djTvtP0rEOcAH5iY84g2w/PhZFBID4a8iiw2muzfy1MGwcHRw3x4nD0ZssPdJUTKlLb+H4Lzvyt1CoXuAAAAAElFTkSuQmCC",
-        "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAANoAAADaCAMAAAD3w6zpAAAAAXNSR0IArs4c6QAAAwBQTFRFHRkS8/DY6Ozb7efJ3efd6N662eDR1NnI3day+9Va+9FXy9LE+85U1c2o+spS+sZPwsq++sNN+8FL+r9J1MOX+b1I+LtH97pHucG39bhGv7+i9LZF8rREyrmL8LND77FC7rBC7a9B7K5A6qxArbWu6ao/s7OY56k+5qg+vq6A5KY946U91ahR4aM83aNC06VN36E71aJI3aA93p86qamPtqd32547059I25052Jw82Zs5nKac1Jo/zJtN15k31Zg6wp1Q1Zc2sp5t0pc8p6B805U2zZY/mqCRyJZLz5Q70JM2xJNJy5E6zpA0qphmkpuQy441mZl9wY9GrpRWxo05yYwzvYxFxoo0pJJbwIk5w4g0jZOIuIhFwYYyk5Fxu4Y5pYxSv4QynI1Xr4ZHvYIxuYM2iI2BuoAytIE4uX8wh4h6l4dUtH40t30wiohlr343nYNLtHsurnw1gIV7sHoyoH1BsXguqno0kYFRrHcxr3YtqHczk31Ifn9wrHQspHY0qHQwhn5UqXIspHMxknc/nnMzpnAshXlNoHAxo24snG8wdXdoi3NBlnAzoGwrm2wunWore3RNlWwwmmgqgm9ClWkuiG04jmkvlmYpd25HjmYubW5bgWo6kWQrkGIod2pAhWUviWE0imIrfGc1amlSjF8ohWEsh18pdWU5hF0ybmVCgl8remIuh1wng1wpcmE0ZGNNflwreF0sglkmflkwc10tb14xfFkoZl49fVYmdVkqeFYoXl1IcFkralowcVUqd1IlclEnZVYtW1c9c08haVIqcE8nak4oXlIsbEwmZ0smVFA2Y0ooWE8pXEsnY0gkU0sqXUYpX0UiVUcmUEkmTEkwW0IhTUclVEMnUUUkS0UlVT8gRkQrS0MjT0AjSEEiSj4hTzweRD8iQD8qSDshQzwgRTkjSTgdOzsmPzkeRDYgQDUkPDYcQTMbPTIjOjQZOjAiPDAaODIXNjAWNi0hNy0YMyoZMikgMCgXLiYgLCUXKSIdKSIUIyATIB0VIB0RocK8lAAATgJJREFUeNqEultz5Ei2Zrfct7vjEhEkq7Kqq0vqo9YxmUx61bP+/5v+wJhs7MzpM32prspMknEB4O7bfQpAuIXRqmZmBckgIiMJLHwbGxsg3f/LTwAXZhJkAByAT2Rq4UEBC2AxODw9R/v0aTy9/Hh6HoDXt//vrKosJIjcCTD873/iKzD9cjlz4TJMSuMIT5/47vn/+b97/K+IOBEBHigKoEAWLdzxTgRFFRBANCcPDed+x4yMEVKGj1j4KMZu9sn3AJf4l7Oymdk5ABRbYIbhfEkTDMN42Wx0YBoux/UBT3xiZBjAYwVxAorwe2QSCxtLt3QhiCoZyI6NBB7g8dKFjUwFDCAZTAVseVgVAGsceDazFzazw0s3APL1n6AAlBCBQuHOq6UcYDxyPnIR9KhHjuxmI6fjeOy9t8EGB/DRTFQUFDJqFmABbjfG7mjIGjFYRdhJPnnANVtm0t2MCibDrlktrQ6NUA1u97pHxq9mod/MOL+fFdGFRDWwe6kAMDPaiYHxcjpzvCAg6BO8yMipd5/+t0++k60aQYTfJQN3s9u8wNwvNDpEAy05ION+opVjrlCopgoVqjGmrg8sYMAB0LywT1tk4xBOz+y80VK7m+nDDYplGjhubuw/2dQXxhPHTzz967e9FXG/ryUq7MlFFtjMLms5/5UjHT1+tzPc2XP74afdLFMpFKhkp4IxZXfaI2hVuGvxxCrGr5GN8swAwDQhCmALkUY7bm4jwPAdwPn5DVPNM5w48fLM04/PY3AtL/kdN3Z2M+blHxMTP/P6wnA8dpC8X6DjYbanBolmBpjsFFutoRqMqHwMCz7ByCpGONHMmJpPIdJCA+SbTyQ/Nrcbl1N5BtjNjs8uv/xxHAXhf4SC6p7ZZga8vvP+xHT5Va5PydNtdk3OsYaWyM2sYioqaiqI+mLxKvRYRrtlBXBibSGEUQ54B8M0TBcAlDu2KDsKeG7s/OE8AhfgeNv2D4nvvn8+ibEgyu8J6vbIoMANlsv0CvB+Y2MCelKi65aFDhKAA2Y2swIVgGpR1tBUsMgItCbN6QWA1YtRfHDeSZhg4kgApAkVGt99guQZaTn9y3QDkPEl4tDh5f/69J2UVov/XTFVLdyAmZ83s39w5s7lj9Czmy4dG44LpAyFRt0KkSJg4UQTGxllzQoIMCI+4HxHmFBC5Ns/XGdYaDQzgIS/3eWG5zidP03cwDmGTy9PP37/YiqVxu+YZVWlJG5bX7zcIztfAcb3p1cudDP9je7uljwOZqBCC412akNaZDzBv7CZ/QgjQA8BBjoCIRIi8Pz8TqOgbAifPMl7AKYBIIRnItNaxmH88emlP4mzoAIPTKWxmsW95zPDzOX1nRu72ZVp4OkV6Jh7luYGroXGw8xUg1SwoM3sE4wHt0YHDzG6ABCIwMjb+RUaontmn+hn0ip3G+F8mgIj/dwDEH586eVg2REaBgxQQdHNrFiAmQUu0/uNzewCx+thYnejmxkXus0teQe00BrFglrgkdnLCAfnPr3Q7y7g/BYZQARAwvOf84UdW/bmyCcggU+eBzL3AQ7wNAYJAGRniwCY35QjGsHSuADNbFva3QaOwG1koVvdcMyJj6HZAljw98yAlxOM88unlya2R9ZVAGSYAHDf8n/8OzfuCJvYaT77ROLGeBunAWK4jT1xNwoWwEHD0Ghobu0c+hm4vN7OsJnN9Fx2t4njQqNbOhyQ+U1oOycAnngBkIcZA9ARKj2alDsSvuXPp6+3KwEQVjFOZwB8YoTbyPkEMPd7aCChslGxKhh+BwU8D17ez1wB5stxpl/dxne4HC+XY3MjuftPLY/QAEvjuJmdTrywmj0So6P2oAmIbCj0q4vedO4RBaCZscYG00DjeoDRQ+BOcWxYCo2PO3y80S0AXPfxkAtsbreR1+Fy3Ja7ub9B52YACqZ+FBM47WasZmtkAWiJdXUVa4TIpCIZeJ7h5fVfXmlWq6xPwFqQ2fGB0A40AIoAWPiIIoqFVpHH6ekzGxdaCUzw9PcX2K6TFlY3y0algsVadkSg8bKbPf1h2KBbqX0PzIACEQZhiXvQR154eaHhz+BHRm4Q4UwEIMa1iXCvx/aVRltUQIBC48jAwIMLXK4Z3t9fJy5775+5Lc3FGGuLBbAWEe/xrRxPp5f/5ceXp5fu6al76taPrnY9AF5pTErk1lYOr3tonyF53ydGGEcCwsTON0/jgQ8xWQP8bnCCLVgAOuBlPHCBxgxMN+C2my6sbrYHzIe7Awi+49h1q9nLajY+j09DB3R7V7yLqUJqcipLYOfCg08JUj/7fheL+dIu4MLTGMzjUBOD/X0thJ0Cnh6Ox+Gp5wj9h/Xdbu9x4nJ3AwveQfOyzawbGISnF5rZU9/T/0rXdx07AmgLTSDuAx7Hh1vCg5/73q5ubhzdUQHov/lxDL7VoDNQwWDgQQWFh5zlEdvzM8CR9vWapwmA5jbj6GcwttzLEQEPA3zP8ZnxxQ3j8+nwq1mlq3NvliaGCg+GSVtpwMPt/cknTz+PxTIAJ2B46cPQPbuAgfBh+mgUGg2j+NQayRG+I1/amtbGeASmESYG1qWlmx3gyViamadj4HjkdBzHgdOz7381o2IqPXWb1H7LReT2WKDxCTzQAwO+xx1g21G4gMeDb7lYw0ezCg1tXzwJumWP66dVc+dIY5jagj3Sg0EARB5mp9Pxu09/OP3pu9PLYatGKjvNDCXxQAONIzQSyYPFDp7NzJ+g63FAC21fMJZGM1PlIwnaNfH49MMPezvmCBy4M9FK0tnjpVcVBMBDx27GcRxO7uD7vvNPPeDT740Ibb8JOd5m5iWxc7gCyfvk08lSDpsikHoPc58d4KFWY8EK1N8tR0VxoGx48HtsAQL8BDzayUBjK1D3/c/HG76tmIcZYzPrAEf+6LXxKM7hEm/zWzqrAConPD5tPzeNwAGf9qg4jyQsEIBqDDgqWJAm1kIDhY8kD/3cZaB8B9fL3MpkDfIFHgOP+46fj5zxQLfsYuxmg2M363oH6nL9jRktNC636acvnPMC0KPAPu57j2WAdMJl3obAjesh8RQBbzx7aILwoAJoc8s88Alb+vkAwHfuszDTPy78h+ke2uW4uCPHz1PXIhvYzYDxxMvDDOHRAfEfQwvxcvv6z88xLyjM6Hw9nOjB44FygNMMGZimIRAPa++8gY1+N2lU05Z0d9vNhALYQvKkouLTgf49xP7l9fPrmZED7tNTGIfVbdj7Je6P05teuXO87GJ7aD27GRvJLNSmxMdvLu+ff5piXhSuwJUZTvRz8u3cSQ+cTzC0yRhuRkgBj0MQmpt5FOMjMqugGEh4kMTh+jQDLy+/vAE8P4X+cIWpaVyO7o/vn4S3Czt/ZBdjHL/p+5fdzAGZZWEnKHzky2o2rWZXRBEVneXUDu9x4ATAWc4yEgAo9v0J1AKbGSDAbzLLbVH03m9TQsWTDmzBXb/7jkig/zPvwEBrkRf3f14m53650Ghmf+j7vpmRmRfual0UiE0TIE5rZrCaMQUUFdXz6jbTWzjNvctzQmUEWmzTcD3I5GQz+0gzy4DSYhPF3zwgmsCvwb0HOFx7DuFpLfLIxMDxwnRjdByPTLdxHywb41qO/bN/onc0swlQITFwuSc/EELg53/8apaIZaomhggBZY3tcN2mEE9Ppk+IMgSaWxpIEAfuqCiCyt2MZtZ6EsoaGqgkD2I5AO+BEANP4A/Ml4EjrGbc3PHC8Pzps09w5LLXKePwzctq1oqx3YRDVBaWmBPM4G/eD8fL7XWKMEeqiUTCe3h/Yo3NvySmgX4+ZpfPMG5mI7RTbPQsIbtdDKWJPIQU5Y4AGZ8QvMy9xZN+DQ7mJ2YOXuR+QrtQABxH+DZ+Tq1ncmT81azv+4cZdgJA5Xq4Ms+YCBkchBPTP2/cqUB47+PT5cg8Ap4TuB6XOZ1PtMzgyoH3J5iJ3vGRZpabWWFDJIpmr0XFjgjg04GN/oBYAXiMsK5bug6m/3IDVi94cZvZ8al37GYzYAsIh+s8v4HFkXEZMml+i5EE7PUS+/AeAjEswJG+B3h15NNAeExqh1aXS58RQEFaRB/MCjQEYJVQARXwvigvCbx4HOCyu7Dj+h4+xS+fuAGIMp5Oru9ffjW7ixGx3VIAWM3SmWOfW/d6f58ngBnaMBb7SAwgHHkZCRHGMiefrgFiAGKI7LEliKZttPIRhd1Mad7ycBQExdpiPSA4Eef7eWljhBu7cpufvuV0u9xCZB0ce17uF2WZGGIIvJEAUOa3LwCzAFiQpK8RCiDaLbtba53Hvh8JBICWVBgfNQk8RT/5VA0IjRaaglLYn0UVAQXRNvWh8rB1Ioh4aLiTRHr+zPi63ocfh3TQnr47dkBmtnNPLMPkF4D5bnbxDkQKFHuLyfOBCCESDt/uZhszJPbM+uS5N9Lr8P4UffLZJa/8hmamcP9suN3NUGyxFLuZCSBHIF6B3nXQoYc///sLgWc4bIPjkY15oYuh2MJiC+g8J1gAD6hCoGia8W1lKaKionEPy7QN6XhdC/IQGPfR8upJBKbDFFL0JbtkcJBB5b7t2vSUDyiQ99VZFSxttLZgC8+eJ74CLmgOiyf8+X1dFKDv8HexxZZ0nCnrsbaHdmYBmIbqASKAzgKALmkCdHswxJiG/W5xZqFPiQOMQsJvH6R0oKR5TFcfMo6p1BwBCM7KHtrvm0FmQ1S23EQdAoJYHdlx4Gy3MDp8ugIO8F1rDIWy0DHRpTJMazkuEAmoTdh2wKF3t8QdUR9keeVpIgQejKLiU4IEwLWfBmIgEcjluiyRBJ7A4EdLU2nPAvqhIEGwbGbSmotox4YTNBQWIHC8T1MdG8sywbB0LCS/1SMAEeIQA1A2OX9fWbxdaWg/9oHlzBORAMRdDIQEPmnq575Vl5GEpPj+yzWz4fzzIfmxibUnReAjW2bolhe7vPTaV8ABWHHqIffQLdDklmk3ZJg8wMwaWtwLMoOrIPggCqDLQkNMCD6oxHNgeHRMW+4BJxIzrHKpqlpsJC+//AStw3/95vmgXVC0eTXFj7FZNiODCMI9urCEaHY1QbsM0DN3VFPNrgQqlyNM7M5vLOxI7CGLgqvhdEYhxkzDjC+nAKqLvuDNwBGmZS6A0GhyUIB0/fpLgjZ92K9ff6Bo4L+HI0PDyIeXRRIVBwIaIkB0uWc2GHYUlOSXbvuy2NY4soOMQ4WC6eIpwbxkGq47HZyNMcHX23kYe08IwyoyP6yAfh4ZFBTK9ZevCZQZoEeT/C3+cEBA/+dyGcEKggOXsQ6Md6iCEGLGw16VM7BAQlQ048HTsRPiZmY2QUWAkyxvZ1VakfThdLDMaVaQr3G4yHD+djgOSzNrbJn1VEPJ778URVOhmff6Cz+01f5P5VTKbgYOgo9E96he1KcQ729fCBF07lHHxsJGhDapZxxk13cjI59xeXNz3Tj0gekaAUtOYfZxik/T88trc2te88F5WAL1+pYUUkmARUFm+KUL4vgtv53LslMszUSREI2j4dnddg/RqEAPzetBdgKNgj+NgiZdBIdIF7pO9DplAIpE6RO8zp/4/mW619u8mZk6DgE1Lvt0u85A0fzY0TLPf+3p3X2dv+en0LAUoWHB4GgUGjOguu/ZJtYtpAI8UAQUqZ0V/xJvsmQFxLmAXqcbGPBZs87OpaQpDccBWLXYqKPBA9mlElOxBY1kWgN0Vs5/6z04yB+VdkSlKgIoNQaUXWcx+JSuTiEDD/KqgSIK/S7m77E9f+FjaNlB33sSw3MNqgAi6LKaUTGJmyRAJPHZh2MgTiww05vBSAgC2VFymikkmGlmQND3cxDXXvitniqiogJA9ir7WpfltgcP+pjUIrBQQVpsOwno+fbvEbokFBAUwfgOIoA4RNnQ5aa2ABZDSRZAEm+nwwBhGbi8RAPSO7/PYR5IQM6Q8C26GOafTx6Xf8dMAPTxLTFUozhIC4w3cI9q/Mhutj3GQJdddvRvXQT1FEAF1Fnv7+r6mBmWs5IAKVCTFNBOXXo7PY8M2Ue+ubpIjzMZ2QcthGZGAg9kXGRKkMk4fhdXUVHuVBUeOGhkSNAQBeaZ/S5fPwaU8ZklIhjR3a1zXpY+eQCTuaMxawWItkjuNHlYuiy8vR1GIAA+ZDAVFCE7vN/MMjsJzyaU5iTAb+QES8HHe2oNhQJ0y7irKc3bJzYiaHbL2/l2vhAJX77d5OjfPn1W7ghd8L1n7qGCdVkUgLKUWlBAsYDiLQBziiMbQbNPpDW2rSRd8DQtBbnLUeaJO5lHFAIUa8k8CFBNoXmOOAVRKQC01CqAe317/+lLjlEUvo4/PveM4x/f5TZFAEE68b01LGJ8wvu4uynplkublyADeFkESefvMhsRNwEZf3dj6GbIJABaY3DZE3uUHeGBbT5EHlTU0C3rB25pMi21xuvbP/9xnVVVgbdLPP1rP+IU65ZMdogEhyWDqlJBFlXNqF4viqHd5S4kJFkB9YVGW1fC5+yAQ3/NGXxCmhlkbwlKis1DMo7fJfDYKR0LjO4XO3oBkEe8Bvj59pd/3v9qX9zS6Wt4GwjRO49PCg6HB0jEACgarxpzqhpvFYMVixWo2d1bDnjuKBmgySHwMr+1rRNtAdXTQIp5AmBwBC//QzPa8NQtuDfmYy8gyp2ZBb1sZpFlD2V1+zRPMS107eYOnoRP5JzJefp81ltcCkrSbEGKl7ayfcIDu7tNsFAgV1DxCbITf0q3TGpuG3n8fuA2TRcAjsEdAUfDmgqE2MwMmIpPu5tLFC9gCziUpvz5n6vZggIossj01977VKrN3kDi/plzodh0O7++TqBs1AJFagAWMHj1gOn7AJlEjaCZSsKq9iSfcQe4ZZ8QQIDkcd+O7vb2NrULrWMdRng0RcnQvHBNb3fDmaqvnLxaUPBE+hn9+f0fZ41ZQQFE0fr1H66nusyDnEma4yTx/PPbnHBiLAWoUJJV54zEUO9h1a7XnIAaKQvUhKL0s2zd0h0Stwxon/DJA99+3zO9vbMt+Akux+oPCCo04kPOYKCCTx1L5zBVr50VNhSAyu2nz80sg1NryObzCW9zOwFmyEkXLclbrl/Ot6IliRNvqyXXWqrRvtjkUtRySB24U08zU6iQMoRZZBZ8du7F+zcSspsl338a3WV6T/cC8X4aLnyTUFqypjYtfDVgi6XhwNS09CBF2Mj99PP722pWdjMyzpqapnPv70pkMkmXlFSTJ53fl6QFVfXVYUreo1u6ajOqGdtRnkcPwGqWKySFBIEEbG4D/TnOyYMH//TN85Hl5zQD0JPus8EozUxI9eFhMFA84BPd4gA0JRG1zQ3S6zlnVTQDBWx2SM1xHm0mr2aZoktcIinWWOfLHLXUiimllpJyKYAt2YGx6I1Rw+mpB6BSdA8eTQVQIXnVHkKIvabNpWc4fXsKt8ttZmOGPuEngvMq7EjJzQwDFD6khqlRBYckgV31tU3MO/eYE7kdY0V1SbOmmIB8XbKWQsHmgtSltLtN2RhTC7K8yjfPp10tQqYmAFwEQEli93nrkCKA6HEYXGDWmchOmAE/fREkWBBArSM77mIGrAj32PaXU1apEv3uluJ7pOyZZQvYQnbVYHTTSmtuutziKlYoGmNWKmWzSauksWV3q1QMVSeVXgBYKMqGUjOkgAJq5938cASQ3riAT0xEmPv1ETc5z9SrikUFBIojeYwBA54HjmqoFjA1RJ8A4mU+x5vmooAKFusAqJDJKUfVrLc4aS5F0aSqRWthtymlGlPtvkg1tRZrbVRP8gBlC00LZABiAHxSIQZMNdAjeA6t58ztEqSPqxuEg7KxuxHqPTPASb7H5jIgaJGKCdFCTml601WhQMUg7aIziIPMbpbitJSy6pfVrdT7u0utsCZsASgOg5XQh5wivgNYaiJpyYUEtIsimMNdHgHaAhlSe1sM6pMs114tgAOXVbcdaAGPEyFvUt4BUFArphK0qMavX6YYtVABasECDvBhcHMib2Zz0pJUKajWSoUKhkrL1wBYsb/iur4zt9uxpKWrq1nKMepCguJdOopgQYkQD0tHEvwu7TvICVRm8czOkej1OqoKwoZzOZW2WoOI7mY4dtSv5jGknM6XGBd2CtiCA6wJYeydS7loVk3zEjezWrRUMBVgfy6ArViwVpxY4x2wnJ9J1DjVmy56Tpq0UBCX6XopKKQZPw2GARrGZFBQSJ4MAZJo0g+/XVOlAhgXxITIxq5mhYJUE1T1+jYBNbdDpUjZ13EYxx7Iq1nRrZUU7ma2AFAxd8diqZjVzRrQzS0FTZR6S/M8p7nEDIq4JZ3ome9jdp+mAXqCB0hUl5FdZHVzZY1tifBARMm7THCA3JdiAIKzaqGSpvlyKQQKGxWomh1i/Hg6gfOzqpJmLQq0vQWNygOLNVCNStEkWZPNstzSZUpLjHnLHGMt5Gu709XH0LcjEFGmMcw+0eKBHIBEQwDZHoogjv2gy4ALAL0YNjRerxDCGLFqKqZWA2CNP33z3HOnKDltXrUU9s5rSzWVh5sBjDEUbIlY4/MSSiSmeZrXktSStIIRd4lB6ADBz44Y0vT9EECUCP1ti62ZOaDElOGBNHGzbm81BpfBAfggCEBa9C2DjEEygC3sZtaN69RD+x/ksnVFpezmdjWAbW9YCpZqKM7WtH2nS7Hx3GFTulymSZfVrQ1Yc3/FhwHoVMh9hJ8H54GU+uP0nj0fSALuLqoC6J7MGgRUEBtdxgEyBIEikMs1zWD707SALRUDRTAcvvnuqVMARChQKMq9jZoqtRhsMRgqYAEw1hooFlAImm5AXKZp0dUsxUp2RGsnghwIsODwc4+mn+EAQBiemPEJGgWsBxSa4u5FpcY5Cn0IuufrD66V4zRloD8+p9t1TcCy8/zdD08dd5xadKVU1ofBSC2UNS5Lqa23WSMWKEgFyHFyi5ZlWmJJMWVN+/qtUVk6LARF84gD/M8EANsfpjlnPuIEnWL0xoehe9xk5Xb95S27MDwdD8E5kOfQ2loigoJ/nj7pzIYB9/LypxdPYkOUojnGXMuev7HGyG7UYgMDRsQYANZIDXlyMqe4aJl10pxzKswYC2IVThQL4dZlXLrx1h+8gjyntF+iegAHFo7C+fVLwnen/ngcNYMTkemvv/z/F5Xu6ceXH54Ghxy8uxeRMqeZAvb4CT5fpW7hdy9/+P55RD3KhqZpSbmUWmgJGZctgKVQALuZiWGPTTHBq95QXRLzvOSsUYsWAGvFAPR7x75poNf0dvReweoxsrqR8Dj2MuPLP//9S8b13csP3w0jiFj48h//6RVw768vyx/+4ORwGDG19ceIooo/Qf9+U5AuHA7fPx98opFLXGJdM2sjSFnz0f3wQmJlbVNWvGFHheAtGciaVGPOMW0VXQ3VWOtqIZfgSEQAZ5EvhxQSeL4hxakNGFbov/HX//i3zwZ4d5+/fPvDy2BFHLe//qe/g4ec55hwh+Fk2N10mi5TYgZww6fgP6V9vDp+13kPBVzGRU3XNbJaAFOBYiqdZluKFWeFhMWuodkMYAF/lAIKuui8xFUsad1zt0ZqKambQgcikg4DJ9F47cVyRxfoBOew/dO36T/+7W9YsCWn63/94c8/Hlzy6fO//1vBZpc8l0xwT6NhI6XbdH67zQACve+eZwAvfuycN2A96lxSjSlWaFRDrcUElzM459Xaso0hwk6xVkZP8gVIMS1xTppK2tsQ99K1sxWxGNeN8wmwfDn0xaZ5+Zo0y2Y39tafnn+wv/z1bxkEpaSbXjX96SRx+ttfLjgpGZK/5OBGdnJM0/WS5pgB54DOdgXowDtvOqCwUVIBDDyoEKgJ372Yer5dM85A80cOB0EVQKclx6gpay6FWgFDVYPFOjHO5Pl60IJ39HNPmn6abwn8qAvd8DQ+H0/h+svfZyCDY7lR/nPSfw1y/vw5ouIEHPBfnQGg5itTBMg5gXfOiXp2pPO+A7x6cGiKgFVjywe5zkkvh1FY4vtPSy1U7l3CnQavJPCQdFnFkqrW9gby/r4irhprNS9Rwc6q/eefvswLWGeLMIz++Yd+mN6+vCkbyi2i6S/96Vu+3m6LL6riKNlxcc1sKTBHCqCoDEZE2RAfvO8jIUoBWBQwppmxLVFwx0N/PB0p5fbanc+Tln36lzAeIJFxyZOz6qI5Fd3EKlCAiqFSEEuhFPA4/0X8l5/fFQDBWwpRIf7yHxEoVVj3gkXnv3QhpMuiivhVTtKQ3W4WSyFS2dHsQNjdRMbB+UBZAoADLICtllp40IX+5ZtDJ1qc0g3TbSkKEtwBnyZUYAtNk+aohUJtgVPA6j7ZVmMKtwyde2f68jmmggUfrFIywXM+TwUSZLLeAK784/AyF1UAD8DkHRtpARKIJSkZNLeLPRkOnT0GYrd41C8ZcVa01oItthiwxhprvR+Pp8Po9wIeZRh1oeC8wJy1rSeiWlRLaUob28+qhaLYrR7i1xD6tP6RfVJAxC3We5KBH7jONWdTwegt4SJc/z6UHGsC0C04cAA5FohAmAAUMskJAGKDt12AMK9us3OAK1r2iVgqZtsaCaHre+/BJxzSidcDCUBBuZPTZlbLLtbc9twqup3mMJTb62Ge33/6ZS6AVOdtcMFDFWLW+V7Ft3XsxkSWMPlFMwotOMcjtCkifQQhkxnYsKeT74YOYHNbEO+zFQWKMQAYKzIcxt5D8oB3Lgkuq3YFEprZyC4XTbkWrbtNE6tg9uSU4rRIten99N3t8na9UTEBjVLs0gX4gs2UmoFCjAUtFXNhtudXg1v2sfiuVrfQkgL44FUzwFaRlq73nXcAgbmDzndRnJaaKrYULNg1s6ETByl10k4eICgkaDi0aMZAM6um0qZ2w1rflWytitp8m97O52ssYJNbxKn0mjt8J2musZQtklRUC1g5D5wvhGJpuTlMNQCYCBnv+0QGSANYusPY4Tx0FGA2suKjdQWjVqoBa7x0wTsci1u8BYcojQ92WgqP3rEZVWg3HaAWS8GqLTleyzTNEUWss1az01AURqv9W6aSKaXkXMEU4uJXTQ00N2epkIhUYgL6NEyODFR8F/ypY1j96RZH6oldEK+hokAFMBbrnbfigJy1tzDkCVy7I0jDZ5oIsHs9lgw7e4MiXrlNU6kFNUmsEx+TP9zM2wFizVRTkmrOGIwpKXqH1ojNTc1DpOGQ0uPmFMCHUeTk3TaLbG4sIbL0rtPUQ9VctNhiEVkbTfDeZRx57hPOiQIIBRrOs1PgcVVsalvarEyxZnUDjW5adFOzRqVYdTUT6DqBREWpRXOlmmpsBeNjIRLAQfKuQ3nQz9Yr9Bncqaf3yGomkIEOAm/iO108GNQWhLVanPfOAWRgFtyAauaB0MxKy6nZNbmmtx+A1rHflS61mmJrUVNyCEnStce7uBpLaSVQKxBEEkbVkhFwXY05sBFIgPT4AljfO+O2rRRadXXEp7dFQlGKwWUFxFonYsWRwQEoOD9Edjev98wEhVKL1lpqi840RYN93HpARCBB1VoqtlhbTZVSoFbXhXBGQaEABowRIMyJqooFBUejxQa9JqA/eJxIcBgA7qGE8ekCytxZKg6KxRknQs4Onx3gMrjhLgkC4vACoJo1aTtZm8etJWPB7s/GOHEWIGup28PCmlzRPPfKKZKLNVQa1QgJ73Prv0nuan4BTAWXkSKIIr1zyMBejg+64/O7+g7mfV9XDFjv0UmizTiPA3AMLsTVRH2vIICmJeaktQJQ4BHU/mystcZYKyK2BHKh1FoUMNWWYquoiRFTcZP6D/dyg8XTaymiUrKAOmj4GEj0s1eQNTUCjmZGI4zPSw5AEgUyLhdnEVQBkTBkAPb4clHULoqgsJyXROsctkATKxZgk8KughQLS9Ja9tqtUo2pmgxZjREjlGKhYYJAoisl0nAV2NMX7rUkAvAcHHgD4NPH2BKXj7bdYNmFsgPXcnPZJ8gZCgnR9H7LABj2Mc0CBioWA1hnncGau9msUUvRUqkVY6m1WGOqWS4dYZiSf2Qu3iiOgD1rAUDF6W4WIruE64EZvhk6qgFPIX0U+R63udlFVF20vett4E7GToMDwGWHY9XLsfiEXqdWjLawb74F22rTiPPGGIwBiiemWqilVopVAEWtcZrm7HA+JSuWDdP1AHgf7IyA4nsHYPxS8CnElluPe+5COyT8R7WO7zGcYekWqdpZ14lAI8/A3Q0yDkeK4OfpLZby6Pq0ItzGK7DivdgCQDXWaKmpVKgFii3YXKvBlqKTBGt7E1HsbhYsKA4RXyFm3PgvThR86CZACNEnHOCP3UAtYJUWWvOm48W569sSF3JWEAdkGjmtcd1xZECkJHSatXV87joYcBatBWtdCGY/sKhG2C596m5KgVIKVjGaVFSC64SM5mqsC33bgNDbp9Ptqt2nPzkFCHFarUIMysaxH7wWoSKlhfagw8vY1UialyXagn5w0+ic40EGkjKdc6GWQgFWNwCscc4UzVjxnUWhbqFRN7VSgGrubttQUtKanIbOOXHxixrrg23rES/P/2u9ajgdHAqYMExsiKiKhP7gEUmYColGi20hDLZfoL6/hZwyERUyoAKgs3c0r5xyjKpznqJS2yzSfukBBufIpSDB0srRQNnE9DFebpbFFEOtxRHpzHBITNYCUIpmG8D6wXuVQ+cUcNQIEQkRRBgOXTBV8SRTbaqpAHQ4AJaYaqTYIUCKBcgWRTLNBpJzNLNbXLRoXq6pUih3M8BiKtaK9wygQqrtFG5tLatbffxekjaQVTW1UoiVlMac2MhRC3YOS12S93hwbMh4o+UT+tB1AqCAxiXGGbAh9H4Vu0w1oYIvPR4HQBbFZRAazWyKt1iSApoplEq1hYoBzCZh/cF4E3yKS4qFzaYUyt74d1uLwarBUFeDShUKBt85v1hgiVoqa2UfbunWmpgCopubF/DBdt4nb8iiaHy7zDelYGUcj4Evb9NS0IqTcTTJL61OFRq5JUhOcQ0NxS1aV7N7PbKxD1WHwXnpSb1OmkuKRStsibWGKhhHMu3kXsAYg41yFdkKO8eYLVilxOXn760Ajh1hzAxLAO883ohRayosX77etCQlw3kYxvS+zAUyFaZrx9zMGoqA3l/L6babJXKB3azAQ8xa6YajeCxdmYfUZctsFai1lrYfMM7YUgvAGlrFFlAT7dw7u/g8xbxbVxuW127o/EMNMeaABwiVoD55lcw0fT0XVrMM+dxBq3yTud0EPA4SgJAVEIDc6jHuZhktUNjMGquZYMLQt5kCEiiFbXa8z1i2YihirAGohoLVAiYb7OK9L6mmDAWK4EyaL/jkH6mpraH6tGoVr0VsEZNT/PkGzQz9PMlpBDIZEqTktQdwZFUUFRTkHmVOcSmsZrprVwo8MsNaRIaDZUc1oQUo5R5aqaBgLFLZqWCKpRhjai05+QOcU8VAsVUc6Rb87JN5pKamggdEEFGLTehtrUbIebOZLgtqnWtmmZRGekeC/U8jwWNFncMBEDWpJiAXfkM1GIs/WkSh0KjAnhm1sm1xNfr4N6qhri8WowXkkJo24j3Zx5QBS0MwFgOAGsSSReMtAXo3S9OienvLeXPK27PeUgbPdDufz6/X9fN6U1o97kZZM0VF+IgxUEzoQSlYADIosIYGtayGhVI0q5YKjULrMxmkk/t4LRJIJS3zdCO6x5FhS/tjCFuMVSER19A2swxpXrTALQyOhlWdPaTb7bbcEhSwPqj0sDtxpyhGrNJoWDPI7lVI3OOt1AqlbrmxobRibrHBWrJKAgaVCsZKoIJq0v9WELytV5aliUEd85+HtaQtRWRGVlU30AZ/hvd/Eu654TM2tA/tqjxEKiTtveaJMT6rYgIgrbzDihSbfO+jAwPdmot1fRYA5Nk/n/rHH39en2sZS3jUax9XKawFzAFKnikWIADt6wEABKS0sPfaFoi5Y0uABHvvteYsLDkvQc0s1tU/tIIBJsRGiBUprg0MDN2YU6d+1ApAzHm5/vjzbc6xpiWYy9niOUxgsBC5zAmAJELcTotlQUcHO/pee+1lQaxYkAABljlHZk/AYqTQjbxmmYMJxALYSewwP6c+jUHH1NFjrQAUg+v6+Mf7taa1scS8fM9RTuYEgFzXEgtAIp5f89IrgAmw7LX2WsAKewUAK7DCWo8V5ZoWKxglgCmXYZoZQCy1Y7MKNhgYAOuaoXYw+uMy//6977UXQrLzHO81F6VmACDX1XcssUKC9PT1NqcMYFDnAmvZa2EnWGHJEjsRCZLYl3q/5oIVUmyAXMxpLYKMvHRS6WnnngEAgIEOxv3j3fzjz2vtvTeRUrDyevwhlycBHSB22eYMKSOJ+vT17F2lAnUgzwR7L9hs0go72TltKyAHIpK505wrkkCWgErpe2FQSPTaa6962vBEnQAA5qgoxri/vd9X/3Ffey2bFLHTCjx+tGfkRR0AUj7GnAsiUj1upwGo7gBir7T33mvZAFYIshlIiRQRCStjhRVCEhQFZS8GDCUSXa9dGUSOktMGIGfQKx1Df3u/T49r7bX2WojIEQvub89xYgKwoOS1ESnVfB7mYCL3CWUirxSLhQ0AJJHzXIhIkSMiCCCFLFJZJeeGR1kGXFAiQVe3MpJc6h0AWe3MjNoH18f7xbjGXmuvZbOWlQN8/Hlw9DwBACkLIuVodV1wkSd5Ig8yVgIAAFIuc25JTpFKTrKUq4UsSiqppJwjl/5WDLjgvbYiUu2llzLsmqOSB2XUXkbkiYw+DOvjzzEYfa2119ob2whAfD5yFYCOmNgJmcwE1JFnZgLI0wzWAgCQouTdZ0opichZlnOx1haaTGnKUUL/72VwQXfNz9zUNtMwShmkp69vl8IA5ZggX2NN5v1xbeOaa+21FgtsNvT3jyPnDECeiW1LsBMTmV4nMPuYIMsBAAApRW1TikiCLMs5FHMRIlVEboW3XlygX/M+e63t01O9RRmljDjHl9df60QZtVOP3qdMn4br/drGva+911qWDUsKK62Y1/XIcp2APLGAnbBkM89Mjy6b+phjdSY5EgCATUR7XlPOkImUI2q73HcuWVVaOp9rLZZygf55f7fT0Kur9ZtilJmP8+vbI9MTyii59p2OMo1pPh7duvrc2JbNlnZaS16xUn+/PY5S+ywTQKwtATuZTMhr6IY5Vp8T1t4JAHZCQmq3R5s52wlZhNpqNVZkrTRabWcu/boXdK77+2a7n129QLHjfPz08d9RB5RRjz5yZjLX+BxzzrmxNtjstNeS0l6x+j3IdXYgz9h7JQFWWADENCx9zmVb21qbWIDEClZaazzy2VWAUFtt+CSXJjtenmvVL0Wn9s/3rdfr2PdTBwdlxtP85/7rZ1m7DBS57nZk5tTXnnsCsIGdbPbey54PTeQqP6quzZXqRoIVks2U1rToprn2Mte2NrGkDewU7LTXejS9RsFAkUttNY5wpUw+PR+5xrr3Wai9f75t9uXhgN6pUqRxrvU/+fVH1FF05OMW5hwse+9lkRJIe4Ntr7Ch54dMzndzHIt8rW3ZkJbNChLXhLlMe+y9tyUm0gYJkOy7mVsuQ15CqXKNnJlXy2dtrZw19AeFzsUF0oY6LjXKlMeNUjxWGWqnvh4e9/uAJAUrSSn2tqUNsFLegulR+6QqeRrHci2xlgVgIZAny9xr7bW3FCkRS4KdCCJyyeb6LIcCVK1GPnIxb1V7bddZ0a+aC1x9X8BO0NPw2UoK3GqNn//+6+O+Z65xHnX/kDyos9HjIXbstQFW7BVIpIEJGRhka821gW2TpAWw91p7bWxlzVhhQRJIRGCvR70BWa6Rj5yz4tCO4weHx107S8e8X127aprxcEp7J/29tkeRtZf89PzX33/cpybr83iJUvscMd977XXvFSt2rI0lpIAdGV0GQBnV3Na2YNtWSCkRC3st9rZJUuQZS4AlpEi51Axzy5Cp0UrObVNP9cgvD70azVVgwnvtNcBWuVR57klrTy+Pn+53Ph+fV53iNOSs9T3yTClW3iYIACmFqZgZdFAua8299mZhM2X2mims2NbeNknK9l5hxRIrSCHXkmbOc88hgxo5l5zrrho5yLFYk1ZwzUe/QG/7BB2fuUKjtdv1ed/6+z+ujqEY87iuS+Rph4y50wZERKrFyHoFDIA51542iyXECtuKxVoLElJIe4+1QyAkIkoJJDYVIueSc63yGQuqcdc7WmHNhVgXdaPSzWseA/SqaZQxwQLk2Vrfo+6eDWkyd7KTFJEijlyYhZnRMWHOtfc0rVjstGIFO4GNDVKkyImxbIQkItdSZGKhBLIj5yglq1/12WsWN8MkKx4LP6Bd3FSYn67HUwGddjUdHpgDUI5r6GVhEJHnlEQqJaLmBqqMaZgYa9p7m2ubsNMKKwMSEqSUIovNWImdgsi11QCR7ZanXLQoJau+nnk8zl6j5vwnMmUAcLWrJRjzkzn6YZRRBr1i9n7ps48x+kDWbn2l4sJIO+08LZFrRM0tkAEA5pp7rW3bkOwEKQGQSFLkSFKkNFmkFFFLzTKySPk4x5BzKzmy4zxeuV8Hudba7w8UYsXRrpmnq5EM47ITRjHKUAbd47rf/3zv/TEGBhzzxhb9kuaKvbKdImqkaKwwCwAY65prrb0WgBSRIqXIhIUkgUiRa05504eUSs6tVGHJai3n7R6ilFwduR5fTtJ5n1k+1+f5nVIQznaZK1y3apRhwthzMuXBmNe8Hu+Pfh/30YdhkeczrjKOfPWYS4KaI0NXDaPIgLHcZx9zr7V3SkhBpEgp5SDtmICQUzQ5R4+c3i4pIpdSsy1SFu24vbz8uNesHtpZn0/ndbybmWV/THmUMDVVngF2GgCf991V6Uz2fXtcG2P0YaxJlucz5Z52ye3qcyNHzshzcuX8cJRcYI51n733uay9QQqRQoqISMTawSLIEVmNqKvcrpFINVLNJHJRa9Qv2vXgqeT21I6Tdqcx/3z747ffHQp5hq/vV8bZr1a4bPuanx5w1BYLkMBYE0Ks53yUMUbaOV8zkyKT55xzTXKkK+caJbPeZ59jrmVhS4lIpEiRM8RKsQJCAlG83O4/lkiR5QyRSmrt5Sk8n323qLmm48Qld7Pf//jt8fH3qz4XsfJsfv7ujnFRzM3V3+QOFenpReMoSulMmEFELnk+5uTRr2uFBPrse++0ItJM92hHue59zgVYiBSIFBEROU/YK29IETlXiqNV7cqyrAAll1qPQs5VbQfO+0m7T1d//9fHBe/vJc9YWTxdnyd8auDq76vnCr33Xq9+Q9Q8AGQF4zz768S43j/HHjDmnmttaa+Incx55TnnspdlA7ZIkSIiR26RTVgJIuecQ5HrcXieIkAZRYpS2/maV6i0r83FiWua/f1f3+B2tatkE2199QnGVeS59XUVHcw+H/fP/nxorc1ShzyhQKEUtRhvuVw9r83ofe5tCWkRaXWwEUvagBQpIiJyLkIwU1hkcg01Sm3PLT91IMU6FFUczwdQoV1A7/f3f32DkmmFbOV5evEJfY7C1eeVgGnNMYZtnY6nPU6fw4QC1FLK4dG7ep/dmNdeNiyzLKy1UqS9NyAWkCIi58hnSZtRd58CUWuUXKr23MLtAUAl5+P5WwM1HffWuGDN9/c/3jA4fv5dkadYeR607/B4YpNTNsHqY3AfOLV+rFxcZFRddUYcx5q1Htz18pgrJgv2zNjT3mEvxNppB4iIyLm23BpD2tbapNpyTa2kfNbXxvPjIjORZUe7PeUamYRL4477vd9/HYD883spI5tIRxQfHbjUD5MFJgM/IgXPY0qXAailFCUfGeXEXYeUgCWz5gIbxNppk1KIyLm285YtGG2ZS225RalRjvZy1jJK/mNANjMlt+dvR0WtDu78+GD2+Xb94wMPDodclEEs1P3crvk4NM1HZwGMgeEjO47HU6K0T0Opp6LIniuUkQ+6kqeVdixYO1lzY8ZCLJJEREpRc23tpR3Me5p1pzKGo5WWcq71OF9LUUo9f+2JnVSR8/O3E4CHe9of5vZx/fHmAR6HUkrtsglSq8VtPT+1R7+ADoBxPzcaeV7blJ+KTI1cq45CZqbIYhMLsdNa2yKAWAEhReT8lOutPefS5mOabuOBXNTI+Xh6OuH0+vqP94lDdpw/vWYiV8nD/sAk3a+3X98BoFCGvKD21HbH7qN3Oph5MFDGj5rQ5C7WEkclpVwbagbFzEpPsWJtsNkWVgICEpEiP5Xj6VZzac/ONCjj/phkueR6PhUFytO35//yJ8jn8fqaVbDT7r0L0Me8MGU8Dora5cnWa9X72/12rT8/f33fhTyhDGXA6Duh1V7H7jMfJ2py8FBzJxu5lsgrSWnHAgA7AaSQpFTqeZzPrWjPZ8ohO67PMRailHpiUOT2enq5w1mPliFX7H5ffeaDPIzHMDGz40ErMPveul779faPPsb1cf/xtppSCiZgFL03SK12XW0HQnN36E+TS5nRPiN2GSntAIgFO22QIqckcv3y0o5WslartkrJ9c4ApRSGYZTiRf32Ah5J1WvQq+7+mFhCwgOY+QHl5QfQ0ff4/V2/P/o1P+bD0UopQBmKMQFS03b62nDhvDuuVrrg+MhR1kpi2wDLQmxIIkXJcn56uUWWc5Sz0HKt1TAgAvfrMdbM6uOfcv0pFo/rvqgA98c0UNn8AOBAqa2D2tH/+LPXDqzLeDydKFBg9AZAOlpzaS7Oa9XjHAyzrc8ZsWPF3ntjswBIOyGlyNFaYOZSKbnG2fRjFkbB+PH5OR+QHz/+9tc4Nucf3SKg177mMAowMAGgtH6N7ILdP357JL2zc72bMmcxigEsOwFwNtpFu2j0a2C0PI++MQc7bZvFlizEBvZiXiooTjnOdrhq7WQ8fny/HhOZ8f7/5bNpriQD6P0+BoDUAaA0JZ36kPK0+/r+1vO1Ied8MT8VhWJQMO6rojnQDg/Npbk4H+1CGeNoxyjLiiXtBGJBLIA9t2S+v5ejPZf5ER/ny1GP06PPY8H9x/ePC1BM/3rkE2oHMPsYAOwKACjy+fPvs/ZUL6vfH44ryzzfL8zr86kUlIEeDyYZh7NxPGgXrW9Pu+/na3C+jvXRLmKQghRL2kIsK5AswvyMLiakR+TzuTmuKfB4+/42F4JM1r9/eQIArMcYCoB+zXdwAy+F3G4edu+ue5+rq0cjnvuFea+jcGh9LrAZo3C0o8BDu6h9t3VbvW25rMmnoZNSslNCCljIQMqjhPEoLaP4+N6Oet47zMePt7kAmHl+/+vDhjyXyMw+BoBpfHgH3r8cpVFi7dquH+/3a7rPtXjM/hwRz+vtYuZ+ymqtfz66MwBjejpL7co4HtqF5Hz15niU8WrywZpbipUithWBtc0UKaUQWQplX6Uobcjl889yS2fvWH/+mAtCBjN//HZqjovVqZFNQ1HAuga3d2DiUHD//fsff3977+r7I0x9qEfE8zRnnmNQ63Ova6gVYE+oHcdDu9Qu1Vfvj+OR86vgw4hVsFKWQmIDUsg5ooax5+fbaz5re43ykd3OB/r9/QFClo0C31+sU9Wh18wA8LhmaBm4gX9XUtz/+3/5j799f1zTvHs5pOShRvGaH9fMqFFNbqd8AdppzKr2YhwP7YLmlcfhUV852x9SDSyR9l4W0mZJkc8VyRh9TfFxtNLef/4aH/XWvn7f+lufCyGDUfD+48b5IMAEQJ/z0eXbfMcN7fgP/0fh87/8n9/nwBz9/e31pRQenkspUfuDIbJ+9efzdAfUs/osuaaql3E8lFG7pL7W90c/HvW1PmpGzJnKEtZaaS8S1PN0Ff0+5wq7l477pfV7e2l/3kd/CMgyAJzJ1z+62uk1AMyxHt2L+ezdjez4D//yt2L+9h8/YhrkkXzOt1/ONsqjluKpzflwnGc18/n1NGt3x6kq7rVKmzKORwAq7ep1+er+6/l+jWtec2Gvufa0kduXp7gX19UXKyz20H5t9ZzlOMrfH3cZyKAAWXWdfQIyBYz16DgokI+f/+Vf/tezxP3X32rqMIW4/PqLoD/hRG9ffr55//HU2iXbL4OSGHymM6kdwEZ13qdF+Kqux/X4mGNNUt6rh51SOp9eH3vOz7FJAGH9/fhan5r0cihlAADkWtE8uqqTa9sKxnp01Pr8/NFwfP3l2y+H4vO/bSoX5crDePPLecWur4jsuf78y+l8Ao45KiD7LDXrc3ug26D2E5Sxvs6RS8S7AeSYpEi1pbH2fWxsK/YsYPz9l5KK/NrO2TEAhcx55ETz5OrzWFFrX8BjQn/J7fWfKPU5Px9J8f47QH7wOadPvzSZXFGlejYuRrumPABmNq62bA+Xbl8AClKJEmXkMus2t4BEqEfNS+/bTiAhJOlxV0n1rKVcc5YBBTlrx+2sDcdSu16b5zlWAKg84dBqbkUu63EVAzEfn+9//LhWeP/8ubZ6PIkMjZxqhzwdD8DIPksxPFzYFx0gbVt+rr3MMsoVzCzWyjNHyjVjIu0kRZKlRXbcf/9b2v3z3seak8IoZFkcX88EzfZouzrOY36MwrBQj1wRjVwisrK1T2Vg3n9/u/pY9P/y4+VJbpXKcaSsJsporqkMwIOnmYG+Lx1A2lWvL3+0ntFGJ6QUZs4hcq7l6pIdBAHskuf94xp/vP32dg0oFJlMfrlVzeHR4IHmiw8UqEeuOHAWt0ZJGYqxHj8+zIi1uT7jMS9/fUY920k+d1eG9ikbAABluABUCipnXXPDTokiEUI5D03ACiJyLlqNUm7p1/P8+Lzu6zGRlUwmyn79+nrUqByP1k84W2vHb53rcMgVAOdBlCjnDwbz4yNNIm324/RBrZX08lRG0e5lKEOeYKeucj1JG9D1mSsUtKv/4Lr6fV6TXVMUUYYiHU2OLNkh7ZRbSqVIWrl+LTfUAqYiR0HJP/9yq62S9vGo+indDkd7+nzs/vmIygOH5ixuLYdSbj9/n8ooc0BKKe1tjLI//Nf4a20//XQoqqfPugftmjDQ1dkTxwMwoSoaV//e3+gAqURVe6K052OWo1uxkKLmGi1Rj3F//miI2w8TkyiU7C8/3VKJRO0OGo5COjy8/3jL09Uuh6ZyatSSnr79v9koXQLC3nv3g+tXZ/3pn5+o1HNeWxnIQ3fPM1NsxAIdIKN//7grT1eHPM1Sc9bKNdrt+ek6cs2XWEQuSUnkGPf1XKHU5zcwcqHk+vMvP1elVVT9gFQzIbfucap3qSVNVdxec1Di9vV1zaJCzkuw0EqU9f7jf//nnyoa7F5GGe2T7p4xp/asdvqju2NWitz8+PHRKc/zd/LxyIh8UPJ6fn0q2uuc+g4paqmlyLvka9ZaIB+v631iUrKXr7+81BK1poA8dTUndibnHUDSnPNw3p5CVRzf/vaWDVnrIfbKMvXWVLXXpxs0mqlDnsimifnRhuv6dNeJfD+3xvV+79M1ar65T2CeWY6bVkrOz7frIR5EPWqJZJ/top0FtJfl3cyZ/HJ++8sNiATKzlKFDun26NA4Hc7bGSpF+ulv/2PNUnJWH3kCIY6cS+6/dw20+aL3Mspon6g9TxTzhz7cO1iLs2quz/t0Gf2YF9fzBPvluL24P/B6f5cvlNyKEuV4fgxPZwVy+xLHmBxfXl+//fSkL5EkFZg5l8GssK+NhjoP5+21qhxFPH37l48+SjveRc5AKnIuOfu3j+spgzxfuk+wMTPOyuj3jgtgLk3v8jTMR27ivO8EL99+fj3r/f3HfXm9/mjPQHbm57Y+Sn55PYCZ29cXXc3fXn8+W+21qyDDjloBzNTOHxNeRnHebk9wKOS/ff74z9NTq3rETCAXCG//7du3c5RhaNdNuAAm51P26G+TfAFc5bNd6QKjMxtXhdaef/nprMfLz/3H/f7S2qUUUJRSfsjny0szZciZp+r49u1IVe0VdgL7aG0sXTHI9rc7vXocztvtlerQCp7++f79787nt16ulLFEK0D/7X6dRawyNGq+3+8ZOEvNee67yQRpY+zv6nVf8xrmAzQ0+fnp9lLzU2nWGNe//fE/HrtiFLIpXo7XlifIoIp8BKi6mmFXcZYWXZ7Abi+//EpWnLfXW+3VoSlphy//NPY/yvPzNaJuM1Ofcy7g+4BYkJuXnKO49JeqYY6OXkkoA3Oueu9rGJgXGrLn45zyU2ntpPvbH//p334IKuDL60vLkwwAtVaQFYjYh9ZattfGrHOp/fzl+O3Oebu1o6oOTRQof+H/+rfz9aOvXqbg55eMjHFd0lYGaJR6b2sM4Bp3dL3aGDy6+yjjuwOPSft8ujSKMD2V1k6c5HL79fujh8I+ci63bMpgZiCngl5zqhm0FiVKtvMsRoIVtT/Xl2uN0qJWHJooBdS/yM//ub9dtsgjnn+uBzkKOqAMedKQ5+5rMMDF8ogK/fHj/XFd9PtZ23z5zK5sPl3NaFWntUqGs97++ve3qy9Rby9+f8QyM5iAqE8hQc1FRctRwkYZy46VEYdX1w8rKhyaKIq0kf/Snv7y/5h/LiPl55+fSqYWBRdpA3m2i8ysvXbMDrDg8fbjj2uZvF+fcpsNrqfr6fPpqJsLK2dMlG/P1/jM2nnmMdaMlQGmrFJfAjWnXCq03FIim/YaFnImFOEBDpoooiBWrPz1+evXr1//7/c7Z37OORSKepQmVtpllAGgmrUDANDv339d4M6DeX2pDZ9Pn002yrquso55ZrOPvvuyPJV2tsOP2/c81Q7yzFRx/tQqqCo0AaY597BcGlFAAzShCAWIFfUvLy/fvv3X73MJBQq1tEMCABQTygD0pau9evzj154ng+uBh/n02njypFAFayS71Ot+f38scLbrSy7nl793sQCZKvLrEZKaUy6QZbEx555rWaNdlwaU0YBQBLWAhPD0v91uP/3r+xi6UdReKX97egqx0i6jjGzKOiQJigm199rXx1tP0zBoD8z8yG+vDUqrJasvDa5Lf/t8gMP9fo2vT/nl9bc81Q6oIt++HJUq1VIh55wT5rxYK8LVLldDLGWsWEEhqArECsviJzn+248xqKhllNtfjiOsWADZRDVrF0sCuqn2t3fbGJiOB2b+0FvLSouoaqtF5fH++QAAHzydf7t/iFU7Va8if305K+SaQWbHZo5uJXEVLiAEJVasABUFSGHFSuWnll7+09sdoJz/088/V5B2rDKw8ywmWBfQZx8iPn+9w0Se7WHCh9qKFjVyjdpUHtcfV68NeBzwEfnp67/868eMVaGK1+efSiXV3DJdZFvBtcZa8SjDAK4oIMTMoJAV0hZLWLFS/fLvzi//+vePO5Ty9M///p++FGIhFjKTLSZMzn5f88e6NB/dzBPI8/Utg/n4mnPUqJwvreL6+7tJTXAA12d7Ef/43i1Crq9fzipRczKjw9FGs/u1rljKMLOZ0QRARt2JLAogbcSSvrSvP//+6+8fXb399MvPf/1SwyIWyHPb7UoxAcR6e6yLy7wzXRozZ6/XA1wzR1Y5bmfB55/vk0kDwPX2dLzU2/vbHxu1vpytQpZMkywej6PE+tH76mnXqJWRASUBkMgoQKwUFnZ6Ol++/vXH6Np53H46CkDalKGMcmmP3C0om7EuAK5RriZz3p/a5cG85EI+bj/f4OMNsBMAzf3pqR5PL79cqKlmIKFnQeChPx4fD97d2u12OkBREgDIggKIJazASk/nT2POnEvJRdoQK5YySJtol8ifANMEnB8wytU4nWSNTFHPuL3WqDzuHQAAXJNajzEBHWo3mRnQ398f78Cv55VzBUhkJsgIFABph8WKFatUQoREsmNB2qSYoozmEe1utsvoq5zvgG1Q4JRxm+DpNWo769EqPEwAAI1Fo10djFmBiQx4fH97BHB3v9/OCi1UMjJAoBQ2iJV2sEIIK4SQAIBYUiojymh08uR+r+7nHY7KUoAKWojy/Pp6SgcB1waAAyc4tMbVdLWTJ/QJwLr/+O3OiTuc/+MpVxpBBoBAEQBIQgQIESEBhBBS2kEiCupZaBn1fHlt0LLWaC2ftZTW2svZzvM4jzOlw1mBJMsyiQNotHQ0NGpVa5Fz1icQWPdff7vj7n4Hd5+dVhWyiIiIiIgIFIoNLCSBWAgkAABliFUG0cAYoHqOWJen1zezZQrRECq15JqdWqtQkGVwwAnNWeWJdgEwAXD/4+2SNnfA6f2rpreoWQCAAmUDgGSHABLEAgAkiDJEZT+o+qpUfS3eMidZCypq/vr1vKWqCRDH1aFWB04azfH0lOWpXQ1XNegQK0P/8ccl7ccBAJ/PIkMAgAIKYAEkG2knCAvAAgCaR7WSl46+anXqT8/tnSy0qHBy+6efc22wHg6OL3cd0uEEcDw/tTyhuWgX5oYVrDDerjI2APB+602KmoMCAAgFAIAECRAWIBYgAWIJ55dxBx2H8/j9O1KWWkBt/8u/r2Nc6CoO7ewV7XBCo9FevmZ5gubSGIQFWO/dMDMAp5tWo0TNQQEAoIAFADuxEwCABQBQH7XHPApQgb89P79dsSghMsf//O9v9fPRN1xwHF8eF+04oaHx+vLlMGQmtEtjIiyE/rgrIz8O7ARuZIACAOS9pGIBACQ7JcQCAAAAxELR31dHdTRye/nx+8eEypH/6d8dMR27b3C1y/Hq7zsdJw00Xl++PVGGDJN2aR5AguudAXZKOOH21ETNoQCADHYRFgCwUyJWLAGkDbEgFgD1Ufvq1/tjDFbo9WhRa3t5fN6VszpuP3+9xVYp4yJVeByv7QcaNBxPrz8/F0MZZDOb2pw50gbCcofHQYKTG+2IVnMoyABAJAUAgAQLAWKBWMQqQ561izLaJR6P9890PhIsH9G/5VpOuvly81RbjTVQ1QcAnp5/ul/r0nBoTy9fj0IZikE2s5lNAMzhvHM8DoAbx8vZag4FGTDzTjOsTFkAAOxErAUAsYgFsfKsHdqlv1+eH/OHLhbr/qaWcPD6cuSo/JigSrGAQ2tH7eM+dDWn8+np6QTFUAbylCckdg7gDgfHw8kNL683ORQAyJJMRgEAQCKWsALEShsQq4xYEGUs656y/Kp/1A7c1TMOtby83Ah3G1DZpCqnmusL1wU5t1aKBFsZikGec05ikUHlvCOWh5Mbfn4+swAyAABKLAAAdl5hRQAgVqxYYpUhz6pHGe0HZTbXTz6IJfT8xy+V9fx8C8qwAFRkmqzQNBSKBJC2MigDpnwsAIo7rPN+4obby1+roCADAEAIAADSiiUsQEgQEEpEpopCFEdu5/HT15MItc7HfalfXl9DKQAgy1lqsqJflHKepdaURESEIFFQIJMD1ForJzjvJ264fftaMyADQAQIsRaAaQEslgCAQASRishZrRFqNCXfztfbt9ezqFt2zfblp59aKSiAZemZBECBhAgQgpSUQkHOuR0VVae2J5ynEzfcvn29gUIGIiIiAhERIhIAWQAiYoUNEiERgiClIiJntUitFsUZx8u3bz99PZ/O46WV15++NoBIGVOoHRWFCkUiQoSIiBBBogA556fXWnXQfjqdGjc3/PLtl5ssAABAAAXACgBW2kGCBGmnLVYssaRU9whEXTNFGcfjhsMDjvPWAkCrU54qZpWQAUgEQYBYYkkbZFOWXy9UjqPm999dbu83bq8vX2oGyEAAAKS1AbACEOwEEtvebBbLwt5G2v3tt2Vea3h4B6itvt5eowHrx5/b2nnKSFWmqNpLKZIgAGBZbH2uDcMaFmqK9ePxOd8v3M7n17PKMweFDAIAQCGx0wYBCCQAJBtAWFLa1dZqN9s2jsft6nDj0M0GiHY8diBDhQIUCQAAwko7pVgbZbYAiC/m+5e+1KOdFXJQyAgAAEGR7JRIG1YAACBt0k5bLMEKS9pSOQ7LXEcsNFfbalQWAO3oa5PRkBWq1opEEAAgLLHII6yddqYMtVfITn3mmSsyQSEjAABAQUKSthUB0k4bCQnSIu20xUIsSKhf/uikrbfNqnqNmogMIE4/FuzWq6xQ0QoQO5EANrFIeSRi5UlJlQo5xFJVAAoQAAACIgBbSpFIJDbsnRKQkCQCQgD1vJEj5VpTq0fEyyFtjVAA7XypIWpTc1aotKeSEiF2khKAhEiBIOWd5QSQAzKQs4hSyJkAAEQECGBLSDslKQEIgARJIiBEIGnPrxE5Uk61ptRaSk1Tj6YopRSlaOdTrRlZKVTa01ER0o6UAABSSsiytDNZzrIcCiFnMgJAAAACILHATjsBAAIAC7aNvVksWJ9vb3RrmwD5fD0LgFHGGveHlSlU2lMrIREIAADLmqMMVizsBKGAsUBQkCFWACAASCwAAEAAgIXNxoJlwbr+/OhrsrYVM6+Qv50lgS1tEvu6rgVVeyotJAQCAGCFtcyRtrRXnsSKFUrGNCwBBRkCAAQAEhbYCQACAMDCxrZtFgvW+PjzsZiLnTb521kBgCyWuQdKyk0kCIQVKwAAy5qjmHkgbSgZmAYoyAgAIFYAeSPBAgAAAQAssG3bxmbvnfby+fj8WCaWqK9nhcyUgShgKEQCAQABACzdUEYZykCRCQsTIM8MsQIAAfIMaWYJFpgZAAIAwALb3tg2Fpij9/v1sMJxtioDAKEgbxKIJQCxYoEAgGWZRhlllFHIAqxYJpBnRljBCiAAQpqZBCsWmBkAAQBgYea9AAsL7GV0fUUlEwAsQiGTdgAAAMQKALAsEyALAMuEPDNixQorAAQQCfj/AaXd77pp6k5MAAAAAElFTkSuQmCC",
-        "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAANoAAADaCAMAAAD3w6zpAAADAFBMVEUUHhsXIR4ZJB4bKCAeKyEgLiMiMSQlNCQrNyUvOyYyQCg4RCdCSChHTStNUy1VXjlQWTREUDM+TC44Ry9IVTlaZD9ja0lqc1F1fFd9hF2Ul26IjF61qFqflU2VhzqEf0B0dj9tbzlmaDdiYS1bVypYSydNPiA5NSMsLiE6PSk9QzF5ZSiEcyxThpJnnaN8tbh6rq94qKtvo6d9q7t0pbhfl65jma9mnLJon7VsordvpLlyp7t1qbx3q755rcB8r8J+ssSBtMaEt8iHucmKu8qMvcyQv86Uws+bxdCmy9PD0tGzztGwyMymxsmewcOYvMKWv8uXrZ2ZtqiItq+CsK2Js7WOuLqTu7icv7SqwrOxybu5zcDK1cnF0cjCzMO6w7ywwcSqvsOmur+Ipq+QrLR6jo93iIVwf32On6KVpambq6+krq6psrGut7Szure4vrrDxL3JyL/NzcPS0cbU1snl18Xp3M3p3tHt4dHv5NHx69ju6NXl38zi2s3e18nb08bVzL3Qx7jIwLG1ta67vLGyuqqstqWpsKKjqqObpZuXn5iMmpiJlJGGkYqBjIOQmY14hXlue3JsdWiIg3tOiKFRi6NUjaVXj6dakqldlKtklqxrm69tn7R3orJ8p7aFq7iKsLyVsruZtr6eucCgvMOkv8Wqwseyxci5yMm9y8vBzs3K09DP19LU2tTZ3dbe4dnl5tzq6t7x8OD39eT8+ur389z37tT16c/048zy38nv28Xt2MHr1b7k0r7hzrncybTYxa/UwKrPvKjHuKfCtKS8r5+1qJqtopalnZGdloyVkIiPjIWIiISFhYGBgn6Af3l9e3NnbmtdZmZITElTWFZGU1Q7TU85Q0UxOz0sNDUlLS4hKSgeJCUoMismNiopOiosPS8wQjI0Rzo7TDtAUkNLWkZUYVBdb2JWaFlgdnBhf3VkhntpjIFwk4Z0mIx6npKHo5WIqp9+o6R5naZ0lp5tkZlmi5Rig4xaeoRTcnpOaWxPYWFGW1ULExQPFxcSGxnEoUClAABZqElEQVR42qS7B5xV1bn+/zzv2udMRaSKWIFhGkizxgo2sGDiVYqiFMXcG0uSe2+6idGU23LvJzER9f6jYgmKLU0jYgO7KRQVZoYZRGOnKmXKOWev9/kzzOAJAlF/9zm7nVX2Z3/nfde7yj7DG/CpxL0li3stxzD1vhewQ8cCkzFfwEflaS+AOv554LjncQIhPIsTnh73NIDjnjvW0SnSDFyk8cBCnvqEYGNdEgmJN34JpASQNAIAnzztcZwcIaFT/HRo/LQJRVQqADRMno/Ow9T56CITu4oEPn/c89u5jhPw4gkAsVjg2CiZO3bI+MIJIJ86HQs5DovFce6CCFGgOQgHCMu4zJU8jtPkUejUnE60zwZF7RlMFItlCIgX/woEBVyA+SIgsGi3C+4DITgAdBqX6RnwhTx58bGiYyfaDi1yGwcHDPCd1GCw6IQgImQCFSOeOsWBqC4yJJ/RCwlC3K2Y2FV6xh3A9DtFTb8LuIsQAOEeCsKFd0OASIDQfJjQRYb5OPbF9CwK4x9bdEIKFf+IgnGRMNYFwAFHt5gN7hQAgvzVJQAfPxmQDF1kV8wx7CaSALkbGQlyD8QUxO7EOwjcSYB3gjASgNCtu/VRZQm/hBdNgCSeFQxaCDy/swxFqavw6YB8h6SbgJtuMkuCRxc6xUzmEgtm43myKAduA7aTFa1GqHvvvjd3Nx73FEOKXECxqgnEtHkEQO1i3S5x9i+ByyD+8jIRXHxGIEyGk54xCAQo+6ieOgWIEEBczowWaZywUwY34tFTzUUB7XN2cUgC3JsL7l27GJEX31lsSwKIeUCnGxICdvkb3LIdbDYFEJeBwEsTjIRJ4wDrdluJAIhFJyOiSzcCuNxssa/DTGrBOMQbrsCcK1MSCjoF6tScTpNd0YVG/B3xU2ZR1J0Eu9IJmWMH2N0AxI9VuEyYfctlt1z2y8vQKTvZjATCmZEyN/G547gzHI0VIQE3dXLdeDmSJ85kAIiJt8yIXwG+bHjidJJIYiS2s+IKYg6ABPz0TMV08WNYIPjRF3Oac0f72u1et2CHZvMyAd1kXWAgE0Nhu5UWcdzTx310Swmaczl0BW7E5bDkLCMBEv8Y7VeY6b+adjofPZ20lOCVNwD2wFW/AMA5e2o/4megJYq0O7AgE0ARu+mWLqxf4rLtG7rB+MwECwZCguTRDQvGxS40I9Qp3ghcDtBKSklQTohySXBfOF6Pn5bcPj1F1Haof03mfeEGXJlgVwl7joEUiL1I1M6mKjrp5gZhT2A7T5cJl2GHO1oCnkYCRIiAGEzCmY8eT4CAIAm6CZ3BI8+yJBhBkNJHUYzjF2I8MEMABVxFnB8BJMVOWNyDtSgWgwywlw6NRYsTokzcKxi2W2yHzTo3iotPhwEQ6CHKBBDC+BwcxbAIXP7rS5hlFih2QA5CxNyZOkOgQIvm2z1SuHfqlQBvxGcPINjzX6BoYULcjalItn3vjJLolGVLbp9FGslulwQguSMuPDVCTrpuuhwl5QaRIgUDAGHnaEQ+dwZAIKZ0B0oSxYIj+QxYhPbcgqhiWxMoiAQ6LbNHsK7AuIOMkgvorl4co8EoxuwjGJ93IPnnGDN0QKScxA4JhLouZnZdS4Ld55chkoXIG/cAJH4WI/JvEQltt8ctOwhQ5CqCcSfVLTtORHh6As24Q8BOq3VtEfboiUzmXZKmoUQOCwBoRKccLgGChLkzCLhHe2LtpYFw6dYpyR7DxicQ7bmkKP5yO9UOoF+Ct2D7lyLTjg8u6+TuTJ49e6cb89EJEAFAFDqlnTnEbQOeO8Eu0aPUxPjMVn2BJNElEwGBMOjSW2fePgMgJwQjRXB2O2/6f+msxaJr7rlJcVdbdVtrZ5ku6NkEgJAJgaSB7OLr3gTQnQ8ljOMFvnC8v/lmOIGB3Bm2JDkAApQDilGWGI0ShDTZ2+xy7yrGxL2A8eNOeAtvYbFMZwq72uHNX5LxqdMAQCxGQ0AAAeEhTHyngMd8woJ9ntehB773u/4nYheJJAAaIEtSGiGRIpK/tdonERWZPxXX3i3YyaVuq9PCoglGGLmzoLoBn1+3r8EG/tfV+fjOQLyt6o734qnAMydZV0mXAyBBCIAICaDQlZ18hiC/N1Ptnl3k4O6tbQdY0augcUIXqtCl7qvjG0s73u/9Zvrjq3O64Z8PDv7XIe+myaKBaYYA1Cl+NF4QWByud/HdvHcsEXu30uzOQPh3wbgb5/YYgk68XUsZF8dzSBLgR1gvHQNAhzzfau99q7rkOx3/2/a112qiN3zeq/9Qw0BA8mdhruPNCFAQqI98GXtH2zvVbBRD325ddrEP2I2Ls/fcIZJ8ZsIds0gSRXXR/fa332c++12rsBJ+eco9yWs6aXXZ1o2Vh5sintEAEW/v98HxodsnhaIo3kwVUfbKg/+D16LTWHvQrbMFbu8ubroik2GnAKrYVCDi2f1+cjWPOSO/X3u5WpfxTqTN//km540T4u+rMiV5ivJ3MickxXFDkSYBuDeW3Y2zB1tpb2TF1lYk263gTZcX7ArazqAowAl5eEYbYb1tox4/7Tt/ynZsYDkc9zGjYSMev2Msntt3fX02euIASgfj2bHEzva2ExLg/6LoaMX2s51qr1zcy4yF2EPj6rwTdkG7FcClO86XGkSExaeTJIodygsbemb6MJSqzV46cTLunzTUE+u9MfkulJ7R71vnkisDw0lPW0FJ5rxhumawddfeaTiCO9BuwafT3/Vc7iVp9segOrm6zrPFIDdbfCYEECABiP7cwKynMUGGP0i+lZaeG2yQm/Vf1/LAiprCBXfVE3zNTgiLlM9e4ByW/WqdoYj2UbdCHvlpiAjxM3R4ncbaI9el7AxBXR/MvukqV3j6tIzBhZ2ROz57YAbmzGXB/EW4j5OGtgxvQ9J/XbPdH4kDze2FAz1xFabHkbBvvTkWoEjs1M577QWN+BQihN2xCWAPZJdu/3T5ONWVGxTg4ckJd15ikBM7pGcKcVgjUNNUG5DaFJ9/QUGHtzsHrluFH1RPvrOp3/G2aIgYNVkI6woLPzweO1lQZAPFIz8zVbGYuDsrP2qrRWt1qZABeOl2exWygJC/Cgx6cjyMZHdt8dn84GYDaiAGIrVJ+vV1S+oZdcCHL5vd8+Oz+wnHvhkmzeeV71m4z7cOCyo+0B+PeekYoVPy53kUAIF7ncpoL7B7sVXRWkWwnbDsbmb5bB7Z2QYgeVIYT/KjlqanD22+rt/6+6bg3pU1mUk2n19gMrgsFuLAzbnmBybZN/c9PsFbWFl71fv2gOfeS45HsXmBHxnt2dyByc6U4tOxWBQiu047k4rinq/3iMXOr7z01lu7sLYf8mR3tYUTAHW7NSW74l5y6nw0MKT3TiGyg1sq2wasF3NZTK5tqmt4EfjXB4ZctarP2pQFHt+FIqjYtQH6zbCEhl1EkIIodhfGzhP3GhtJAh8z2q3bheI9BUG4FTuwkEcemCOAOAXjxwsA5gpCp167raMjd8/YcTd87/QvN2LS5HvLD1NAv0DkqHAvnOwlv7i5Zt3igOCCoG6h+/gbqVfJBVN5FLh3PyvqU72vmb0jXOzBmnlsZ8KuuhJAWKTTQQK8fRZBMALP+wHBVl3bF801uGHK/f7jHhGJrw+FEmS2/SjfwHP+mpyYqeaclbXpOycaBO0y3KO3cOgL6+tLeTSgPS8+UhSLCMInQM/GrX8vIH0crfQSMvDJj9BAEgL0u7NeiAfx9apVwy7nnKl3Tx2Jyqieb4ZceVr4US6u6v21+6Z8GBfF9K3NfY8DBXU/+0ufA0A8M/DiO6qe2y/Yx9f7CYI7VEQVBJCAsDcRs2/dhYzkLmA7yEpQVAdugHSKIAnFGi/ynHD8iQ1vHxpr0IQrFKygTQk398+XtjNbyLL3QSGx3nNya9623gRcLun3elE6ZvvhZenEd+6d2fwBAo/ebcV7xyaKn9Y9uffveaDoiiXIochHtOMq0p48jWC3JODFo38/EX+oS9hUK5vmGJVP0qSU2KQSrbwPryVfu3fKg1+6UZ4W1h8PAb+fuGMG9NA5O3t9PTR68v2eT8BdmtnOjeDuT03toWPbO2aXoXLsRCpigQAuuU0AIECnuJ4aj+0OCaHTasdoIlBZmr5RkmamAfrOeSOXH1Uo9f7vY4Wm3LGlFhdsnHRTmiJ7wjM7wCbqaP2h96aJeh5J3Ph56Pc94gPn/ToYBX3Kzpooehm5d3sVybppcuiiQwlzXRVvw6Vox5VQl4CZgCCXjtaL0POFyVO/g3fyd83v5+ejzaAPN+fAoeGet8868wHvN9/T5H/+U+7SRD0M4Mz8mfrDwX03DDhH+l2vg7kyOTdJ9hjVqT1yinvnJ3aps4sTlqBrB1F6yW1AFxyuZFe1Hfr9OXTgj0e/dMwxUjoMAVffO4V93xOShtHLRrw8ChmVQVxz7T8FWEymTq0//+uAgDMFqvq5E/ZJyka+3tBLvVyFqvlTJyfdd6coQiwyiBA/yy8sdu5AvtiiihfEDkfsJgPaweJKOjBRAF5cr6P18FkvHjq573r2O1/93oE88E9VXlPWWtmGkd/QGTP9+6jK/gMfKGn9yXnHY8F4AgvKaw59ftDkewJ67m/vHLtg3/TQ+VMTEKIIomiS4hvATxTFjzNzJ02u60wUddvHOjYCAk5+TBMAQEf/wZ87sP5ZC5EPnL9+c8/12X7vKw01Dke+R6/N355569Gv9/8+r73SgG/+tw/UY2VPn0T1OJQ/WcZRWD4vluZ9gQBF8XN/b7qpv48F8RMdmXu+N9CGqwCQEGFPnk506sX9y85/ULJzj/w6kvMRM4IKNgSeBB9Y8K+nF6a/nfz9IRNOxvc8z5uver0wZMYdKysGXzD8ZR5mhdJv/NdjN7L9jBfTQYntikZAe15wFAB+xl6Ae4HqVFuX4UgABJ8SOtXj0KkPtjMYf/L1DmQvTB0h9aoWViujxuG9UmpJwNo5w88NetBznv3P4/7XiXum3K/J94uTNNqWMFyTP/35A98c1IlGiPg/ip/Q0anIVK728p1wFZfwD2fdMd24SAJQWTV5PqOSqcAYnVOnVVc7bf9320qrEofZvpI8+SYbvnlUep1yfGvL6HxD5ff8Pp7njjFgoSSfxRdCsmVfDUzM9vgoRLG18ZOoOrX3YQhAFhPbUAaWqxML5UArdObt0/Gwxp1KG1dWff4GIzhVuu/b377OcC09+rs4rDrAIcmggibr6gwSIEkP3Pe160d+dz7P+4KPIpYsXZKkCfnbWpzxOVIn8djdlxKLg8rdzCnwUxpv7wXbyjpK21FGtAGVs4DbZwJG4YXL+2+8XtWYvrbf3YGYLCr1Gl8F1DZVm4yhp0v27cmHhtLsN/L24gHUd+kRkRqDpXUyseLqf5PFb72V4pCQ7PqaHSqaCwQ/41u2Ty6GWTeWdnwRtLkiAMwFZs2dBSfOe36/DdcrvHYdFvmqek0h2G8tpZqWmqaa4AAFITg6GrPDviVrOFBD7N4pLufoZUsxhlBpzEy+cN5/hMw37vwrjMcVuf4PIvCp0Nr/8QLi7osgzLsZT+N+SVPGVgKzcJ7hjZ8r8rAGVGVXqmbVD+Af9pQGi6urm2odGbBXpiP86+mjQwnKv9H+l6PK3Sa7j1wKjGkvA9sYKr7tU+5xYtW1vJs87uNPJOpv271QDJnaM9YndQjFPF8YAMQQfNM+J15+5nevNxJ+QuWsudtG/azErzrWnvv5V0z/c9Nr+On/N9kRKQyRDFBAQLY8zXzz82PAkHwtn0y7b5IzhnT0dpMB6Oi/sd/W5YQQ7smHC0950kAS5M7JMmGgAaSBxahAdIp7FIBiJoq12CUUC+pRI/lhK2mHdVx59j3Xm4UPQliMubMqjzcUjuW5P/X/+clPvvJPhZ9svfS+JLVIrTaIMBJILec/RpsH/ivKLrhvsqJbGpaOkeCFEA5eX+gv9e8fJ/37v8cnCjweFAUUpzHFIdduvqqPGwIE9jiJ3eP4s+25RE5uUoqRLRy6KqqXwrvbBh1fiVl+wa9uvko++T4Ckx7ApH+G/SAfAxwYmgZSGQ/smSK+PKJQZl+fAouAOILLDzPBPLI3tyyDtvQYiHfGLCXBE8SPeD6FBH5i/8291Wx7JoDAAcsPA17LH9awr3zdtqqOsagEti0eW4ltlxNzKmbceNV5Fv+VXx3Kd+UghnpQoNH29W2Z9DrE/1wChXpyJTTcAbpFlXSUYFksCXmkQvjI7Qh+bGmHILEHkd2+t8c87ppVvEcr0AbpnryDePWwjg6/pffLeGdTUFVuO9m2Gduu2E426wrOmYvWOyvjWOCnvxh6OTIhQGxOlCHJ/gG9kfnRf4Y/C2PiK/aK7r731SDv1deBtETLtpZec7VSWALADQR2NgkQ7BaKyR+xAtwTaTfQntpksUOfefHlM2Ysnkz/UARXGmxAcMO7W9P7UAlMemZyZev08zFp8SOoAPj0vSSv+tEV9wUYnKFKh5JUBSIsk/8BMHLZiFEv/8CaXr3nZXGL1Je2ZVlU+K9rnUmy/0ACPBH/bxLFT/0yVW1fvMgECqDZ2hHtGbvu2msuX68tQ/MnonL6FG7bB2RortYm9BTkUOaKOYU2XHM1hDHth74ZA3AItqDAbckrI14dlSwdWv6F4Sv/i3OvBeBpWSsql//w3/bZN9Pgydr6tRaTXRq/gO6dHzVB7FkE9zIVJXZT6z9N23bYyzJ0qrfaSzrKzvsBDV6dzgdmTGKrbxzwXnLf1A19Um0YsA6GPptu2PJdSgPf04crCyMOLhCOPIXK1u1kv8Z36kv1g8tvuvX5E8pElCCXgY7Q4xyw/vhtfHnjA1OyPPHjj+jWzUPn3waPnYzUbtOYT9S2Z5Iv1/27cpllAezLt8bkytybIrYMifPv2HbFpFzsszawzzsgtPMPSxOQAGnGGWsPTMEMcqWbS8D1TCzGTC5r3/4PuiBCfGX7RNyknPd3eNvL6x8jTwKonR9Q2Bn8he6U/8uwBOpCKyR6OhcxIl12wPvJpvK6MvoKKj2goBMqZ0zqiKlK8u4gPTDTASUpCBEULGF88Pyx7w6wrAAgjetKCtkcM8wnBGAmo4tLQR+ZL0V7f1frclfkSUUWfmytTjsbjj4b2O5oUtsVk7ZJGJNfrkwc0jIqX+a2XPtp3p14eJuPWFqSRgEUMur/LljWCoLqWvt440996vqUpMyqIPBdUwaQeUYkjQ4sGUNfVmd4BaPAUEHw/RIs41j8HYm7ftslRXtD2h1OrVf8bMk6BPcjeje/jsGqLJRyKbZu98cb8QcfEVewAAiUMenzXtjvg7YkTWIkgLrBEaIrIEEBAPUuEwElhBNYcsSSw3O5Ho6oPFTW3nD4Pihvx0Z72fD3tGsud4VgUbtNzorJMzkLaL18ytK1YN9++y3ZmAwxU74MoA+VgOd8BMDDxoweMxIgrIcZN+HAjCUkQbQ8/tQ7AUag0EXmAwYUMmLHkgh1aKQf5vumKQoxlpSyvUztH6JVGwvbqgwgQHCPEkHiU6qbhtzFqrfPZJ/fPf757LsjiPWbNmpJj1hoVh5oBUFOfvbAuhhRByToM6ZuzGh+bd3oEbQNoEgS1Ac8GKCBBM3AEnjIGwyEI9eek7diW1vGzFVShuEr85uMvQ6RJexi28tYvZgnUNRnGVpRnHE7Zi6qObGDvd4b/Uo0RUJLxw9ZTfeOppomObgxDbBCRshhI4FXkoiCGWX7bxAgwifhHbJfEByP4KwELEVvcCtPECNKUFLRVpbLFvK9uTEGpw0D1Soc/AzH7b7MU1zxByh8Ju1W49K3ZvaOzLwTsKWSADVq+emveezVAbX03fzda2w4Vgz37MtxlOUCbGVlW03muxcr9RwgQMMGxA5PvbT1QMVkVTWAt0v1MnFYQKF3O0qBNogsa6ukY2MgC9HK6FoGnvypYog+49vtYpUhP5930xVTN26rguxdmcxx+AehUO5NQ1s/uPqm92qzQtKkQvQjcmavZr/z/TErwhdvyeUNkarvm2bXlVihrG0pzrCm184KMSzAmKUARQhmw6ESxlaWFcBe3ND/fTAkhcY0KvmMCx0q/tyUKAJztzo7s1vOAGltg6OTB7wTg0Df98PEMWaVMOcda64vXarvHHfB+0iBeHjDTfuvTBK789yEkePbercXckkA5FVaMKQOzar93dBVSyE6nQZ3I/PBeuQVkkqm/WEwLlEHRJ6yh/mWCAH/dwmYcceM2zXjotRFhjWVSI1hZE+8ZU3DylaqY1jZq6Pxqgr7cBD2cdtqn//1yuQbW44/z5ivHVAIm5NC1kzt9Lborx3eKwvD66souuqaVIdKAMtHrBj58mhvU7aP24akfSVqmwAUeMqur0C5p/YlfPYOWx/VmzH3ItwRHr5vqoUWVoCjl561OfdBghbrGFZuDA0IuchqqqRCuZib8t9ph7vz5BzbU5TACHqh4+AG1K5L963QXxtgUi2AxjqsqgkVtnQkUMjGdmR7K6xbkW4nqxWYgNghE7lzREjsOjTmxxipzzID/cXiDGe4X+CIVcZ3DGhz9GotGfZKXVIoyayce2l7QcwUYK25Xk605Z0Ixyq7hVkahQfPZeEAb5m4wEaHtlLUbUeKAFWn5noq8LgCxTwMYVtlut/pj3iNAJGnFo2G4s8o9Ikm+6S5troPvu3ZDJxgS6UG+mb1eU+jmaSFkry1H5pTXvqLS8LhRCgX9VwkoZEV3LpyVKAM8BDbSvr9rlpv0HBc5q0Eh64hBAhBLMuAaSW3FqSM1LPyzQO9SSRoPA07RRiTjuIvZD+zVxIioGIFdTa1yRnI4KsrnXIkA98X/KhlVaXIH5TzQuZZB8jRBWTSbFnHEhcVR/aOtjlrMJN+8wUuGR23DY6r1hg5mqWbCzQ3iXIGsSTke2+rbFWPjdnUfB/ww4684GbiaUWwSyndFv8OzM6p3Cf/NFJdu6CLp2t1lRVCSw3eaa0Y6o31Lcmg/7n5tcEpJN/c0TiaUmC5k/aMS6oNPYNhS5adAiNaLacUTXWrQRLHq7WNJgESQVkIvq+ptcK2FkJPwG1DmhdDiiJaZlaA/LaAQiw+vSpadyP5pJXyIprA6VP5+mArKBGF4O/RKRrqCzjAnPqALAAlQgW0ebm8Tiwrb+tdyMtgZDTEfPhjfSwg02x0G7N8dGlmcysZlMmZADBJrbScJnBroZc29jFssm0gwNNFlbcRKLk4ISXX3JD76PnK0VZsV/pscR99NkC/z66uVnrPhRCCg2Z4j6o5FIhStr30jTK+UpclKCxJayT0yFauHdCRRjMTEEVsKd8CJbnQbA7jGPYo5ONWSyhzB0CAZJ80Ebm1PHygnoYPuGQoYehW+UUUYDS7JBo6oUCirQ0VO4e+YNcV9iiSu34FNkAzAljInTDp7jTGmLz+Tllp6eCq0S3r3gPM0uzrvmTpYa8s9SX5pX9Oa9xbKrzwPnMQCQGge0fZ5hatsRKxGrUAlm1GxjJ6NRhgpBEEtTGkMJX3QCwA7FUYETzlF1oBVEy6d2piRtDlmDt93gXA/A6Ut5Wr7dNEFO6eqR1bfDTkzzIJ2/xXFU4hqdmPmxpGLvfT0YQkWWl1DeZBYKyBWg5XHrZfhwpGwqL5X4aWtedsNb02GoQWt9GoVNqWphxo7wMxcRJgf6XKlkI5bIq9bWMU8gUDyIrJnEpIkguYC5tmxqmlwPQ9L0jy49qD+UgQfWeqMNFmcBbwpx5tB7dny0L/D7ZmsNz94UaEMLimbtDw+iPHHH54BGBQSu5XipTfEeiIcaS25ejVzsbQJG+JAPGhSsrKQnx3iw4CgIMwAP2BDEvR/les60WgrwzZYGB5+SQAxFwJkDCr2wpTys+n2OWZn/q/o4p0IrjxzhMmEnfgjlnPtQwckg7OoH7ziqXLYhoLQ7EmaXzkr2VIQj5SqCU4LGac67dQ+ncS0bzvkiYHLSYlZzXVejMgLBeYyjKr3St3sL11ICSVKtmM5CBz9MHadeyP/YNNmnH++QAgzZTkt7nmzpQAkpOgSSjvZMMubyc+zrZLHop0hPr1nI4ZmIG4pmqMo7BPZBg12lU1ZKgn1YIXkOvV65A+6ZJ60MyRI3rDRINH5bSAEYoWqoatqaVCNYFRAYZEPKKytSMnUzxIAMog2Ga4DuJ6xwH7c38ewlmnCXgCGm8EIX0U0n0hiFPuJ9CGYqj8VFL3QRAFAXg0+klfmpKs10jjUsRqFSwgNBGwkfu4be4wgYJ5Yr092VhqTCFfCq8yiVk3IVpTTWwZVuq2bx4xTZNCbiDe8iqurLNUKAG24e1Br5f7gLQcUaCdbsGeAAAJksBd3mdzEtraSJRD5fjUItl9A6qvOAMX88QHrrrgrfU6PAPAaykpRaeoV7ZuSTwEkjaIg2iwTaRLaesSYiidGcagQYmtqnFjg5KUYEg8RWZt7IlVqwkPxg509PDS96WDrEfBAyEjt+MBWKhOQQIgUC6g05znlxPo3rgTeu9RZWduRbftuL6f7tCkfIVfsLHSiKhl6hRczaoVALd0c6SVmftbA429PmhDEtGmZSvJaiKgMQw5JJsHaxSbVO+ODYDYqzdlZeWldK4maOyguM82U0vSwRaZWSJ7+EwAxMLxoEAIEB79GEEbyj+2TAKI2F0ECAFtFLu67fWYcftEPPzW+wZkXAavhUQFImMQwhLUAzFk2wZJeW6VM3ZUoE1EGmHKZP/rxyh5bniM0epV4QqikjRln/V40/qWrbK4ymtbqhwdzNS2xKi1bUObYG6QsBAg+dijEig9+ujChewS8CRQVlYGsr0d6LyGdj4+Ae194qYKAMQGEHf8fuYfPugRLBM+WIplDsAIsJlNZwqU6gGULs1lKGZW6MBt1pFtYypTjRFJA0/49je/i3ZFoxDNFBN4NpOmcWCSWns1jWjWgvC+mMlZDk1p+ojc3ezhc/4w3k+XgE5bCZ1YRhLjxoEAzpe0nagbDGVEWTkA/r238yTY1u3DfTE9TNsYjA+o32GkUEuKZANj3ToAGtZQxtK0Ppa0v7/+sbw/krLSC0ubDdUErfFwPs7J3xoi0c0r2ZGTwJhfl9V+b8ekRB1c3YAWq+FBDBs8MaEQqhKKBgB2BiQAWLhAAkhgO1jnTnZldJms86KTr31XoJ0fotiDE+WoIABsmHHhpvfHnFBPqrQlLmU1GgVHwtzqQuGw+jqivsPysdJ8c7IsJWsyaVu6ptrHCCKhNr/42hEmeURkzKE0kyWEfpnESbyZ6JCaqqRGVX9gdl2/MMCAAl0AbMHZD531iBYCUFeTIzuZxkLSDsCiQYp4eyRDp8I/BoBdya2oAInruWV03Oh15x8M1kloQqeaNLQQe/ctqQDKiP5sLzFbVi12hJJCPj3UjtzPQTTZEWUj69whUgITIe1IYSWR7yYb+zEcvDbvFWmjr2quWdM8cB18CLFadJJmC+xRPkZjp4AXQQCLFi3WYvIBEN1WFFEmCe27kpG7trgwO7nM0IVZTrYR4HMt1UuXZ8hBtrq2MalaRaAFovsQbv1g6V/U2J519O3vXKrG2mEhYYyFZJW/VheCDS8DX24wMghBqtymsgQlW9sM7X3fwXriLYv5njc7oJjna86Qs2AtBA021mwf68EKVpCVZlsNAMZi7OKxAh544AE8AEllKC0TSKC9fW+rCATtMov2pX8CSLSjvBy9LuJFmUNSDEVY7s3AkXE1YauGAodKWvX8AWA1GmjrUIgpVSPbz/Opr/Ex7dYIGmLkCF+xf8oSjwxtqZbmjbn81tKyreEAQ+/EhNwvTlqtFiKiff06B+tgLXLYS1Z6+ElHjD1y7JHlaK0A0LkvHrcYJM47T3jwPJyPbhW5yspIABT/1i1tNkQhhJ2p0+Ze8Puzr4cNbNay6hbWmoSEDKtp2aExXzAhrhLagwIHLKN8VbLOC0rYQsOw0myp9e7d41XgsaDUDEiNOqBvPnqurW2fge+kDvXKJ2jbdsznXWCUDkClg6F2NWB55J/940svPfNHHTl2bGfraAWARQAJbIfDrwEQ7PApU5xEl3TX/kYC7MaiiNmXXmohkMD2M4h2bJuUQSisgcCl1U2MjdmlliAJdACChohG1dQinyBTVhPrcFghTaFmjV4GloWQY6DfW2IZsywtuNhS+7pSeH98e+O7RkOvTeUG7de28fMtzaLaaAfDhtMAGCTlcjnknv3jM3886aSj0CUJnXrwQYAPsKMD8Lvv9gwg9Zx6Qek/bKubZdnuUiK/OBuEkSAJZr44+x8zKMM0n3/xlaO+xy+D1U3mPBKewBKzOsCo+6P/Llio7Ow331v/drM3mkP0TG2wurLSnKeUl6JtdsX30LgSIoJGRzgNGzi+6Vlnb4Re2FSKnAobBQJo4ZbyRpdXA1YcQORx1B8hyCU5IIFGEmAHAFyIi7bvZeUX9tiyZexv/eI4Y96FZQRA4lLLzr7EQqC664VwSUjxu2kP4hdL+20ZtsHBYRhmqQWzVHSiWWHytl7E2JN6Elya5jtQVwutoAw+amlZqgw8AVhZ8Q//cF3Dh9EtNaLV2INE7IM+aOy1kY6SPm2laY82niO5gLJ9+tWIMRXtOIoQIXX+FB3dIk4BSTrQ0bGDDPcAF2P65HPPGfEfP/zBS6P8hdffem6yWQYg5ZGBBCDXSwLNwmWXpjNmFc7WD6+wK/rWNA0rHZbkVhzusa8h7cGw7cPMtsJancagQsGGGSMEcnhjk6dJqBdJmYct69f94uRHvh/2hYkRjMHQvz8Bw5wjrQ8N2FhJkW2FOmaTTEkOUYpkEsxOOBHHUySB7WR/GkfDqaduPPW++0liiiNDsstqAPH4i3dNSnuoNT/aXx98/TOXzHbOwiy4g0YCIo5WJNLCr6P/8pczn7o/+jUbYShLS824JCYbbdiIqIbFcYCPOvnzD5W890FAJCNFmJV4HVGuEiREkiktDUy21m/9ocPgIUR0KmoA3veWK77JTVhvH/TdyoowKLu5RwsSFN4HslVgQiUZ+InqZAPAxcBTp4KA7gLumi5gCu6mhGw+A0B6ouSaBxS39Hkv4MB/1VdKAYU7QYLWRQZQQkxz2Kj9NH7x8BdKNPi712B4DBnlPJiPZFlJKzPjHnilTgngngNK91/tCRrraB11IAHK0xA9y+8AP+p3RGueQUE0JWQ7IA4w+CnXMGArN2JrvuzJwVkdZQ4V2hlep7ksCTC/FzifTwrjTwd0d/f/daa4BwIw/U6nFIBpwsLwM5ty56txrIDrZ5LHugwAaDtjZerhQduHah078xHycXyluea9LRcOr8hbbA/OUQmhtJ1Wt+b8eiMeiQ+fs6ZSmz8MiVjPJDZUW0wgIFV0xPD9l33iiGT/9T02IKQkUZqDm4CSQ1dlG04xdvTfiALiGMawxSDgnQSggNQE3O3uwU4fP4HEr+5MO8U0BdJU031GmEWEOPNCdCr7ZfSefh22ktaxDljgKaZfDEgEBEArHiscVjrbGV5aQADZK5+8IelluW1pqMyQR8Q0VyhICuGwWrLtQz8byLZ+4CGRkzqoUE2hHCgIFFwF1g4ZsmLZg3/e0BchEKRK1isCD1Wxrir9w+vEBoeUJxTMtyst5A4EnGIiASlwF5I0AIj4W02/fRYJ0+zUxYXjgc89d+UNfa7zCJb/OfO9/ATNuygSAGSAEyj5zj3Z795/aAuNACpm7wvkgdIOFLzPB+WFflGAaGtL06Sjgy1Hyn+rWlrGQawcssrYVEtRGUBOl7U3oGpIR3OSIsTgjBnmCThr3IGkuWLbgRs8024ACcrNoqvZjBG07gABpIjbBQCcTcMO3QkImHmJiMeEhQuxKPn5xoZN1lHWd4vxxwIOeu/tF9ElPeMSOCNxi3NwJFBe/+1TDhs+enR9XbtchVLG3qkAQRUD8we2tofVw9VxrlKyeSUEDaVERUZQaXRvHyShtqaludmSyk2iKGMOQGXINKeSvPBhZm0+KUAQAchTh0FeiBBMuvse7CKDXSYAMJsOUCAFnP44xo8fL3z1+3N6xpbWjQq4vedfx31/6sWH9LFgENS30R9Y/WH80eFx+jr8CScVvlpfsW/vfUJZaRmodLXpw82bP9wcsOmv7x+khtdaasvpCwqqTQyNcZW7AlWvABRSP/igXFgzSMFSJH0q73WYAAQY9tNWaagB8GGNaTwk5kmAJakJwUB1CqARF+wKNmvWbAIGwMVZBoCg/HEOW7R4/YhDza51p8WlmJd8axruvVdT6yUaXG997Yn+NVLuZaThh64//WBOT1jb5tY/L2n3soZI9XWzQmFtts+B6cOPoMYbISDB/QbWwGpAlzWKAHGwVkVPX1dqiVmvAZPftwEyBINTEPaDAHia+0v7mljmQCnTrFugKCAxiTBJU5EkSgAgARQCFdGpMAMSb3P3mD7G7BspG1tKrqm978RhuUw68r4p5yowzc27p8nlkvyE//5evpB4n5GJ4nxn+/zG8VtbsbxBXIlYH4hN/XoXspkkU96+8myvXTU8bNuKNAv8UUCQG8XGelKp/PWHpFQFwTND/V1wXZ6ZCByIAV5KSm5khgxJVGxFwkDvHwFIkPIoSQJ4t4B7p0LgXclUzE852yC/VQi4ECANkvAYAGg8njvULjg2kok2eiaE3z6fNux7HEGj5MIjv7x+cu3+W5eNWDHvNRvyH8vMR6TLk1F/thEIm9HTOgZgXWSm7/p2axSHQYVVQ5vbLd9XQ5pRBXMLli8xJO2DH6qKSBDMBI+heUx+wHuyaKYBJdyw1A+WAZKlhkRZG4C1aYxyA13OENDchYa7LsZ8TBV0X8pLDdAtJHChnoAwfiEhbD8BAFFaO2VEMOuJrQLCRj5+d3OfcwiD6/cT/cmv8oik19P2m/a3huL7q9b2qcn6K8KYfTdo2cR3vKRjwDr4wW8coMfTYZTcWAgNhRT71LZUO4Sksn9z9dvCAWRTlIVgsINfKyQq2V7RPJuTHbQRj4dJa4Sm6hQEGEtUQh74UA2VkuYRITTTzSRB09ynXiCJFwQIAC8VBNjpOh0LO/EmnGETJowfD8nw/Ve+9ZdcWysym7f4wX3Pufu4cwBCtM/zkbJY2QjUZ73kaptqhX1U4q8ANTnXQWe/HZJ89j3I3g5r19UEpWkaEcGEw3L1TWOiAIT0jao3++OgNxoXEpB56aBDYCUObCAS5Tx24CmchtVqagIAM1qmwHjgAap2hyHQyMyaI0iZAAEkYOHe+XcDcKFTvJghmfAYMGGCiI+W+mPDDX2u2LRl3YZNa9PYQ2UV9ouHIIAAXwB/MVAKJaPCpPgPvnL/MDp5lfQ4APaWsL8rNWg7t3dEXxUga1TzamQaS1/iUjBJVmV7Zd84GHo9YigMGFKl3FvKDE6AggCsSAtGPbU8rnSgFpYYSSHmXQ9HdyclQ6apxkeNGZ4YcDchERdv/wAGEZLhojtwCVNC4AShSz06vlqpd+xHcw59aCJTqd2yZaUb/uWnE/H0gS2sP3S/NT/aYI4szk2Sua/relOOqEqTrZV9/nnslLi/vRFCbEcbE0d1c00gLKlqpqH1zL9mQBtu1juL9XSEaKLVWA4DfH+3wGik0DTUHiqkm5RjtYFmiEYpRVA1AQhuIIeVQTEkyR0UBGDaXbiIuOMSwSkHOAtQsnYW5I8SEDDhmSt7wDDg58Pe4cT3+rJ0S2gt6dHmE74enz0UxLik3Dbso9INpTrq68jWTF4/PGbSGrTYUcJ11z0fzgHTiBggNFer1hHqWGM13tBRdv+RNJX8edi6Pu/i+SlrGAprhjDBm4fmHOHdUkMUOwBm0mos5zMnUoIgCXCIHkTADfLApuFLIR1unAGIM6ZD06bJBWCu3P3i6XeAoF0Skkx24gSQ5HNXVu//4Q8yP/VvHvHbp9wAFB44d8r8q68+RXzrzUF87PEDWsuGaPkBmW8VvvAPX/jCkBHWLzkcTazKBXTkzjn7vfucUGNHAQh0B5gk1tiM4f3qfJBZCKO3HymgPINYh9oh2F8mW0sUEJAlWeekMhiLKnMBSEmHk4BLTndkMj2OLpFU126gz5g+3QxQp6a7z5BHSDMBUFIUwdMFIN/3yusXZq59Y1LzK+dq4K/Xte9jTD58883WJxYc97njDm1/s+lnP9v635nxaLtledYSli0F8gNWUVgG69/vvfezeqMZK4clcUVuMIInoaJHUslqaxrcAMD65cHsJpUevzHvChgqk7Ce3s88bY/qOBj1ciAMJzFfBCRQDiONhCABfjAqex4NNDTwAc3F9GCKd+FCUPcI6LwAydsvgeZi5u2z4FoI1K8O1lYBXrpPqTaivF2fL+OWeb/ZcJYWnCE8OuFRstI15LS+49Zf+7kDWYgEhps6QsSQJ7HpqR8v2dAnxFGtK0MVYgaJiLKosK2xGpm/uI1NHUozfa21taSQV36oEOnr+gsbUjhkaqilRKe9nD7FG1fDQypjFEjzSEAgwuoxSvBKTuADilDg3JnuIHB3GniBCIC07VCSQOhRgiWf46JxiyoOunbVg+dujeUd8pP6Z3naMcICQgSIivyX7forjypDgr+MxnKmrMvu/8YKnD3/sS+tWXx6W8+OyglvrJjY7GbNYWQhRUnvktVhEN/7y7ZwctruhgxjjzZjPo1D3sgCDjJ2klmECQ4TJL7MAg+nM6UhykA4OiXKMlUL6hrHvDIIPHO6g0bAJTyGjdCFLoJPaDwBCAsJEMA4/emoPx355yNHnfzyg6f2veZf/KRv/rAPSz74qRaQAoCKwve0/xX/nD3iFYzI5Je7eR2khCpdGdb5grOTKq2ueoe1K4YiREsY7IB3+nzQZ2Mu33zYn2Pf6njIX3HI+/u/Vbq0Vk3VnpUCLPUowegmBxUNiGGlRw9jHNGoSFCUQnBA0RI2kUAYzB0eyHkXURKAu2WaVgBALBJOISgJEjr17AnPnvDHb/LHdVf+TBNT5Z/Tv1WWTRsMLMAZCzDyy83q+92vVnh25PIRHczS2kGXleVKr25O5zQpW9WYRRasAj2UHfB6SGT7hi19V7uFV9rr14/aCh26tv/7z2VGNQ5rqAqywa+7M0LB0FjjgJweIMPLcD/S4aScTiQmwumkiwFNBJDMmzbvQkG/AkAIflnhDocA4SSa3R0ReAEEwILwDJ+txcCq2IRVZ//ispJGfPMn2067SSAetf/oGauutOHWxt8vHWUqjz2Dx+TPE/G2BeRKv1z4iqASt6FNhKT8+0k/EVpb9i4YEOob6vtuHgSmD5y4b2uslRgR1kRKEFyssUhaKCiCzhDNl44kKIcjJJIpQhBMctasqmsEzwZACZ3SbGe4ZZopDwAPTrrXAYAUhVmw2CbghSvm2JCv/iOvqr8+M/ZmDJ72gwKBLAZ92b8i6WtDoa9errTfSWLhw5IXk9/dZI/xRxD0xSSbjllZj6Y6Z3N96EeZC9zWhrLCwN/FPEMpaoby9UN+w+EWrWkoaOZUJDIFlyFxIbpAkisUdbhkTM0oo4c0MgYQO0TDDjShW/qi6B4Yb8WMO93QKcEAQZgdVCBi7Zzkc89f9x3YVb/Ql3Xz4NX/rW8UAPzbPvFr6Ymjkp99tfpK3XBDnFq7H1sfs77XPFVy+y+HvAkqj38p9IjpuY/QgXpmHEkvgdgEeNL2ctq398hHag/BmytyFdWDXoPlaaQpBeV0BXOABQEGWGPstc5Go7kqgQMmOARzvgYKUq2LCQDuZLsERDCHLtVtNOzQbKR3CpxxO2PIpKnmWLtZxUl6Vskxyy70pp9+FTt015qjP4cXjlpoJsbrT/v/fvhCn7EVNwxrwFX/82QooQSLyGQydl8mBWtRmmfim9xAYv+/psSk+WtfLg8wAGcMfiORB8FNCo01CARlhHu3jzlf3fQMVw6vTiRIDgEkkgQ1BIBVqBXPvJS3oku6NFh0QwpgLtHto7cQAC82ppKeOPn5Y58i6gcKT+tE6PCfnwA+BQACUf6zVYf8878UbqTXN3IwTzvxmmaTzb5FQ/A6kP9etJCe+dpqpFR9uZDzcm4bDOiNFbVNqdBrbSZzlgm/HlPZGgk5kVpwSZ0HQoALXeJreY/oUasdAiAaErMoslI5SbLZQRfxIgLwmZToaYSR6JLNiJgxQxDn3oZ50ilPdWRw2mmNIpUx+/XPvvIMnoJPON1jmsZD9POvEUC4ov1KvL7m5u+PH4zkmJuJNaeL/iXR05oWDU5VA7R3tKWlS7bydYCDJgYLGfZWlPGN1Wja2oWgvCt1WYhMGB0yyxA7pMEJE20DIJdBLjgFV5Lt0dEhAEo8gtMAgAEy5QECvJU7XzZNx50XzRR4yW2Jz5s1F7NwluKpAsY9BUzSDV9dMO7JiZaebfK49vIMJKBVby289jpYi97K+B+DiBtFTwyphKZqtTYPCUGD3+ioie4Q2NLkkr85oHeT/254Y6EuGpzOgthU73IxTWS0TEiUKQg7VPMqn/3c0hFRSAgqkccAVGNBDaAG4EyeCcy4a9o84sJf6RJ4BI003TrzdoqC4eLtuXDMtIKQAU2M7nCDCxJevOoPDXEi/njM7896ZMyqjnHPXfUL5kP1X7/4iwww6LWOHhECjxn5uJ26b1pNrar1hhxHK6hq/RZ3yxz6hqLQwJpGDG4IGRgKIx1uIbo5ZIBicIswMwGpAyCosCqPVPsMRYA8yihnkmF0mSipzmbs8LcLL7hAxO25gm/XXAjALM2kGSAA4Ay5Sw6CgAWaGQmBx/78rHqLWhfPXBBW6CQNffIfE4TskTd/dRDweqiMSlPi+ZsycbHXSpa8tVyZRS8vZwtbG2VVeLiwEnCKNforPJ8A9Bg95gsem8FVlCgApCI8hkBClmQ4NGHCP6wykUbIBVqhkDolj+kQ8B7MuxACAdw9VQBowUDp9hlyAvMuhs+7CL/ChY+fRrtjFjqlCEKAHp+AR+vP+ll+PBaC4Fjxpe3hm/rZVzDozDn0Iauha/iDGjGcP8R9TR7MfLjP78Z6r9rG2pe/IDx09iNxxKus8VV1voppvn51YBpqHRApOBPIZW5SAEVAAqKtAQZpJfS0zqi36I4SpamRgYJHV32S5z3o1LxpEiEBAs1ASPzVhSDmYdq8i3jXhSTvQCeYHFqI8QYIkGkhyi7/RUEAiIrWitY6lOS1euhr8BuuwlBceJi0YkSuDz/oSK0R6XA0dVTfdPPDJllhItDczEJSI62qExrq8o0hizRTJVLUDh5Ibs6EApAaQrMJtQ2GQf7mFsZ82Sggla3RUA8KgssjbCgC70bxBS8Bkr/CxS50SjTC5+EiSTS7HTMFSo/yNG6HAwhRjwHlX+q3cDHGCdBLg1dfPqe6of7LX8rgci36ERxAR1lHiWKeXBHaOZyNFOqhRnjt0IeqlWnCUGdzNdFo3lH/WkiHyU0U6KAUIJJuAgVlm4jD/0LUIa+eL6RMnz2tTgJNkRboUXCwzt9t43wAvGuaAAggd1hJgNRtQAGKAvGkeOoT0HhQwEJC6BQJsfT6xv9tR5fqsgWuxhXXJ6o/b3iI1kYgsBBK2lW+ZPRLSQzRfNiqGgB0KcCEVElTDdUY61ZUN5fmM0NFCDIXgeBSMACMsGYDqCO2NdU1VmXKNjcUuAhnDoHAkIKAHBTX4JymlPcUB1oC78Y0gV0Oeh/OB/m3vwuBdl5QgoAnTsGTPPkp4KTRdmPHOPzxaC0ui/W5Nw4qO//a64ZBlpPKOlDKdgiAh4acmcNqXWGV6p1Oa6pRk3s9xEYPPGRVwDBHiOiUAzSHsgKV0rLlzqX0zKDQVOv7LB2cNqV93n9uQg2MFpUKFMxBvjZEXQ6pnY9N4J4LdnFREX/LA+HJU5847fFTAUA7D4vGaeT/X9iZAMlx3ef99/179gJJESRxMJaog9gDIGnFKknkggB3AYqUYZEU5SOS7TgpWqqSHNuRKdmxnThyle1KUkkqoeWUK5JiS3QcR/KhWOIhwRZJAAuAWFCU7LIoLLAHbYo6CIAkABIE9ph+X3p6/KprdlXS93p6ul/37Lzv/c/X29Ov7+GZ3eDpN8x/ZuDfvueNCXRRZuhi51E+1te3OUkzW2dI2jKn60vLRZIDcGJuGCLaM1uPtaO4TnYSBrAkA6EE/X191aOdXyKOj0ZJ/8zrPbvEVc8VbwGdGEvuRgaD5AiMESajZmbbvbdT2xhAuv2R2/8adwDGALvM3370jr6jPmqKz7H0H25IWlpaZMVc4EJ6snLJ2+yybI9StvFCcX0y5jjYJNuUGB9zzBfblCht3AV2ItlKckqv87m/47Ki3OpEDI2g0aE41/KTx5kdI9Q83pJIYYxtTKaUGw0NTHMs3YZuA3eAwewTcPMXPvj+IzceHfvPS32+aC8y+LWvK329XCnbLpNT6XpQshWjbVJBQkoB2KaIUNrqEbXmSo4JCwEIsGQ7HE4nnzrvr7KuKDEiYQ+32tLKw18TmKALCYf+hAyD8Jrf+FoAXvWoN5Nh8nr6X/uLv7QZF8sts0wqIyUhklKRUsteWRidZWxGsdUqSUVQAmA8qzHPboGnabfHZlujzt8J4UhWq8RuzV5HWs9X2WJ5IC0m5NbMMql9+PY3qnSZIsmSIllh+89crwCbGoY/rwpgN+LBGFyjkWK2y4Os3Ff+CH9Xyu0LS0su27OdrELHI9yKJBFipkwULQG1pz5um+SqKKERwwgamGE5BIBQEAtCtFMyHi2G+7/yVejD8fq2uz62v9Xft+NLfztzIiEwlizQH9ODv/iJ+rWqZi28eusg9C8HvzS2SU+O6rKLKzouxlKSUqiI1LZVCmI2POowwpU3cAJsVx7PKcyCk9oj8xojgSA0l2LYCQBp27ctD66s+OsjfSvLCIgUxxPl4uO3trYmIoGLMGXof9NF5xY6mu16r35f+2SODAsD+YoQOPjtG7hQujV0geMjQWIlEsU8bFtxucAIcybQtpmtJ8YQbqcgWab19WLUUcxQus9LRIwmIdNipmCkNIDcP/YNsYnnpav/4bUniNF/eINnoDVTUi4f2tXXGlYpFJFKQn/Ew3c+VBU6q1ygXmfkzTU/98q8qDGGfuoHWWqXaWDdBUd5fIykamfmuq+NORGzwkG7tVWWnebHSsAYGY5fJ5M0G+3Ab5iLYlgy8pyDLTbA9d+ULbc2PG/zT+TvJBBKrz2e5kuXj+3aNhvFqC3JCXS/6HmYJ24qHr6jWmS6y1pkXrXEpB/8LZXLlKlYd9GJSKVREkU8xbBmnQRWBMjbEuG2QUrIgpmtBZgTGpmzVoaPD2grpOSnU4wkG7jhWfiBb4MHluVrko351mu/8XrQcafZlEaPqYhAMaKEpYtkZyRKCcDIa40qe8cP//CFg2nXAejO5Lrj8IQ1hXnj79jWIklDDl90u8uu39IxB8NzBsUWzV5fzm5LtpwQYZtwcSxdB0oniATF8FPuE9ucSE8nDWPw9d9O+LXw0B08KN/10J3pO9qov/KdD1//ume+dm1rfrmtFO4j0Ci29Psfg4wvvxXgX4H52M/l+l4cvYknEG+lwRO2sF4cG0zx1bFIXHLRx65LZepzuyxK6cT1K5pL4dE5a8SavS45kkhlhAOXihPbdMxSIpIY9sLWmZUo0GgJxayGazW8hNd4rj3PSAlC89yl0+v7/eCWmLuTKstmvkxtoE8iGLF1kRuPctNRoMGFdTTIcQ1rjQMRgK0o/uieTfpKlMgjA5SRSDaGjhjGPLclLOZIspS2pfnaCsGaH8aFlGZHypgj0kiSKUhz7ShwVDShqkvEdQ9ea2uesTYgxRy6Q8dLuZgbnqMW7YLaBtFKGmFWb4QGrXa90Hmrd6tCm++KzoSJHEmID92bWvz4Z6NFCob19NbFp7eldpFODMd8EsPMD89b1sisGXU4QqVJKpzmAIKSsbnKHPEoxkjoRJKkEWDuWooSqeTv31Cc2NoOxPyw5zTiAJhjmEqYogzmbCMkg36ILBGDDGMnWI2rXmAtdNi37D2Dr33phZUWtLuqAESK6ovT1gQC5lHOgjWsFHOJbSRKQDEjUKJAtjQyxxYr5kZKLZDcpZbA5NgTC9eKmEuMcWJsvkRKRVmUIDMqC5izrFRse0r/VGBkWaYm1l2gwcjc2ilc9CcFSQIZMFLZzqLvh9xzI3g+IQ3DXKfpViLAwo4tCyVKIY/OqzSgMFtnGGEhVU0IPDqrRIx0uJQGQvNOrTayYni+LVtEgi6EC4QJUqCLrixNGCCvpWxPMoLMSHDjE/9Yjraw5gJv+eDvonPrY5ZCBoMCUxgno7D7km0rIhmLrHMoEW6VQpUrSCA0suCtxxAwYjSTY1EAcozOlZKpN0KYEiSwxOjs6AkcSmOzLtqof1RLyLnxWXSyUQ5yYCwkyBCWjUNA20LG9360kGbJPTE6b+G2ChWjc6/jeIsybePY/q+D8C8OrvSXS9dVtWolGQhMx/iTcvfm7y8NIgUamxvhRFALH5KlRKuURpiDYXkWYeHw0q59LV0AK8A2SsqTbIeUDBKWhVJCwkg0SojpwgkcgQgaryp0AlmAkGWRPxVCUcaodWKl3PBiKSiKKEtFq93uc5mK1NeyLQlsm5X+EMPzpXDhhLCCkRPeOodtJHBRyrJTKtpc+Rd6BQlDAkmQc2dZuLtYyWEEygpgIxtjkWTSr2H4ryEFRuQXAiTXJMkVGGE1OrBCpIjAEDYOaFf6xZiOwRjFAkptUAByFFASjM6hC1CUrTbhMWYA+wC7vHJAlhYBW8Ihye3AGITpdkEeIgggCYUBDE4yyL6Xj+YzsqABcKYiEKKmh1wXyC+QQZAho+YgRgaDDQQSmJXAjM2A5f2T//O6Y+8/NOGDt3yc9yMQ1jLG1BAGW04BRtiWZbj3PvgQgPx7ASFjksDuHOJXth+8796+/xaSAQE2QsCJrTNiK4KZzjNQelDtywjg+FY4YZpHzDVeWjkyAYax+nTGYMYCmzBmCsOxiiDGU+DQK8I0BkAyEGEMSpKduJcav6tA4ABh3JUqCfnDtP5LyCZQ1jVnj0P9Ux1fej430ZdcgC7ymZZBxuQYC+tf5CqyFHn+KhDIMvhFruQFIhEAKaobA4FPM2PY2ukno1do0iVSgnvhPqmAEt+787Dv+1BFSTLCBkQzaaJzqLDhQ/dF+vC5T+7gCBiA5QHg4hDyRYOc03CQQLYkTJKMAAsZZX4CZ+62BdlwkexoQpUwvZenZOk8nvggh+7jQ+iWg/9d3Ktb7EPs/D39Qgikh3iHfw8++AV8x8NV+SiCA5N4BLjzoeWfeOCuz5bIxNAJYcn6rqnnIwwsJWjMx4guOywbJBMyCAPdGsBCYKshumoiOTfcPvI70r/7j/r1/6T7kXgILcKP+8E7+B/tn7dR/D607FHu9ENz2oK0xIAxCx4x80IGYY8uMWgDBIkUc1nF8logPYo1ud+SbYPIRiUQNjZAw1M51kR3xjYb7OYvW3kLZCBFpcBX9Tyf9I//4t3mz/uBu+NPsX/qM1kZBhNawmgAA/O542hDCxuAEeaGRdxFhD+fVC6INMw8DM8LPdq30monS+Jtj9jGCBA0QTEKABJuZpqUIGUldbIQkD+epJAxNgYj1PxJGdBvgD71MLDAlpUE+Kc/bWkwLahNMbJo4plEFy0wYIaFlKw5hkOLGBODRiTPAyC6+jrMJylNPbuV7ZAAKKx2kkDUsMkhHSFn5ZL/6F8KlP7Pz2AjRf7QPcgA4z93z/3++DT3f+wD8In3fzxP2jnNjTwxju4exFpkANCiNWjjOeExXUQDaJHBF9fhrF1DNnOiy5Al854/NRo8wRiek4D98F7JYOFPMmkdgMkt/CGoBAskkbJ5hEW2/gQIbJAE999z/z0gJHJo+9Q9TdLXIfNzH/vAxztknmC8ny6WMcb6IRjREgbgPZ8GJA0a43lGJJ8YW/KgFjtVXhDtFvZwViscSwNaNEPv7LsfBRpK5JD/qXbxXhk+aUA5b7OwbUQXlrBR8bMCw/3mZ+nKBIAbDXyZ8enxaapMvt6VZazG2iSLbLEhcEJ3A4PWIuYnP23kGEoClkggBgFdBMAEg7gsLPdM2rZo+/JzP/1QolxoHzZYZfFeJNn4k6VdyDbgkIOfhX4tVd3fL6S0CBoQWMbLvIUnjd7ip27gqf7lG9CTb8GzV74AXPXiaBYgWNgQQEMrvYhiByG+3Kc3dd1c9rj85P/FWeBRK2SOZu/5DCDe/ef9f8D7dOdDILT4ns+8m4dCnLv8zs97kYE7HvqD2qeJ9wpTESMhUKB71LW8ei0ayNzwVLVUha+8FajUCyAlUHbvQkhYiWSYu4JNAtu8GENv/spbYv/dK3sHfBMAR1HH1hZN1nADGpoFwyhiseL6GTEIi8asox1eOLBr/+QBueKnKq55CbPuorH6nt6i6vDkloUD+H18sk2h6v0P3+s+rXlOQsVEKkxy3/IPguAJ3goGAdlV0kWWinxGQxdZl976ZbM9PflKUnhdurnUUeBHysJl+5EY5/EYD/3JnyIYxDgPPS5C/9PYDAsEiIsGYhCMXU9Ri4yQlMoCCVxfUZGhlfdkYAWizEN53vwUIBAF0O5bvkFGPPlWy9nZA8p+vomPuw6K8gUlE7okeVwA6ShmvCBNL6uIt/dhWP4SjE8zrndq0LAEuBJQ5fDezZ+9+8+MUJZi16vMMbKc0FBbMD+MBTQwcg4SAjWjOpklPoWxkIHKXXccGlVl5dtu9JNvyT6v2gMkkiwhK6VEKDCy0/NGwtIlbw5Rw9OG7cLTrTLh7Wi67F8RxrobTA0ri77RhEbPAaK1AAyDlf0UmU0DiRygQESyl/D92PavA4ym6XFg+qaj3AjwxI0yJjsGnkesP7v+LAJfRTorkQiSkS1f6ZL2dgHgI+NHGRckBOUT40+w0kegC+ifdQffxOIAnhsuLoBjyLCUgwxiCJdinuFKXOB8GU8AXLgE04wzCfyj/KWDFFYCKEBcvll869vjgXRc1BgTONotgFJAlBKkglIuWIG+FWed+KZCbHg+0DqzWFogWZMgsJANfuKmaRmAipoR0qIBG7h0ZQFA7hCx5qGmU5SQ0QJZWUAJZSNBCACpdB8sb+DqyumdOmu48sz6TUhSVDO4A6IezR3fdhy2ApZdrABhy0JkGBautVN6MXZwuBSyfWY93nxKQEDcLAwGjqwLAIHeAxaLDFKjHQbmyRgGqCi2msRTQoAIg8mXy5xlZ9FimY2n+40t2AR+Hq4CZF64CsOZ0UBSjrghjsN1M2CPYkAOGrfi7COfhWssQkbJ8IwkvXJJMwBQbDq1qQoMNbXu5WKYr6RUIC5qEFyS0UJc8GWgJjEyXSgBhNdMo+urt3OE56RKWpUqCiHRR4ncnGkQx7ceB8G2YyPpG7wW8lG1Soq2gGJFYSGnhWElym8i6azf8UUuBxNnL8+jIqQNMMfIyaRz7zOaH6ajfDhzsS6A5UuzYlgB5l36S+TMi8Rde1kWBYCdBbvxNEbiHXwR1ptNCIXtUxsBJAShvqTj13FsKyk5mRJatAtJ/MPrEyHL34jXEPIziFdLz8iKc9TQ5U4/8Nw5fuQLvlsB5vCVAZOUn92g516tkH7iD9+HAavVZHXUJTCOBJGyaK7e7s+RiankLj3wTh6+80He+fl3iepYAFe+WF9Lf8cXxBVngBGRWi4hErSEJ6cEBtyOkkhJKvyCIG1oCT8Lr1G1ap15xxfXn+04ywR2vATrk2QSAYJkUJxdz4Y+aL9w5e79gFr9pSb/F9fpx+gHBDJrHrQUkCyAwuAun6JTwKoaj/G7APicMLApnRkJvr05Timi0snnJK4CC7DWA2fRq16+DCEygtIGQ4TPWTH0pifGlf7mAkNv4m+5kGJd4s3C5lCyz3nDC+tDwpsCJxJ+wXgjbhHa1TqIJkH6aQGsvafi7gfeVbe2WstghN4BfBFgPUnoLK6tCrYfeW4zOLYfIdGFsI03uTJpVWQuxReHUF3QbnkfgI0MTu1bODQRKXEQNK4jDjtuTgL7KCbw+HRwsXyRy885/diToOV1oQCRWrV+l5NSiCkmAdA/LyzLCTLeCQ9wtx+4+0F32GGu5rmrnwOBLIsMW776uU2ATm5WknA2ZrABCS7BCVQDiAQGRGqncaYBdrb7piZQpANRFjcJmSPeLqKEIgHqEBQslpJujieXBkDhlvqCPiiRJoXEAdXEutQISFEvFBjDj8oc2S6wsyhrC5M2nBZ0YtQVL9bisgmLrMtDGIA6CgcIQUrA0qBAnL8MyYAol8PjR6ISRqW3Ow6PT4skdBNM66bC2NPjAk8LPE7BIeKm9GWwB2I3+2C3WqGI7qh+ihqTBzIz9DMIXDu7B4HC+Oqb+eqbAI6M14xAgNjA81yFBAJsEKc229KQlZ0vXBwEAcY987yHJCendku4DI9Ttz3KVptpVImLqqYqXU20heXpHSSKMoRC+3e1AgPeC2ZPKAJ1QEzDTg5VtjE+DexEFTVAAlO5ubs/fzefz2QA3/15JADzzge0AZCwAXFyMwIuAc5fCoATbWgJQ1wccj02BygVlkVCjENLFvZhh2Wbm4FpebuwOTqOeHy7TCEQHGCC/kDycqsQRrYrQUlSAOSgnt27JGR9tvJi8C74HOIueAi4Ex5Uhyo82PGCnUhVFU5vlGykdQkrXjFGwq+i8hKkZakQQcLQ7ggBZIoSAXTDiCRNhY0ApfC4yNIl0GHvNCDrcCoNe/Zy+75d/SGBV6IAkG2MENn0rbxBo5D6PpMPmKsxdOiUhRCpKMsJG3HIRek+jC1RugAw4yA5EgAyAYkQTiBM5kkc3pEoZMFBdhye3Kddj8DALeyfgCknzB4BkoSAlQjIum4hABm5W8iwjP4FwF3AQ7WweqZ12iDBuiSRAFhaN3lgYqpk6e2pBAxqtzDo0HjBYRgvEkAkUUNhRNjkbspZNQcmLKaAXbK+hBz+YfbuQWbv7bZoCQlkNXlZIgAa4YhVMJlZl5rhXXRVEjYhjKxLXoFLX76kMnvbuHXLQYDdZShWnAxYGOQUoBIiIUMghNqggNWTigimJvUob9tnbGHoqF2leHumJqYmv7inQzBHEFmrog0CzGrI9IgM0K+wPYw7BsdmOHk1lisHMVScvyxBssWOQ+w8dAvIEY8yGYXbNgE2oquJiSPj4RCiRMoWTQ+qtjv1pAg1q6p6gr31JhKwOi9SIxI1jW8gy6w6YP2/v7GwQBfAYFvEUEmxNGSXE1NMWAgb5JKiyTQBGQ7tODSuOCzvIEUKRAOJ/bsf5bZHbnvEQCOgjugswFMTe4E9QvROHZlh0cOsh4jIcK/BuSO1HGlzh9ntFjV2Lk9Xvw6tGhEqiZIpmMSSobI5iBW1lvt2OsERdiQ5JJqOPDC5P2EAhnRhHXABKhEh6sDqWgdFlo9M3laQe851AQwWxuSVIEP53Q3ND6NLMlFo8jqlMDslAwRKmsLj8jRmO9NKQZLqRA8QhgAJqJt+wGA8sAhDiI70KxoHmKTaMpVBKUKSyMgcDM00fj2izDA2zhEA8o6EQsjYRr+8DgyUaEc5nYOGYNJUEivK2D9xEAHg8aNg3Zw8be0gkZ2hsxqqEvF+AJsBpDUda5gAIVlICIUQElgmywmBek1N7pprZyFDGDDJNiCFxJHtNtZHrLb7TFvg3Z7aeagrkGo7Te0K2hU1HcgN56aiVCcecXinI6XIzrwbhdYJcYYrA07BRk76mkbXwHWKJ7qNs0zTdoGyUtqII8BOAL7HHYyIGrZxo6o2oH8PSwy6BHYedhmycJHQ+NFEYJXazhHE5L4doRKQEeAQFgiYMo1SDQBCnLddsTQnTZeh5D52cHACi2w7AiTxOEAVuOtE0Fjfda5Mr/n/XIaFsvxssH5TwkuywHIZsQuqrODAuB7ffWCH4xArcTNHYmdKOTcCmih6sNcKDAzAIkOCvOxG6iIe37mqPT4MN5tM5ch2OFLtuya7oyeKrRlYfvwD0KvyNgkbAP2WSTlAhZdJPyx9oSAx0I4VPOg2Et4VZVoV/3UAwI23Nr29uad2FoBQY1OSqLN0ZDIO7bQOkdHhemSnjNzDrEcF11S6LsrM0W8bbF5OIcCgV+3aTw2f85Xs3mfnvnsJA/qeszAYYD2AJ6pRlHbhKWrsEgASQkLdIh7fgVZNloMrvWw4GDIs1iCzqiGBctfvE6kzKpGT9LIu75CxbtVnN4Bb39GaqU0sYzadzns0t0QYMNW8VpsBOLm51YbdBmMDIhMib2eelfopMwQjMjFDhkCZnY0b55FPk5SpPeYv9YVIk4G9d8CTfSoJ4Sm/lKCLM+tX55+bTptNpzoLsnKfbT4Jm4GTr/4WgLkGJPBkJ5dqZp3y6lsiBCgXST061gsB5K5sWFkGk30IQr9hedxH2Z0shBzAX+2ZAs4Dhvo+myacsrFiBJxkMyfrBU6zEUCnJdkbXEnrW7z6m1yDkFpVuqYJoYDVgw/yS2DIkFHe9cEJuvFCNIdtMKvzMjsD9EA1YoedCkDVD9PMOoCamXuVPePKF2BjU3d6I4jnlTXoiiiEBTwDvAGEgF2oLjRoMqi1sJjqUpKMxfdAz+1PzvqgXxe2GZDgfI55Z2A9lrNin13fWWpsPG02ApnXJp5HQiBYZ8QrTnXMtvE1AYEmQLnf1XRXr/lCg5x2dMr3nTeGtTaJjH4ZTOYDjVE1ARXI5sQmshJCVwUBxAsbkAF7w3OviT4oC0rBLgEyOdZm0fa+yT3JiQGLhqP8iffzfZDNNwsEfZhci9XYN2e44kxVqCEaklcScGqjsDhtAAG8dNnLl2Hsa6TQxJQxC2xBQhPAJz4AIGgMSYe4mS6sHIPXCERutvKe/L0YCkDWr3R+TF35/vNkWG4Ef+n5S1+pTjgPXJYt9qVXAeIsAK6857nLX7qMilkVQbBfE4T9NJCZfeL9tYNskkVDsg2SoIeecEMuuxyxGl7Nxms0Vh/h+3WAmhjTvUr6kn1lYDhJ1iJhCeFabtFX2rhp9y0H0YQEknUIYCeoiYSigRG5EmEZG4S0hlzmraYyhz011Jb7VytAcxJYfsWuJGRszDXP1hP7XPMs6pazVAoMwPoNLYHbgIAUiZiUhIQwoNAR6GI7a3OnJhSrLs2RJtg/fjMml3xIiBrOUnvT39TEGnqyrEzOesU1K4yRN52kClmCzSCYuyJnFOsMIDUiZmIKJLFbkqYmDkzkr5d7W2zANCsD6oDcfoEFDdV8wDbGOT1Vd/nuCimclXdpAOk8WXNc30wEXAE4928XS9mUnLxHUzUpFKalrDF9O8URgO3JWclo2pjrEKqBss72ykegJpCZHp4YpJC0iposdxtpDAPksVftUADMxaGqMLg4uMTaa0/YXhdoNwfcQgDPco1CugUB7gAA0TTcNrZBRLddoXicmzNnQJl8E0gQOMelJNwwhEAfyV6ITCoBwogerA2uponAAyCdvwyQ6PACumH7GoDJ/NhDA0gIjHtmNELKvCREkx4aA1k7M1dgzZ8xKAFG6DfBMksSNNGN7z+xZuNo+glquRqjOhkxcBq8iU4KvQlgV7YfepvTJCaKukiix8xy0utGs8D5rEYZkm3vvZ1HqmuDIP0bhIR727w2I8lwsxa9FPGg4Dx2c4oRrAfELiEai3DPiFmI3FiJXCB/IrMzGJGXLhDIOAMb61fBld2wNMAS+RMNhYGqfrk/l6WBJQZYBAEG1HitTNZpUHTtkjx9z7oJTVU6uTrZk+XstzIV8ipTBGSwccJ2/lryQXKp0XSGfg3LylQGqAnmzzX62WFmGcDsCdnei0A0DQqwSDhhBpfI/Lu9wR7L0MNqNQwCWD1QFYBtMI1mQo+vp4bNfibNgUl9hKVcmxuyVK+psVyRIqN/kT0Ae+lCNQMQMkKN9mLI2P3YrY9yO2utV85vGXZvReZoCUtrRjEQlgIFSJYhx4r9E/rVgdyHOTj1MO1Jm2vSlte0EVaJGnbtZ3f1pEzf+pjR2x6hNuweWmtgVsM99Y2BuSfprEsXgLLzyXENgbyaFAbR7C4Cg7C4Bxn20t0FltAqbjU5ugxhN4/eJozU8Pqe3KweZkYW3XUvRC+/bKFGv3zZy3Apjc97GcP6s6s+rPqkOkBNTTYE8JSz4bIkEA18676uPu7b/ejbVPnkHrlFWsuj501GlrXWKVumR26ADFKYxkjv7SFvOrR6Mjo1L71KBqAe2QMCzgA5DF+KcVeC3PqYKlZVkeXK2m5rZLoGay3Uct5valaLO0hqqtSEmwBbv5jbXUXW09Q3V208DRs5hTedAjfM1TnARuqGG2A/GE6px6eJS3NLcJWT5YSM20QNrSW2xrqbLcvNSb1yFggpguWEenyvwvqFRn03c2oT9a0G1frUppON2E1GPZxpFM8YeBZx4xNcWIdAIh83IL0KZJhsWp8l4sZHrY0G+STMmrHpakFFIXDbTb+JippludczNnxkTAO/7hnAXCvVF2VueZwV+HsQNW46itwTE8Gy4NWVkSKvmkzbgHGP+awSrGjgbCd/9fa/vh1y12QdaUnLqPmNzs8LI5php6FXFxoY4A1Pc60QFbeijfn7VS246QmDex6B4Wuf3gJiotcDuyEJbkhrtYDUNGn/JOxjtceZMOxlD/EFeHtQWlBRA0HP2BNYY8KrYswwEwdtWMgfUj2MzQN2A4hGHFz7dN0fqvzrgQlEo4lQyRMrn2lWG4Jx99Idxvt2dx/cBRKP7WbfrY+Rc4O6wuwDY/4/HcAVzkAAmnkAAAAASUVORK5CYII=",
-        "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAANoAAADaCAMAAAD3w6zpAAAB1FBMVEXl6Orz9PPy9PXy9PTy9PPx9PXy9PLy8/Ty8/Py8/Lx8/Ty8/Hx8/Px8/Lw8/Tx8/Hw8/Pw8/Hw8vTx8vHw8vPw8vHv8vPw8vDw8fHv8fLv8fHv8fDu8PDt8O/t7/Ds7+/s7u7r7vDr7u7r7e7q7e3q7O7q7Ozp7O7p7O3o7O3o7Ovp6+3p6+zo6+3o6+zn6+3n6+zo6uzm6+zn6uzl6+zn6uvn6urm6uzm6uvn6evn6erm6evm6erm6enl6evm6ejl6enm6Orl6Ovl6Onk6Ork6Onl5+nk5+nk5+jj5+nk5ujj5ujj5ufi5ujj5efi5efi5ebh5efi5Obh5Obh5OXg5Obh4+Xf5OXg4+Xg4+Tf4+bf4+Xf4ubf4uXf4uTe4ube4uXf4eXd4uTe4eTc4uTe4ePd4eTe4OTc4ePd4OPc4OPb4OLa4OPc3+Lb3+Tb3+La3+Ta3+Lb3uHb3uDa3uHZ3uHa3eDZ3eDZ3d/Z3N/Z3N7Y3N/X3N/Y297X297W297X2t7W2t7W2t3W2tzV2t3W2dzV2d3V2dzV2dvU2dzV2NvU2NzU2NvT2NvT19vT19rS19rS1trS1tnR1tnR1dnR1djQ1djQ1NjP1NfP09fO0tbM0NT2Xg03AAA/tUlEQVR42gTBwa4sWZYg1LX3OeYvoqoF4ntwoTC8uxIBAgYMWiq1BJ+Z2XL8DW7+Tw+qIu8zO2dv1or/MnmwIMoDLjzA0AVGC41CKgAAyII1wZrVNcECAABsWg07dh1bHeDWBHR06DvQIBANQIuJh5sD/CAmRhrx/1qPaYGoWdHzQprWBCBVKlkAAADAkrlMFc2WZBUAAGCj7aY6OG4Hd7NkQhV0FoCAFuhoArMG4ECOYTKS+C8Mj60QU8WeC8zF4/KANVkT4HpUYk2w5jItc4G0ktwAAACVcHnsPTRLaRAtemUuyNJRoQkAAABAMIEHcoyJkeK/UEeWUSQqS+dcsyormbhyVpmAWo9aD4CVBQByG7vnBgCVFPug1lzGxnDDmtXAygJoHY3oAGiKDiADYA84QBySx9RxSOSuzC0fVElG7NgVpcpS10SlBZelgHVdF6ZCqkDtsis2AJDAgNgMxrjvYlXuFkEt1Q3drTVVHUD3WmtVte5urdZuIBux1kIDLQZpMnfR9yIzKxPMAlUrsazKhbkysUrJTLOqHjNtszo7JIkCAAD7ls0FOeaWOuheqyDosvcWEYjWe++9t4iI0tCho2uvjSh068KluPaCDCb7HnWw7w1ARmQkEyszcwNKUaugFvMuKUmAIosCgO5OjtX2rqr7rr2iiA5AC127kIFIu9bWAAjQvTu03jTQwG1gQPw/bHhcccB9AFBZiY6xdc47cs3e2ei5MSptMFEFoOT1uB5QCXvjYW+tKR0NAEuWZmcZ28CmgWgAEA2iITJ0jQ5iIo4cxjQy/hXZYVQOLo89AICS0NPuQGhjjxUwNgAAwPW4ZsIeewMgd1M0gMoFuVWPPbBpQnc2AOgAAMC0MeBAHDmMOTL+FY4VjOEy9oM9AADoaXeQdgAAACUBcHnABrZm3sdi3pQGWJlLR4MNstrY2AMAXZpo0Qh0GOwhOogkJh5y+HGIf4U1kxjNntIetR72AAAAWQAAKAkAuMzlcQ32sMfuIrRA0WABGgC2BtEAuwGiQaCB6MggWhjCxG88fhf/imU6bEPloGjjGgOUVFKlSiUBAEAlAOBuAMbWGkUWaGsuOjpo9gBYAABbA0B0gIYAjICBA48cYx7xrwAkkans2fsB26DkfSiwpix77JH3yGsuU17TmhIAtQDQqNSUJrToykUDtrENWKAD2JpoAEBAA4KGGIKBwx6PY8wj/tUyl2lNHPcPas/eJmxjG1mylgmppJIlLyawzARwAQw72RWwAxqwoGHNPbYBu4XuAFsDAKIBogFCAzEEgwPHY5jxnzWYawI/8h+HYsAeVgxrLhAMkpJubVoTy0TCBQCjd4MtQIMlC9qONgCbBrCVAABsYwM0YhCgQ0dPYXAwjocR/xlBG3sA+LG6DId7WDHIWoBHJeCasCbAmpbHZS7MG8aCahAaKwsdNDttMWBFoyMaCwBgdwDQoomOFllDaNERPTDF5HgM8Z9BQFoTjtuPX34U45qLuQ0LgAdcTGsuzDUXM+0Nw+rMO4ACDdhjzSq5gU2Lwe5QNYAFALDp6Bi2rA4dTSALBhCRMDl4/Cb+c7QA5DI5bsfNj1/8qI259VyiMbcGiAYAAGPvAChAs8wly1xo7GGDsVs0YMEeAGw6GqIDAGhEByIFDIw4OB4j/u+UAkCuOQm4cWxirGiAuRsAREdjbGOPbSyaktjRARrLtGAuDfbApgGwAIA91txAQwAAGgIiBQYmB79JVav23g1UirV07z4cNqOXBrAaAGhGN5mdct/dDaqqtO7uu1my19LdVrfaewO66U1Re8PeQO9NrNTd3aDR3XejNdCN3OjewmKFLf5vyCxSQKoEZPWwH5uxAgAAGM0t8MOvH7+AAhpgyVzQADsDdu5oAAsA2NBBhwYsjA3mmtFEBx0wBAMzjh5H/N86pEpkAEiVAFmE6KAFAI0oWQAoAA1rloIstD2ADlppAHYDwKYJHUDZ5l9f7xdvL28v3i8mQRMYwcCMzDGyW6uSxdrd3aBKVVWVqkJ3lUJ3FxTRvYqlyiiqqmjduhuLpehGd3XbYNfea19dAlh7VQCwt+5AA3XvzV+9vd9v3u/T+w3vtXS3gN7dvVCde+/4vzIIsshKCaIDAAkAgHEDHThgFxpUggXQALtjsDs0nQ1YtgFg69CAKDa88fx6vfH8wsv75f2CKZrAECLDyDHi/8oyApAlKxMIAJAlqSwAAHDgpmFllqykFDTAzspgd9AALACo1qIJmrbh/fL2egO83gAvMEMTxh7BwGOM+L/ICB0AUlpJihYdAAAAWqBDhw5bVrI6yMrKrEJrBDRUI1oHsABgd7TQEN02eOP1BuDlDQD8S0QjGILBPGRTXdW1VgNUZZVVrXY10ECDbjRN66b1ViyroXI3dHXvqqruDaoa1lbQawFgo0M36LW3N+83AMAbAJ7Yq4He3d2bde/4P3WEhCA6SJREFmR0NIgGAFAkK7NQsgBktQ57aIXB1uxBq4EFALYWDTr0hjfgxRvAC7yB88PLCAEdRhjkTF1aVVV1a1pRFAqZWldV0QAAClBlV1GA1rupvSEyM7sXGBCDtQBgIwgiWGsDwAsvnHgCXgCgVzcNFFW5y9Zo6C4UqKqqAlV2VaHKKkqtoiqr9lqru0p3A92t295gi0ZV6QbQa9kNYC+tW6Nr7fF+v3m/AYDzcz6fzjfv8gY+eL//tt90ozcNM5VGBCG0DjuaAEpWqkiVlcgi11QFBAIEaHsgsBmtQ9GCaKAaEmAPVIfWemPzeuMFb3jjPq/gftbHx/kBcH68LROiW+yh4v9A0EIMINCEDiQqiyxZzAUAAIAGOqCVDG0LDYDd0QDQ1SELTW+8AV68X+/z43SjAxw3X89Dvl+88XrjNYEYYRD/e9ZAkzqkAOggdJCVBanIAgCAjoYOdkcGHa0YG3psHWBrUQHAJpUsenm/3l5vAF7qPtyggw4tGuHL8+v1Bk4frwliRMvMLo2Q3bp3bdDdhKbbBlR1AwCgu1uh2bSuvTYBG92K0LvX7qZrA/beuqtaob39er7eADzrF/fdNAFNCHQ/n56/AGBZImhqxf8aIUNHEwAxWoCAFmQBWbJAC7qjowUdOrpkAWM3iAbYGi0AGzoAuv8GAHgCNATQBBoQvsDp9vUyIUa0jK7e3ZpARAS9q3Yj6Caa0o3e3bu7u5vuVuwoBCFAwiagAbSgA0TYSHSDXoHX6/XCy4sTgAjQNCBERNCeT/g4AKgm0b13AVp306331rV67+rq1d2sqrahwd62rm5r795NE6m6ujXQ0HutrbqFQHSDaA3dtd5/ffF+v71er7dy3mi6RaO7dQM0usPVDXzwfi/oQvxvWtgjUkA0IJogS1JZRtfYxpYCm1SAFpCUjBUNANgNOgCidWwdGizvF7xfby/v060DLRoAEAA0SorDh9MHf4HoKf4322yiR3QQDQAEyAKypMrK6GLssQEdEjYAewB6hwYA6NgAer1fvF/Am+dxBQ3RBAAAQAMIX8BrIsYe4n/TgtCBAQBAaNECcsfYHS0AAC3IomGb3cUAWxMNADoXoKN7834BvDlvdDSIDgBoCNAQDcTxAV6ZjBqyIXSD3boBgG4E3XpH76EBAED27m5Ad40Ea3XbOgCwt0LT9ML09n4DfNA6CBqA7m6qand3N2jAvk/gXdiW+F8GoYHoSJVB0NEAAQ2iEQCydHQHAGCnsI0VTTSAPTbIoqOJXuANL2/njY4ODQFoZU2LuQDmmgkAfwdeMs01s3s3IIjepbq7ultEBCJAREREhwjQmrJUR2MLW4Oh9m5LowHQdFMI9L1gAFVAR2tBBEDVWiwsFMB1AeAJvCU7V6raq1s3unXrqrJbd3cToAEhQENX9yCgR3cTYFc3DQC6907Q0I3t/cbGi8/H89Y0GoDubWFRVaooLAsFoJ/AW1UTf4kOMgBAkCqDDgJaAHrPjhZNV8YeLaADoKsBAGBn0dFEC21hbKDuLzzRQAB2qoWSBQAklXM9AMQX4C8lc2qoDADQk4RACfZooWF0iBIqZQ8CBLDRAADYVIdoNK3BNtg4zpsOggbAYqoskCULgEpUViJaA5Ak6N67G4C2d5fe3bYgENEdILo7dFu1tg57b9B7r65uAIC9bYnuBqze2xvs7f2+b621bgDoxqJQVCpAQlm1rgWNpye8FiqJFqjaAESrFqrojl2ytd2g7aYVdJDovfZuBAAINmmobgKEFowXbN7nyR2ChkDr7n1dahUSKCSQUEUB6P9xwvuNmh1CR8MeHRAEUSCVtI1uqQMaohMC2B2aBgAde3QNGZsmtGhuLLPB+/w87wMcdwOh9TUtyIQsgIJUgAKABSAzaCGQCWgNpGyVqkDV1jYyEIHaa6/dTQsAgGjKtpeGRlsLDAHvV+KiIYIGxVpVVZBZhUyQmQDABcCTJ/+VylbdQNnsDYFu1VWVMnMkUCSF7r2rSmuBCB0AgKaTDQ0CA9jdQ5X3G5oGEYHmQiZUVYGCBAVAUkBpT/BXOfUeawodii0BAqAAdKisLNXRoUVDdGhoAGBLCjSgo+yxGdje5/2kCU3fgFbWXJAKgJSgJFkAKoHEly/PrxfxL/aIDgKpUiA6AAA6mo6gETQARAOAPboYdocWaKHRm2GPDW/P46YBAdDUAgCKBFAJBUg8gMr44ryPnBK7deumalSxu7u7u7u7abpbC9G6RejuEOgNGgCwi9yrNVo3WJq3vW1v3s6v++gGAOjrqkUVqCqQAEpRBUjFBQzw4e2v8S/swTZCACQBQgdaC4CO0ABaAIiGji6ADi0a0NH7/QJ4v9482+MCCGhqgZJKFolKUFkAskBWwgOEL/B6x7/YBjZTIAsyiA5AAwDR6AAAooVuiiwANEBH2wBvr7fzBjQBdOU1F1AJAFAAAKkk8ACVfwf/qfJvG9seBhpJiqa7qqEBIGgIAEDTJaoGkqa7aQSwAgPeb96et25fAMcB6rGYFAVAQYENACgAxIgnqHfCxrbpoKSyi1a1qwoAaGgAQDfdYmNnV2nd6IaOwLawAU7HQXiC4KY7MFkkCYBSBYy9AVQBKNDd4C1eA9hGdAhAqkSRIAAAAGAn0Xagg46OBkC03rNtGJs3zs95QwcAmspacwEAK+1RUt5Go8Y29lAJCeo3wPETL/EaAEFkkQoJlBQ7SwYdAIQG6LCNLkB3iAZEE73MBtvY3s776/xw3ocbALQCC8Bkjb4ra2jHDbIqhT12HUiUfAD+DiR/29hb06XVhiggMSpHdXd0797doNG7t12r2y7d3boFDSBow4otGPb77fwc/6On83PcNwC6myRzAcjs3tctZXfmzsz0DxLLllDIrAuA80nW37wxBq2rNK3tLBGSaFk7SwiCsHfX7ibLzhwVJEQDAMDaY/aItgFPD07PGwC7q6qq1roKUOXehXRIKJR/BkvbkIkqBXjiIJ1eAA3duiELBAqpkVvpVJURqlCk7t0AAoBueo4QIdhwcn8ccBzHcYBWCwsWUKkeEgWZoCT2rgF1F5DkVaD/R58P+fmc770B6N0rabt0Y3c0SpRNJuQY0TRNVTWgAQAWKxqw36qePvfh+fncN4C2a625LOnxAOQ4NDLlfShkFVVVEYxo7CooqRKI5/NJPA8+r7ENgOiA6EAqWUkZm1RjZ2V0gbQRtGhaAAA6/PWFCevtieP+eoIWB9ytFkzJ9bgoZqx6XB7ajVSJAnaMFnt73IekwGM9QJg/TWADEEDTWEkp2Ci2UkBHoaOhEQBAhz3Xv2w0++28He7P6bgh4KYrAfAADmbJugCVKhWUyN5ZW7hVFsCVwBck7vP9fr83oFs3ESJQ1brRNI1Gat000QAA0G1ta7RtsPf2Oj/ct6fnDXCDZE5IuEApanoAAKgR2H/+25/fjQ1AThDwx8SRrzfvlwHboGno1E00Go2GEk2zJkIDAES3YWyGGJs3z/OGvr+eHcDXSZdcqFwzuSAzpAQgoSroUbZ11S3H46h9HwC1HgDEyX3Ax+v9GmwMgKARgGihgxYN0AEAAHozttl77PE3cH6eaOFwc9ygXfC4mOvBhcrNA6sAiSVYU1+u2lXr8U8/YCQg6zdw/MR0g/vr/LzB2AD2RES36I5oHd3Q0RUd6OgAAAC9x2bsNra/wZMnxAEc6NDArLmYFEWOSwuA4y7UsI1faq3efREBIwEkLo+fkFfz4ThvL/beG8C2umkabfUqvVZ3lxBrrd5LAwDo1cvcRmz23wZe/uD2RfeNm/uGpiCZ1rquBTNQcXVx4E7UWJ3rcl3Xff/68/6HbtgFYAJ/wBSc3MdxlrcX2AwYoCmi7EnMRbCmuWwAAMBmja3H3u/XfvP2k6enFsBxO+4AHq7r4QIlAbtzp7oTsqqMi6t2XfXv5hpCBwBYD+YCpuOGw+fE6+0FRughQOhoHXNpYYKJqQFAB2jYw9hje59vgCcEx4fzxk1XMl0mc4EsVpcsZEkUtblctauu72ZpRUfHTiDrN+QEZty4D54+zy9486IjWhNNaBtDAABiGQEg0HvGwtiD/ebjvB2fJ19PgNPnvNERy1zTAxYA5uVxUYAad/W2alet9asA0HoCCuAnxBMOfE588Hq/MKIBwIYhgDWB3iMAOmDNtg17bLx5OnyeWgA4bocbWq0HanlcoLLYEoBUwb0utavW+lWA/PH7778hRgKkB9cjvjABPic+L2/vF+xhGwJa9IBABwYgJqDt0fY0lmEutvcLT4fP09cTwOHzPEAjJzA9rsdFFsamEkgr2r5W7aq1vqMAIqPBToBKPHzBPNwO4HPiBQDbhCAa0OgIAEBvtjHXCMLijfpw3Pfx5LyPz8ntcB++nHQQLSEfeHj4TnAAUDtXrKtX1VXXMgC0Vkm7DyBngucXf+R1AyeSd9X7bWBvjEY32FtrujXQAL2HYcQShsX7ffK8n8/nffSt3e7zvm/um/M871u0AACQkPu+b4+Dg869//y+r3Vd3//e3QAQNmhALaAhHdzAWc/3mbyYYA579drR2h6EiCCi0R1oVoc99thrWGvzxoevry8OQcDN8XVw3LcbTaMo4OKCDZlr5/Grav/686p71bq+m5l3AjKACHEDCgj8nIED4DiV8+31fvH+F7AH2mbogOgIBLCw2Dab9wteb4APnoDjw+F2QIvWrIcEXMC4oZRV1qXuWq5/f1QqrDZAayAMIAtoSADgw4fz7Y3de2NHh21AIwCatRi2NwC8z/f7fPLE1/PpCcDpxq2hCbgAVCkkqiqqrKvuq64/v//9UcAQUQnoFq1toAB/xx95OA4AfJzOD97YYNjLsPfeGwjQwbQHwwvvt/f7/Xp74XN4ej49edLdOPhw4w4IGuYFLijmJpPa1p/fpe4/l/xRks1mAUDraIAE/sDPCQAf8OHlzb9sY2Njz7HHNgA0e2zYxub9eoPX2xt8OG4cN6KDL55fAI2uxJQPgCysY6vrcMd1o+piaor45Vit70GlaogGAK7H+uMnCQAnJ+DFZsPbm7Vt9kavXr33tpmwwQuM18l5nk++HIev+4Aw4QvdfUCIIUhAoWDexWP/uv6891rbmu77BnA3gALQAPDgJ3/kBeDmPD+czvf7/QLGGK/xGgbeaMuMgTesN7zf79cb+NvbeX7uT5/Pk9vzC/j6OZ3n+bxFxKVp3TbF3lhIuDPV9/e11rr//PNm9fwOcN/AjgIU1UQBdaH0H/yMEwA+nB8nH6+319sLA2zAbDYA7xdvAOcHTh9PDvDBeTs+zw7o8OuhMhqAywOXsrMey7er9u7l4vG4rl62XmPsFU2YmPz4/XE8FMZIIB/g+Mm8j/sAH3B++Jyf8+Pl7QXY4P3CGnuMDTBe3i9On+fx4QM++DoB8HF+iA4dwRR0JdGwDXsrjLbqumrvXnXZv5k9rO/oH3X0Xoebdh9AQUICAD+RfbvBeZ7O03mep/Nzvt/F+/1m28PAC2ww3wy2N063L8/n6Txxnud5Apzg83wSRHc3rWKhwRgDRVO+v3/d17q/v79ru1bXWvv4EdfdPdw3gCrYBfoGFIo/kNoBcPLh8/HxOX3A+23bYwPA9u4X2/uNN47z/IDPeZ4AuH3gfGq6u4NKUj9wAQNk2/v6t1/f9+7v7++FUk1Pu6rvtZkcaDJhJHAAYAFTHAB84Px88OFF5fv1fhkbgPG3F69N5Zu3k6yP0xc+PifA58QH3EQjICHBAwB7Z11X7a61ryvRZVmzrV6Om2Bxk6h0/VBAAMAEEtw3bs7zBADFq15jgAFshjfvzxugnCdOAO6b5+3GE8BV3Q0CALC/N9Z1rbWuX//4t3+oqi4g0AE3gAiKbneBAgDwxww34AA4PwAfZ368gI2xjZcNOD+vt8+rwAkncMNx3zy/jicarAfXAw2ASx0973Jdq/fa9SfQBUSzWEAWVAJRDUhAAjdSdzcA4AQvSLzhDTabN29er8/5Pnl/Pj7w4fP5AHA4Ds/bocEDHqUAgHLdv+r6t+97rX/c18IAcCPMAChg3RsIoBUAKQ5+zlYGAADAq/ACeL+GDbzevOEDPnzOj/MDABw3uAEekBIAVx03rmv17quWVQDgqIIGAHCAYQAFJIgvyEBzA+C+T3i/32+/nN715nxj/w1V3vWC83OeOE/P+7zPE+cJBzf3/QU0XFwUAOzru3xT//brXuvX97WWAgDuTN0RaJgA981D9YYIgAH9/APZkQC4Ac7zPE8clV4f5OvNUHw+p8+bl8/5cfL5wHFz+vh8Pp+79X3zBAIePEgAsa+79t6uf/v3+951wbzSBhY4wN26NRYA6gJFdyaoDcCMrgTggAP44ON8A+/zxd98zs+rvHi/nJ+PD/B1ug/wASF0gAYAAOxdUH/WrnL1GuZaWQYA+A5uAAA4ACAAgPmTv2Qj2uEGAJ8P4IPXC/ByftTn88b7/XGenCdO3ACeILq7AQAAVMmxq9Z9175+3Zdfa6lib+w7cMuHrqQBANyADQ2kCRb+mtD6vg8AfPDBC3i/kfD64OQN4Lyd5wluH+Cg2yHoBgCA6/peMeKyfFfVaqXUgl02AxwpG0REBAAUAACUBeYf/GVCjXbcx30AHwBvL294v168vSDfeIMPjs/p43TwgfN2E/oCAACguO9a+HPTsuBhAQNA5frthmM1oAXkwQMGRCUkAP46Yahx930AHwDg9cbrzQvw5uUNwPkB7i883bRoaAAA+IZ0r6vyASsBC1Tagw7ch7llhQU0dACug0HJTsADYs0/fpqVqSU1bgef08kH4I2TOu/jfX7egDfOj9N94AQ3nrRAR4PrAQDbLpC/1lVbeQCVZAPJoBMO9++D0AAITcAjGxAA1wPmmsyMhpa4Dz7cx+kDwAdOp/MD5/0FH+fnPG4HPs77uM/P4aKhgQEAdoF9uWpXG0CUYm6wVeKWN34kzFs0iBYaCQhIA/AAX3/Mn0wI6CY4Pxx8AAA+Th84PwAfHyd8cNw+5w0AMADgO0m/1lXVVejR86ZT8R0Wxk44NoCqG8cNAkHXD1w/IhMCAPATUtPdLSLCzXneN6fT6TzPk9PpPE/gdAIAH57n6T48byguAACu7+9vxohf13fde+21lhYLoYqJggI/juM4/PomM+ibCADhBlBCAg8A/qMsILSD43PfNzen8+PDx+nkAzhxAuDzwfHBrXWTTACAfRXc1/e//Xntq661r28SQE6YD7YECxwP2gyZTABAPqi6AUUCfwf/aYKg48Dn5HbwOX3A+fmAD/A5PwAA93E/b7QGJAC4Ssob12X17r3zIhENd2SBxcbAaom78p8AWTeA0EDnthMkAPjLX/8y16MSwq3j6T7w4fN0AgCcfAAAnPftuHUAAAAXM9eox7fr3r1773IBOG4UALAZOOA2l8DhFwANAEMP4AHg9de/mBMaQnC7HU6f08kHzs/J54TbCZwfAHCjo6MBgIvC6FH3vtbq3XuXRTELChFFzl1qA/bR4FdOA+oGAMD1Qw1iJAAE3mQqIAJwfPH5+Hw+PuDj8+Hz+bgdtxM+T+B5Pm8gtAYArqrC/v6u73//9+9rrfv7rmVVdf8mgZ6KVd+yABDS/f0Dy56iOwIBUIAxEiABeEmJQtDAx8cJPgB8wHE4OOEL+PoAGgBwXdcFObaq//bv1732+v5e339adbe6gS0WVRMrAQwCv92HZVkB0NAtE262kCABXy/yLyol2N2Ap5MTcJ7neZ7gBG5OADy7tW6NAHBVlXKMULX+vO6113WvdVVXjVmpehATXGstYKAK3OXgxirobgAjuZXBkcZdYEL83ZtUJlQWlYATTh8AnB/njY/zAHB+PHWgEVoDLkUaiu919erqq1BNK0z2NCnaw1JZlbdxUwwNXL/vGXcLAAzAI7k9HEBCA+RcD5KUwHHfODh9+HDiw4cPPgB8+HpGBwItoF2YK+N68P1dq7f+tqxZPVFMa8Ka4MG0yRp7pwJgDxo0ACpxACPtBLMSAf8JppIAOtzgPnB+gM/pc34AAHDeOjpoIdBcFGPw8F3fq3fvXcvi6kkBU6LIAkuXAmCL+2B46PmN0CAaJeH6ETJGgkyIL/ivf5FmUVkqAcABNyfuk/MDAAAIMW8CjY1KJb/VWnsvfdWyFLMVWeQyCxYF5gJAFoAD/wiBaGgAEuJASQ8qA3gh5yMrJUELgPu4D8cJDnx4vQEAACs6aFwogz0uV127uq9aLJit3D9cIdmJpIwCVBZIie77uLEj0AKAVJWgc4CUSB14mWTmkgABwHEfAABeAABujkbopkqIMfC4rj/XvVb9+r7+XGtBt7qTNccPLKguBBQpNwDHj8Nx3NfwmyQASI7joNwkJBMlvjARTJSkQwc66AD34T64D3iB0wdO3HPh1gTXo7YQ4Lu+tb2vWhcFUPcP/f3bhnjkZe6ZNBQmt7EV0noAOG5BA/BjrQekAGUCYE1G5oREEDpEh+DAcXMD58f7xfkBJzf3426gi9q//wP4rqsW3bvWBQD5Y82pGtr6JwQUYE1jbwA3Bw+AJjTJwcTIOQ4oKUHjNQmVOYsiNAJxcNzgwHEcn8+H9+vt9QE+nw/ibsDVHds/gH/7/sd1r7X23msB991gWeScWMVsmg0rp2ltSBTF7SihSQQBbnOm/O0/zAwUQMYBGFKmkqVba7r7hvu+ccDH6eN8v843AGhAVADw53+7rrVW//rVrlXAMRdhLSHWWlYfEu5GuqiFGgMADjx2WRSBlscB/PN//9uP334/7EoJsPAGKiuRoLUQuAEOnD4neb4/LwAQDXHHVgWu7//2fd21uy+2WWSy+W1OmxAiLEXRAA9UWw/GIEmi7gMj/TYReaQImT9+XPH7P//248fvPwZFoqC/8CJJk4QATcBxO3xOHB/48AY4P6CFiHL9+AVSfa9r9VZu9/odkmJY5grhPiC0DgTo4DJV1QIksqLuw3VgLlkDNPz+2yOPeVB1HAUS/o5XklLOLJIWmg44btwneH4B8AY8aWix/PrxC75rrau3vrQ1FwA47NjDARATteZQqMLCw6o9jM3YUs7CwG/f5SY9iPxtzvE4RleHopIJASMga86Ckhp04MZ9AF+nDzjzfer1ha+naC1a8Qu+19rL7r6bVd9qAIC5xh72ACweOZGwgK6UWbYCo4G5+O1bPn5Fl/FPM4/HwS+1x2ODnQ+AnQk5J1QC0BDgdvgA+Lx8zuB+fj01Djt+Ad9r7d2799asQtoUe4BlYwBIC3YBwAJIsH0/JPAtx462/vnxyOOYVu26HY+x2YdZCZCmaUogAABN8uXj/HyAl/P1ub+eX/jiYfWvX+D7z+/rutZaa2spLVENAFA3AEBv5AMTTPbe3IrBmJmLOfn998Hjxz//D//023HM2f/4df+6q3ZtDLmUABMFc00UEgDCUbfnfX4+pw94O8vhC19Pc4sC/rz27iqr6KySK1EDDEAX29gMqJwE1A4WwLA5bmmzx5pgLsz+PR85fsh9r7vKuh4TPWF59N/xIqTMMYvFXGYCgNtxH/ft5Mzywcfz88dP/E879sh9w/d3rd5tLRmlyspZSAsAijRgDygAPC5kLsht7AMg1hTLIh9+m3McD2uvVdXrm2En6wEq8ZoMUxozLXOlCSA6gAMnvJ3A8fz5/PLHzz/o+oXv773s7rvQgUWpAfOCPYAcMDbA9ZuORvPw56yENPYGQESIJfhtzvEY6V6rqq/LlSQBIIBUMvWE5bImQAf4eh734XZ88Plj4P15/rFeu/7n/+8PJcv3n6uqb32ZKDDXSrVyLGz2sIE9bOwBQIMLqnIuMDZgD0Qmj3wcOcfeq1b19b2AFhzAGgBT1hETYALQAc++3bjBz5c3r1/ryx+Tn3/4haqqgglS5aPysQAwAGw2sAesGbkDPK65UEkZAKDCZD7yOKZ71aq+vpc9qAc6UInHF5CSHOY011yTBAAI4OC1B29eHvU8usYfOkGhKcguSsIiwcAGgPvAHpg6JDDXXHMxC3sYNpDEnPKRw71q1drXPxR1AHoieYCJkIZjsmDNSgCaAA7Y9vCC/88fojfVAE1DNOBaoAbYA4wN3Md9MKBwXFmw5prm0lkM9hg2g99ikjnCXavq17q+IeOe6j6ABMAUMh05F5ZlwUzQaMJx3774+UIWXtvnOdkCYNMAVF7m2hij2Pg+sMf3MTbHfbiPzQAasEDJsdkGm2E+fhvTiN659u6r/ry3sWXl7xiwJfDkByqTkdIEgAKAdnM4T1DS9vOn1AALY8BiQRbLlEgb+6i6b9+HDRgFinUDHrAAxgDDP/13v89jzrDr17XW959/MoaRwq+Suwn7houWSJkPHnMugAkAQIfP69fXi7f/GLfh5RsbUA1cOcWURc41F2bvMjbk7TAAh5IMgArAXHNBojA8Ho8xc9Br7V5rXfj9tloe93H/QGkxAPH1F1Om4Zg5FwCWWQkAwfPX4c1/0g6VJXYWv35ARsHCmqFgoZWwbFBjo8gCKu0BpAYk06qEVB6PR+acsbt37bXW1dZ0r9kcDoei0OtROTOaSnJmHpk5AVhYsyQAOO4bL8JNhkd/zvoHkKIpDwvgsmSA+QsKR4ECYABjZ4NHXXMxl7nMNT0eMUYOVX332tcqS68Oon+nQIMHUvMXKdOIfDjSnOYETICIiAi4OU+1wFFB/7Hqd7+gQM7L9AtcZAZsOQaFlCCBTJAMqoGUMBXm4z/8GI/jGPbqtX/948+rOETTd8ciiaUhAPF3Us6Uac5plQWwABoBOO7jlP/1PzrqPkTlZW5ZAMQDwOOCBV2oPaiUhcIeAAlQAbM8LpgeDyNHprW71a8/NxhZ0QJ2TwAOILwQKccohzQzASBTAbqbw+fLh1ePdrj9ZPJjAgCrLACNHLH2xt6UArAVsLBJGYBrIh//4ZE/jh/R+772uqr/NMBGAGJVLQAFkAJHPqaclkqAuZRMADpup8+Zb6+VAa89sRegNp0XlonHlcuIRRs2Y6MAAAMwbmRFW/NiVfz+iMiZSe2qtQxzATcGqKEGANIDR0rJlJBITJgmgCBCAOq04SZ+JjkAEr4Rc8IF1Wp7wNgDAAywgS2zqYo4Vmbm7//dY8zHceS+7+v7+v7+889t2SjHYSAz2QA3QMgkgXE8jnxMsGCthQINofl83Bhb1eHyP6P8AICHtXoteEwTAGkA7A1sVTawibqWqorj+PHjMR5zzrHu+163P69r23vi5r5vG7AB9D2Q+Epk5vCYJvOaACYLSgIInl+4/9jHPRDr5x/4NXHD2CSiq0jAzAyMnQUwgAEAkI+15pJpZo4Uu3bVutywgWFz3Nh7bCNBEUcN+YDKiRxHjgdjWgAwAQQAnhyp4LixwlwAG99KZWVhAQKMnRQAAABQlSUfM3ImalnLZam8Z7CQcGOzUbkHaO4DwSRzHkcKeZgPteYCYDGzSATgi9f7Zbz/I6jcueD4B6iFtMaqyeN6WJWyYAMA2IOECSDVf4jIkSh3LZd7RlT9toYEHLg3AHugHwzw9ZLkCI95TMOsxYKHa1qwTMtMgD9++uPt/fLi5g8//6f+4RcmMG2INdeDB9MKWQCJAhioxIrEKJkzc+Swlb17XbYsCxNjj80BR9mwD+wBOhFfppwzx/GbY+bhmFcCjwsAzAQgPH96er/q8wf8VAEskHXsWbJy5ZqYa01tLBtjQ6IA0gBgyhzpcLtLrUttsxZZJYlbAiRSbfeBBfYYpr/IzBzHw+8zD0zAw8xaAMusBA44zs/X85QOagMAY8v67XsucldC5oQae8Cwx4YsIA1oyGMbY9CrbnVZxaiVE4pD//ZdCSC5uQ+Y/39BcLCqa5odhvlZ632/f++q6io6MvGNCEOgD6GLUqdNTPAoI4PIJAENMkowaKBJgggBk0YGW1LuwoMGKXJRTSiRgPFtZJKEdrr6nNr7/961Vp5n5uxYyW/IzFwrc++8Mtg6O3nuAwAbsO/Bz+c3fu47v/gFMn++5gYAsl/f9nFSnddsO4HNgWUVJACQ7JO5r3PN/azu8/Txakl275Mk9nl960sB3K6bxSPDwLr8cnu8rGvv/Vlei+vaksZpCdiOfD76POIE8HN8k/fK+3LLv/sQAIDR2fLsrrMBr2/NPhOwlFUsgDyb7fII7rtvrZ3PDp06szOkACjghht17Z0yZC7+SO7HesmXx85rgZ1kS9LjqRNnbx7yYVYCWFxcbtj1/nK3DZBe6my2zBxawnZm4ZzNYgHAZl+RPX2frpqZir11Hi0bk0Gvy3kVBbhuF1ZuZzNwrfXYj/3yWI8NF2xI2NkAx+4MZiXgN76pC+7rct9/1OkdiQKs0wln59BJP5xXOP0KBMc+YO/rel3N83TVHNGEeX3bDqA3dAX52fPxrGXV5y3ZcC5XrMff/3I/HvvlsR4r8rKui213Ag4k8ADqAvj5b1zgwnWf33y9UsOMGEY8zj5wEu5QBNj7bMfZ57O3z58P8Hh52V9dt7qf1X2esIPwEm9bA8deToKHh07H42zANq7Xv/8nuT9/eazHztjLddks+7WRPPfZSAjAK7/5Ob/5hl8MQMa81i/62z/6tz/n9yUZgszdslPD49FPNgEPvW3bq5/UK9Z+/ckXf+/D1P9z98EDzbgmaA46ka/PZuPQudnb2dji83/w5f5nL6/x2GtbK1duLJb4YzcDa0HRuWphohbZZOfK6pZWLUqbfp7nr/+TN3XM2d1mAJj86fnYJgAAECNFPh7/8PN0/u//q2cB2TFiCDNRqVM/Xj/N9IAxMTFiEvR6fXz1B1/99KcrrmtbGa4YgRD/NVAWAID3xHVfgMICuO9Pbz/+eKiCGGJAssF292yAroEYkBpf/McPzm9/ezp1apSlFpwYiPV4FlYZhgkjRpSUj21dvvjy9csvH7ktO10rllXx3yzF2DXBquF24Qa5AAAI88OPn348y3XX/QQ3wBXP6xb2w/3kgnhi6AwTLuKSfa2ffPWgPj57/q1vVHjWHjHUvBsNj+u31UQAAGA/Ll6tbdn7i8dPPt8sa0eIPxFLDYADxAirJoZgQCz7KL/78fdvz7WNp/eBLiwFutnXo97OaliYnhiwgpViiJd/+OUqP/72453rhgljcsK9xRATPp8Dt+yVnS1lQ7kexy54JL/hF6+vX3z2eMlF/AlhHcIQFgAnJhYgrdLkfX779vapFniu9Xw3dt4ru6yCdh4v/fp8uy/cLu6rs9UVKsMqrHLdX/2Dn/B8/pt/1LJxY2K6roPBSONsZx/2xBDwyPeXl/g/f7FJOhOzwmTm65efb/EnACAWiSYbtWrVArJz3e+/++F5/+abb/3Swbd+9mwSTReq8AWvfhgAvSYmYAQMneH6g6++4Pnjv/lD4HbdYFXiHVd6tvPQzoZs6HQeVm7gqodgEL73iy3jvwWoRWqps9UiWzbFgjL/4dP72wFGmCf9bAsA09YEL//uZ29SowuAjIQuI/Dllz99mP79//exATd44b7u5z4er2/tABoAicfLSaz15KEP27GTVfHfj6EWIUaYkBr3UriG03j7D8/3W1pu+nbd5qmfhLU7WzZdXF3Xv//l738AVxcGCLNruMEV8/j3//QrXefj7353DMAqYt/J009en4f0hMfz0QcAj5fufLwlHmLQB3iIPw1jmmwAaK1WhGG1VnC2Y4LSz3KX8+P97Qf4nm986wPGkz/w+zddsMjOJtEFrLxXPk6//uSrn968ffzhhyfE9VxwtX1rz69e38qdDZ4AD30mPK7m9dkgG7nz+QjfE/8dwgyC6CRpZgjgeT5+fGspJbIzYy8r0bfpzmbCoIzp/XqfmjJTvv36uw/ME2ggNfl4e/37/+KLL9/T/em3H5vEotyavO7X1+uHN3h6eAI8vL94emS8uo7pQwMg2xX/XDHUypQiKyYmqkYtEeP59sPb2998uNKqb/H1d7+c+vaXMXPz5mjkw9N2dvL47j+LbUIsghUgE46BYpDdmS9fGd5/eHvWMVWNahMTfPmT+H9PAVKn9nwcmO3zTXz/9Q3Gcx88gPjn0DKJEcNEJ50a9enHtx8/fdIprvt7gA/f82E69bOzyxDrPHSNcLVshUV2rYT0EJfv+GZDrL0vi+uKVfAsd+nWTTdNPvJ5/vY/reJWogO0pDxyp86Y55ae4AEx4s8AGhOalLqZ834+frrffv/kEcA87uvG9z5gxDwBaNwsZyeabGUQA7FODPdKhEuy9hevn70+zH1/ejv3MWL7Dd8ke9uPDY6mtdZomi0d6NO8Vz5ZhYeIP6NH6CKGlp0yVP14//Dj+998wPXdB9/72nf4xobDt998y9f3xPTpzoTuzL4nLundSo2UGp1I76xi5cP/4evby2fXy39EnLcfnr/+R+8MASasDXBNlhVTK/ieX0bsvR9rr9jX5X6KOTHv6tmciD9lwoCmyRRz5sdPH5/vf+Pr775hUVbBt78UDP72m299+P5nz8ez3VamDccp69Wqp+SUJZPu3QmnruzOPPkal5vv//H+7KfXxX1+++nXP3u7J7Co4fE43QpGU1gUsXnwSOJ7/+Snrx9/LGvnWupaLf4UwOjUIqfr+fb26dP5uw++/+WObY6p8y0+XN99+J4PjBg8G7Qk9+lWylp7v9UES12pNcp0XY+WibMf6OPFF6/7+rI9fPz4fPv01LlP50GxUBhugxi1iEl7LaR9PF5fP7t/vG9XXhmj4k8TSqeOYNSn+9Pbs3/tF/2tDy6++5r7e1+7Xb77hm99fcP13dfPJx4xwPPtRmW49rmtwkpNMTEAe61tn0c/If/df3599uW10v3ph7dff3iHbsrK1F0D9+V23dRArImHVRcSD/H9L30s1sT3fhZ/KuEEJvR7v7/92N1aNyfqHS/v13cfvv/HrIjsscqU6rqf3XmvI17s9Kmeo1lrLc+yZJSEzlZGDISx1yW7y9pfvTxev9o4P3769PHjRwO9Jq64ukww3EBNQIYrrs7EPg+evFzffRhgy06amIiJ9dl8MS1RWuk608X9z57/ZTdatqNH/R0/I10ds969f2HXUgu1Xp8pCWtiQErgNkbUolOt8iZrFtaKzv/9D5+0WsKt1CBqQBiGxQQS9loGe77zvW++/Wb7271lsBgNcmDE5VhABqUG0zTVNfVfuZ99Ts35FnyQj2d3MXERGcOyu8vo7Oxa5HXHMHGl5mr1Zu8fvGZ78PGfvv3+TStMSwrW2cc+Awgi2gQmLOT9vv6Q13cc8T9CFbEjlaNJbcJZdII1DYBlwrSnug8HvEOVWxmOGse3X/vug3nqLpSYYujZn+199D3Ey1evr1+8viSeP759/PS7Q5lgoaAGPG0QnUFkAKyCpVbKl+vec+Di6vumIGJBbe1qmxitoVKbCJpVaZe9DzaQqTXUvL+8/zF/7OmMQ43q/82HwbOl8+inGPptv3m+frbZn9N+914yILVVi/Tcx4OZ64yqh7HL1bUSCWTq/nHE/7T6Vj2BsqiQ+6qVTSdukRlDF4fpZUTRU9M3Zx+cFU6sWsUCgzir9gExTd4aRbno7OfpA3tfX+6duN9/9/z9795N4EIBPOGhOTwftovUr54Pz5aARvx5KxoARpAp5grb2dwxTmVgd9ENPVWm3Tgx+4AY1IpBZRwxYmxiyiqwirVfNLcagFi1csXz/Ph23z0TxYqaujkmDsUq7j5sSyIfgoEnGsSfoSN1AsgUu6Ii11w4E5mtDYBVzq6e++iWOnXWqtNqJWgqkpNj1cqWugwxxMKVknoqSy1lkS21bqYIi5ob1aoabdSoYbS/Az7UcTY6W+r4c6CaMNA5BnJlXmq9J11aQyZid88+03UISZeXntNjCmzHFoaJAF1YwRTNS+Zyq4NODQBqYgBi1KIYQFOWlbJT0/nU9whPHH3iz9W6AbRZaEA2wESudKMzO2O6oTk6osvL6bQoignEYNEgNROGqZY7ciXVbY7tQGcnnbrWqVVLmBgAlW0gkHldIQPb2auyycA6xP+wyrqBBgmyZcg1S1OWvMFSPWE6yT7PM5HFqpN5EqvLAoERmFrUNQZqKf1wZeg5M3GsMKo9zlLQSE22AzH2YVMDMTyukFuxxFpyhssF8ecRUGhQiyYXWImmrGIlWnYVZDtVbaZn3XVxj7g8H9wXzw3QV1lE3GjJqhUrtY5poKyCpdDITivmRq2CYauFbnI/5GWOzUJYV2KJif95uVGrwCp0dlqNi3ulLquWsmQXWmGYquxR4QC4AXA9QVw6NaRetWpV5xU4Vrmv+0LD2Z0NoBa1QK0yAAzrsfOSfYaNSMT6fEWq+BfATbZaQFlYcN0X1SRNNl20kt1UDfSAsmKK+wK36zYxYTz0gYlZoHcCeAIxAdfNqEQY62xnn1gcAIZlP17W1aVGhli5Jwa5U/wqRhvVanFNLwX2jLbapTS6AGjTsvMoB7QBUAvKKuB2gSeAjQTAffEUcN2Ay41hO9jcWKCpjc/y9eKuhB3bJRhE/CqmB9Uj6somNa3g0mVDagmQ3QPOHEoNGgMEDAUAALfrhgv2AYAbAEZw2ODYUyumsAS47s9elutmxIoNEDtM/EXrQVVMoK6GaQAX+7Dzvm4AcF+duvqGAgcVA4BaBYCBAy5sOKvAcHJhvG1MYOKsYAqbsw82YKXHJWOCBYidyw3xLyi0oTNky6aQzco1TrYULne2G64bi909R+mUDgq1DgWoBQDUQllqCQOA0hINZaFWrbPyAACOzdmXnS87zUAnsS9Lth7xKwXcKQ+pJ5hORIJGCjFmNXRyk2GaxnQzDcABeqCssgqsWqAsxAC1qAUF0NkSALoGCuyFa125r1pidB777EutsFL8hSgTrZvONm0NYSzb6lRTAJ1ELfahU1cDoNrENDUALWkD1CqLWgVLYAAKoJGdGmTjADDy7LEd+1qxFrG699lnc8ltYqX4Vz16zEzOxJhmVbYmM2Ks6DkArFqVofKevlBoJGui6DlQB2gDC1q27IRO7APQ2SYMoNYN2VzcqwBrGuDwWeRexAA20kprxcRfTPZMRzKEHmrdCTtbmJDTJrLBFLjpyDHEOnl16RGjkwMKOPsAWgIA2wH2AUAzACJLaQBw2OQSa60YWAIgZUjxv4iBiInBTEwMYgihLWJIxigH3FLHWZVwJT26DXCAzgI427HVArAA9KDGPgCgiEQbUE0uZQHLXmHV2CRaAqnjVzQRIaI7J2ZAaDFyxYSc6CK1SmI65twp1rgriIRVnc0cAPTAsQEgsmDtbA5QAEAtaoAJJQYgDIiMtcKC3RnUMp06I3X8ysxkTKCDiBARg5iMAdDRkZRgzExFN5rbpZvs6RQ3AD1hEAMAMTFWSxuoASgAgM4yAEAYBMuyc1X2qgVSIzOWjl/FjOgwEGuycxIyiKSnZo0RwzAdpg3V6b72PI8JutliDqCTigHEhAGR+5hmiUUZiOmBGsQA2Ac9iAFiwrCwM7lUACTgIv6lMDMiuqWIIbaJmAmRpolwm0jMjKgR0zGnwuV5kLdUbOCwz67ZByqys0F26lSIZLuu+z5iOejhYOMAoA1iQCQAe8tVBEjIzkjZ8S/FtMiZmYgIZM5ECBhDDJPMCEZPTw8FlrJi7psJl9uFe9CzTyzgqq4BK2pQC6woXrkPMXoAHDnRMQAA0An2isUIstNKKDExK/4q59zRK1LmTJuMmAkGZWwizOgRkYZo03lq4sXkbWVV3XbccEUfN5B5FLOa1NkZamIA9hSAignZAwDQWVatE2YDZdUiMpYkG7moqwFlxV+ayiS7IxLN6IiWMRMlgyFaRnaYTsLMtNWRQ3TxJAaiD5RliGpMFKwL1WAHlU3XxAAlkiIGwCqgm43InhhW5zVy5YYYU6AiwU5yms6gc1oNQkT1yFhrpmkTJ5gZGdM5udZYOTHOWYW1etgVIaNST8jM5b7ue01MXHK57mpErsKyck0v162e4uohhs4eAMi0YKtRdO6J4OWx5rx3oRPxcCD+uhPTA0m0HilMizSmERMbmDCIKawkzNB6YnSGypmY6Yk1HTERMdNzy7UWenpiJc47tZK15606+1ihBnYN6KwFwK7RWVjsz5eYK6veO5dqiTbLNeJ/ZSBMd8RkTFcSetg5M21yRI6MYWTJ6O4wsdOUHlqNyJ4ZEdGsa6on9u7Zp0KLiIwJfSJXzLNNbJOruoZV1TfyWuJ5k82xIpczHLCzT7HEta6XF6Zn7qnqlNlNkuKvWyRgSmSoo5GrZARmYiJGTsz0zOoVZqJYMXE6SkzoOakhWTI7zOzlzFUlhZMrQhSTNCa21KNrpu4Ju5sdN7hfVpzmMW43uS729ayb+7r2wo5QI05VYKnVJv6yI9JEBF3TV6qe7ImVekSkMXdcSkQVIcYZGbOzqlOUYQw6O1tmML2zS2R0r+jOmHrkTGQLRPVeESaC7tOiZyJhuhb3JdYyMSJ70CNmQcsVORUxnbFghrNyZrT4V2FmJqxkssVMxQgiQw0mspBhzGQ6PXR27ioyaoiJaalFNOgkYzrWtLHMSZIcERO7u2JdGXOGPicD1bLiVadp1oolWo5R1Ju0xMqyljC5AsCcyAQm/vUEM9aaiggTqWcmA2rpypgikpjZUVUjTKcYOttAGNARHdGR2dOLSmJiwp3k6nvnZJSX9dYxuZZ0v8+aXhFxTnbnCjBVIu1rZ79vs+4TGbOed1rWEltECDCMnBGC+KuI6pEhk66yhOmE6cjOnhixcoiZ6jQzRkZMjxidYrSBJhEDnTp1ChODJTLzdOnMyM42/arKqteI6buj41pzuisjRon0qJtZe0VOn86VmhgRmT0xI1tGYAIm/jLM9MTErBzTQ+ypjD4yZvUQe44wgukMEzViTcioMhkobdAJdOpOluIxnRVyLTqfBatnreq09FWX3piayL5r2jUmhNyeYa2JhOlaiZg7VoYYGL0CDIb4K2iqc0VEmKq9dRVWxDGIIWaVWiIz9GnJilE9ADFtEFnQqRNhgJBiGrKlImTnihNXL4foWzzU6WQqcyW5FhV0DGLF9OS5q9eOR2oJAGDiX9NbU4iMQeTcndZCnxWTpjJjumXPWkoPIktngZA9MXqCLGiSkJ2UZalmWJ3VGalHTL7k1EStVJGm9tydu3pixkrV+6WfZT2iJhL1nGnyJawVAkzABIb4a9PZqAWICH2spFEQQ5CdxOQcEFmdYuhZxNDTE0kBWJaCFQxdxtKDPYVYsbvymnuHUasnu9pEilnv94ihyVV90ROyp+XaOiPXIhw6H4gxnfHXMTAz2kRWJDEVCRBGD2EZQkSfIOlEGCUYtCKbESayk0htiAkmpoWBDKZTYC1PPSsRQ2ToE7ncTyZ160xnVoUkwRoi0kTSOzp1khHz/wMrCFBRA9VmbwAAAABJRU5ErkJggg=="
+        "asset:f2b2775e99b118e05d9b4cab8091a8fd90760212b5943ff54d0058860a41303a.png",
+        "asset:7a1317576b6db57e98de512e480cf0515defe776739631ca7d1e832caa6a7843.png",
+        "asset:78986f2af240d993507eea0fc484dc14c62ed04f5c56cedd420935a2d018bd99.png",
+        "asset:bda1bc0f7662244032f5313e4a56c2b0478d73e8565aa9a8eefe87c244326703.png",
+        "asset:8efd10f9ff10003d023b07046c0d7753f5ec5f0a2cf4cd637471ae7eaf82f1ff.png",
+        "asset:fd50453eb95f2db7fe5088b5f27a04a97487b7106c271e23e747371404fbe32e.png",
+        "asset:25a4d990e12eeea6547657487c9d0fecc461ed4b906eeaa839c3b40667168f33.png"
       ], null, true)
     ])
   ]
@@ -0,0 +1,424 @@
+// Prompt-expansion core shared by Wildcards.js, Funk Wildcards.js and dynamic-prompts.js.
+//
+// Scripts run without require/import, so script_manager.py inlines this file at
+// a script's `//@inline prompt-core` line when the script is installed or run.
+// Only the declarations the script references, and the ones those reference in
+// turn, are copied. Keep every declaration at column 0 with its comment directly
+// above it, and avoid names the scripts already declare.
+
+// ============================================================================
+// Parsing
+// ============================================================================
+
+const WEIGHT_PREFIX = /^(\d+(?:\.\d+)?)::/;
+
+const TEMPLATE_CACHE = new Map();
+
+/**
+ * Parses a prompt into a cached tree of nested wildcard alternations.
+ * Braces are paired in one pass, so `{a {big|small} cat|dog}` is one wildcard
+ * whose first option holds another; unpaired braces stay literal text. Options
+ * are trimmed, an "N::" prefix gives an option weight N, and empty options are
+ * dropped unless keepEmpty is set. Each template and group carries its exact
+ * combination count as a BigInt.
+ * @param {string} text - Prompt with wildcards
+ * @param {boolean} [keepEmpty] - Keep empty options such as the second one in {red|}
+ * @returns {{text: string, parts: Array, groups: object[], count: bigint}} Template tree
+ */
+function parseTemplate(text, keepEmpty = false) {
+  const key = keepEmpty ? `\u0000${text}` : text;
+  let template = TEMPLATE_CACHE.get(key);
+  if (!template) {
+    template = parseRange(text, pairBraces(text), 0, text.length, keepEmpty);
+    TEMPLATE_CACHE.set(key, template);
+  }
+  return template;
+}
+
+/**
+ * Pairs every '}' with the nearest unpaired '{' before it.
+ * @param {string} text - Prompt text
+ * @returns {Int32Array} Position of the matching '}' for each paired '{', else -1
+ */
+function pairBraces(text) {
+  const closing = new Int32Array(text.length).fill(-1);
+  const open = [];
+  for (let i = 0; i < text.length; i++) {
+    if (text[i] === '{') {
+      open.push(i);
+    } else if (text[i] === '}' && open.length > 0) {
+      closing[open.pop()] = i;
+    }
+  }
+  return closing;
+}
+
+/**
+ * Parses text[start, end) into literal parts and wildcard groups.
+ */
+function parseRange(text, closing, start, end, keepEmpty) {
+  const parts = [];
+  let literalStart = start;
+  for (let i = start; i < end; i++) {
+    if (text[i] !== '{' || closing[i] < 0 || closing[i] === i + 1) {
+      continue;
+    }
+    if (i > literalStart) {
+      parts.push(text.slice(literalStart, i));
+    }
+    parts.push(parseGroup(text, closing, i + 1, closing[i], keepEmpty));
+    i = closing[i];
+    literalStart = i + 1;
+  }
+  if (literalStart < end) {
+    parts.push(text.slice(literalStart, end));
+  }
+  const groups = parts.filter(part => typeof part !== 'string');
+  const count = groups.reduce((total, group) => total * group.count, 1n);
+  return { text: text.slice(start, end), parts, groups, count };
+}
+
+/**
+ * Parses a group body text[start, end), splitting options on '|' outside nested groups.
+ */
+function parseGroup(text, closing, start, end, keepEmpty) {
+  const options = [];
+  let optionStart = start;
+  for (let i = start; i <= end; i++) {
+    if (i < end && text[i] === '{' && closing[i] >= 0) {
+      i = closing[i];
+      continue;
+    }
+    if (i < end && text[i] !== '|') {
+      continue;
+    }
+    let from = optionStart;
+    let to = i;
+    optionStart = i + 1;
+    while (from < to && /\s/.test(text[from])) from++;
+    while (to > from && /\s/.test(text[to - 1])) to--;
+    if (from === to && !keepEmpty) {
+      continue;
+    }
+    const match = WEIGHT_PREFIX.exec(text.slice(from, to));
+    if (match) {
+      from += match[0].length;
+      while (from < to && /\s/.test(text[from])) from++;
+    }
+    const template = parseRange(text, closing, from, to, keepEmpty);
+    options.push({ value: template.text, weight: match ? Number(match[1]) : 1, template });
+  }
+  const count = options.reduce((total, option) => total + option.template.count, 0n);
+  return { body: text.slice(start, end), options, count, table: null };
+}
+
+// ============================================================================
+// Indexed Enumeration
+// ============================================================================
+
+/**
+ * Joins a template's literal parts with one value per group.
+ */
+function fillTemplate(template, values) {
+  let idx = 0;
+  return template.parts.map(part => typeof part === 'string' ? part : values[idx++] || '').join('');
+}
+
+/**
+ * Returns combination `index` of a template in Cartesian order.
+ * @param {object} template - Parsed template
+ * @param {bigint} index - Combination index below template.count
+ * @returns {string} Expanded text
+ */
+function templateAt(template, index) {
+  return template.groups.length === 0 ? template.text : fillTemplate(template, combinationAt(template.groups, index));
+}
+
+/**
+ * Decodes a combination index in Cartesian order (first wildcard most significant).
+ * @param {object[]} groups - Parsed wildcard groups
+ * @param {bigint} index - Combination index
+ * @returns {string[]} One expanded value per wildcard
+ */
+function combinationAt(groups, index) {
+  const values = new Array(groups.length);
+  for (let i = groups.length - 1; i >= 0; i--) {
+    const radix = groups[i].count;
+    if (radix === 0n) {
+      values[i] = '';
+      continue;
+    }
+    values[i] = valueAt(groups[i], index % radix);
+    index /= radix;
+  }
+  return values;
+}
+
+/**
+ * Decodes value `index` of a group: options in order, each covering as many
+ * indices as it has combinations.
+ * @param {object} group - Parsed wildcard group
+ * @param {bigint} index - Value index below group.count
+ * @returns {string} Expanded value
+ */
+function valueAt(group, index) {
+  for (const option of group.options) {
+    if (index < option.template.count) {
+      return templateAt(option.template, index);
+    }
+    index -= option.template.count;
+  }
+  return '';
+}
+
+// ============================================================================
+// Samplers
+// ============================================================================
+
+/**
+ * Expands a template at random, following option weights at every level.
+ * @param {object} template - Parsed template
+ * @param {function(): number} [random] - Uniform [0, 1) source
+ * @returns {string} Expanded text
+ */
+function sampleTemplate(template, random = Math.random) {
+  return template.groups.length === 0
+    ? template.text
+    : fillTemplate(template, template.groups.map(group => sampleGroup(group, random)));
+}
+
+/**
+ * Expands one group at random through its alias table, built on first use.
+ * @param {object} group - Parsed wildcard group
+ * @param {function(): number} [random] - Uniform [0, 1) source
+ * @returns {string} Expanded value
+ */
+function sampleGroup(group, random = Math.random) {
+  if (group.options.length === 0) return '';
+  if (!group.table) {
+    group.table = buildAliasTable(group.options.map(option => option.weight));
+  }
+  return sampleTemplate(group.options[drawAlias(group.table, random)].template, random);
+}
+
+/**
+ * Builds a Vose alias table for constant-time weighted draws.
+ * Column i keeps its own option with probability[i] and hands the rest of its
+ * share to alias[i]. A group whose weights are all zero is drawn uniformly.
+ * @param {number[]} weights - Option weights
+ * @returns {{probability: Float64Array, alias: Uint32Array}} Alias table
+ */
+function buildAliasTable(weights) {
+  const size = weights.length;
+  const sum = weights.reduce((total, weight) => total + weight, 0);
+  const scaled = weights.map(weight => sum > 0 ? weight * size / sum : 1);
+  const probability = new Float64Array(size).fill(1);
+  const alias = new Uint32Array(size);
+  const small = [];
+  const large = [];
+  scaled.forEach((share, index) => (share < 1 ? small : large).push(index));
+
+  while (small.length > 0 && large.length > 0) {
+    const less = small.pop();
+    const more = large.pop();
+    probability[less] = scaled[less];
+    alias[less] = more;
+    scaled[more] += scaled[less] - 1;
+    (scaled[more] < 1 ? small : large).push(more);
+  }
+  return { probability, alias };
+}
+
+/**
+ * Draws an option index from an alias table.
+ * @param {{probability: Float64Array, alias: Uint32Array}} table - Alias table
+ * @param {function(): number} [random] - Uniform [0, 1) source
+ * @returns {number} Option index
+ */
+function drawAlias(table, random = Math.random) {
+  const column = Math.floor(random() * table.probability.length);
+  return random() < table.probability[column] ? column : table.alias[column];
+}
+
+/**
+ * Draws `count` different indices of [0, size) in random order. A partial
+ * Fisher–Yates shuffle keeps its swaps in a map, so the cost is O(count)
+ * whatever the size.
+ * @param {number} size - Number of indices
+ * @param {number} count - Indices to draw, at most size
+ * @param {function(): number} [random] - Uniform [0, 1) source
+ * @returns {number[]} Distinct indices
+ */
+function pickDistinct(size, count, random = Math.random) {
+  const swapped = new Map();
+  const picks = new Array(count);
+  for (let i = 0; i < count; i++) {
+    const j = i + Math.floor(random() * (size - i));
+    picks[i] = swapped.has(j) ? swapped.get(j) : j;
+    swapped.set(j, swapped.has(i) ? swapped.get(i) : i);
+  }
+  return picks;
+}
+
+/**
+ * Uniform [0, 1) stream seeded from a string: FNV-1a hashes the key into the
+ * state of a mulberry32 generator, so the same key always gives the same stream.
+ * @param {string} key - Seed text
+ * @returns {function(): number} Random source
+ */
+function keyedRandom(key) {
+  let state = 0x811c9dc5;
+  for (const char of key) {
+    state = Math.imul(state ^ char.charCodeAt(0), 0x01000193) >>> 0;
+  }
+  return function() {
+    state = (state + 0x6d2b79f5) >>> 0;
+    let t = state;
+    t = Math.imul(t ^ (t >>> 15), t | 1);
+    t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+}
+
+/**
+ * Keyed pseudorandom permutation of [0, size). A balanced Feistel network runs
+ * over the smallest power of four >= size and cycle-walks values that land
+ * outside the range, so every position maps to a distinct index in O(1) memory
+ * and the same key always gives the same order.
+ * @param {bigint} size - Number of indices
+ * @param {number} key - Seed selecting the permutation
+ * @returns {function(bigint): bigint} Position to index
+ */
+function keyedPermutation(size, key) {
+  let bits = 2n;
+  while ((1n << bits) < size) {
+    bits += 2n;
+  }
+  const half = bits / 2n;
+  const mask = (1n << half) - 1n;
+  const seed = BigInt.asUintN(64, BigInt(key));
+  const round = (r, x) => {
+    let folded = 0n;
+    for (let rest = x; rest > 0n; rest >>= 64n) {
+      folded ^= BigInt.asUintN(64, rest);
+    }
+    let out = 0n;
+    for (let shift = 0n; shift < half; shift += 64n) {
+      out |= mix64(folded ^ seed ^ (BigInt(r) << 56n) ^ (shift << 40n)) << shift;
+    }
+    return out & mask;
+  };
+  return position => {
+    let x = position;
+    do {
+      let left = x >> half;
+      let right = x & mask;
+      for (let r = 0; r < 4; r++) {
+        [left, right] = [right, left ^ round(r, right)];
+      }
+      x = (left << half) | right;
+    } while (x >= size);
+    return x;
+  };
+}
+
+/**
+ * splitmix64 finalizer.
+ * @param {bigint} x - Input
+ * @returns {bigint} 64-bit mixed value
+ */
+function mix64(x) {
+  x = BigInt.asUintN(64, x + 0x9e3779b97f4a7c15n);
+  x = BigInt.asUintN(64, (x ^ (x >> 30n)) * 0xbf58476d1ce4e5b9n);
+  x = BigInt.asUintN(64, (x ^ (x >> 27n)) * 0x94d049bb133111ebn);
+  return x ^ (x >> 31n);
+}
+
+// ============================================================================
+// Seed Plans
+// ============================================================================
+
+// Master seeds and planned seeds stay in [0, 2^31 - 1), the range the scripts
+// draw random seeds from.
+const MAX_SEED = 2147483647;
+
+/**
+ * Seed of one image in a seed plan, derived from the master seed and the
+ * image's key, so a plan always gives an image the same seed.
+ * @param {number} master - Master seed of the plan
+ * @param {string} key - Image key, a kind letter and a base-36 index ("r1f")
+ * @returns {number} Seed in [0, MAX_SEED)
+ */
+function planSeed(master, key) {
+  return Math.floor(keyedRandom(`${master}:${key}:seed`)() * MAX_SEED);
+}
+
+/**
+ * Parses a master seed typed into a dialog; empty text draws a random one.
+ * @param {string} text - Decimal master seed, or empty
+ * @returns {number|null} Master seed in [0, MAX_SEED), or null if malformed or out of range
+ */
+function parseMasterSeed(text) {
+  if (!text) return Math.floor(Math.random() * MAX_SEED);
+  return /^\d+$/.test(text) && Number(text) < MAX_SEED ? Number(text) : null;
+}
+
+/**
+ * Compact token from which one image of a seed plan can be rendered again by
+ * the script that logged it, with the same prompt. Tokens do not carry over
+ * between scripts: Wildcards.js keeps empty options and Funk Wildcards.js
+ * drops them, so the same key can pick a different prompt in the other script.
+ * @param {number} master - Master seed of the plan
+ * @param {string} key - Image key
+ * @returns {string} Token such as "k3x9qp-r1f"
+ */
+function replayToken(master, key) {
+  return `${master.toString(36)}-${key}`;
+}
+
+/**
+ * Parses replay tokens separated by commas or whitespace. Only the syntax is
+ * checked; the calling script decides whether a token's kind fits its modes.
+ * @param {string} text - Tokens as logged by replayToken
+ * @returns {{master: number, key: string, kind: string, index: bigint}[]} Tokens in order
+ */
+function parseReplayTokens(text) {
+  return text.split(/[\s,]+/).filter(token => token.length > 0).map(token => {
+    const match = /^([0-9a-z]+)-([a-z])([0-9a-z]+)$/.exec(token.toLowerCase());
+    if (!match || parseInt(match[1], 36) >= MAX_SEED) {
+      throw new Error(`Invalid replay token: ${token}`);
+    }
+    let index = 0n;
+    for (const digit of match[3]) {
+      index = index * 36n + BigInt(parseInt(digit, 36));
+    }
+    return { master: parseInt(match[1], 36), key: match[2] + match[3], kind: match[2], index };
+  });
+}
+
+/**
+ * Configuration for replayed images: steps and "WIDTHxHEIGHT" size override the
+ * batch settings when given.
+ * @param {object} configuration - Batch configuration
+ * @param {string} stepsText - Steps, or empty to keep
+ * @param {string} sizeText - Size such as "1536x1536", or empty to keep
+ * @returns {object} Configuration copy
+ */
+function replayConfiguration(configuration, stepsText, sizeText) {
+  const replay = { ...configuration };
+  if (stepsText.trim()) {
+    if (!/^\d+$/.test(stepsText.trim())) {
+      throw new Error(`Invalid replay steps: ${stepsText}`);
+    }
+    replay.steps = Number(stepsText.trim());
+  }
+  if (sizeText.trim()) {
+    const size = /^(\d+)\s*x\s*(\d+)$/i.exec(sizeText.trim());
+    if (!size) {
+      throw new Error(`Invalid replay size: ${sizeText}`);
+    }
+    replay.width = Number(size[1]);
+    replay.height = Number(size[2]);
+  }
+  return replay;
+}
@@ -0,0 +1,674 @@
+// Headless stand-in for the Draw Things scripting host.
+//
+// Runs one script under node with mock `pipeline`, `canvas`, `filesystem`,
+// `device`, `requestFromUser` and friends, and prints a JSON trace of every
+// API call to stdout. Driven by `script_manager.py run`; the spec arrives as
+// JSON on stdin:
+//
+//   {
+//     "name": "Detailer", "source": "<script text>",
+//     "answers": {...}, "latency": {...}, "configuration": {...},
+//     "prompts": {...}, "canvas": {...}, "files": {...},
+//     "pictures": "/tmp/pictures", "seed": 1, "maxRuns": 50
+//   }
+//
+// Time is virtual: pipeline.run, __dtSleep and timers advance a simulated clock
+// instead of blocking, and the script's Date sees real elapsed time plus the
+// simulated time, so elapsed-time logging inside scripts stays meaningful.
+
+"use strict";
+
+const vm = require("vm");
+const fs = require("fs");
+const path = require("path");
+
+// ============================================================================
+// Defaults
+// ============================================================================
+
+const DEFAULT_CONFIGURATION = {
+  width: 1024, height: 1024, steps: 20, strength: 1, seed: 42, guidanceScale: 7.5,
+  shift: 3, clipSkip: 1, sharpness: 0, sampler: 0, stochasticSamplingGamma: 0.3,
+  batchSize: 1, batchCount: 1, model: "sd_xl_base_1.0_f16.ckpt", loras: [], controls: [],
+  upscaler: null, refinerModel: null, faceRestoration: null,
+  tiledDecoding: false, decodingTileWidth: 1024, decodingTileHeight: 1024, decodingTileOverlap: 128,
+  tiledDiffusion: false, diffusionTileWidth: 1024, diffusionTileHeight: 1024, diffusionTileOverlap: 128,
+  maskBlur: 8, maskBlurOutset: 0, preserveOriginalAfterInpaint: true, hiresFix: false,
+  zeroNegativePrompt: false, resolutionDependentShift: true, clipLText: "", numFrames: 16,
+  cropLeft: 0, cropTop: 0, cropRight: 0, cropBottom: 0
+};
+
+// pipeline.run cost = runBaseMs + megapixels * effectiveSteps * msPerMegapixelStep,
+// where effectiveSteps = steps * strength (img2img only denoises part of the schedule).
+// Per-model rates in `models` override msPerMegapixelStep.
+const DEFAULT_LATENCY = {
+  runBaseMs: 400,
+  msPerMegapixelStep: 90,
+  models: {},
+  upscalerMs: 1500,
+  modelSwitchMs: 4000,
+  downloadMs: 0,
+  detectFacesMs: 60,
+  maskMs: 40
+};
+
+const SAMPLER_TYPE = Object.freeze({
+  DPMPP_2M_KARRAS: 0, EULER_A: 1, DDIM: 2, PLMS: 3, DPMPP_SDE_KARRAS: 4, UNI_PC: 5, LCM: 6,
+  EULER_A_SUBSTEP: 7, DPMPP_SDE_SUBSTEP: 8, TCD: 9, EULER_A_TRAILING: 10, DPMPP_SDE_TRAILING: 11,
+  DPMPP_2M_AYS: 12, EULER_A_AYS: 13, DPMPP_SDE_AYS: 14, DPMPP_2M_TRAILING: 15, DDIM_TRAILING: 16
+});
+
+const MOCK_IMAGE_SRC = "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mNkYAAAAAYAAjCB0C8AAAAASUVORK5CYII=";
+
+class StopRun extends Error {}
+
+// ============================================================================
+// Clock and Trace
+// ============================================================================
+
+/**
+ * Virtual clock: real elapsed time plus simulated time from generation/sleeps.
+ */
+function createClock() {
+  const epoch = Date.now();
+  const origin = process.hrtime.bigint();
+  let simulated = 0;
+  return {
+    epoch,
+    real() { return Number(process.hrtime.bigint() - origin) / 1e6; },
+    now() { return this.real() + simulated; },
+    advance(ms) { simulated += Math.max(0, ms); },
+    get simulated() { return simulated; }
+  };
+}
+
+function createTrace(clock, echo) {
+  const events = [];
+  let depth = 0;
+
+  /**
+   * Wraps fn so each outermost call is recorded with its virtual start time
+   * `t`, the simulated time it consumed `dur`, and the real time spent inside
+   * the mock `callMs`. `cost` returns extra simulated ms for the call;
+   * `describe` / `summarize` turn arguments and results into JSON-safe values.
+   */
+  function traced(api, fn, { cost, describe, summarize } = {}) {
+    return function (...args) {
+      const outer = depth === 0;
+      const t = clock.now();
+      const simulatedBefore = clock.simulated;
+      const callStart = clock.real();
+      depth++;
+      let result;
+      try {
+        result = fn.apply(this, args);
+        if (cost) clock.advance(cost(...args));
+      } finally {
+        depth--;
+      }
+      if (outer) {
+        const event = {
+          seq: events.length,
+          api,
+          t: round(t),
+          wall: round(callStart),
+          dur: round(clock.simulated - simulatedBefore),
+          callMs: round(clock.real() - callStart)
+        };
+        const described = describe ? describe(...args) : sanitize(args);
+        if (described !== undefined) event.args = described;
+        if (summarize) event.result = summarize(result);
+        events.push(event);
+      }
+      return result;
+    };
+  }
+
+  function log(level, args) {
+    const message = args.map(arg => (typeof arg === "string" ? arg : safeString(arg))).join(" ");
+    events.push({ seq: events.length, api: `console.${level}`, t: round(clock.now()), wall: round(clock.real()),
+                  dur: 0, callMs: 0, message });
+    if (echo) process.stderr.write(`${message}\n`);
+  }
+
+  return { events, traced, log };
+}
+
+function round(value) {
+  return Math.round(value * 1000) / 1000;
+}
+
+function safeString(value) {
+  if (value instanceof Error) return value.stack || String(value);
+  try {
+    return JSON.stringify(value);
+  } catch {
+    return String(value);
+  }
+}
+
+function sanitize(value, depth = 0) {
+  if (value === null || value === undefined) return value ?? null;
+  if (typeof value === "string") {
+    return value.startsWith("data:") ? `${value.slice(0, 32)}…(${value.length} chars)` : value;
+  }
+  if (typeof value !== "object") return typeof value === "function" ? "[function]" : value;
+  if (depth > 3) return "[…]";
+  if (Array.isArray(value)) return value.map(item => sanitize(item, depth + 1));
+  const out = {};
+  for (const key of Object.keys(value)) out[key] = sanitize(value[key], depth + 1);
+  return out;
+}
+
+// ============================================================================
+// Geometry Helpers (Rectangle, Point, Mask, ImageMetadata)
+// ============================================================================
+
+function Rectangle(x = 0, y = 0, width = 0, height = 0) {
+  if (!(this instanceof Rectangle)) return new Rectangle(x, y, width, height);
+  this.x = x;
+  this.y = y;
+  this.width = width;
+  this.height = height;
+}
+
+Rectangle.prototype.scale = function (factor) {
+  this.x *= factor;
+  this.y *= factor;
+  this.width *= factor;
+  this.height *= factor;
+  return this;
+};
+
+/**
+ * Removes `other` from this rectangle when the remainder is still a rectangle
+ * (other spans a full edge); otherwise returns a copy unchanged.
+ */
+Rectangle.prototype.exclude = function (other) {
+  const r = new Rectangle(this.x, this.y, this.width, this.height);
+  if (!other || other.width <= 0 || other.height <= 0) return r;
+  const right = r.x + r.width, bottom = r.y + r.height;
+  const oRight = other.x + other.width, oBottom = other.y + other.height;
+  const coversX = other.x <= r.x && oRight >= right;
+  const coversY = other.y <= r.y && oBottom >= bottom;
+  if (coversY && other.x <= r.x && oRight > r.x) { r.width = Math.max(0, right - oRight); r.x = Math.min(oRight, right); }
+  else if (coversY && oRight >= right && other.x < right) { r.width = Math.max(0, other.x - r.x); }
+  else if (coversX && other.y <= r.y && oBottom > r.y) { r.height = Math.max(0, bottom - oBottom); r.y = Math.min(oBottom, bottom); }
+  else if (coversX && oBottom >= bottom && other.y < bottom) { r.height = Math.max(0, other.y - r.y); }
+  return r;
+};
+
+Rectangle.union = function (a, b) {
+  if (!a || a.width <= 0 || a.height <= 0) return new Rectangle(b.x, b.y, b.width, b.height);
+  if (!b || b.width <= 0 || b.height <= 0) return new Rectangle(a.x, a.y, a.width, a.height);
+  const x = Math.min(a.x, b.x), y = Math.min(a.y, b.y);
+  return new Rectangle(x, y, Math.max(a.x + a.width, b.x + b.width) - x, Math.max(a.y + a.height, b.y + b.height) - y);
+};
+
+function Point(x = 0, y = 0) {
+  if (!(this instanceof Point)) return new Point(x, y);
+  this.x = x;
+  this.y = y;
+}
+
+function ImageMetadata(src) {
+  if (!(this instanceof ImageMetadata)) return new ImageMetadata(src);
+  this.src = src;
+  this.width = 1024;
+  this.height = 1024;
+}
+
+// ============================================================================
+// Host Objects
+// ============================================================================
+
+function createHost(spec, clock, trace) {
+  const latency = { ...DEFAULT_LATENCY, ...(spec.latency || {}) };
+  latency.models = { ...DEFAULT_LATENCY.models, ...((spec.latency || {}).models || {}) };
+  const { traced } = trace;
+  const picturesPath = spec.pictures || path.join(require("os").tmpdir(), "dt-mock-pictures");
+  const maxRuns = Number.isFinite(spec.maxRuns) ? spec.maxRuns : Infinity;
+  let random = Math.random;
+
+  const state = {
+    runs: 0,
+    loadedModel: null,
+    zoom: 1,
+    topLeft: { x: 0, y: 0 },
+    size: { width: 1024, height: 1024 },
+    image: null
+  };
+  const initialImage = spec.canvas && spec.canvas.image !== undefined
+    ? spec.canvas.image
+    : { x: 0, y: 0, width: 1024, height: 1024 };
+  if (initialImage) state.image = new Rectangle(initialImage.x || 0, initialImage.y || 0, initialImage.width, initialImage.height);
+  const faces = (spec.canvas && spec.canvas.faces) || [{ origin: { x: 412, y: 300 }, size: { width: 200, height: 220 } }];
+
+  // --------------------------------------------------------------------------
+  // Masks
+  // --------------------------------------------------------------------------
+
+  function Mask(width, height, value) {
+    if (!(this instanceof Mask)) return new Mask(width, height, value);
+    this.width = width;
+    this.height = height;
+    this.value = value;
+    this.fills = 0;
+  }
+  Mask.prototype.fillRectangle = traced("mask.fillRectangle", function (x, y, width, height, value) {
+    this.fills++;
+  });
+  Object.defineProperty(Mask.prototype, "src", { get() { return MOCK_IMAGE_SRC; } });
+
+  const namedMask = api => traced(api, () => new Mask(state.size.width, state.size.height, 1),
+                                  { cost: () => latency.maskMs, describe: () => undefined });
+
+  // --------------------------------------------------------------------------
+  // pipeline
+  // --------------------------------------------------------------------------
+
+  const configuration = { ...DEFAULT_CONFIGURATION, ...(spec.configuration || {}) };
+
+  function runCost(options) {
+    const config = (options && options.configuration) || configuration;
+    const megapixels = (config.width * config.height) / 1e6;
+    const strength = Number.isFinite(config.strength) ? Math.max(0, Math.min(1, config.strength)) : 1;
+    const steps = (config.steps || 0) * strength;
+    const rate = latency.models[config.model] ?? latency.msPerMegapixelStep;
+    let ms = latency.runBaseMs + megapixels * steps * rate;
+    if (config.upscaler) ms += latency.upscalerMs;
+    return ms;
+  }
+
+  function describeRun(options = {}) {
+    const config = options.configuration || configuration;
+    const names = list => (Array.isArray(list) ? list.filter(Boolean).map(item => item.file || item.name || String(item)) : []);
+    return {
+      model: config.model ?? null,
+      width: config.width,
+      height: config.height,
+      steps: config.steps,
+      strength: config.strength,
+      sampler: config.sampler,
+      seed: config.seed,
+      upscaler: config.upscaler ?? null,
+      hiresFix: !!config.hiresFix,
+      loras: names(config.loras),
+      controls: names(config.controls),
+      mask: !!options.mask,
+      prompt: options.prompt ?? null,
+      negativePrompt: options.negativePrompt ?? null
+    };
+  }
+
+  const pipeline = {
+    configuration,
+    prompts: { prompt: "a photo of a cat", negativePrompt: "", ...(spec.prompts || {}) },
+
+    run: traced("pipeline.run", function (options = {}) {
+      if (state.runs >= maxRuns) throw new StopRun(`maxRuns (${maxRuns}) reached`);
+      state.runs++;
+      const config = options.configuration || configuration;
+      const switchCost = state.loadedModel !== null && config.model !== state.loadedModel ? latency.modelSwitchMs : 0;
+      clock.advance(switchCost);
+      state.loadedModel = config.model;
+
+      // The app leaves the last run's configuration on screen, with the seed resolved.
+      Object.assign(configuration, config);
+      if (!Number.isFinite(configuration.seed) || configuration.seed < 0) {
+        configuration.seed = Math.floor(random() * 4294967295);
+      }
+      const rendered = new Rectangle(state.topLeft.x, state.topLeft.y,
+                                     config.width / state.zoom, config.height / state.zoom);
+      state.image = Rectangle.union(state.image, rendered);
+      if (config.upscaler && !(config.strength > 0)) {
+        const match = /(\d)x/i.exec(String(config.upscaler));
+        const factor = config.upscalerScaleFactor || (match ? Number(match[1]) : 2);
+        state.image = new Rectangle(state.image.x, state.image.y, state.image.width * factor, state.image.height * factor);
+      }
+    }, { cost: runCost, describe: describeRun }),
+
+    downloadBuiltins: traced("pipeline.downloadBuiltins", function (names) {
+      return names;
+    }, { cost: names => latency.downloadMs * (Array.isArray(names) ? names.length : 1) }),
+
+    downloadBuiltin: traced("pipeline.downloadBuiltin", function (name) {
+      return name;
+    }, { cost: () => latency.downloadMs }),
+
+    areModelsDownloaded: traced("pipeline.areModelsDownloaded", function () {
+      return true;
+    }),
+
+    findLoRAByName: traced("pipeline.findLoRAByName", function (name) {
+      const known = (spec.loras || {})[name];
+      return { file: known || `${slug(name)}_lora_f16.ckpt`, weight: 1 };
+    }, { summarize: result => result.file }),
+
+    findControlByName: traced("pipeline.findControlByName", function (name) {
+      const known = (spec.controls || {})[name];
+      return {
+        name, file: known || `${slug(name)}_f16.ckpt`, weight: 1,
+        guidanceStart: 0, guidanceEnd: 1, noPrompt: false, globalAveragePooling: false,
+        downSamplingRate: 1, controlImportance: "balanced", targetBlocks: []
+      };
+    }, { summarize: result => result.file })
+  };
+
+  // --------------------------------------------------------------------------
+  // canvas
+  // --------------------------------------------------------------------------
+
+  const emptyBox = () => new Rectangle(0, 0, 0, 0);
+
+  const canvasMethods = {
+    clear: traced("canvas.clear", function () { state.image = null; }),
+    updateCanvasSize: traced("canvas.updateCanvasSize", function (config) {
+      state.size = { width: config.width, height: config.height };
+    }, { describe: config => ({ width: config.width, height: config.height }) }),
+    moveCanvas: traced("canvas.moveCanvas", function (x, y) {
+      if (x && typeof x === "object") {
+        state.topLeft = { x: x.x, y: x.y };
+        if (x.width > 0) state.zoom = state.size.width / x.width;
+      } else {
+        state.topLeft = { x, y };
+      }
+    }),
+    saveImage: traced("canvas.saveImage", function (file) {
+      return file;
+    }),
+    saveImageSrc: traced("canvas.saveImageSrc", function () {
+      return MOCK_IMAGE_SRC;
+    }, { summarize: () => "[src]" }),
+    loadImage: traced("canvas.loadImage", function () {
+      state.image = new Rectangle(0, 0, 1024, 1024);
+    }),
+    loadImageSrc: traced("canvas.loadImageSrc", function () {
+      state.image = new Rectangle(0, 0, 1024, 1024);
+    }),
+    detectFaces: traced("canvas.detectFaces", function () {
+      return faces.map(face => ({ origin: { ...face.origin }, size: { ...face.size } }));
+    }, { cost: () => latency.detectFacesMs, summarize: result => result.length }),
+    createMask: traced("canvas.createMask", function (width, height, value) {
+      return new Mask(width, height, value);
+    }),
+    clip: traced("canvas.clip", function (texts) {
+      return (texts || []).map(() => random());
+    }),
+    bodyMask: namedMask("canvas.bodyMask"),
+    notify: traced("canvas.notify", function () {})
+  };
+
+  const canvasProperties = {
+    boundingBox: { get: () => (state.image ? new Rectangle(state.image.x, state.image.y, state.image.width, state.image.height) : emptyBox()) },
+    topLeftCorner: { get: () => new Point(state.topLeft.x, state.topLeft.y) },
+    canvasZoom: {
+      get: () => state.zoom,
+      set: traced("canvas.canvasZoom=", value => { state.zoom = value; })
+    },
+    foregroundMask: { get: namedMask("canvas.foregroundMask") },
+    backgroundMask: { get: namedMask("canvas.backgroundMask") },
+    currentMask: { get: () => new Mask(state.size.width, state.size.height, 0) }
+  };
+
+  // Anything else (load*FromSrc, clearMoodboard, extractDepthMapFromSrc, ...)
+  // becomes a traced no-op so scripts using newer APIs still run.
+  const dynamicMethods = new Map();
+  const canvasTarget = Object.defineProperties({ ...canvasMethods }, canvasProperties);
+  const canvas = new Proxy(canvasTarget, {
+    get(target, key, receiver) {
+      if (key in target || typeof key !== "string") return Reflect.get(target, key, receiver);
+      if (!dynamicMethods.has(key)) dynamicMethods.set(key, traced(`canvas.${key}`, function () {}));
+      return dynamicMethods.get(key);
+    }
+  });
+
+  // --------------------------------------------------------------------------
+  // filesystem, device
+  // --------------------------------------------------------------------------
+
+  function readEntries(directory) {
+    const stubbed = (spec.files || {})[directory];
+    if (stubbed) return stubbed.map(name => path.join(directory, name));
+    try {
+      return fs.readdirSync(directory).map(name => path.join(directory, name));
+    } catch {
+      return [];
+    }
+  }
+
+  const filesystem = {
+    pictures: {
+      path: picturesPath,
+      readEntries: traced("filesystem.pictures.readEntries", function (subdir = "") {
+        const stubbed = (spec.files || {})[subdir];
+        if (stubbed) return stubbed.map(name => path.join(picturesPath, subdir, name));
+        return readEntries(path.join(picturesPath, subdir));
+      }, { summarize: result => result.length })
+    },
+    readEntries: traced("filesystem.readEntries", readEntries, { summarize: result => result.length })
+  };
+
+  const device = { screenSize: { width: 1512, height: 982, ...((spec.device || {}).screenSize || {}) } };
+
+  return {
+    state,
+    pipeline,
+    canvas,
+    filesystem,
+    device,
+    Mask,
+    setRandom(fn) { random = fn; }
+  };
+}
+
+function slug(name) {
+  return String(name).toLowerCase().replace(/[^a-z0-9]+/g, "_").replace(/^_|_$/g, "");
+}
+
+// ============================================================================
+// requestFromUser
+// ============================================================================
+
+/**
+ * Widget builder bound as `this` inside construction closures. Each widget is a
+ * descriptor; the dialog result mirrors the tree with default values, which
+ * scripted answers can then override by path ("0.0.1") or by widget label.
+ */
+function createWidgetBuilder(picturesPath) {
+  const widget = (kind, value, label, extra = {}) => ({ __widget: kind, value, label, ...extra });
+  const builder = {
+    section: (title, detail, views) => widget("section", null, title, { children: views || [] }),
+    segmented: (index, options) => widget("segmented", index, null, { options }),
+    menu: (index, options) => widget("menu", index, null, { options }),
+    slider: (value, type, min, max, title) => widget("slider", value, title, { min, max }),
+    switch: (isOn, title) => widget("switch", !!isOn, title),
+    textField: (value, placeholder) => widget("textField", value ?? "", placeholder),
+    comboBox: (value, options) => widget("comboBox", value, null, { options }),
+    customTextButton: (selected, options) => widget("customTextButton", selected, null, { options }),
+    multiselectButton: (selected, options) => widget("multiselectButton", selected, null, { options }),
+    directory: value => widget("directory", value ?? picturesPath, "directory"),
+    imageField: (title, multiSelect) => widget("imageField", multiSelect ? [] : null, title),
+    image: (src, height, selectable) => widget("image", selectable ? 0 : null, null),
+    size: (width, height) => widget("size", { width, height }, "size"),
+    plainText: value => widget("plainText", null, null)
+  };
+  builder.slider.percent = "percent";
+  builder.slider.scale = "scale";
+  builder.slider.fractional = k => `fractional(${k})`;
+  builder.slider.integer = step => `integer(${step})`;
+  return builder;
+}
+
+function widgetValues(node) {
+  if (Array.isArray(node)) return node.map(widgetValues);
+  if (node && node.__widget === "section") return node.children.map(widgetValues);
+  if (node && node.__widget) return node.value;
+  return node ?? null;
+}
+
+function findByLabel(node, label, at = []) {
+  if (Array.isArray(node)) {
+    for (let i = 0; i < node.length; i++) {
+      const found = findByLabel(node[i], label, at.concat(i));
+      if (found) return found;
+    }
+    return null;
+  }
+  if (!node || !node.__widget) return null;
+  if (node.__widget === "section") {
+    if (node.label === label) return at;
+    return findByLabel(node.children, label, at);
+  }
+  return node.label === label ? at : null;
+}
+
+function setPath(values, at, value) {
+  let target = values;
+  for (const index of at.slice(0, -1)) target = target[index];
+  target[at[at.length - 1]] = value;
+}
+
+// ============================================================================
+// Runner
+// ============================================================================
+
+/**
+ * Small seeded PRNG (mulberry32) so repeated runs make the same choices.
+ */
+function seededRandom(seed) {
+  let a = seed >>> 0;
+  return function () {
+    a = (a + 0x6d2b79f5) >>> 0;
+    let t = a;
+    t = Math.imul(t ^ (t >>> 15), t | 1);
+    t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+}
+
+function createTimers(clock) {
+  const queue = [];
+  let nextId = 1;
+  return {
+    setTimeout(fn, ms = 0, ...args) {
+      const id = nextId++;
+      queue.push({ id, due: clock.now() + Math.max(0, ms), fn, args });
+      queue.sort((a, b) => a.due - b.due || a.id - b.id);
+      return id;
+    },
+    clearTimeout(id) {
+      const index = queue.findIndex(timer => timer.id === id);
+      if (index >= 0) queue.splice(index, 1);
+    },
+    async drain(limit = 100000) {
+      for (let fired = 0; fired < limit; fired++) {
+        await new Promise(resolve => setImmediate(resolve));
+        const timer = queue.shift();
+        if (!timer) return;
+        clock.advance(timer.due - clock.now());
+        timer.fn(...timer.args);
+      }
+    }
+  };
+}
+
+async function runScript(spec) {
+  const clock = createClock();
+  const trace = createTrace(clock, !!spec.echo);
+  const host = createHost(spec, clock, trace);
+  const timers = createTimers(clock);
+  const answers = spec.answers || {};
+  let dialogs = 0;
+
+  const RealDate = Date;
+  class ScriptDate extends RealDate {
+    constructor(...args) {
+      if (args.length === 0) super(clock.epoch + clock.now());
+      else super(...args);
+    }
+    static now() {
+      return clock.epoch + clock.now();
+    }
+  }
+
+  const requestFromUser = trace.traced("requestFromUser", function (title, confirm, construction) {
+    const index = dialogs++;
+    const tree = typeof construction === "function"
+      ? construction.call(createWidgetBuilder(host.filesystem.pictures.path))
+      : [];
+    const values = widgetValues(tree || []);
+    const overrides = (Array.isArray(answers) ? answers[index] : answers[title] ?? answers[String(index)]) || {};
+    for (const [key, value] of Object.entries(overrides)) {
+      const at = /^\d+(\.\d+)*$/.test(key) ? key.split(".").map(Number) : findByLabel(tree, key);
+      if (!at) throw new Error(`requestFromUser("${title}"): no widget for answer key "${key}"`);
+      setPath(values, at, value);
+    }
+    return values;
+  }, { describe: (title, confirm) => ({ title, confirm }), summarize: sanitize });
+
+  const sandbox = {
+    pipeline: host.pipeline,
+    canvas: host.canvas,
+    filesystem: host.filesystem,
+    device: host.device,
+    SamplerType: SAMPLER_TYPE,
+    Rectangle,
+    Point,
+    Mask: host.Mask,
+    ImageMetadata,
+    requestFromUser,
+    __dtSleep: trace.traced("__dtSleep", () => {}, { cost: seconds => (Number(seconds) || 0) * 1000 }),
+    console: {
+      log: (...args) => trace.log("log", args),
+      info: (...args) => trace.log("log", args),
+      warn: (...args) => trace.log("warn", args),
+      error: (...args) => trace.log("error", args),
+      debug: (...args) => trace.log("log", args)
+    },
+    setTimeout: timers.setTimeout,
+    clearTimeout: timers.clearTimeout,
+    Date: ScriptDate
+  };
+  const context = vm.createContext(sandbox);
+  const random = seededRandom(Number.isFinite(spec.seed) ? spec.seed : 1);
+  host.setRandom(random);
+  context.__seededRandom = random;
+  vm.runInContext("Math.random = __seededRandom; delete globalThis.__seededRandom;", context);
+
+  const result = { script: spec.name || null, events: trace.events, truncated: false, error: null };
+  try {
+    // Draw Things evaluates scripts as a function body, so top-level `return` is legal.
+    const wrapped = `(function () {\n${spec.source}\n})`;
+    const fn = new vm.Script(wrapped, { filename: spec.name || "script.js", lineOffset: -1 }).runInContext(context);
+    const value = fn.call(context);
+    await timers.drain();
+    if (value && typeof value.then === "function") await value;
+    await timers.drain();
+  } catch (error) {
+    if (error instanceof StopRun) {
+      result.truncated = true;
+    } else {
+      result.error = { message: String((error && error.message) || error), stack: error && error.stack };
+    }
+  }
+  result.runs = host.state.runs;
+  result.simulatedMs = round(clock.simulated);
+  result.wallMs = round(clock.real());
+  return result;
+}
+
+async function main() {
+  const input = fs.readFileSync(process.argv[2] || 0, "utf8");
+  const result = await runScript(JSON.parse(input));
+  process.stdout.write(JSON.stringify(result));
+}
+
+if (require.main === module) {
+  main().catch(error => {
+    process.stderr.write(`${error.stack || error}\n`);
+    process.exit(2);
+  });
+}
+
+module.exports = { runScript, DEFAULT_LATENCY, DEFAULT_CONFIGURATION };
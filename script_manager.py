@@ -0,0 +1,2791 @@
+#!/usr/bin/env python3
+"""Manage the Draw Things script registry (custom_scripts.json).
+
+The registry is loaded once into name / file / tag indexes. Every add, update
+and remove is a dictionary operation on those indexes, and saving re-serializes
+only the entries that changed: untouched entries are written back from the
+exact text they were read from, in their original order.
+
+Usage:
+  python script_manager.py list [--tag TAG]
+  python script_manager.py show NAME
+  python script_manager.py add FILE [--name NAME] [--description TEXT] [--author NAME] [--tag TAG ...]
+  python script_manager.py update NAME [--file FILE] [--rename NEW] [--add-tag TAG] [--remove-tag TAG] ...
+  python script_manager.py remove NAME
+  python script_manager.py scan [--dry-run]
+  python script_manager.py assets externalize|inline|verify [--output PATH]
+  python script_manager.py bundle extract|restore SCRIPT ...
+  python script_manager.py install [NAME ...] [--dest DIR] [--assets inline|file|thumbnail] [--wildcards DIR] [--telemetry] [--profile]
+  python script_manager.py run NAME [--answers JSON] [--latency JSON] [--max-runs N] [--trace FILE]
+  python script_manager.py bench [NAME ...] [--update-baseline] [--repeat N]
+  python script_manager.py estimate NAME [--image WxH] [--batch N] [--iterate] [--set KEY=VALUE] [--const NAME=VALUE]
+  python script_manager.py calibrate MODEL SECONDS [--size WxH] [--steps N]
+  python script_manager.py wildcards DIR [--script NAME] [--verbose]
+  python script_manager.py expand NAME [--prompt TEXT] [--samples N] [--histogram] [--export FILE [--match REGEX]]
+  python script_manager.py telemetry LOG ... [--by model,resolution] [--csv FILE]
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import binascii
+import hashlib
+import json
+import math
+import os
+import random
+import re
+import shutil
+import statistics
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+try:
+    import numpy
+except ImportError:  # optional: `expand` samples with the random module instead
+    numpy = None
+
+# ============================================================================
+# Constants
+# ============================================================================
+
+ROOT = Path(__file__).resolve().parent
+REGISTRY_FILE = ROOT / "custom_scripts.json"
+
+ASSET_DIR = ROOT / "assets"
+ASSET_PREFIX = "asset:"
+
+REQUIRED_FIELDS = ("name", "file")
+
+_WHITESPACE = re.compile(r"\s*")
+
+
+class RegistryError(Exception):
+    """Raised for invalid registry contents or operations."""
+
+
+# ============================================================================
+# Registry
+# ============================================================================
+
+@dataclass
+class _Record:
+    """A registry entry plus the exact text it was loaded from.
+
+    ``raw`` is cleared whenever the entry is modified, which marks it for
+    re-serialization on the next save.
+    """
+
+    data: dict[str, Any]
+    raw: str | None = None
+
+
+def _scan_entries(text: str) -> Iterator[tuple[dict[str, Any], str]]:
+    """Yields (entry, source_text) for each object in a top-level JSON array."""
+    decoder = json.JSONDecoder()
+    pos = _WHITESPACE.match(text, 0).end()
+    if text[pos:pos + 1] != "[":
+        raise RegistryError("registry must be a JSON array")
+    pos = _WHITESPACE.match(text, pos + 1).end()
+    if text[pos:pos + 1] == "]":
+        return
+    while True:
+        try:
+            entry, end = decoder.raw_decode(text, pos)
+        except json.JSONDecodeError as error:
+            raise RegistryError(f"invalid registry JSON: {error}") from None
+        if not isinstance(entry, dict):
+            raise RegistryError(f"registry entries must be objects (offset {pos})")
+        yield entry, text[pos:end]
+        pos = _WHITESPACE.match(text, end).end()
+        token = text[pos:pos + 1]
+        if token == "]":
+            return
+        if token != ",":
+            raise RegistryError(f"expected ',' or ']' at offset {pos}")
+        pos = _WHITESPACE.match(text, pos + 1).end()
+
+
+def _serialize_entry(entry: dict[str, Any]) -> str:
+    """Serializes an entry the way json.dump(indent=2) lays out array items."""
+    return json.dumps(entry, indent=2, ensure_ascii=False).replace("\n", "\n  ")
+
+
+def default_name_for(file_name: str) -> str:
+    """Derives a display name from a script filename ("sd-ultimate-upscale.js" -> "Sd Ultimate Upscale")."""
+    stem = Path(file_name).stem
+    return re.sub(r"[-_\s]+", " ", stem).strip().title()
+
+
+class Registry:
+    """Indexed, incrementally-saved view of custom_scripts.json."""
+
+    def __init__(self, path: Path | str = REGISTRY_FILE):
+        self.path = Path(path)
+        # Records are keyed by a slot number that never changes, so file order
+        # survives renames and removals without reshuffling anything.
+        self._records: dict[int, _Record] = {}
+        self._by_name: dict[str, int] = {}
+        self._by_file: dict[str, int] = {}
+        self._by_tag: dict[str, dict[int, None]] = {}
+        self._next_slot = 0
+        self._modified = False
+        if self.path.exists():
+            self._load(self.path.read_text(encoding="utf-8"))
+
+    def _load(self, text: str) -> None:
+        for entry, raw in _scan_entries(text):
+            self._validate(entry)
+            self._insert(self._next_slot, _Record(entry, raw))
+            self._next_slot += 1
+
+    # ------------------------------------------------------------------
+    # Index maintenance
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _validate(entry: dict[str, Any]) -> None:
+        for field in REQUIRED_FIELDS:
+            if not isinstance(entry.get(field), str) or not entry[field]:
+                raise RegistryError(f"entry is missing required field '{field}': {entry.get('name', '?')}")
+        tags = entry.get("tags", [])
+        if not isinstance(tags, list) or not all(isinstance(tag, str) for tag in tags):
+            raise RegistryError(f"tags must be a list of strings: {entry['name']}")
+
+    def _check_unique(self, entry: dict[str, Any], slot: int | None = None) -> None:
+        owner = self._by_name.get(entry["name"])
+        if owner is not None and owner != slot:
+            raise RegistryError(f"duplicate script name: {entry['name']}")
+        owner = self._by_file.get(entry["file"])
+        if owner is not None and owner != slot:
+            name = self._records[owner].data["name"]
+            raise RegistryError(f"{entry['file']} is already registered as '{name}'")
+
+    def _insert(self, slot: int, record: _Record) -> None:
+        self._check_unique(record.data)
+        self._records[slot] = record
+        self._index(slot, record.data)
+
+    def _index(self, slot: int, entry: dict[str, Any]) -> None:
+        self._by_name[entry["name"]] = slot
+        self._by_file[entry["file"]] = slot
+        for tag in entry.get("tags", []):
+            self._by_tag.setdefault(tag, {})[slot] = None
+
+    def _unindex(self, slot: int, entry: dict[str, Any]) -> None:
+        del self._by_name[entry["name"]]
+        del self._by_file[entry["file"]]
+        for tag in entry.get("tags", []):
+            members = self._by_tag.get(tag)
+            if members is not None:
+                members.pop(slot, None)
+                if not members:
+                    del self._by_tag[tag]
+
+    def _slot(self, name: str) -> int:
+        slot = self._by_name.get(name)
+        if slot is None:
+            raise RegistryError(f"no script named '{name}'")
+        return slot
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._by_name
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        return (record.data for record in self._records.values())
+
+    @property
+    def modified(self) -> bool:
+        return self._modified
+
+    def get(self, name: str) -> dict[str, Any] | None:
+        slot = self._by_name.get(name)
+        return self._records[slot].data if slot is not None else None
+
+    def by_file(self, file_name: str) -> dict[str, Any] | None:
+        slot = self._by_file.get(file_name)
+        return self._records[slot].data if slot is not None else None
+
+    def with_tag(self, tag: str) -> list[dict[str, Any]]:
+        return [self._records[slot].data for slot in self._by_tag.get(tag, {})]
+
+    def tags(self) -> dict[str, int]:
+        return {tag: len(members) for tag, members in self._by_tag.items()}
+
+    def script_path(self, entry: dict[str, Any]) -> Path:
+        return self.path.parent / entry["file"]
+
+    # ------------------------------------------------------------------
+    # Mutations
+    # ------------------------------------------------------------------
+
+    def add(self, entry: dict[str, Any]) -> dict[str, Any]:
+        entry = dict(entry)
+        entry.setdefault("description", "")
+        entry.setdefault("author", "")
+        self._validate(entry)
+        self._insert(self._next_slot, _Record(entry))
+        self._next_slot += 1
+        self._modified = True
+        return entry
+
+    def update(self, name: str, changes: dict[str, Any]) -> dict[str, Any]:
+        """Applies field changes to an entry. A value of None deletes the field."""
+        slot = self._slot(name)
+        record = self._records[slot]
+        updated = dict(record.data)
+        for field, value in changes.items():
+            if value is None:
+                if field in REQUIRED_FIELDS:
+                    raise RegistryError(f"cannot delete required field '{field}'")
+                updated.pop(field, None)
+            else:
+                updated[field] = value
+        self._validate(updated)
+        if updated == record.data:
+            return record.data
+        self._check_unique(updated, slot)
+
+        self._unindex(slot, record.data)
+        self._records[slot] = _Record(updated)
+        self._index(slot, updated)
+        self._modified = True
+        return updated
+
+    def remove(self, name: str) -> dict[str, Any]:
+        slot = self._slot(name)
+        record = self._records.pop(slot)
+        self._unindex(slot, record.data)
+        self._modified = True
+        return record.data
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def dumps(self) -> str:
+        if not self._records:
+            return "[]"
+        parts = []
+        for record in self._records.values():
+            if record.raw is None:
+                record.raw = _serialize_entry(record.data)
+            parts.append(record.raw)
+        return "[\n  " + ",\n  ".join(parts) + "\n]"
+
+    def save(self, force: bool = False) -> bool:
+        """Atomically writes the registry if anything changed. Returns True if written."""
+        if not (self._modified or force):
+            return False
+        _atomic_write(self.path, self.dumps())
+        self._modified = False
+        return True
+
+
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+_DEFAULT_FILE_MODE = 0o666 & ~_UMASK
+
+
+def _atomic_write(path: Path, content: str | bytes) -> None:
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.chmod(tmp_name, path.stat().st_mode & 0o777 if path.exists() else _DEFAULT_FILE_MODE)
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+
+def unregistered_scripts(registry: Registry) -> list[Path]:
+    """Scripts next to the registry that have no entry (dotfiles are skipped)."""
+    return sorted(
+        path for path in registry.path.parent.glob("*.js")
+        if not path.name.startswith(".") and registry.by_file(path.name) is None
+    )
+
+
+# ============================================================================
+# Asset Store
+# ============================================================================
+
+# Some entries carry the prefix twice ("data:image/png;base64,data:image/png;base64,...");
+# the repeated group swallows any number of copies.
+_DATA_URI = re.compile(r"^(?:data:(image/[\w.+-]+);base64,)+(.*)$", re.S)
+
+_MIME_EXTENSIONS = {
+    "image/png": ".png",
+    "image/jpeg": ".jpg",
+    "image/webp": ".webp",
+    "image/gif": ".gif",
+}
+_EXTENSION_MIMES = {ext: mime for mime, ext in _MIME_EXTENSIONS.items()}
+
+
+def parse_data_uri(value: str) -> tuple[str, bytes] | None:
+    """Returns (mime, payload) for a base64 image data URI, or None if it is not one."""
+    match = _DATA_URI.match(value)
+    if not match:
+        return None
+    try:
+        return match.group(1), base64.b64decode(match.group(2), validate=True)
+    except binascii.Error:
+        return None
+
+
+def make_data_uri(mime: str, payload: bytes) -> str:
+    return f"data:{mime};base64,{base64.b64encode(payload).decode('ascii')}"
+
+
+class AssetStore:
+    """Content-addressed sidecar directory for images pulled out of the registry.
+
+    Blobs are stored as ``<sha256><ext>`` and referenced from registry fields as
+    ``asset:<sha256><ext>``. Identical blobs share one file, and nothing is read
+    from disk until a reference is resolved.
+    """
+
+    def __init__(self, directory: Path | str = ASSET_DIR):
+        self.directory = Path(directory)
+        self._cache: dict[str, bytes] = {}
+
+    @staticmethod
+    def is_ref(value: Any) -> bool:
+        return isinstance(value, str) and value.startswith(ASSET_PREFIX)
+
+    def put(self, mime: str, payload: bytes) -> tuple[str, bool]:
+        """Stores a blob and returns (reference, newly_written)."""
+        name = hashlib.sha256(payload).hexdigest() + _MIME_EXTENSIONS.get(mime, ".bin")
+        path = self.directory / name
+        written = not path.exists()
+        if written:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            _atomic_write(path, payload)
+        self._cache[name] = payload
+        return ASSET_PREFIX + name, written
+
+    def path_for(self, ref: str) -> Path:
+        return self.directory / ref[len(ASSET_PREFIX):]
+
+    def load(self, ref: str) -> bytes:
+        name = ref[len(ASSET_PREFIX):]
+        payload = self._cache.get(name)
+        if payload is None:
+            path = self.directory / name
+            if not path.exists():
+                raise RegistryError(f"missing asset {name} in {self.directory}")
+            payload = self._cache[name] = path.read_bytes()
+        return payload
+
+    def data_uri(self, ref: str) -> str:
+        suffix = Path(ref).suffix
+        return make_data_uri(_EXTENSION_MIMES.get(suffix, "application/octet-stream"), self.load(ref))
+
+    def verify(self, ref: str) -> bool:
+        """True if the referenced file exists and still matches its hash."""
+        path = self.path_for(ref)
+        return path.exists() and hashlib.sha256(path.read_bytes()).hexdigest() == path.stem
+
+
+def _map_strings(value: Any, transform: Callable[[str], str]) -> Any:
+    """Applies transform to every string nested in lists / dicts, preserving structure."""
+    if isinstance(value, str):
+        return transform(value)
+    if isinstance(value, list):
+        return [_map_strings(item, transform) for item in value]
+    if isinstance(value, dict):
+        return {key: _map_strings(item, transform) for key, item in value.items()}
+    return value
+
+
+def _iter_strings(value: Any) -> Iterator[str]:
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, list):
+        for item in value:
+            yield from _iter_strings(item)
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _iter_strings(item)
+
+
+def _rewrite_strings(registry: Registry, transform: Callable[[str], str]) -> int:
+    """Runs transform over every optional field and updates changed entries. Returns the count."""
+    changed = 0
+    for entry in list(registry):
+        changes = {}
+        for key, value in entry.items():
+            if key in REQUIRED_FIELDS:
+                continue
+            rewritten = _map_strings(value, transform)
+            if rewritten != value:
+                changes[key] = rewritten
+        if changes:
+            registry.update(entry["name"], changes)
+            changed += 1
+    return changed
+
+
+@dataclass
+class AssetStats:
+    entries: int = 0
+    blobs: int = 0
+    written: int = 0
+    text_bytes: int = 0
+
+
+def externalize_assets(registry: Registry, store: AssetStore) -> AssetStats:
+    """Replaces every data-URI image in the registry with an asset reference."""
+    stats = AssetStats()
+
+    def externalize(value: str) -> str:
+        parsed = parse_data_uri(value)
+        if parsed is None:
+            return value
+        ref, written = store.put(*parsed)
+        stats.blobs += 1
+        stats.written += written
+        stats.text_bytes += len(value)
+        return ref
+
+    stats.entries = _rewrite_strings(registry, externalize)
+    return stats
+
+
+def inline_assets(registry: Registry, store: AssetStore) -> AssetStats:
+    """Replaces every asset reference with a data URI, normalizing malformed prefixes on the way."""
+    stats = AssetStats()
+
+    def inline(value: str) -> str:
+        if store.is_ref(value):
+            uri = store.data_uri(value)
+        else:
+            parsed = parse_data_uri(value)
+            if parsed is None:
+                return value
+            uri = make_data_uri(*parsed)
+            if uri == value:
+                return value
+        stats.blobs += 1
+        stats.text_bytes += len(uri)
+        return uri
+
+    stats.entries = _rewrite_strings(registry, inline)
+    return stats
+
+
+def asset_refs(registry: Registry) -> Iterator[tuple[str, str]]:
+    """Yields (script name, reference) for every asset reference in the registry."""
+    for entry in registry:
+        for value in _iter_strings(entry):
+            if AssetStore.is_ref(value):
+                yield entry["name"], value
+
+
+# ============================================================================
+# PNG Thumbnails
+# ============================================================================
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+_PNG_CHANNELS = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}
+
+
+def _png_chunks(data: bytes) -> Iterator[tuple[bytes, bytes]]:
+    if not data.startswith(_PNG_SIGNATURE):
+        raise ValueError("not a PNG image")
+    pos = len(_PNG_SIGNATURE)
+    while pos + 8 <= len(data):
+        length, kind = struct.unpack(">I4s", data[pos:pos + 8])
+        yield kind, data[pos + 8:pos + 8 + length]
+        pos += 12 + length
+
+
+def _paeth(a: int, b: int, c: int) -> int:
+    p = a + b - c
+    pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+    if pa <= pb and pa <= pc:
+        return a
+    return b if pb <= pc else c
+
+
+def _unfilter(raw: bytes, width: int, height: int, bpp: int) -> bytearray:
+    stride = width * bpp
+    out = bytearray(stride * height)
+    previous = bytearray(stride)
+    pos = 0
+    for y in range(height):
+        kind = raw[pos]
+        line = bytearray(raw[pos + 1:pos + 1 + stride])
+        pos += 1 + stride
+        if kind == 1:
+            for i in range(bpp, stride):
+                line[i] = (line[i] + line[i - bpp]) & 0xFF
+        elif kind == 2:
+            for i in range(stride):
+                line[i] = (line[i] + previous[i]) & 0xFF
+        elif kind == 3:
+            for i in range(stride):
+                left = line[i - bpp] if i >= bpp else 0
+                line[i] = (line[i] + ((left + previous[i]) >> 1)) & 0xFF
+        elif kind == 4:
+            for i in range(stride):
+                left = line[i - bpp] if i >= bpp else 0
+                upper_left = previous[i - bpp] if i >= bpp else 0
+                line[i] = (line[i] + _paeth(left, previous[i], upper_left)) & 0xFF
+        elif kind != 0:
+            raise ValueError(f"unknown PNG filter {kind}")
+        out[y * stride:(y + 1) * stride] = line
+        previous = line
+    return out
+
+
+@dataclass
+class _Bitmap:
+    width: int
+    height: int
+    rgba: bytearray
+    palette: list[tuple[int, int, int, int]] | None = None
+
+
+def png_decode(data: bytes) -> _Bitmap:
+    """Decodes 8-bit, non-interlaced PNGs (the format the bundled script images use)."""
+    header, palette, alpha, idat = None, None, b"", []
+    for kind, body in _png_chunks(data):
+        if kind == b"IHDR":
+            header = struct.unpack(">IIBBBBB", body)
+        elif kind == b"PLTE":
+            palette = [tuple(body[i:i + 3]) for i in range(0, len(body), 3)]
+        elif kind == b"tRNS":
+            alpha = body
+        elif kind == b"IDAT":
+            idat.append(body)
+    if header is None:
+        raise ValueError("PNG has no IHDR chunk")
+    width, height, depth, color_type, _, _, interlace = header
+    if depth != 8 or interlace or color_type not in _PNG_CHANNELS:
+        raise ValueError(f"unsupported PNG (depth {depth}, color type {color_type}, interlace {interlace})")
+    channels = _PNG_CHANNELS[color_type]
+    pixels = _unfilter(zlib.decompress(b"".join(idat)), width, height, channels)
+
+    rgba = bytearray(width * height * 4)
+    rgba_palette = None
+    if color_type == 3:
+        if palette is None:
+            raise ValueError("indexed PNG has no palette")
+        rgba_palette = [(*rgb, alpha[i] if i < len(alpha) else 255) for i, rgb in enumerate(palette)]
+        for i, index in enumerate(pixels):
+            rgba[i * 4:i * 4 + 4] = bytes(rgba_palette[index])
+    else:
+        for i in range(width * height):
+            px = pixels[i * channels:(i + 1) * channels]
+            if channels == 1:
+                rgba[i * 4:i * 4 + 4] = bytes((px[0], px[0], px[0], 255))
+            elif channels == 2:
+                rgba[i * 4:i * 4 + 4] = bytes((px[0], px[0], px[0], px[1]))
+            elif channels == 3:
+                rgba[i * 4:i * 4 + 4] = bytes((*px, 255))
+            else:
+                rgba[i * 4:i * 4 + 4] = px
+    return _Bitmap(width, height, rgba, rgba_palette)
+
+
+def _downscale(bitmap: _Bitmap, max_side: int) -> _Bitmap:
+    """Box-filter downscale so the longest side is at most max_side."""
+    scale = max(bitmap.width, bitmap.height) / max_side
+    if scale <= 1:
+        return bitmap
+    width = max(1, round(bitmap.width / scale))
+    height = max(1, round(bitmap.height / scale))
+    src, src_w = bitmap.rgba, bitmap.width
+    out = bytearray(width * height * 4)
+    for y in range(height):
+        y0, y1 = y * bitmap.height // height, max(y * bitmap.height // height + 1, (y + 1) * bitmap.height // height)
+        for x in range(width):
+            x0, x1 = x * src_w // width, max(x * src_w // width + 1, (x + 1) * src_w // width)
+            totals = [0, 0, 0, 0]
+            for sy in range(y0, y1):
+                row = sy * src_w
+                for sx in range(x0, x1):
+                    offset = (row + sx) * 4
+                    totals[0] += src[offset]
+                    totals[1] += src[offset + 1]
+                    totals[2] += src[offset + 2]
+                    totals[3] += src[offset + 3]
+            count = (y1 - y0) * (x1 - x0)
+            out[(y * width + x) * 4:(y * width + x) * 4 + 4] = bytes(total // count for total in totals)
+    return _Bitmap(width, height, out, bitmap.palette)
+
+
+def _png_chunk(kind: bytes, body: bytes) -> bytes:
+    return struct.pack(">I", len(body)) + kind + body + struct.pack(">I", zlib.crc32(kind + body))
+
+
+def _filter_rows(pixels: bytes, stride: int, height: int, bpp: int) -> bytes:
+    """Picks the filter with the smallest absolute sum per row (the usual libpng heuristic)."""
+    out = bytearray()
+    previous = bytes(stride)
+    for y in range(height):
+        line = pixels[y * stride:(y + 1) * stride]
+        candidates = []
+        for kind in range(5):
+            filtered = bytearray(stride)
+            for i in range(stride):
+                left = line[i - bpp] if i >= bpp else 0
+                up = previous[i]
+                upper_left = previous[i - bpp] if i >= bpp else 0
+                predictor = (0, left, up, (left + up) >> 1, _paeth(left, up, upper_left))[kind]
+                filtered[i] = (line[i] - predictor) & 0xFF
+            cost = sum(value if value < 128 else 256 - value for value in filtered)
+            candidates.append((cost, kind, filtered))
+        _, kind, filtered = min(candidates)
+        out.append(kind)
+        out += filtered
+        previous = line
+    return bytes(out)
+
+
+def png_encode(bitmap: _Bitmap) -> bytes:
+    """Encodes a bitmap as the smallest of indexed / RGB / RGBA, compressed at level 9."""
+    count = bitmap.width * bitmap.height
+    colors = [bytes(bitmap.rgba[i * 4:i * 4 + 4]) for i in range(count)]
+    opaque = all(color[3] == 255 for color in colors)
+
+    if bitmap.palette is not None:
+        # Snap back onto the source palette so box-filtered thumbnails stay indexed.
+        lookup: dict[bytes, int] = {}
+        palette = bitmap.palette
+        indices = bytearray(count)
+        for i, color in enumerate(colors):
+            index = lookup.get(color)
+            if index is None:
+                index = lookup[color] = min(
+                    range(len(palette)),
+                    key=lambda p: sum((palette[p][c] - color[c]) ** 2 for c in range(4)))
+            indices[i] = index
+        header = struct.pack(">IIBBBBB", bitmap.width, bitmap.height, 8, 3, 0, 0, 0)
+        chunks = [_png_chunk(b"IHDR", header),
+                  _png_chunk(b"PLTE", b"".join(bytes(color[:3]) for color in palette))]
+        if not all(color[3] == 255 for color in palette):
+            chunks.append(_png_chunk(b"tRNS", bytes(color[3] for color in palette)))
+        stream = b"".join(b"\x00" + bytes(indices[y * bitmap.width:(y + 1) * bitmap.width])
+                          for y in range(bitmap.height))
+    else:
+        channels = 3 if opaque else 4
+        pixels = b"".join(color[:channels] for color in colors)
+        header = struct.pack(">IIBBBBB", bitmap.width, bitmap.height, 8, 2 if opaque else 6, 0, 0, 0)
+        chunks = [_png_chunk(b"IHDR", header)]
+        stream = _filter_rows(pixels, bitmap.width * channels, bitmap.height, channels)
+    chunks.append(_png_chunk(b"IDAT", zlib.compress(stream, 9)))
+    chunks.append(_png_chunk(b"IEND", b""))
+    return _PNG_SIGNATURE + b"".join(chunks)
+
+
+def make_thumbnail(payload: bytes, max_side: int) -> bytes:
+    """Downscaled, recompressed copy of a PNG; returns the original if that is smaller or unsupported."""
+    try:
+        thumbnail = png_encode(_downscale(png_decode(payload), max_side))
+    except (ValueError, zlib.error):
+        return payload
+    return thumbnail if len(thumbnail) < len(payload) else payload
+
+
+# ============================================================================
+# Script Bundling
+# ============================================================================
+
+DRAW_THINGS_SCRIPTS_DIR = Path.home() / "Library/Containers/com.liuliu.draw-things/Data/Documents/Scripts"
+PICTURES_DIR = Path.home() / "Pictures"
+PICTURES_ASSET_SUBDIR = "DrawThings/Scripts/assets"
+
+ASSET_MODES = ("inline", "file", "thumbnail")
+
+# Quoted image data URIs inside script source. JSON-style escaping of "/" as
+# "\/" shows up in some embedded images, so it is accepted and unescaped.
+_JS_DATA_URI = re.compile(r"""(["'])(data:image/[\w.+-]+;base64,(?:[A-Za-z0-9+/=]|\\/)+)\1""")
+_JS_ASSET_REF = re.compile(r"""(["'])asset:([0-9a-f]{64}\.\w+)\1""")
+
+
+@dataclass
+class BundleOptions:
+    asset_mode: str = "inline"
+    pictures_dir: Path = PICTURES_DIR
+    asset_subdir: str = PICTURES_ASSET_SUBDIR
+    thumbnail_size: int = 128
+    wildcards: Path | None = None
+    telemetry: bool = False
+    profile: bool = False
+
+
+def extract_script_assets(source: str, store: AssetStore) -> tuple[str, int]:
+    """Moves quoted data-URI images in a script into the store. Returns (source, count)."""
+    count = 0
+
+    def extract(match: re.Match) -> str:
+        nonlocal count
+        parsed = parse_data_uri(match.group(2).replace("\\/", "/"))
+        if parsed is None:
+            return match.group(0)
+        ref, _ = store.put(*parsed)
+        count += 1
+        return f'"{ref}"'
+
+    return _JS_DATA_URI.sub(extract, source), count
+
+
+def script_asset_refs(source: str) -> list[str]:
+    return [ASSET_PREFIX + match.group(2) for match in _JS_ASSET_REF.finditer(source)]
+
+
+def resolve_script_assets(source: str, store: AssetStore, options: BundleOptions) -> str:
+    """Replaces asset references in script source according to options.asset_mode."""
+
+    def resolve(match: re.Match) -> str:
+        ref = ASSET_PREFIX + match.group(2)
+        if options.asset_mode == "file":
+            return f"`file://${{filesystem.pictures.path}}/{options.asset_subdir}/{match.group(2)}`"
+        if options.asset_mode == "thumbnail" and ref.endswith(".png"):
+            return f'"{make_data_uri("image/png", make_thumbnail(store.load(ref), options.thumbnail_size))}"'
+        return f'"{store.data_uri(ref)}"'
+
+    return _JS_ASSET_REF.sub(resolve, source)
+
+
+# Scripts cannot import code, so the shared prompt-expansion core is copied in at
+# their `//@inline prompt-core` line, keeping only the declarations they reach.
+PROMPT_CORE = ROOT / "lib" / "prompt-core.js"
+_PROMPT_CORE_SLOT = re.compile(r"^//@inline prompt-core$", re.M)
+_JS_TOP_LEVEL_NAME = re.compile(r"^(?:function|const|let|var|class)\s+([A-Za-z_$][\w$]*)", re.M)
+_JS_COMMENT = re.compile(r"/\*.*?\*/|//[^\n]*", re.S)
+
+
+def load_prompt_core(path: Path = PROMPT_CORE) -> dict[str, str]:
+    """Top-level declarations of the core in file order, each with the comment above it."""
+    declarations: dict[str, str] = {}
+    for block in re.split(r"\n\s*\n(?=\S)", path.read_text(encoding="utf-8")):
+        match = _JS_TOP_LEVEL_NAME.search(block)
+        if match:
+            declarations[match.group(1)] = block.strip("\n")
+    return declarations
+
+
+def _js_identifiers(source: str) -> set[str]:
+    return set(_JS_IDENTIFIER.findall(_JS_COMMENT.sub(" ", source)))
+
+
+def prompt_core_names(source: str, core: dict[str, str]) -> set[str]:
+    """Core declarations a script needs: the ones it mentions and, in turn, the ones those mention."""
+    needed: set[str] = set()
+    pending = list(_js_identifiers(source) & core.keys())
+    while pending:
+        name = pending.pop()
+        if name not in needed:
+            needed.add(name)
+            pending.extend(_js_identifiers(core[name]) & core.keys())
+    return needed
+
+
+def inline_prompt_core(source: str, core: dict[str, str] | None = None) -> tuple[str, int]:
+    """Source with the core declarations it needs at its `//@inline prompt-core` line.
+
+    Returns (source, declarations inlined). Scripts without the line come back
+    unchanged; a script that declares a name it would also receive is an error.
+    """
+    if not _PROMPT_CORE_SLOT.search(source):
+        return source, 0
+    core = load_prompt_core() if core is None else core
+    needed = prompt_core_names(source, core)
+    clashes = sorted(needed & set(_JS_TOP_LEVEL_NAME.findall(source)))
+    if clashes:
+        raise RegistryError(f"script redeclares {', '.join(clashes)} from {PROMPT_CORE.name}")
+    body = "\n\n".join(block for name, block in core.items() if name in needed)
+    return _PROMPT_CORE_SLOT.sub(lambda _: body, source, count=1), len(needed)
+
+
+_PARSE_BENCH_JS = r"""
+const vm = require("vm");
+const sources = JSON.parse(require("fs").readFileSync(0, "utf8"));
+const rounds = Number(process.argv[1] || 20);
+const results = sources.map((source, index) => {
+  const times = [];
+  for (let i = 0; i < rounds; i++) {
+    // Unique suffix defeats V8's compilation cache. Scripts may use top-level
+    // `return`, so compile them the way Draw Things does: as a function body.
+    const text = `(function () {\n${source}\n})//${index}:${i}`;
+    const start = process.hrtime.bigint();
+    new vm.Script(text);
+    times.push(Number(process.hrtime.bigint() - start) / 1e6);
+  }
+  times.sort((a, b) => a - b);
+  return times[times.length >> 1];
+});
+process.stdout.write(JSON.stringify(results));
+"""
+
+
+def measure_parse_ms(sources: list[str], rounds: int = 20) -> list[float] | None:
+    """Median compile time per source under node, or None if node is unavailable."""
+    node = shutil.which("node")
+    if node is None:
+        return None
+    result = subprocess.run([node, "-e", _PARSE_BENCH_JS, str(rounds)], input=json.dumps(sources),
+                            capture_output=True, text=True, check=False)
+    if result.returncode != 0:
+        return None
+    return json.loads(result.stdout)
+
+
+@dataclass
+class InstallReport:
+    name: str
+    inline_bytes: int
+    installed_bytes: int
+    assets: int
+    inline_parse_ms: float | None = None
+    installed_parse_ms: float | None = None
+    wildcard_categories: int = 0
+    core_declarations: int = 0
+
+
+def install_scripts(registry: Registry, names: list[str], dest: Path, store: AssetStore,
+                    options: BundleOptions, measure: bool = True) -> list[InstallReport]:
+    """Writes installed copies of the named scripts (all if empty) plus their registry entries to dest."""
+    entries = [registry.get(name) or registry.by_file(name) for name in names] if names else list(registry)
+    missing = [name for name, entry in zip(names, entries) if entry is None]
+    if missing:
+        raise RegistryError(f"not registered: {', '.join(missing)}")
+
+    dest.mkdir(parents=True, exist_ok=True)
+    installed = Registry(dest / REGISTRY_FILE.name)
+    inline_options = BundleOptions(asset_mode="inline")
+    core = load_prompt_core()
+    reports, comparisons = [], []
+    for entry in entries:
+        source, core_declarations = inline_prompt_core(registry.script_path(entry).read_text(encoding="utf-8"), core)
+        pack = None
+        if options.wildcards is not None and _WILDCARD_PACK_SLOT.search(source):
+            pack = compile_wildcard_pack(options.wildcards, script_constants(source).get("categories"))
+            source = inject_wildcard_pack(source, pack)
+        if options.telemetry:
+            source = add_telemetry(source, entry["name"])
+        if options.profile:
+            source = add_profiler(source)
+        refs = script_asset_refs(source)
+        output = resolve_script_assets(source, store, options)
+        inlined = resolve_script_assets(source, store, inline_options) if refs else output
+        if options.asset_mode == "file" and refs:
+            target_dir = options.pictures_dir / options.asset_subdir
+            target_dir.mkdir(parents=True, exist_ok=True)
+            for ref in dict.fromkeys(refs):
+                shutil.copyfile(store.path_for(ref), target_dir / ref[len(ASSET_PREFIX):])
+        _atomic_write(dest / entry["file"], output)
+
+        published = _map_strings(entry, lambda value: store.data_uri(value) if store.is_ref(value) else value)
+        if installed.get(entry["name"]) is not None:
+            installed.update(entry["name"], published)
+        else:
+            stale = installed.by_file(entry["file"])
+            if stale is not None:
+                installed.remove(stale["name"])
+            installed.add(published)
+
+        reports.append(InstallReport(entry["name"], len(inlined.encode("utf-8")),
+                                     len(output.encode("utf-8")), len(refs),
+                                     wildcard_categories=len(pack.categories) if pack else 0,
+                                     core_declarations=core_declarations))
+        comparisons.append((inlined, output))
+    installed.save()
+
+    if measure:
+        compared = [index for index, report in enumerate(reports) if report.assets]
+        timings = measure_parse_ms([text for index in compared for text in comparisons[index]])
+        if timings:
+            for position, index in enumerate(compared):
+                reports[index].inline_parse_ms = timings[position * 2]
+                reports[index].installed_parse_ms = timings[position * 2 + 1]
+    return reports
+
+
+# ============================================================================
+# Mock Runtime
+# ============================================================================
+
+RUNTIME_DIR = ROOT / "runtime"
+MOCK_RUNTIME = RUNTIME_DIR / "mock-runtime.js"
+
+
+class ScriptRunError(RegistryError):
+    """Raised when the mock runtime cannot be started or returns garbage."""
+
+
+def _load_json_arg(value: str | None) -> Any:
+    """Accepts inline JSON or a path to a JSON file."""
+    if not value:
+        return None
+    candidate = Path(value)
+    if candidate.exists():
+        return json.loads(candidate.read_text(encoding="utf-8"))
+    return json.loads(value)
+
+
+def run_script(registry: Registry, entry: dict[str, Any], *, answers: Any = None,
+               latency: dict[str, Any] | None = None, configuration: dict[str, Any] | None = None,
+               prompts: dict[str, str] | None = None, canvas: dict[str, Any] | None = None,
+               files: dict[str, list[str]] | None = None, max_runs: int | None = None,
+               seed: int = 1, echo: bool = False, timeout: float = 600,
+               store: AssetStore | None = None, source: str | None = None) -> dict[str, Any]:
+    """Runs a registered script under the mock runtime and returns its trace."""
+    node = shutil.which("node")
+    if node is None:
+        raise ScriptRunError("node is required to run scripts headlessly")
+    if source is None:
+        source = registry.script_path(entry).read_text(encoding="utf-8")
+    source, _ = inline_prompt_core(source)
+    if script_asset_refs(source):
+        source = resolve_script_assets(source, store or AssetStore(), BundleOptions(asset_mode="file"))
+    spec = {
+        "name": entry["file"],
+        "source": source,
+        "answers": answers or {},
+        "latency": latency or {},
+        "configuration": configuration or {},
+        "prompts": prompts or {},
+        "files": files or {},
+        "seed": seed,
+        "echo": echo,
+    }
+    if canvas is not None:
+        spec["canvas"] = canvas
+    if max_runs is not None:
+        spec["maxRuns"] = max_runs
+    try:
+        # With echo on, the script's console output streams straight to our stderr.
+        result = subprocess.run([node, str(MOCK_RUNTIME)], input=json.dumps(spec), text=True,
+                                stdout=subprocess.PIPE, stderr=None if echo else subprocess.PIPE,
+                                timeout=timeout, check=False)
+    except subprocess.TimeoutExpired:
+        raise ScriptRunError(f"{entry['file']} did not finish within {timeout:.0f}s") from None
+    if result.returncode != 0:
+        raise ScriptRunError(f"mock runtime failed for {entry['file']}: {(result.stderr or '').strip()}")
+    try:
+        return json.loads(result.stdout)
+    except json.JSONDecodeError:
+        raise ScriptRunError(f"mock runtime returned invalid JSON for {entry['file']}") from None
+
+
+def summarize_trace(trace: dict[str, Any]) -> dict[str, Any]:
+    """Per-API call counts and time totals for a trace."""
+    calls: dict[str, int] = {}
+    simulated: dict[str, float] = {}
+    mock_ms = 0.0
+    for event in trace["events"]:
+        api = event["api"]
+        if api.startswith("console."):
+            continue
+        calls[api] = calls.get(api, 0) + 1
+        simulated[api] = simulated.get(api, 0.0) + event["dur"]
+        mock_ms += event["callMs"]
+    return {
+        "calls": calls,
+        "simulated_ms": simulated,
+        "runs": trace.get("runs", 0),
+        "total_simulated_ms": trace.get("simulatedMs", 0.0),
+        # Real time the script spent outside host calls, i.e. its own logic.
+        "script_ms": max(0.0, trace.get("wallMs", 0.0) - mock_ms),
+    }
+
+
+# ============================================================================
+# Benchmarks
+# ============================================================================
+
+BENCH_DIR = ROOT / "benchmarks"
+BENCH_SCENARIOS = BENCH_DIR / "scenarios.json"
+BENCH_BASELINE = BENCH_DIR / "baseline.json"
+
+# Host calls whose counts are tracked individually; anything under canvas.* or
+# mask.* also rolls up into canvas_ops.
+BENCH_CALLS = (
+    "pipeline.run",
+    "pipeline.findControlByName",
+    "pipeline.findLoRAByName",
+    "pipeline.downloadBuiltins",
+    "canvas.updateCanvasSize",
+    "canvas.moveCanvas",
+    "canvas.canvasZoom=",
+    "canvas.createMask",
+    "canvas.detectFaces",
+    "mask.fillRectangle",
+    "__dtSleep",
+)
+BENCH_COUNT_METRICS = ("runs", "canvas_ops", "model_switches", "lora_switches", "control_switches")
+
+# Script time is real wall time and therefore noisy: medians of one scenario
+# swing by 20 ms or more between runs on a loaded machine. It only counts as a
+# regression past both the relative tolerance and this absolute floor, and only
+# if a second round of runs confirms it.
+BENCH_TIME_FLOOR_MS = 25.0
+
+
+def trace_metrics(trace: dict[str, Any]) -> dict[str, Any]:
+    """Reduces a trace to the numbers the benchmark compares."""
+    calls = {api: 0 for api in BENCH_CALLS}
+    canvas_ops = 0
+    generation_ms = idle_ms = mock_ms = 0.0
+    switches = {"model": 0, "lora": 0, "control": 0}
+    previous: dict[str, Any] | None = None
+    for event in trace["events"]:
+        api = event["api"]
+        if api.startswith("console."):
+            continue
+        mock_ms += event["callMs"]
+        if api in calls:
+            calls[api] += 1
+        if api.startswith(("canvas.", "mask.")) and api != "canvas.notify":
+            canvas_ops += 1
+        if api != "pipeline.run":
+            idle_ms += event["dur"]
+            continue
+        generation_ms += event["dur"]
+        args = event.get("args") or {}
+        current = {"model": args.get("model"), "lora": args.get("loras"), "control": args.get("controls")}
+        if previous is not None:
+            for key in switches:
+                switches[key] += current[key] != previous[key]
+        previous = current
+    return {
+        "runs": trace.get("runs", 0),
+        "canvas_ops": canvas_ops,
+        "model_switches": switches["model"],
+        "lora_switches": switches["lora"],
+        "control_switches": switches["control"],
+        "calls": calls,
+        "generation_ms": round(generation_ms, 1),
+        "idle_ms": round(idle_ms, 1),
+        "script_ms": round(max(0.0, trace.get("wallMs", 0.0) - mock_ms), 2),
+        "truncated": trace.get("truncated", False),
+        "error": (trace.get("error") or {}).get("message"),
+    }
+
+
+def load_scenarios(path: Path = BENCH_SCENARIOS) -> dict[str, dict[str, Any]]:
+    return json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+
+
+def bench_script(registry: Registry, entry: dict[str, Any], scenario: dict[str, Any], repeat: int = 5,
+                 store: AssetStore | None = None) -> dict[str, Any]:
+    """Runs one scenario `repeat` times; counts come from the first run, script_ms is the median."""
+    kwargs = {
+        "answers": scenario.get("answers"),
+        "latency": scenario.get("latency"),
+        "configuration": scenario.get("configuration"),
+        "prompts": {"prompt": scenario["prompt"]} if "prompt" in scenario else None,
+        "canvas": scenario.get("canvas"),
+        "files": scenario.get("files"),
+        "max_runs": scenario.get("max_runs"),
+        "seed": scenario.get("seed", 1),
+        "store": store,
+    }
+    samples = [trace_metrics(run_script(registry, entry, **kwargs)) for _ in range(max(1, repeat))]
+    metrics = samples[0]
+    metrics["script_ms"] = statistics.median(sample["script_ms"] for sample in samples)
+    return metrics
+
+
+def compare_to_baseline(name: str, current: dict[str, Any], baseline: dict[str, Any],
+                        tolerance: float) -> list[str]:
+    """Human-readable regressions of current versus baseline metrics."""
+    problems = []
+    if current.get("error") and not baseline.get("error"):
+        problems.append(f"{name}: script now fails: {current['error']}")
+    for metric in BENCH_COUNT_METRICS:
+        if current[metric] > baseline.get(metric, current[metric]):
+            problems.append(f"{name}: {metric} {baseline[metric]} -> {current[metric]}")
+    for api, count in current["calls"].items():
+        before = baseline.get("calls", {}).get(api)
+        if before is not None and count > before:
+            problems.append(f"{name}: {api} calls {before} -> {count}")
+    if script_time_regressed(current, baseline, tolerance):
+        problems.append(f"{name}: script time {baseline['script_ms']:.1f} -> {current['script_ms']:.1f} ms")
+    return problems
+
+
+def script_time_regressed(current: dict[str, Any], baseline: dict[str, Any], tolerance: float) -> bool:
+    before_ms = baseline.get("script_ms")
+    if before_ms is None:
+        return False
+    return current["script_ms"] > max(before_ms * (1 + tolerance), before_ms + BENCH_TIME_FLOOR_MS)
+
+
+# ============================================================================
+# Render Cost Estimates
+# ============================================================================
+
+THROUGHPUT_TABLE = RUNTIME_DIR / "throughput.json"
+
+# Same cost model as the mock runtime's latency table, so a calibrated table can
+# be passed to `run --latency` as well.
+DEFAULT_THROUGHPUT: dict[str, Any] = {
+    "runBaseMs": 400,
+    "msPerMegapixelStep": 90,
+    "models": {},
+    "upscalerMs": 1500,
+    "modelSwitchMs": 4000,
+}
+DEFAULT_ESTIMATE_CONFIGURATION: dict[str, Any] = {
+    "width": 1024,
+    "height": 1024,
+    "steps": 20,
+    "strength": 1,
+    "model": "sd_xl_base_1.0_f16.ckpt",
+    "loras": [],
+}
+
+_JS_TRIVIA = re.compile(r"(?:\s+|//[^\n]*|/\*.*?\*/)*", re.S)
+_JS_NUMBER = re.compile(r"-?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?")
+_JS_IDENTIFIER = re.compile(r"[A-Za-z_$][\w$]*")
+_JS_KEYWORDS = {"true": True, "false": False, "null": None, "undefined": None}
+_JS_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "b": "\b", "f": "\f", "v": "\v", "0": "\0"}
+_JS_TOP_LEVEL_CONST = re.compile(r"^(?:const|let|var)\s+([A-Za-z_$][\w$]*)\s*=\s*", re.M)
+
+
+def js_literal(text: str, pos: int = 0) -> tuple[Any, int]:
+    """Reads the JavaScript literal starting at `pos`; returns it and the end offset.
+
+    Covers what scripts use for configuration: strings, numbers, booleans, null,
+    arrays and objects with bare or quoted keys, comments and trailing commas.
+    Raises ValueError on anything else (expressions, calls, interpolation).
+    """
+
+    def skip(i: int) -> int:
+        return _JS_TRIVIA.match(text, i).end()
+
+    def string(i: int) -> tuple[str, int]:
+        quote, i, chars = text[i], i + 1, []
+        while i < len(text) and text[i] != quote:
+            char = text[i]
+            if char == "\\":
+                i += 1
+                escaped = text[i:i + 1]
+                if escaped == "u":
+                    chars.append(chr(int(text[i + 1:i + 5], 16)))
+                    i += 4
+                elif escaped != "\n":
+                    chars.append(_JS_ESCAPES.get(escaped, escaped))
+            elif quote == "`" and text.startswith("${", i):
+                raise ValueError("template interpolation is not a literal")
+            else:
+                chars.append(char)
+            i += 1
+        if i >= len(text):
+            raise ValueError("unterminated string")
+        return "".join(chars), i + 1
+
+    def value(i: int) -> tuple[Any, int]:
+        i = skip(i)
+        char = text[i:i + 1]
+        if char in ("'", '"', "`"):
+            return string(i)
+        if char == "[":
+            items, i = [], skip(i + 1)
+            while text[i:i + 1] != "]":
+                item, i = value(i)
+                items.append(item)
+                i = skip(i)
+                if text[i:i + 1] == ",":
+                    i = skip(i + 1)
+                elif text[i:i + 1] != "]":
+                    raise ValueError(f"expected ',' or ']' at offset {i}")
+            return items, i + 1
+        if char == "{":
+            obj, i = {}, skip(i + 1)
+            while text[i:i + 1] != "}":
+                if text[i:i + 1] in ("'", '"'):
+                    key, i = string(i)
+                else:
+                    match = _JS_IDENTIFIER.match(text, i) or _JS_NUMBER.match(text, i)
+                    if match is None:
+                        raise ValueError(f"expected a key at offset {i}")
+                    key, i = match.group(), match.end()
+                i = skip(i)
+                if text[i:i + 1] != ":":
+                    raise ValueError(f"expected ':' at offset {i}")
+                obj[key], i = value(i + 1)
+                i = skip(i)
+                if text[i:i + 1] == ",":
+                    i = skip(i + 1)
+                elif text[i:i + 1] != "}":
+                    raise ValueError(f"expected ',' or '}}' at offset {i}")
+            return obj, i + 1
+        match = _JS_NUMBER.match(text, i)
+        if match:
+            number = match.group()
+            return (float(number) if any(c in number for c in ".eE") else int(number)), match.end()
+        match = _JS_IDENTIFIER.match(text, i)
+        if match and match.group() in _JS_KEYWORDS:
+            return _JS_KEYWORDS[match.group()], match.end()
+        raise ValueError(f"not a literal at offset {i}")
+
+    return value(pos)
+
+
+def script_constants(source: str) -> dict[str, Any]:
+    """Top-level `const NAME = <literal>` declarations of a script."""
+    constants = {}
+    for match in _JS_TOP_LEVEL_CONST.finditer(source):
+        try:
+            literal, end = js_literal(source, match.end())
+        except (ValueError, IndexError):
+            continue
+        # `= null; // note` is a literal; `= null || fallback` or `= 2 * TILE` is not.
+        following = _JS_TRIVIA.match(source, end).end()
+        if source[following:following + 1] in ("", ";") or "\n" in source[end:following]:
+            constants[match.group(1)] = literal
+    return constants
+
+
+_CATEGORY_SLOT = re.compile(r"{(\w+)(?::(\d+)(?:-(\d+))?)?}")
+
+
+def count_combinations(template: str, categories: dict[str, list[str]]) -> int:
+    """Distinct expansions of a dynamic-prompts template (computeTotalPromptCount).
+
+    `{cat:n}` and `{cat:a-b}` count ordered picks of n different values, each
+    expanded on its own, with n capped at the number of values; unknown
+    categories stay in the prompt and count once. A slot written twice draws
+    twice, as in random mode.
+    """
+    memo: dict[str, int] = {}
+
+    def enter(name: str, active: frozenset[str]) -> frozenset[str]:
+        if name in active:
+            raise RegistryError(f"circular reference detected for placeholder '{{{name}}}'")
+        return active | {name}
+
+    def picks(name: str, active: frozenset[str], n: int) -> int:
+        # n! * e_n(value counts): e_k sums the products of every k-subset.
+        inner = enter(name, active)
+        sums = [1] + [0] * n
+        for value in categories[name]:
+            count = product(value, inner)
+            for k in range(n, 0, -1):
+                sums[k] += sums[k - 1] * count
+        return math.factorial(n) * sums[n]
+
+    def options(name: str, active: frozenset[str]) -> int:
+        inner = enter(name, active)
+        if name not in memo:
+            memo[name] = sum(product(value, inner) for value in categories[name])
+        return memo[name]
+
+    def product(text: str, active: frozenset[str]) -> int:
+        total = 1
+        for name, low, high in (match.groups() for match in _CATEGORY_SLOT.finditer(text)):
+            if name not in categories:
+                continue
+            if low is None:
+                total *= options(name, active)
+            else:
+                size = len(categories[name])
+                total *= sum(picks(name, active, n)
+                             for n in range(min(int(low), size), min(int(high or low), size) + 1))
+        return total
+
+    return product(template, frozenset())
+
+
+@dataclass
+class RenderPass:
+    """A group of identical pipeline.run calls; `runs` may be an expectation."""
+
+    label: str
+    runs: float
+    width: int
+    height: int
+    steps: int
+    strength: float = 1.0
+    model: str | None = None
+    loras: tuple[str, ...] = ()
+    controls: tuple[str, ...] = ()
+    upscaler: str | None = None
+
+    @property
+    def effective_steps(self) -> float:
+        # img2img only denoises `strength` of the schedule, as in the mock runtime.
+        return self.steps * max(0.0, min(1.0, self.strength))
+
+    @property
+    def pixel_steps(self) -> float:
+        return self.runs * self.width * self.height * self.effective_steps
+
+    def run_ms(self, table: dict[str, Any]) -> float:
+        rate = table["models"].get(self.model, table["msPerMegapixelStep"])
+        ms = table["runBaseMs"] + self.width * self.height / 1e6 * self.effective_steps * rate
+        return ms + (table["upscalerMs"] if self.upscaler else 0)
+
+
+@dataclass
+class RenderEstimate:
+    script: str
+    passes: list[RenderPass]
+    model_switches: float = 0.0
+    worst_case_runs: float | None = None
+    notes: tuple[str, ...] = ()
+
+    @property
+    def runs(self) -> float:
+        return sum(p.runs for p in self.passes)
+
+    @property
+    def pixel_steps(self) -> float:
+        return sum(p.pixel_steps for p in self.passes)
+
+    @property
+    def models(self) -> list[str]:
+        return sorted({p.model for p in self.passes if p.model and p.runs})
+
+    @property
+    def loras(self) -> list[str]:
+        return sorted({lora for p in self.passes if p.runs for lora in p.loras})
+
+    def seconds(self, table: dict[str, Any]) -> float:
+        ms = sum(p.runs * p.run_ms(table) for p in self.passes)
+        return (ms + self.model_switches * table["modelSwitchMs"]) / 1000
+
+
+@dataclass
+class EstimateInputs:
+    """What the user would have entered: UI configuration, canvas image and dialog choices."""
+
+    constants: dict[str, Any]
+    configuration: dict[str, Any]
+    image: tuple[int, int] | None = None
+    batch: int | None = None
+    iterate: bool = False
+    prompt: str | None = None
+    faces: int = 1
+    start: int = 0
+    shard: tuple[int, int] = (1, 1)
+
+    def base_pass(self, label: str, runs: float, **overrides: Any) -> RenderPass:
+        config = {**self.configuration, **overrides}
+        return RenderPass(label, runs, int(config["width"]), int(config["height"]), int(config["steps"]),
+                          float(config.get("strength", 1)), config.get("model"),
+                          _lora_names(config.get("loras")), upscaler=config.get("upscaler"))
+
+
+def _lora_names(loras: Any) -> tuple[str, ...]:
+    return tuple(item.get("file", "") if isinstance(item, dict) else str(item) for item in loras or ())
+
+
+def _estimate_ultimate_upscale(inputs: EstimateInputs) -> RenderEstimate:
+    const = inputs.constants
+    width, height = inputs.image or (inputs.configuration["width"], inputs.configuration["height"])
+    zoom, tile, overlap = const["UPSCALE_FACTOR"], const["TILE_SIZE"], const["MIN_OVERLAP"]
+    # tiledUpscale: tile count grows with the overlap between neighbouring tiles.
+    across, down = (math.ceil(n + overlap * (n - 1) / tile) for n in (width * zoom / tile, height * zoom / tile))
+    tiles = across * down
+    passes = []
+    if const.get("USE_UPSCALER"):
+        passes.append(inputs.base_pass("upscaler", 1, strength=0, upscaler=const["USE_UPSCALER"]))
+    passes += [
+        inputs.base_pass("tile", tiles, width=tile, height=tile, strength=const["TILE_STRENGTH"], upscaler=None),
+        inputs.base_pass("seam inpaint", tiles - 1, width=tile, height=tile,
+                         strength=const["INPAINTING_STRENGTH"], upscaler=None),
+    ]
+    passes[-2].controls = ("Tile (SD v1.x, ControlNet 1.1)",)
+    passes[-1].controls = ("Inpainting (SD v1.x, ControlNet 1.1)",)
+    return RenderEstimate("sd-ultimate-upscale.js", passes,
+                          notes=(f"{width}x{height} image, {across}x{down} tiles of {tile}px at {zoom}x",))
+
+
+def _estimate_detailer(inputs: EstimateInputs) -> RenderEstimate:
+    const = inputs.constants
+    notes = []
+    if const.get("EXISTING_IMAGES_DIRECTORY"):
+        times = inputs.batch or 1
+        notes.append(f"details existing images; pass --batch with the file count (using {times})")
+    else:
+        times = inputs.batch or const["NUMBER_OF_EXECUTIONS"]
+    top_k = const["TOP_K_FACES"]
+    faces = min(inputs.faces, top_k)
+    overrides = {"strength": const["DETAILER_STRENGTH"], "hiresFix": False}
+    for name, key in (("DETAILER_STEPS", "steps"), ("DETAILER_WIDTH", "width"), ("DETAILER_HEIGHT", "height"),
+                      ("LORAS", "loras")):
+        if const.get(name) is not None:
+            overrides[key] = const[name]
+    passes = [inputs.base_pass("detail", times * faces, **overrides)]
+    if not const.get("EXISTING_IMAGES_DIRECTORY"):
+        passes.insert(0, inputs.base_pass("generate", times, strength=1))
+    notes.append(f"{faces} face(s) per image (--faces); TOP_K_FACES allows up to {top_k}")
+    worst = (times if len(passes) == 2 else 0) + times * top_k
+    return RenderEstimate("Detailer.js", passes, worst_case_runs=worst, notes=tuple(notes))
+
+
+def _estimate_dynamic_prompts(inputs: EstimateInputs) -> RenderEstimate:
+    const = inputs.constants
+    categories, prompts = const["categories"], const.get("prompts") or []
+    if inputs.prompt is not None or not prompts:
+        templates = [{"prompt": inputs.prompt or ""}]
+    else:
+        templates = prompts
+    notes = []
+    if inputs.iterate:
+        # Iterate Mode renders a slice of the combinations of one randomly selected
+        # template: iterateRange clips start/count to the total, then takes this
+        # shard's contiguous share of the window.
+        counts = [count_combinations(t["prompt"], categories) for t in templates]
+        shard, shards = inputs.shard
+        runnable = []
+        for total in counts:
+            first = min(inputs.start, total)
+            last = min(first + inputs.batch, total) if inputs.batch else total
+            size = last - first
+            runnable.append(size * shard // shards - size * (shard - 1) // shards)
+        notes.append(f"combinations per template: {counts}; slice from index {inputs.start}"
+                     + (f", count {inputs.batch}" if inputs.batch else "") + f", shard {shard}/{shards}")
+        shares = [r / len(templates) for r in runnable]
+    else:
+        batch = inputs.batch or 10
+        shares = [batch / len(templates)] * len(templates)
+    passes = []
+    for index, (template, runs) in enumerate(zip(templates, shares)):
+        overrides = dict(template.get("configuration") or {})
+        if "model" in template:
+            overrides["model"] = template["model"]
+        if "loras" in template:
+            overrides["loras"] = template["loras"]
+        passes.append(inputs.base_pass(f"prompt {index}", runs, **overrides))
+    switches = 0.0
+    if not inputs.iterate and len(passes) > 1:
+        # The batch is planned up front and grouped by model, so it switches once
+        # per distinct model drawn, less the first load.
+        weights: dict[Any, float] = {}
+        for p in passes:
+            weights[p.model] = weights.get(p.model, 0) + 1 / len(passes)
+        drawn = sum(1 - (1 - w) ** (inputs.batch or 10) for w in weights.values())
+        switches = max(0.0, drawn - 1)
+    return RenderEstimate("dynamic-prompts.js", passes, model_switches=switches, notes=tuple(notes))
+
+
+def _inline_combinations(prompt: str) -> int:
+    """Combinations of a Funk Wildcards prompt (calculateMaxCombinations), nested groups included."""
+    grammar = PromptGrammar()
+
+    def count(template: _Template) -> int:
+        return math.prod(sum(count(option) for option in grammar.values(part))
+                         for part in template.parts if isinstance(part, _Slot))
+
+    template = grammar.template(prompt)
+    return 0 if template.literal else count(template)
+
+
+def _estimate_funk_wildcards(inputs: EstimateInputs) -> RenderEstimate:
+    cap = inputs.constants["MAX_BATCH_COUNT"]
+    runs = min(inputs.batch or 10, cap)
+    notes = [f"batch capped at MAX_BATCH_COUNT={cap}"]
+    if inputs.iterate:
+        # cartesianShardSize: shard i of n owns every n-th combination from i - 1,
+        # and the start offset skips that many of them.
+        combos = _inline_combinations(inputs.prompt or "")
+        shard, shards = inputs.shard
+        owned = (combos - shard) // shards + 1 if combos >= shard else 0
+        runs = min(runs, max(0, owned - inputs.start))
+        notes.append(f"Cartesian mode over {combos} combination(s), shard {shard}/{shards} from offset {inputs.start}")
+    return RenderEstimate("Funk Wildcards.js", [inputs.base_pass("generate", runs)], notes=tuple(notes))
+
+
+def _estimate_batch(script: str, default: int) -> Callable[[EstimateInputs], RenderEstimate]:
+    def estimate(inputs: EstimateInputs) -> RenderEstimate:
+        return RenderEstimate(script, [inputs.base_pass("generate", inputs.batch or default)])
+    return estimate
+
+
+# Static cost models keyed by script file. Each mirrors the script's control
+# flow closely enough to count its pipeline.run calls without executing it.
+ESTIMATORS: dict[str, Callable[[EstimateInputs], RenderEstimate]] = {
+    "sd-ultimate-upscale.js": _estimate_ultimate_upscale,
+    "Detailer.js": _estimate_detailer,
+    "dynamic-prompts.js": _estimate_dynamic_prompts,
+    "Funk Wildcards.js": _estimate_funk_wildcards,
+    "Wildcards.js": _estimate_batch("Wildcards.js", 10),
+    "waveform-generator.js": _estimate_batch("waveform-generator.js", 10),
+}
+
+
+def load_throughput(path: Path = THROUGHPUT_TABLE) -> dict[str, Any]:
+    table = json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+    return {**DEFAULT_THROUGHPUT, **table, "models": {**DEFAULT_THROUGHPUT["models"], **table.get("models", {})}}
+
+
+def estimate_script(registry: Registry, entry: dict[str, Any], inputs: EstimateInputs) -> RenderEstimate:
+    estimator = ESTIMATORS.get(entry["file"])
+    if estimator is None:
+        raise RegistryError(f"no static cost model for {entry['file']}; "
+                            f"use `run --latency {THROUGHPUT_TABLE.relative_to(ROOT)}` to time it under the mock runtime")
+    constants = script_constants(registry.script_path(entry).read_text(encoding="utf-8"))
+    inputs.constants = {**constants, **inputs.constants}
+    inputs.configuration = {**DEFAULT_ESTIMATE_CONFIGURATION, **inputs.configuration}
+    try:
+        return estimator(inputs)
+    except KeyError as exc:
+        raise RegistryError(f"{entry['file']} no longer defines {exc.args[0]}; its cost model needs updating") from None
+
+
+def calibrate_throughput(table: dict[str, Any], model: str, seconds: float, width: int, height: int,
+                         steps: int) -> float:
+    """Sets `model`'s ms per megapixel-step from one measured render and returns it."""
+    rate = (seconds * 1000 - table["runBaseMs"]) / (width * height / 1e6 * steps)
+    if rate <= 0:
+        raise RegistryError(f"{seconds}s is below the fixed per-run cost of {table['runBaseMs']} ms")
+    table["models"][model] = round(rate, 2)
+    return rate
+
+
+# ============================================================================
+# Wildcard Packs
+# ============================================================================
+
+# Scripts cannot read text files, so wildcard libraries are compiled into the
+# script at install time, replacing this placeholder declaration.
+_WILDCARD_PACK_SLOT = re.compile(r"^const wildcardPack = null;", re.M)
+_CATEGORY_NAME_CHARS = re.compile(r"\W+")
+
+
+@dataclass
+class WildcardPack:
+    categories: dict[str, list[str]]
+    files: int
+    lines: int
+    strings: list[str]
+    runs: dict[str, str]
+
+    def to_js(self) -> str:
+        body = {"strings": "\n".join(self.strings), "categories": self.runs}
+        return json.dumps(body, ensure_ascii=False, separators=(",", ":"))
+
+    @property
+    def option_count(self) -> int:
+        return sum(len(values) for values in self.categories.values())
+
+
+def load_wildcard_dir(directory: Path) -> tuple[dict[str, list[str]], int, int]:
+    """One category per .txt file under directory. Returns (categories, files, lines).
+
+    Categories are named after the file's path ("hair/colors.txt" -> hair_colors).
+    Blank lines and lines starting with # are skipped; repeated options are kept once.
+    """
+    if not directory.is_dir():
+        raise RegistryError(f"no such wildcard directory: {directory}")
+    categories: dict[str, list[str]] = {}
+    sources: dict[str, Path] = {}
+    files = lines = 0
+    for path in sorted(directory.rglob("*.txt")):
+        relative = path.relative_to(directory).with_suffix("")
+        name = _CATEGORY_NAME_CHARS.sub("_", "_".join(relative.parts)).strip("_")
+        if name in sources:
+            raise RegistryError(f"{path} and {sources[name]} both compile to category '{name}'")
+        sources[name] = path
+        options: dict[str, None] = {}
+        for line in path.read_text(encoding="utf-8", errors="replace").splitlines():
+            lines += 1
+            option = line.strip()
+            if option and not option.startswith("#"):
+                options[option] = None
+        if options:
+            categories[name] = list(options)
+        files += 1
+    if not categories:
+        raise RegistryError(f"no wildcard options in {directory}")
+    return categories, files, lines
+
+
+def compile_wildcard_pack(directory: Path, script_categories: dict[str, list[str]] | None = None) -> WildcardPack:
+    """Compiles a wildcard directory into a string table plus per-category index runs.
+
+    Every distinct option is stored once. The table is filled from the largest
+    category down, so big categories are single runs and the smaller ones that
+    share their options point back into them. References to categories that
+    neither the pack nor the script defines, and reference cycles, are errors.
+    """
+    categories, files, lines = load_wildcard_dir(directory)
+    merged = {**(script_categories or {}), **categories}
+    unknown = sorted({match.group(1) for values in categories.values() for value in values
+                      for match in _CATEGORY_SLOT.finditer(value)} - merged.keys())
+    if unknown:
+        raise RegistryError(f"wildcards reference unknown categories: {', '.join(unknown)}")
+    count_combinations(" ".join(f"{{{name}}}" for name in categories), merged)
+
+    table: dict[str, int] = {}
+    runs: dict[str, str] = dict.fromkeys(categories, "")
+    for name, values in sorted(categories.items(), key=lambda item: -len(item[1])):
+        spans: list[list[int]] = []
+        for value in values:
+            index = table.setdefault(value, len(table))
+            if spans and spans[-1][0] + spans[-1][1] == index:
+                spans[-1][1] += 1
+            else:
+                spans.append([index, 1])
+        runs[name] = ",".join(_base36(start) + (f"+{_base36(count)}" if count > 1 else "")
+                              for start, count in spans)
+    return WildcardPack(categories, files, lines, list(table), runs)
+
+
+def _base36(value: int) -> str:
+    digits = "0123456789abcdefghijklmnopqrstuvwxyz"
+    text = ""
+    while True:
+        value, digit = divmod(value, 36)
+        text = digits[digit] + text
+        if not value:
+            return text
+
+
+def inject_wildcard_pack(source: str, pack: WildcardPack) -> str | None:
+    """Source with the pack in place of `const wildcardPack = null;`, or None if the script has no slot."""
+    if not _WILDCARD_PACK_SLOT.search(source):
+        return None
+    return _WILDCARD_PACK_SLOT.sub(lambda _: f"const wildcardPack = {pack.to_js()};", source, count=1)
+
+
+# ============================================================================
+# Prompt Expansion
+# ============================================================================
+
+_BRACE_GROUP = re.compile(r"{([^{}]+)}")
+_SLOT_SYNTAX = re.compile(r"(\w+)(?::(\d+)(?:-(\d+))?)?")
+_OPTION_WEIGHT = re.compile(r"(\d+(?:\.\d+)?)::")
+
+EXPAND_MAX_DEPTH = 32
+
+
+def _outer_groups(text: str) -> Iterator[tuple[int, int, str]]:
+    """Start, end and body of each outermost paired {...} group (Funk Wildcards nesting).
+
+    Braces pair like Funk Wildcards.js pairs them: every `}` closes the nearest
+    unpaired `{`, and braces left unpaired stay literal. `{}` is not a group.
+    """
+    closing: dict[int, int] = {}
+    open_braces: list[int] = []
+    for index, char in enumerate(text):
+        if char == "{":
+            open_braces.append(index)
+        elif char == "}" and open_braces:
+            closing[open_braces.pop()] = index
+    index = 0
+    while index < len(text):
+        end = closing.get(index)
+        if end is not None and end > index + 1:
+            yield index, end + 1, text[index + 1:end]
+            index = end + 1
+        else:
+            index += 1
+
+
+def _split_options(body: str) -> list[str]:
+    """Splits a group body on the `|` characters outside nested groups."""
+    options, start, depth = [], 0, 0
+    for index, char in enumerate(body):
+        if char == "{":
+            depth += 1
+        elif char == "}" and depth:
+            depth -= 1
+        elif char == "|" and not depth:
+            options.append(body[start:index])
+            start = index + 1
+    options.append(body[start:])
+    return options
+
+
+@dataclass
+class _Template:
+    text: str
+    parts: list[str | _Slot]
+    literal: bool
+
+
+@dataclass
+class _Slot:
+    """One {...} group: a category reference, or an inline {a|b|c} choice."""
+
+    token: str
+    key: str  # category name, or the group itself for inline choices
+    options: list[_Template] | None = None
+    low: int | None = None
+    high: int | None = None
+    weights: list[float] | None = None  # inline {3::a|1::b} weights, None when uniform
+
+
+class PromptGrammar:
+    """Template semantics of dynamic-prompts.js and Funk Wildcards.js.
+
+    With categories (dynamic-prompts), `{cat}`, `{cat:n}` and `{cat:a-b}` pick
+    category values, which may reference further categories; any other group
+    stays in the prompt as written. Without categories (Funk Wildcards), every
+    group is an inline `{a|b|c}` choice whose options may hold further groups,
+    and `3::a` gives an option weight 3.
+    """
+
+    def __init__(self, categories: dict[str, list[str]] | None = None):
+        self.categories = categories
+        self._templates: dict[str, _Template] = {}
+        self._values: dict[str, list[_Template]] = {}
+
+    def template(self, text: str) -> _Template:
+        template = self._templates.get(text)
+        if template is None:
+            template = self._templates[text] = self._compile(text)
+        return template
+
+    def values(self, slot: _Slot) -> list[_Template]:
+        if slot.options is not None:
+            return slot.options
+        if slot.key not in self._values:
+            self._values[slot.key] = [self.template(value) for value in self.categories[slot.key]]
+        return self._values[slot.key]
+
+    def _compile(self, text: str) -> _Template:
+        parts: list[str | _Slot] = []
+        last = 0
+        if self.categories is None:
+            groups = _outer_groups(text)
+        else:
+            groups = ((match.start(), match.end(), match.group(1)) for match in _BRACE_GROUP.finditer(text))
+        for start, end, body in groups:
+            slot = self._slot(text[start:end], body)
+            if slot is None:
+                continue
+            if start > last:
+                parts.append(text[last:start])
+            parts.append(slot)
+            last = end
+        if last < len(text):
+            parts.append(text[last:])
+        return _Template(text, parts, all(isinstance(part, str) for part in parts))
+
+    def _slot(self, token: str, body: str) -> _Slot | None:
+        if self.categories is None:
+            options, weights = [], []
+            for option in (option.strip() for option in _split_options(body)):
+                if not option:
+                    continue
+                match = _OPTION_WEIGHT.match(option)
+                options.append(option[match.end():].strip() if match else option)
+                weights.append(float(match.group(1)) if match else 1.0)
+            uniform = all(weight == weights[0] for weight in weights) or not any(weights)
+            return _Slot(token, token, options=[self.template(option) for option in options],
+                         weights=None if uniform else weights)
+        match = _SLOT_SYNTAX.fullmatch(body)
+        if match is None or match.group(1) not in self.categories:
+            return None
+        name, low, high = match.groups()
+        if low is None:
+            return _Slot(token, name)
+        return _Slot(token, name, low=int(low), high=max(int(low), int(high or low)))
+
+
+class PromptSampler:
+    """Draws random expansions in batches and counts how often each value is picked.
+
+    Every slot draws the value indices for the whole batch at once (as a NumPy
+    array when NumPy is installed) and nested values are expanded once per
+    distinct value picked, for all the prompts that picked it.
+    """
+
+    def __init__(self, grammar: PromptGrammar, seed: int | None = None):
+        self.grammar = grammar
+        self.histograms: dict[str, Any] = {}
+        self.slot_values: dict[str, list[_Template]] = {}
+        self._rng = numpy.random.default_rng(seed) if numpy is not None else random.Random(seed)
+
+    def sample(self, text: str, count: int) -> list[str]:
+        return self._expand(self.grammar.template(text), count, 0)
+
+    def sample_templates(self, texts: list[str], count: int) -> tuple[list[str], list[int]]:
+        """Expansions of uniformly chosen templates, plus the template index of each."""
+        chosen = self._tolist(self._integers(len(texts), count))
+        prompts: list[str] = [""] * count
+        for index, positions in self._group(chosen, range(len(texts))).items():
+            for position, prompt in zip(positions, self.sample(texts[index], len(positions))):
+                prompts[position] = prompt
+        return prompts, chosen
+
+    def _expand(self, template: _Template, count: int, depth: int) -> list[str]:
+        if template.literal:
+            return [template.text] * count
+        if depth > EXPAND_MAX_DEPTH:
+            raise RegistryError(f"categories nest more than {EXPAND_MAX_DEPTH} levels deep in '{template.text}'")
+        columns = [[part] * count if isinstance(part, str) else self._slot(part, count, depth)
+                   for part in template.parts]
+        return ["".join(row) for row in zip(*columns)]
+
+    def _slot(self, slot: _Slot, count: int, depth: int) -> list[str]:
+        values = self.grammar.values(slot)
+        if not values:
+            return [""] * count
+        if slot.low is None:
+            indices = self._weighted(slot.weights, count) if slot.weights else self._integers(len(values), count)
+            return self._pick(slot.key, values, indices, depth)
+        # {cat:n} and {cat:a-b}: n different values joined with ", ", where n is
+        # drawn from [a, b] and then capped at the number of values.
+        sizes = self._between(slot.low, slot.high, count)
+        sizes = numpy.minimum(sizes, len(values)) if numpy is not None else [min(n, len(values)) for n in sizes]
+        joined: list[list[str]] = [[] for _ in range(count)]
+        for rows, indices in self._distinct(len(values), sizes):
+            for row, text in zip(rows, self._pick(slot.key, values, indices, depth)):
+                joined[row].append(text)
+        return [", ".join(texts) for texts in joined]
+
+    def _pick(self, key: str, values: list[_Template], indices: Any, depth: int) -> list[str]:
+        self.slot_values[key] = values
+        if numpy is not None:
+            counts = numpy.bincount(indices, minlength=len(values))
+            self.histograms[key] = self.histograms[key] + counts if key in self.histograms else counts
+        else:
+            histogram = self.histograms.setdefault(key, [0] * len(values))
+            for index in indices:
+                histogram[index] += 1
+        indices = self._tolist(indices)
+        picked = [values[index].text for index in indices]
+        nested = [index for index, value in enumerate(values) if not value.literal]
+        if nested:
+            for index, positions in self._group(indices, nested).items():
+                for position, text in zip(positions, self._expand(values[index], len(positions), depth + 1)):
+                    picked[position] = text
+        return picked
+
+    def _distinct(self, size: int, sizes: Any) -> Iterator[tuple[list[int], Any]]:
+        """Per pick position j, the rows picking at least j + 1 values and their j-th value."""
+        if numpy is None:
+            picks = [self._rng.sample(range(size), n) for n in sizes]
+            for j in range(max(sizes, default=0)):
+                rows = [row for row, n in enumerate(sizes) if n > j]
+                yield rows, [picks[row][j] for row in rows]
+            return
+        width = int(sizes.max(initial=0))
+        matrix = numpy.full((len(sizes), width), -1, dtype=numpy.int64)
+        for j in range(width):
+            # Rows whose draw repeats an earlier pick of the same row draw again.
+            pending = numpy.flatnonzero(sizes > j)
+            while pending.size:
+                drawn = self._rng.integers(0, size, pending.size)
+                clash = (matrix[pending, :j] == drawn[:, None]).any(axis=1)
+                matrix[pending[~clash], j] = drawn[~clash]
+                pending = pending[clash]
+            rows = numpy.flatnonzero(sizes > j)
+            yield rows.tolist(), matrix[rows, j]
+
+    def _integers(self, size: int, count: int) -> Any:
+        if numpy is not None:
+            return self._rng.integers(0, size, count)
+        return [self._rng.randrange(size) for _ in range(count)]
+
+    def _weighted(self, weights: list[float], count: int) -> Any:
+        if numpy is not None:
+            return self._rng.choice(len(weights), count, p=numpy.asarray(weights) / sum(weights))
+        return self._rng.choices(range(len(weights)), weights, k=count)
+
+    def _between(self, low: int, high: int, count: int) -> Any:
+        if numpy is not None:
+            return self._rng.integers(low, high + 1, count)
+        return [self._rng.randint(low, high) for _ in range(count)]
+
+    @staticmethod
+    def _tolist(indices: Any) -> list[int]:
+        return indices.tolist() if numpy is not None else list(indices)
+
+    @staticmethod
+    def _group(indices: list[int], wanted: Iterable[int]) -> dict[int, list[int]]:
+        """Positions of each wanted index value in indices."""
+        groups: dict[int, list[int]] = {index: [] for index in wanted}
+        for position, index in enumerate(indices):
+            positions = groups.get(index)
+            if positions is not None:
+                positions.append(position)
+        return {index: positions for index, positions in groups.items() if positions}
+
+
+_BAKED_SCRIPT = """//@api-1.0
+// Baked prompts: __COUNT__ prompts from __SOURCE__, expanded by script_manager.py expand.
+// Regenerate with script_manager.py instead of editing by hand.
+
+const bakedPrompts = [
+__PROMPTS__
+];
+
+const uiConfiguration = pipeline.configuration;
+const loraFiles = new Map();
+
+// LoRA display names are resolved to files once each, as dynamic-prompts.js does.
+function loraFile(name) {
+  if (name.endsWith(".ckpt")) {
+    return name;
+  }
+  if (!loraFiles.has(name)) {
+    let file = name;
+    try {
+      file = pipeline.findLoRAByName(name).file;
+    } catch (e) {
+      console.warn(`LoRA ${name} not found: ${e}`);
+    }
+    loraFiles.set(name, file);
+  }
+  return loraFiles.get(name);
+}
+
+for (let i = 0; i < bakedPrompts.length; i++) {
+  const baked = bakedPrompts[i];
+  const configuration = { ...uiConfiguration, ...(baked.configuration || {}), batchSize: 1 };
+  if (configuration.loras) {
+    configuration.loras = configuration.loras.map(lora => ({ file: loraFile(lora.file), weight: lora.weight }));
+  }
+  console.log(`[${i + 1}/${bakedPrompts.length}] ${baked.prompt}`);
+  canvas.clear();
+  pipeline.run({
+    configuration: configuration,
+    prompt: baked.prompt,
+    negativePrompt: baked.negativePrompt ?? pipeline.prompts.negativePrompt
+  });
+}
+"""
+
+
+def bake_prompt_script(entries: list[dict[str, Any]], source: str) -> str:
+    """A standalone script that renders each {prompt, negativePrompt?, configuration?} entry once."""
+    lines = ",\n".join("  " + json.dumps(entry, ensure_ascii=False) for entry in entries)
+    return (_BAKED_SCRIPT.replace("__COUNT__", str(len(entries))).replace("__SOURCE__", source)
+            .replace("__PROMPTS__", lines))
+
+
+# ============================================================================
+# Telemetry
+# ============================================================================
+
+TELEMETRY_MARKER = "DT_TELEMETRY"
+TELEMETRY_FIELDS = ("script", "model", "width", "height", "steps", "sampler", "seed", "ms")
+
+# The api-version comment must stay the first line, so preludes go after it.
+_SCRIPT_HEADER = re.compile(r"\A(?:[ \t]*//[ \t]*@api[^\n]*\n)?")
+
+_TELEMETRY_PRELUDE = """// Telemetry added by script_manager.py install --telemetry: one line per pipeline.run.
+(function () {
+  const script = __SCRIPT__;
+  const run = pipeline.run;
+  const timed = function (options) {
+    const started = Date.now();
+    try {
+      return run.apply(pipeline, arguments);
+    } finally {
+      const configuration = (options && options.configuration) || pipeline.configuration || {};
+      console.log("__MARKER__ " + JSON.stringify({
+        script: script,
+        model: configuration.model ?? null,
+        width: configuration.width ?? null,
+        height: configuration.height ?? null,
+        steps: configuration.steps ?? null,
+        sampler: configuration.sampler ?? null,
+        // A seed of -1 asks for a random one; the host reports the seed it drew.
+        seed: configuration.seed >= 0 ? configuration.seed : (pipeline.configuration || {}).seed ?? null,
+        ms: Date.now() - started
+      }));
+    }
+  };
+  try {
+    pipeline.run = timed;
+  } catch (e) {}
+  if (pipeline.run !== timed) {
+    console.warn("__MARKER__ unavailable: pipeline.run cannot be replaced in this build");
+  }
+})();
+"""
+
+
+def add_telemetry(source: str, script: str) -> str:
+    """Source with a prelude that logs a TELEMETRY_MARKER JSON line after every pipeline.run."""
+    prelude = _TELEMETRY_PRELUDE.replace("__SCRIPT__", json.dumps(script, ensure_ascii=False))
+    prelude = prelude.replace("__MARKER__", TELEMETRY_MARKER)
+    header = _SCRIPT_HEADER.match(source).end()
+    return source[:header] + prelude + source[header:]
+
+
+_PROFILER_PRELUDE = """// Profiler added by script_manager.py install --profile: times every host call
+// and prints a summary table when the script ends.
+const __dtProfile = (function () {
+  const root = typeof globalThis !== "undefined" ? globalThis : this;
+  const started = Date.now();
+  const stats = new Map();
+  const known = {
+    pipeline: ["run", "findControlByName", "findLoRAByName", "downloadBuiltins", "areModelsDownloaded"],
+    canvas: ["clear", "clip", "createMask", "bodyMask", "detectFaces", "moveCanvas", "updateCanvasSize",
+             "loadImage", "loadImageSrc", "saveImage", "saveImageSrc", "loadCustomLayerFromSrc",
+             "loadMaskFromSrc", "loadDepthMapFromSrc", "loadMoodboardFromSrc", "loadPoseFromJson", "notify"],
+    filesystem: ["readEntries"],
+    "filesystem.pictures": ["readEntries"],
+    "": ["__dtSleep", "requestFromUser"]
+  };
+
+  const wrap = (owner, key, label) => {
+    const original = owner[key];
+    if (typeof original !== "function" || original.__dtProfiled) {
+      return;
+    }
+    const timed = function () {
+      const start = Date.now();
+      try {
+        return original.apply(owner, arguments);
+      } finally {
+        const ms = Date.now() - start;
+        const entry = stats.get(label) || { count: 0, ms: 0, max: 0 };
+        entry.count += 1;
+        entry.ms += ms;
+        entry.max = Math.max(entry.max, ms);
+        stats.set(label, entry);
+      }
+    };
+    timed.__dtProfiled = true;
+    try {
+      owner[key] = timed;
+    } catch (e) {}
+  };
+
+  // Known API methods plus any other plain function properties; accessors such
+  // as canvas.foregroundMask are left alone so listing them has no side effects.
+  const instrument = (path, owner) => {
+    if (!owner) {
+      return;
+    }
+    const keys = new Set(known[path]);
+    for (let object = owner; object && object !== Object.prototype; object = Object.getPrototypeOf(object)) {
+      for (const key of Object.getOwnPropertyNames(object)) {
+        const descriptor = Object.getOwnPropertyDescriptor(object, key);
+        if (key !== "constructor" && descriptor && typeof descriptor.value === "function") {
+          keys.add(key);
+        }
+      }
+    }
+    for (const key of keys) {
+      wrap(owner, key, path ? `${path}.${key}` : key);
+    }
+  };
+  instrument("pipeline", root.pipeline);
+  instrument("canvas", root.canvas);
+  instrument("filesystem", root.filesystem);
+  instrument("filesystem.pictures", root.filesystem && root.filesystem.pictures);
+  for (const key of known[""]) {
+    wrap(root, key, key);
+  }
+
+  return {
+    report() {
+      const wall = Date.now() - started;
+      const rows = [...stats.entries()].sort((a, b) => b[1].ms - a[1].ms);
+      const hosted = rows.reduce((sum, [, entry]) => sum + entry.ms, 0);
+      rows.push(["(script code)", { count: 0, ms: Math.max(0, wall - hosted), max: 0 }]);
+      const width = Math.max(...rows.map(([label]) => label.length));
+      const cell = (value, size) => String(value).padStart(size);
+      const lines = [`Profile: ${(wall / 1000).toFixed(1)} s in total`,
+                     `${"call".padEnd(width)}  ${cell("count", 7)}  ${cell("total s", 9)}  ${cell("mean ms", 9)}  ${cell("max ms", 9)}  ${cell("share", 6)}`];
+      for (const [label, entry] of rows) {
+        const mean = entry.count ? (entry.ms / entry.count).toFixed(1) : "";
+        const share = wall > 0 ? `${(100 * entry.ms / wall).toFixed(1)}%` : "";
+        lines.push(`${label.padEnd(width)}  ${cell(entry.count || "", 7)}  ${cell((entry.ms / 1000).toFixed(2), 9)}  ` +
+                   `${cell(mean, 9)}  ${cell(entry.count ? entry.max.toFixed(1) : "", 9)}  ${cell(share, 6)}`);
+      }
+      console.log(lines.join("\\n"));
+    }
+  };
+})();
+try {
+"""
+
+_PROFILER_EPILOGUE = """
+} finally {
+  __dtProfile.report();
+}
+"""
+
+
+def add_profiler(source: str) -> str:
+    """Source wrapped so every pipeline/canvas/filesystem call is timed and summarized at exit.
+
+    The body runs inside try/finally, so the table is printed however the
+    script ends, including a top-level `return` or an uncaught error.
+    """
+    header = _SCRIPT_HEADER.match(source).end()
+    return source[:header] + _PROFILER_PRELUDE + source[header:] + _PROFILER_EPILOGUE
+
+
+def read_telemetry(lines: Iterable[str]) -> dict[str, list[Any]]:
+    """Telemetry records from console log lines, as one list per TELEMETRY_FIELDS column.
+
+    Lines may carry timestamps or other prefixes before the marker; anything
+    that is not a telemetry record is skipped.
+    """
+    columns: dict[str, list[Any]] = {field: [] for field in TELEMETRY_FIELDS}
+    decoder = json.JSONDecoder()
+    for line in lines:
+        start = line.find(TELEMETRY_MARKER + " {")
+        if start < 0:
+            continue
+        try:
+            record, _ = decoder.raw_decode(line, start + len(TELEMETRY_MARKER) + 1)
+        except json.JSONDecodeError:
+            continue
+        if not isinstance(record, dict) or not isinstance(record.get("ms"), (int, float)):
+            continue
+        for field in TELEMETRY_FIELDS:
+            columns[field].append(record.get(field))
+    return columns
+
+
+def percentile(ordered: list[float], fraction: float) -> float:
+    """Linearly interpolated percentile of an ascending list."""
+    position = (len(ordered) - 1) * fraction
+    low = math.floor(position)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+
+def summarize_telemetry(columns: dict[str, list[Any]], by: list[str]) -> list[dict[str, Any]]:
+    """Count, p50, p95, mean and total ms per distinct combination of the `by` columns."""
+    columns = {**columns, "resolution": [f"{width}x{height}" for width, height in zip(columns["width"], columns["height"])]}
+    unknown = [field for field in by if field not in columns or field == "ms"]
+    if unknown:
+        raise RegistryError(f"cannot group telemetry by {', '.join(unknown)}")
+    groups: dict[tuple[Any, ...], list[float]] = {}
+    for key, ms in zip(zip(*(columns[field] for field in by)), columns["ms"]):
+        groups.setdefault(key, []).append(ms)
+    rows = []
+    for key, times in groups.items():
+        times.sort()
+        rows.append({**dict(zip(by, key)), "runs": len(times), "p50_ms": percentile(times, 0.5),
+                     "p95_ms": percentile(times, 0.95), "mean_ms": sum(times) / len(times), "total_ms": sum(times)})
+    rows.sort(key=lambda row: -row["total_ms"])
+    return rows
+
+
+# ============================================================================
+# Command Line
+# ============================================================================
+
+def _format_row(entry: dict[str, Any]) -> str:
+    tags = ", ".join(entry.get("tags", []))
+    return f"{entry['name']:<32} {entry['file']:<36} {tags}"
+
+
+def _print_rows(entries: Iterable[dict[str, Any]]) -> None:
+    for entry in entries:
+        print(_format_row(entry))
+
+
+def cmd_list(registry: Registry, args: argparse.Namespace) -> int:
+    entries = registry.with_tag(args.tag) if args.tag else list(registry)
+    _print_rows(entries)
+    return 0
+
+
+def cmd_show(registry: Registry, args: argparse.Namespace) -> int:
+    entry = registry.get(args.name) or registry.by_file(args.name)
+    if entry is None:
+        raise RegistryError(f"no script named '{args.name}'")
+    if args.inline:
+        store = AssetStore(args.asset_dir)
+        entry = _map_strings(entry, lambda value: store.data_uri(value) if store.is_ref(value) else value)
+    print(json.dumps(entry, indent=2, ensure_ascii=False))
+    return 0
+
+
+def cmd_add(registry: Registry, args: argparse.Namespace) -> int:
+    file_name = Path(args.file).name
+    if not (registry.path.parent / file_name).exists():
+        print(f"warning: {file_name} does not exist next to {registry.path.name}", file=sys.stderr)
+    entry: dict[str, Any] = {
+        "name": args.name or default_name_for(file_name),
+        "file": file_name,
+        "description": args.description or "",
+        "author": args.author or "",
+    }
+    if args.tag:
+        entry["tags"] = list(dict.fromkeys(args.tag))
+    if args.base_color:
+        entry["baseColor"] = args.base_color
+    registry.add(entry)
+    registry.save()
+    print(f"Added '{entry['name']}' ({file_name})")
+    return 0
+
+
+def cmd_update(registry: Registry, args: argparse.Namespace) -> int:
+    entry = registry.get(args.name)
+    if entry is None:
+        raise RegistryError(f"no script named '{args.name}'")
+    changes: dict[str, Any] = {}
+    if args.rename:
+        changes["name"] = args.rename
+    for field in ("file", "description", "author"):
+        value = getattr(args, field)
+        if value is not None:
+            changes[field] = value
+    if args.base_color is not None:
+        changes["baseColor"] = args.base_color or None
+    if args.add_tag or args.remove_tag:
+        tags = [tag for tag in entry.get("tags", []) if tag not in set(args.remove_tag or ())]
+        tags.extend(tag for tag in args.add_tag or () if tag not in tags)
+        changes["tags"] = tags or None
+    registry.update(args.name, changes)
+    print("Updated" if registry.save() else "No changes to", f"'{changes.get('name', args.name)}'")
+    return 0
+
+
+def cmd_remove(registry: Registry, args: argparse.Namespace) -> int:
+    entry = registry.remove(args.name)
+    registry.save()
+    print(f"Removed '{entry['name']}' ({entry['file']})")
+    return 0
+
+
+def cmd_scan(registry: Registry, args: argparse.Namespace) -> int:
+    missing = unregistered_scripts(registry)
+    for path in missing:
+        name = default_name_for(path.name)
+        print(f"{'Would add' if args.dry_run else 'Adding'} '{name}' ({path.name})")
+        if not args.dry_run:
+            registry.add({"name": name, "file": path.name})
+    if not missing:
+        print("All scripts are registered.")
+    registry.save()
+    return 0
+
+
+def cmd_assets(registry: Registry, args: argparse.Namespace) -> int:
+    store = AssetStore(args.asset_dir)
+    if args.action == "verify":
+        problems = [(name, ref) for name, ref in asset_refs(registry) if not store.verify(ref)]
+        for name, ref in problems:
+            print(f"{name}: {ref} is missing or corrupt")
+        print(f"{len(problems)} problem(s)" if problems else "All asset references are intact.")
+        return 1 if problems else 0
+
+    before = len(registry.dumps().encode("utf-8"))
+    if args.action == "externalize":
+        stats = externalize_assets(registry, store)
+        print(f"Externalized {stats.blobs} image(s) from {stats.entries} entr(ies) "
+              f"({stats.written} new file(s), {stats.blobs - stats.written} deduplicated) into {store.directory}")
+    else:
+        stats = inline_assets(registry, store)
+        print(f"Inlined {stats.blobs} image(s) into {stats.entries} entr(ies)")
+    if args.output:
+        registry.path = args.output
+        registry.save(force=True)
+    else:
+        registry.save()
+    after = len(registry.dumps().encode("utf-8"))
+    print(f"Registry size: {before:,} -> {after:,} bytes ({registry.path})")
+    return 0
+
+
+def _parse_assignments(pairs: Iterable[str] | None) -> dict[str, Any]:
+    """KEY=VALUE pairs; values are JSON when they parse as JSON, strings otherwise."""
+    result: dict[str, Any] = {}
+    for assignment in pairs or ():
+        key, _, value = assignment.partition("=")
+        try:
+            result[key] = json.loads(value)
+        except json.JSONDecodeError:
+            result[key] = value
+    return result
+
+
+def _parse_size(value: str) -> tuple[int, int]:
+    width, _, height = value.lower().partition("x")
+    try:
+        return int(width), int(height)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected WIDTHxHEIGHT, got '{value}'") from None
+
+
+def _parse_shard(value: str) -> tuple[int, int]:
+    shard, _, shards = value.partition("/")
+    try:
+        shard, shards = int(shard), int(shards)
+    except ValueError:
+        shard = shards = 0
+    if not 1 <= shard <= shards:
+        raise argparse.ArgumentTypeError(f"expected SHARD/SHARDS with 1 <= SHARD <= SHARDS, got '{value}'")
+    return shard, shards
+
+
+def cmd_run(registry: Registry, args: argparse.Namespace) -> int:
+    entry = registry.get(args.name) or registry.by_file(args.name)
+    if entry is None:
+        raise RegistryError(f"no script named '{args.name}'")
+    configuration = {**(_load_json_arg(args.config) or {}), **_parse_assignments(args.set)}
+    prompts = {"prompt": args.prompt} if args.prompt is not None else None
+    source = registry.script_path(entry).read_text(encoding="utf-8")
+    if args.telemetry:
+        source = add_telemetry(source, entry["name"])
+    if args.profile:
+        source = add_profiler(source)
+    trace = run_script(registry, entry, answers=_load_json_arg(args.answers), latency=_load_json_arg(args.latency),
+                       configuration=configuration, prompts=prompts, max_runs=args.max_runs, seed=args.seed,
+                       echo=not args.quiet, store=AssetStore(args.asset_dir), source=source)
+    if args.trace:
+        _atomic_write(args.trace, json.dumps(trace, indent=2, ensure_ascii=False))
+
+    summary = summarize_trace(trace)
+    print(f"\n{entry['name']}: {summary['runs']} pipeline.run call(s), "
+          f"{summary['total_simulated_ms'] / 1000:.1f}s simulated, {summary['script_ms']:.1f} ms script time"
+          + (" (stopped at --max-runs)" if trace["truncated"] else ""))
+    for api, count in sorted(summary["calls"].items(), key=lambda item: -item[1]):
+        print(f"  {api:<36} {count:>6}  {summary['simulated_ms'][api] / 1000:>9.1f}s")
+    if trace["error"]:
+        print(f"error: script raised: {trace['error']['message']}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def cmd_bench(registry: Registry, args: argparse.Namespace) -> int:
+    scenarios = load_scenarios(args.scenarios)
+    if args.names:
+        entries = [registry.get(name) or registry.by_file(name) for name in args.names]
+        if None in entries:
+            raise RegistryError(f"not registered: {args.names[entries.index(None)]}")
+    else:
+        entries = list(registry)
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8")) if args.baseline.exists() else {}
+    store = AssetStore(args.asset_dir)
+
+    results: dict[str, dict[str, Any]] = {}
+    problems: list[str] = []
+    print(f"{'script':<30} {'runs':>5} {'canvas':>7} {'model':>6} {'lora':>5} {'ctrl':>5} "
+          f"{'gen s':>8} {'idle s':>7} {'script ms':>10}")
+    for entry in entries:
+        scenario = scenarios.get(entry["file"], {})
+        metrics = bench_script(registry, entry, scenario, args.repeat, store)
+        if script_time_regressed(metrics, baseline.get(entry["file"], {}), args.tolerance):
+            # One slow round is usually machine noise; keep the faster of two medians.
+            retry = bench_script(registry, entry, scenario, args.repeat, store)
+            metrics["script_ms"] = min(metrics["script_ms"], retry["script_ms"])
+        results[entry["file"]] = metrics
+        flag = " !" if metrics["error"] else (" …" if metrics["truncated"] else "")
+        print(f"{entry['name'][:30]:<30} {metrics['runs']:>5} {metrics['canvas_ops']:>7} "
+              f"{metrics['model_switches']:>6} {metrics['lora_switches']:>5} {metrics['control_switches']:>5} "
+              f"{metrics['generation_ms'] / 1000:>8.1f} {metrics['idle_ms'] / 1000:>7.1f} "
+              f"{metrics['script_ms']:>10.2f}{flag}")
+        if entry["file"] in baseline:
+            problems += compare_to_baseline(entry["name"], metrics, baseline[entry["file"]], args.tolerance)
+
+    if args.update_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        _atomic_write(args.baseline, json.dumps({**baseline, **results}, indent=2, sort_keys=True) + "\n")
+        print(f"\nBaseline updated: {args.baseline}")
+        return 0
+    if problems:
+        print("\nRegressions against baseline:")
+        for problem in problems:
+            print(f"  {problem}")
+        return 1
+    if baseline:
+        print("\nNo regressions against baseline.")
+    return 0
+
+
+def cmd_estimate(registry: Registry, args: argparse.Namespace) -> int:
+    entry = registry.get(args.name) or registry.by_file(args.name)
+    if entry is None:
+        raise RegistryError(f"no script named '{args.name}'")
+    inputs = EstimateInputs(
+        constants=_parse_assignments(args.const),
+        configuration={**(_load_json_arg(args.config) or {}), **_parse_assignments(args.set)},
+        image=args.image, batch=args.batch, iterate=args.iterate, prompt=args.prompt, faces=args.faces,
+        start=args.start, shard=args.shard)
+    estimate = estimate_script(registry, entry, inputs)
+    table = load_throughput(args.throughput)
+
+    print(f"{entry['name']}: {estimate.runs:,.0f} pipeline.run call(s)"
+          + (f" (worst case {estimate.worst_case_runs:,.0f})" if estimate.worst_case_runs else ""))
+    for render in estimate.passes:
+        print(f"  {render.label:<16} {render.runs:>8,.1f} x {render.width}x{render.height} "
+              f"{render.effective_steps:g} steps  {render.model or '-'}"
+              + (f"  +{', '.join(render.controls)}" if render.controls else ""))
+    print(f"  pixel-steps      {estimate.pixel_steps / 1e6:,.1f} M")
+    print(f"  models           {', '.join(estimate.models) or '-'}")
+    print(f"  LoRAs            {', '.join(estimate.loras) or '-'}")
+    if estimate.model_switches:
+        print(f"  model switches   ~{estimate.model_switches:,.1f}")
+    seconds = estimate.seconds(table)
+    hours, rest = divmod(round(seconds), 3600)
+    print(f"  estimated time   {hours}:{rest // 60:02d}:{rest % 60:02d}"
+          + ("" if args.throughput.exists() else " (uncalibrated default throughput)"))
+    for note in estimate.notes:
+        print(f"  note: {note}")
+    return 0
+
+
+def cmd_calibrate(registry: Registry, args: argparse.Namespace) -> int:
+    table = load_throughput(args.throughput)
+    width, height = args.size
+    rate = calibrate_throughput(table, args.model, args.seconds, width, height, args.steps)
+    _atomic_write(args.throughput, json.dumps(table, indent=2, ensure_ascii=False) + "\n")
+    print(f"{args.model}: {rate:.1f} ms per megapixel-step -> {args.throughput}")
+    return 0
+
+
+def cmd_wildcards(registry: Registry, args: argparse.Namespace) -> int:
+    entry = registry.get(args.script) or registry.by_file(args.script)
+    path = registry.script_path(entry) if entry else Path(args.script)
+    if not path.exists():
+        raise RegistryError(f"no such script: {args.script}")
+    pack = compile_wildcard_pack(args.directory, script_constants(path.read_text(encoding="utf-8")).get("categories"))
+    raw = sum(len(value.encode("utf-8")) + 1 for values in pack.categories.values() for value in values)
+    encoded = len(pack.to_js().encode("utf-8"))
+    print(f"{len(pack.categories)} categories from {pack.files} file(s), {pack.lines:,} lines: "
+          f"{pack.option_count:,} options, {len(pack.strings):,} distinct")
+    print(f"Encoded pack: {encoded:,} bytes ({raw:,} bytes of options)")
+    if args.verbose:
+        for name, values in pack.categories.items():
+            print(f"  {{{name}}}: {len(values):,} options")
+    return 0
+
+
+def cmd_expand(registry: Registry, args: argparse.Namespace) -> int:
+    entry = registry.get(args.name) or registry.by_file(args.name)
+    path = registry.script_path(entry) if entry else Path(args.name)
+    if not path.exists():
+        raise RegistryError(f"no such script: {args.name}")
+    constants = script_constants(path.read_text(encoding="utf-8"))
+    categories = constants.get("categories")
+    if args.wildcards is not None:
+        if categories is None:
+            raise RegistryError(f"{path.name} has no categories for --wildcards")
+        categories = {**categories, **compile_wildcard_pack(args.wildcards, categories).categories}
+    if args.prompt is not None:
+        templates = [{"prompt": args.prompt}]
+    elif constants.get("prompts"):
+        templates = constants["prompts"]
+    elif constants.get("defaultPrompt"):
+        templates = [{"prompt": constants["defaultPrompt"]}]
+    else:
+        raise RegistryError(f"{path.name} has no prompt list; pass --prompt")
+
+    sampler = PromptSampler(PromptGrammar(categories), args.seed)
+    started = time.perf_counter()
+    prompts, chosen = sampler.sample_templates([template["prompt"] for template in templates], args.samples)
+    distinct = dict.fromkeys(zip(prompts, chosen))
+    seconds = time.perf_counter() - started
+    engine = "numpy" if numpy is not None else "random module"
+    print(f"Sampled {args.samples:,} prompts from {len(templates)} template(s) in {seconds:.2f} s ({engine}): "
+          f"{len(distinct):,} distinct ({len(distinct) / max(args.samples, 1):.1%})")
+    for prompt, _ in list(distinct)[:args.preview]:
+        print(f"  {prompt}")
+
+    print("Slot coverage:")
+    for key, histogram in sampler.histograms.items():
+        counts = [int(count) for count in histogram]
+        used = sum(1 for count in counts if count)
+        label = f"{{{key}}}" if categories is not None else key
+        print(f"  {label:<24} {used:>6,}/{len(counts):<6,} values used  "
+              f"min {min(counts):,}  max {max(counts):,}  picks {sum(counts):,}")
+        if args.histogram:
+            values = sampler.slot_values[key]
+            peak = max(counts) or 1
+            ranked = sorted(range(len(counts)), key=lambda index: -counts[index])
+            for index in ranked[:args.top]:
+                bar = "#" * round(30 * counts[index] / peak)
+                print(f"      {counts[index]:>10,}  {bar:<30}  {values[index].text}")
+            if len(ranked) > args.top:
+                print(f"      ... {len(ranked) - args.top:,} more, {len(counts) - used:,} never picked")
+
+    if args.export is not None:
+        match = re.compile(args.match) if args.match else None
+        entries = []
+        for prompt, index in distinct:
+            if match is not None and not match.search(prompt):
+                continue
+            template = templates[index]
+            baked: dict[str, Any] = {"prompt": prompt}
+            if "negativePrompt" in template:
+                baked["negativePrompt"] = template["negativePrompt"]
+            configuration = dict(template.get("configuration") or {})
+            for key in ("model", "loras"):
+                if key in template:
+                    configuration[key] = template[key]
+            if configuration:
+                baked["configuration"] = configuration
+            entries.append(baked)
+            if len(entries) == args.export_count:
+                break
+        _atomic_write(args.export, bake_prompt_script(entries, path.name))
+        print(f"Baked {len(entries)} prompt(s) into {args.export}")
+    return 0
+
+
+def cmd_telemetry(registry: Registry, args: argparse.Namespace) -> int:
+    lines: list[str] = []
+    for path in args.logs:
+        if not path.exists():
+            raise RegistryError(f"no such log: {path}")
+        lines.extend(path.read_text(encoding="utf-8", errors="replace").splitlines())
+    columns = read_telemetry(lines)
+    if not columns["ms"]:
+        raise RegistryError(f"no {TELEMETRY_MARKER} lines found; install scripts with --telemetry first")
+    by = [field.strip() for field in args.by.split(",") if field.strip()]
+    rows = summarize_telemetry(columns, by)
+    if args.csv is not None:
+        header = ",".join(TELEMETRY_FIELDS)
+        records = (",".join("" if value is None else json.dumps(value) if isinstance(value, str) else str(value)
+                            for value in record) for record in zip(*columns.values()))
+        _atomic_write(args.csv, "\n".join([header, *records]) + "\n")
+    widths = [max(len(field), *(len(str(row[field])) for row in rows)) for field in by]
+    print("  ".join(field.ljust(width) for field, width in zip(by, widths))
+          + f"  {'runs':>6}  {'p50 s':>8}  {'p95 s':>8}  {'mean s':>8}  {'total s':>9}")
+    for row in rows:
+        print("  ".join(str(row[field]).ljust(width) for field, width in zip(by, widths))
+              + f"  {row['runs']:>6}  {row['p50_ms'] / 1000:>8.2f}  {row['p95_ms'] / 1000:>8.2f}"
+              + f"  {row['mean_ms'] / 1000:>8.2f}  {row['total_ms'] / 1000:>9.1f}")
+    print(f"{len(columns['ms'])} render(s) from {len(args.logs)} log(s)"
+          + (f"; records written to {args.csv}" if args.csv is not None else ""))
+    return 0
+
+
+def cmd_bundle(registry: Registry, args: argparse.Namespace) -> int:
+    store = AssetStore(args.asset_dir)
+    for name in args.scripts:
+        entry = registry.get(name) or registry.by_file(name)
+        path = registry.script_path(entry) if entry else Path(name)
+        if not path.exists():
+            raise RegistryError(f"no such script: {name}")
+        source = path.read_text(encoding="utf-8")
+        if args.action == "extract":
+            output, count = extract_script_assets(source, store)
+            verb = "Extracted"
+        else:
+            count = len(script_asset_refs(source))
+            output = resolve_script_assets(source, store, BundleOptions(asset_mode="inline"))
+            verb = "Restored"
+        if output != source:
+            _atomic_write(path, output)
+        print(f"{verb} {count} image(s) in {path.name}: {len(source.encode()):,} -> {len(output.encode()):,} bytes")
+    return 0
+
+
+def cmd_install(registry: Registry, args: argparse.Namespace) -> int:
+    options = BundleOptions(asset_mode=args.assets, pictures_dir=args.pictures,
+                            thumbnail_size=args.thumbnail_size, wildcards=args.wildcards, telemetry=args.telemetry,
+                            profile=args.profile)
+    reports = install_scripts(registry, args.names, args.dest, AssetStore(args.asset_dir), options,
+                              measure=not args.no_measure)
+    for report in reports:
+        line = f"Installed {report.name:<32} {report.installed_bytes:>9,} bytes"
+        if report.assets:
+            saved = report.inline_bytes - report.installed_bytes
+            line += f"  ({report.assets} image(s), {saved:,} bytes saved vs inline"
+            if report.inline_parse_ms is not None:
+                line += f", parse {report.inline_parse_ms:.2f} -> {report.installed_parse_ms:.2f} ms"
+            line += ")"
+        if report.wildcard_categories:
+            line += f"  ({report.wildcard_categories} wildcard categories)"
+        if report.core_declarations:
+            line += f"  ({report.core_declarations} prompt-core declarations)"
+        print(line)
+    if args.wildcards is not None and not any(report.wildcard_categories for report in reports):
+        print(f"warning: no installed script declares `const wildcardPack = null;`; {args.wildcards} was not used",
+              file=sys.stderr)
+    if args.assets == "file" and any(report.assets for report in reports):
+        print(f"Images copied to {options.pictures_dir / options.asset_subdir}")
+    if args.telemetry:
+        print(f"Telemetry: each pipeline.run logs a {TELEMETRY_MARKER} line; read exported logs with `telemetry LOG`")
+    print(f"Registry written to {args.dest / REGISTRY_FILE.name}")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Manage Draw Things custom scripts.")
+    parser.add_argument("--registry", type=Path, default=REGISTRY_FILE,
+                        help="path to custom_scripts.json (default: next to this file)")
+    parser.add_argument("--asset-dir", type=Path, default=ASSET_DIR,
+                        help="content-addressed asset directory (default: assets/)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    list_cmd = commands.add_parser("list", help="list registered scripts")
+    list_cmd.add_argument("--tag", help="only scripts with this tag")
+    list_cmd.set_defaults(handler=cmd_list)
+
+    show_cmd = commands.add_parser("show", help="print one registry entry")
+    show_cmd.add_argument("name", help="script name or file")
+    show_cmd.add_argument("--inline", action="store_true", help="resolve asset references to data URIs")
+    show_cmd.set_defaults(handler=cmd_show)
+
+    add_cmd = commands.add_parser("add", help="register a script")
+    add_cmd.add_argument("file")
+    add_cmd.add_argument("--name")
+    add_cmd.add_argument("--description")
+    add_cmd.add_argument("--author")
+    add_cmd.add_argument("--tag", action="append")
+    add_cmd.add_argument("--base-color")
+    add_cmd.set_defaults(handler=cmd_add)
+
+    update_cmd = commands.add_parser("update", help="edit a registry entry")
+    update_cmd.add_argument("name")
+    update_cmd.add_argument("--rename")
+    update_cmd.add_argument("--file")
+    update_cmd.add_argument("--description")
+    update_cmd.add_argument("--author")
+    update_cmd.add_argument("--base-color", help="empty string removes the color")
+    update_cmd.add_argument("--add-tag", action="append")
+    update_cmd.add_argument("--remove-tag", action="append")
+    update_cmd.set_defaults(handler=cmd_update)
+
+    remove_cmd = commands.add_parser("remove", help="unregister a script")
+    remove_cmd.add_argument("name")
+    remove_cmd.set_defaults(handler=cmd_remove)
+
+    scan_cmd = commands.add_parser("scan", help="register scripts that are missing from the registry")
+    scan_cmd.add_argument("--dry-run", action="store_true")
+    scan_cmd.set_defaults(handler=cmd_scan)
+
+    assets_cmd = commands.add_parser("assets", help="move inline images in and out of the registry")
+    assets_cmd.add_argument("action", choices=["externalize", "inline", "verify"],
+                            help="externalize: data URIs -> asset files; inline: back to data URIs for publishing")
+    assets_cmd.add_argument("--output", type=Path, help="write the result here instead of updating in place")
+    assets_cmd.set_defaults(handler=cmd_assets)
+
+    bundle_cmd = commands.add_parser("bundle", help="move images embedded in script source to asset files")
+    bundle_cmd.add_argument("action", choices=["extract", "restore"])
+    bundle_cmd.add_argument("scripts", nargs="+", help="script names or files")
+    bundle_cmd.set_defaults(handler=cmd_bundle)
+
+    install_cmd = commands.add_parser("install", help="install scripts into a Draw Things scripts folder")
+    install_cmd.add_argument("names", nargs="*", help="script names or files (default: all)")
+    install_cmd.add_argument("--dest", type=Path, default=DRAW_THINGS_SCRIPTS_DIR)
+    install_cmd.add_argument("--assets", choices=ASSET_MODES, default="inline",
+                             help="how bundled images are installed (default: inline)")
+    install_cmd.add_argument("--pictures", type=Path, default=PICTURES_DIR,
+                             help="Draw Things pictures folder for --assets file")
+    install_cmd.add_argument("--thumbnail-size", type=int, default=128)
+    install_cmd.add_argument("--no-measure", action="store_true", help="skip the node parse-time comparison")
+    install_cmd.add_argument("--wildcards", type=Path, metavar="DIR",
+                             help="compile the .txt wildcard files in DIR into scripts that declare a wildcard pack")
+    install_cmd.add_argument("--telemetry", action="store_true",
+                             help=f"log a {TELEMETRY_MARKER} JSON line for every pipeline.run")
+    install_cmd.add_argument("--profile", action="store_true",
+                             help="time every pipeline/canvas/filesystem call and print a table when the script ends")
+    install_cmd.set_defaults(handler=cmd_install)
+
+    run_cmd = commands.add_parser("run", help="run a script headlessly under the mock Draw Things runtime")
+    run_cmd.add_argument("name", help="script name or file")
+    run_cmd.add_argument("--answers", help="requestFromUser answers: JSON or a JSON file, "
+                                           "keyed by dialog title or index, then widget path/label")
+    run_cmd.add_argument("--latency", help="latency model overrides: JSON or a JSON file")
+    run_cmd.add_argument("--config", help="initial pipeline.configuration overrides: JSON or a JSON file")
+    run_cmd.add_argument("--set", action="append", metavar="KEY=VALUE", help="single configuration override")
+    run_cmd.add_argument("--prompt", help="prompt shown in the UI (pipeline.prompts.prompt)")
+    run_cmd.add_argument("--max-runs", type=int, help="stop the script after this many pipeline.run calls")
+    run_cmd.add_argument("--seed", type=int, default=1, help="seed for the script's Math.random")
+    run_cmd.add_argument("--trace", type=Path, help="write the full JSON trace here")
+    run_cmd.add_argument("--quiet", action="store_true", help="do not echo the script's console output")
+    run_cmd.add_argument("--telemetry", action="store_true", help="add the install --telemetry prelude before running")
+    run_cmd.add_argument("--profile", action="store_true", help="add the install --profile wrapper before running")
+    run_cmd.set_defaults(handler=cmd_run)
+
+    bench_cmd = commands.add_parser("bench", help="measure orchestration overhead under the mock runtime")
+    bench_cmd.add_argument("names", nargs="*", help="script names or files (default: all registered)")
+    bench_cmd.add_argument("--scenarios", type=Path, default=BENCH_SCENARIOS)
+    bench_cmd.add_argument("--baseline", type=Path, default=BENCH_BASELINE)
+    bench_cmd.add_argument("--update-baseline", action="store_true", help="record these results as the baseline")
+    bench_cmd.add_argument("--repeat", type=int, default=5, help="runs per script; script time is the median")
+    bench_cmd.add_argument("--tolerance", type=float, default=0.5,
+                           help="allowed relative script-time increase before flagging (default: 0.5)")
+    bench_cmd.set_defaults(handler=cmd_bench)
+
+    estimate_cmd = commands.add_parser("estimate", help="estimate a script's render cost without running it")
+    estimate_cmd.add_argument("name")
+    estimate_cmd.add_argument("--config", help="configuration as inline JSON or a JSON file")
+    estimate_cmd.add_argument("--set", action="append", metavar="KEY=VALUE", help="configuration value")
+    estimate_cmd.add_argument("--const", action="append", metavar="NAME=VALUE",
+                              help="override a script constant, e.g. TOP_K_FACES=2")
+    estimate_cmd.add_argument("--image", type=_parse_size, metavar="WxH", help="input image size on the canvas")
+    estimate_cmd.add_argument("--batch", type=int,
+                              help="batch count / frames / images entered in the dialog (Iterate Mode: count)")
+    estimate_cmd.add_argument("--iterate", action="store_true", help="Iterate (Cartesian) mode")
+    estimate_cmd.add_argument("--prompt", help="prompt entered in the UI")
+    estimate_cmd.add_argument("--start", type=int, default=0,
+                              help="Iterate/Cartesian start index or offset entered in the dialog (default: 0)")
+    estimate_cmd.add_argument("--shard", type=_parse_shard, default=(1, 1), metavar="I/N",
+                              help="Iterate/Cartesian shard entered in the dialog (default: 1/1)")
+    estimate_cmd.add_argument("--faces", type=int, default=1, help="faces detected per image (default: 1)")
+    estimate_cmd.add_argument("--throughput", type=Path, default=THROUGHPUT_TABLE)
+    estimate_cmd.set_defaults(handler=cmd_estimate)
+
+    calibrate_cmd = commands.add_parser("calibrate", help="record a model's measured throughput")
+    calibrate_cmd.add_argument("model")
+    calibrate_cmd.add_argument("seconds", type=float, help="wall time of one measured render")
+    calibrate_cmd.add_argument("--size", type=_parse_size, default=(1024, 1024), metavar="WxH")
+    calibrate_cmd.add_argument("--steps", type=int, default=20)
+    calibrate_cmd.add_argument("--throughput", type=Path, default=THROUGHPUT_TABLE)
+    calibrate_cmd.set_defaults(handler=cmd_calibrate)
+
+    wildcards_cmd = commands.add_parser("wildcards", help="check and size a wildcard directory for install --wildcards")
+    wildcards_cmd.add_argument("directory", type=Path, help="folder of .txt files, one option per line")
+    wildcards_cmd.add_argument("--script", default="dynamic-prompts.js",
+                               help="script whose categories the wildcards may reference (default: dynamic-prompts.js)")
+    wildcards_cmd.add_argument("--verbose", action="store_true", help="list every category")
+    wildcards_cmd.set_defaults(handler=cmd_wildcards)
+
+    expand_cmd = commands.add_parser("expand", help="sample prompt expansions offline and check slot coverage")
+    expand_cmd.add_argument("name", help="script name or file (dynamic-prompts or Funk Wildcards syntax)")
+    expand_cmd.add_argument("--prompt", help="template to expand (default: the script's prompt list)")
+    expand_cmd.add_argument("--samples", type=int, default=100_000, help="expansions to draw (default: 100000)")
+    expand_cmd.add_argument("--seed", type=int, help="sampling seed (default: random)")
+    expand_cmd.add_argument("--wildcards", type=Path, metavar="DIR", help="add a wildcard directory's categories")
+    expand_cmd.add_argument("--preview", type=int, default=5, help="distinct prompts to print (default: 5)")
+    expand_cmd.add_argument("--histogram", action="store_true", help="print per-value pick counts for every slot")
+    expand_cmd.add_argument("--top", type=int, default=10, help="values per histogram (default: 10)")
+    expand_cmd.add_argument("--export", type=Path, metavar="FILE", help="write distinct prompts as a baked script")
+    expand_cmd.add_argument("--export-count", type=int, default=100, help="prompts to bake (default: 100)")
+    expand_cmd.add_argument("--match", metavar="REGEX", help="only bake prompts matching REGEX")
+    expand_cmd.set_defaults(handler=cmd_expand)
+
+    telemetry_cmd = commands.add_parser("telemetry", help="render timings from console logs of --telemetry installs")
+    telemetry_cmd.add_argument("logs", nargs="+", type=Path, help="exported console logs")
+    telemetry_cmd.add_argument("--by", default="model,resolution",
+                               help="comma-separated grouping: script, model, resolution, width, height, steps, "
+                                    "sampler, seed (default: model,resolution)")
+    telemetry_cmd.add_argument("--csv", type=Path, metavar="FILE", help="also write every record as CSV")
+    telemetry_cmd.set_defaults(handler=cmd_telemetry)
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        registry = Registry(args.registry)
+        return args.handler(registry, args)
+    except RegistryError as error:
+        print(f"error: {error}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())